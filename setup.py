@@ -83,6 +83,18 @@ setup(
         "urllib3"
     ],
     extras_require={
+        "async": [
+            "aiohttp"
+        ],
+        "cache": [
+            "cryptography"
+        ],
+        "json": [
+            "orjson"
+        ],
+        "rtr": [
+            "py7zr"
+        ],
         "dev": [
             "flake8",
             "coverage",
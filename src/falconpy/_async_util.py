@@ -0,0 +1,362 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+_async_util - Asyncio request handling for the CrowdStrike Falcon OAuth2 API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import asyncio
+import ssl
+from urllib.parse import urlparse
+try:
+    import aiohttp  # pylint: disable=E0401  # Optional dependency
+except ImportError:
+    aiohttp = None
+from ._util import _ALLOWED_METHODS, _USER_AGENT
+from ._util import validate_payload, generate_error_result, upload_positions, rewind_uploads
+from ._result import LazyResult
+from ._upload import UploadReader, upload_length
+from ._registry import _IDEMPOTENT_METHODS
+
+# Default connection pool size for asyncio transports
+_ASYNC_POOL_MAXSIZE = 100
+
+
+def require_aiohttp() -> None:
+    """
+    Raises an ImportError if the optional aiohttp dependency is not installed.
+    """
+    if not aiohttp:
+        raise ImportError("The aiohttp package is required for asyncio support. "
+                          "Install it with: python3 -m pip install crowdstrike-falconpy[async]"
+                          )
+
+
+class AsyncTransport:
+    """
+    Pooled asyncio HTTP transport shared by asyncio flavoured Service Classes.
+    The underlying client session is created on first use within the running event loop.
+    """
+    def __init__(self: object, pool_maxsize: int = _ASYNC_POOL_MAXSIZE) -> object:
+        """
+        Initializes the transport. No connections are opened until the first request is performed.
+        """
+        require_aiohttp()
+        self.pool_maxsize = pool_maxsize
+        self.session = None
+        self.lock = None
+
+    def client(self: object) -> object:
+        """
+        Returns the pooled client session, creating it if necessary.
+        """
+        if not self.session or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_maxsize),
+                cookie_jar=aiohttp.DummyCookieJar()  # The API is stateless
+                )
+
+        return self.session
+
+    def refresh_lock(self: object) -> asyncio.Lock:
+        """
+        Returns the lock used to ensure only one token refresh is performed at a time.
+        """
+        if not self.lock:
+            self.lock = asyncio.Lock()
+
+        return self.lock
+
+    async def close(self: object) -> None:
+        """
+        Closes the client session and all pooled connections.
+        """
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+
+def async_params(params: dict) -> list:
+    """
+    Converts a query string parameter dictionary to a list of tuples.
+    List values are expanded to repeated keys and None values are dropped to match requests.
+    """
+    returned = None
+    if params:
+        returned = []
+        for key, val in params.items():
+            if isinstance(val, (list, tuple)):
+                returned.extend([(key, str(item)) for item in val])
+            elif val is not None:
+                returned.append((key, str(val)))
+
+    return returned
+
+
+def async_ssl(verify: bool or str) -> object:
+    """
+    Converts the ssl_verify setting (boolean or CA bundle path) to an aiohttp ssl argument.
+    """
+    returned = None
+    if verify is False:
+        returned = False
+    elif isinstance(verify, str):
+        returned = ssl.create_default_context(cafile=verify)
+
+    return returned
+
+
+def async_proxy(proxy: dict, endpoint: str) -> str:
+    """
+    Selects the proxy for the endpoint's scheme from a requests style proxy dictionary.
+    """
+    returned = None
+    if proxy:
+        returned = proxy.get(urlparse(endpoint).scheme, None)
+
+    return returned
+
+
+def async_timeout(timeout: float or tuple) -> object:
+    """
+    Converts a requests style timeout (float or connect / read tuple) to an aiohttp ClientTimeout.
+    """
+    if isinstance(timeout, tuple):
+        returned = aiohttp.ClientTimeout(total=None, sock_connect=timeout[0], sock_read=timeout[1])
+    elif timeout:
+        returned = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+    else:
+        returned = aiohttp.ClientTimeout(total=None)
+
+    return returned
+
+
+def codec_encoded(kwargs: dict) -> bool:
+    """
+    Returns a boolean indicating if the body of the request is encoded using the codec specified by json_codec.
+    """
+    return bool(kwargs.get("json_codec", None) and kwargs.get("body", None) is not None
+                and not kwargs.get("data", None) and not kwargs.get("files", None)
+                )
+
+
+def async_payload(kwargs: dict) -> dict:
+    """
+    Calculates the data / json keywords for the request, mirroring how requests encodes them.
+    Headers required by the body (the length of streamed bodies) are returned using the headers key.
+    """
+    data = kwargs.get("data", None)
+    files = kwargs.get("files", None)
+    body = kwargs.get("body", None)
+    returned = {}
+    if files:
+        form = aiohttp.FormData()
+        for key, val in (data or {}).items():
+            form.add_field(key, str(val))
+        for field, details in files:
+            form.add_field(field, details[1], filename=details[0], content_type=details[2])
+        returned["data"] = form
+    elif hasattr(data, "read"):
+        # Streamed bodies are wrapped so that aiohttp does not close them, they are rewound and resent by retries
+        returned["data"] = UploadReader(data)
+        length = upload_length(data)
+        if length is not None:
+            returned["headers"] = {"Content-Length": str(length)}
+    elif data:
+        returned["data"] = data
+    elif codec_encoded(kwargs):
+        returned["data"] = kwargs["json_codec"].dumps(body)
+    elif body is not None:
+        returned["json"] = body
+
+    return returned
+
+
+async def async_send(endpoint: str, headers: dict, method: str, kwargs: dict) -> tuple:
+    """
+    Performs a single request, returning the result, status code and response headers.
+    """
+    payload = async_payload(kwargs)
+    async with kwargs.get("transport").client().request(
+            method.upper(), endpoint, params=async_params(kwargs.get("params", None)),
+            headers={**headers, **payload.pop("headers", {})},
+            ssl=async_ssl(kwargs.get("verify", True)), proxy=async_proxy(kwargs.get("proxy", None), endpoint),
+            timeout=async_timeout(kwargs.get("timeout", None)), **payload
+            ) as response:
+        if response.headers.get('content-type') == "application/json":
+            # The body is decoded when it is first accessed
+            returned = LazyResult(response.status, response.headers, await response.read(),
+                                  loads=getattr(kwargs.get("json_codec", None), "loads", None)
+                                  )
+        else:
+            returned = await response.read()
+
+        return returned, response.status, response.headers
+
+
+async def async_send_request(send: callable, rate_limiter: object = None, retry_policy: object = None,
+                             idempotent: bool = True, retryable: bool = True) -> object:
+    """
+    Asyncio equivalent of send_request. send returns an awaitable of the result, status code and headers,
+    only the result is returned.
+    """
+    attempt = 1
+    throttled = 0
+    if retry_policy:
+        retry_policy.started()
+    while True:
+        if rate_limiter:
+            delay = rate_limiter.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        try:
+            returned, status_code, response_headers = await send()
+        except Exception as err:  # pylint: disable=W0703  # Reraised unless the retry policy accepts it
+            delay = retry_policy.retry_delay(attempt, idempotent, exception=err) if retry_policy and retryable else None
+            if delay is None:
+                raise
+        else:
+            delay = None
+            if rate_limiter:
+                rate_limiter.update(status_code, response_headers)
+                if retryable and rate_limiter.retry(status_code, throttled):
+                    throttled += 1
+                    continue
+            if retry_policy and retryable:
+                delay = retry_policy.retry_delay(attempt, idempotent, status_code=status_code)
+            if delay is None:
+                return returned
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+async def async_perform_request(endpoint: str = "", headers: dict = None, **kwargs) -> object:
+    """
+    Asyncio equivalent of perform_request. Accepts the same keywords, with the persistent
+    session provided as an AsyncTransport using the transport keyword.
+    """
+    method = kwargs.get("method", "GET")
+    body_validator = kwargs.get("body_validator", None)
+    headers = headers if headers else {}
+    returned = None
+    if method.upper() in _ALLOWED_METHODS:
+        if body_validator:
+            try:
+                validate_payload(body_validator, kwargs.get("body", None), kwargs.get("body_required", None))
+            except (ValueError, TypeError) as err:
+                returned = generate_error_result(message=f"{str(err)}")
+        if not returned:
+            headers["User-Agent"] = _USER_AGENT  # Force all requests to pass the User-Agent identifier
+            if codec_encoded(kwargs) and not any(key.lower() == "content-type" for key in headers):
+                headers["Content-Type"] = "application/json"
+            positions = upload_positions(kwargs.get("data", None), kwargs.get("files", None))
+
+            def send():
+                # Streamed data and uploaded files are rewound so that retried requests resend the entire body
+                rewind_uploads(positions)
+                return async_send(endpoint, headers, method, kwargs)
+
+            try:
+                returned = await async_send_request(
+                    send,
+                    rate_limiter=kwargs.get("rate_limiter", None),
+                    retry_policy=kwargs.get("retry_policy", None),
+                    idempotent=kwargs.get("idempotent", method.upper() in _IDEMPOTENT_METHODS),
+                    retryable=positions is not None
+                    )
+            except Exception as err:  # pylint: disable=W0703  # General catch-all for anything coming out of aiohttp
+                returned = generate_error_result(message=f"{str(err) or type(err).__name__}")
+    else:
+        returned = generate_error_result(message="Invalid API operation specified.", code=405)
+
+    return returned
+
+
+async def async_cached_token(cache: object, creds: dict, base_url: str, renew_window: int,  # pylint: disable=R0913
+                             current: str, token_request: dict, transport: AsyncTransport) -> dict:
+    """
+    Returns a token result from the token cache if one is in use and contains a valid token,
+    otherwise performs the token request and caches the result. The cache lock is acquired
+    in an executor so that waiting for another process does not block the event loop.
+    """
+    if cache:
+        loop = asyncio.get_event_loop()
+
+        def request():
+            # Performed on the event loop while the executor thread holds the cache lock
+            return asyncio.run_coroutine_threadsafe(async_perform_request(transport=transport, **token_request),
+                                                    loop
+                                                    ).result()
+
+        returned = await loop.run_in_executor(None, cache.fetch, creds, base_url, renew_window, current, request)
+    else:
+        returned = await async_perform_request(transport=transport, **token_request)
+
+    return returned
+
+
+async def async_token(auth_object: object, transport: AsyncTransport) -> bool:
+    """
+    Refreshes the token for the authentication object without blocking the event loop.
+    Concurrent callers wait for a single refresh instead of each requesting a new token.
+    The refresh is performed by renew_token in an executor, so it is also single-flight with
+    synchronous Service Classes sharing the authentication object.
+    Returns a boolean indicating if a valid token is available.
+    """
+    if auth_object.token_expired():
+        async with transport.refresh_lock():
+            # Another task may have refreshed the token while we waited
+            if auth_object.token_expired():
+                await asyncio.get_event_loop().run_in_executor(None, auth_object.renew_token)
+
+    return not auth_object.token_expired()
+
+
+async def async_service_request(caller: object = None, **kwargs) -> object:
+    """
+    Checks for token expiration, refreshing asynchronously if possible and then performs the request.
+    Streaming downloads are not supported, and are rejected instead of returning the content.
+    """
+    if kwargs.get("download_to", None):
+        raise TypeError("download_to is not supported by asyncio Service Classes.")
+    if caller.auth_object:
+        if await async_token(caller.auth_object, caller.transport):
+            kwargs["headers"]['Authorization'] = 'Bearer {}'.format(caller.token)
+        else:
+            kwargs["headers"]['Authorization'] = 'Bearer '
+
+    return await async_perform_request(transport=caller.transport, proxy=caller.proxy, timeout=caller.timeout,
+                                       rate_limiter=getattr(caller.auth_object, "rate_limiter", None),
+                                       retry_policy=getattr(caller.auth_object, "retry_policy", None),
+                                       json_codec=getattr(caller, "json_codec", None), **kwargs)
@@ -0,0 +1,273 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+_download - Streaming, resumable file downloads for the CrowdStrike Falcon API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import hashlib
+import os
+import requests
+from ._result import Result
+from ._util import generate_ok_result, generate_error_result
+
+# Size of each chunk read from the response and written to disk
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Number of times an interrupted transfer is resumed before giving up
+_DOWNLOAD_RESUME_ATTEMPTS = 3
+
+
+class PartialDownload:
+    """
+    Streams a download to a partial file alongside its destination, hashing the content as it
+    is written. The partial file is renamed to the destination once the transfer completes and
+    the content matches the expected SHA-256 (when provided).
+
+    An interrupted transfer leaves the partial file in place, and the next attempt requests
+    the remaining content using an HTTP Range header.
+    """
+    def __init__(self: object, path: str, sha256: str = None) -> object:
+        """
+        Initializes the download. No files are created until content is received.
+        """
+        self.path = path
+        self.partial = f"{path}.part"
+        self.sha256 = sha256.lower() if sha256 else None
+        self.digest = None
+        self.handle = None
+
+    def resume_headers(self: object) -> dict:
+        """
+        Returns the headers necessary to request the content not yet received.
+        """
+        returned = {}
+        if os.path.exists(self.partial) and os.path.getsize(self.partial):
+            returned["Range"] = f"bytes={os.path.getsize(self.partial)}-"
+
+        return returned
+
+    def begin(self: object, status_code: int) -> None:
+        """
+        Prepares the partial file for the response status code specified.
+        Partial content (206) and unsatisfiable ranges (416, the partial file is already complete)
+        continue the existing partial file, any other response restarts the download.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.digest = hashlib.sha256()
+        if status_code in [206, 416] and os.path.exists(self.partial):
+            # Hash the content received by earlier attempts
+            with open(self.partial, "rb") as existing:
+                for chunk in iter(lambda: existing.read(_DOWNLOAD_CHUNK_SIZE), b""):
+                    self.digest.update(chunk)
+            self.handle = open(self.partial, "ab")  # pylint: disable=R1732  # Closed by complete or close
+        else:
+            self.handle = open(self.partial, "wb")  # pylint: disable=R1732  # Closed by complete or close
+
+    def write(self: object, chunk: bytes) -> None:
+        """
+        Writes a chunk of content to the partial file.
+        """
+        if chunk:
+            self.handle.write(chunk)
+            self.digest.update(chunk)
+
+    def close(self: object) -> None:
+        """
+        Closes the partial file, leaving it in place so the transfer can be resumed.
+        """
+        if self.handle:
+            self.handle.close()
+            self.handle = None
+
+    def complete(self: object) -> dict:
+        """
+        Verifies the content and atomically moves the partial file to its destination.
+        Content that does not match the expected SHA-256 is discarded.
+        """
+        self.handle.flush()
+        os.fsync(self.handle.fileno())
+        self.close()
+        calculated = self.digest.hexdigest()
+        if self.sha256 and calculated != self.sha256:
+            os.remove(self.partial)
+            returned = generate_error_result(f"SHA-256 verification failed, expected {self.sha256} "
+                                             f"but received {calculated}")
+        else:
+            os.replace(self.partial, self.path)
+            returned = generate_ok_result(message="Download successful")
+            returned["body"]["resources"] = [{"path": self.path, "sha256": calculated}]
+
+        return returned
+
+
+class WriterDownload:
+    """
+    Streams a download to a writable file-like object, hashing the content as it is written.
+
+    An interrupted transfer is resumed from the number of bytes already written using an HTTP Range
+    header. If the API returns the complete content instead, seekable writers are truncated and
+    rewritten, anything else fails the download.
+    """
+    def __init__(self: object, writer: object, sha256: str = None) -> object:
+        """
+        Initializes the download. Nothing is written until content is received.
+        """
+        self.writer = writer
+        self.sha256 = sha256.lower() if sha256 else None
+        self.digest = hashlib.sha256()
+        self.written = 0
+        self.handle = self
+
+    def resume_headers(self: object) -> dict:
+        """
+        Returns the headers necessary to request the content not yet written.
+        """
+        return {"Range": f"bytes={self.written}-"} if self.written else {}
+
+    def begin(self: object, status_code: int) -> None:
+        """
+        Prepares the writer for the response status code specified.
+        """
+        if self.written and status_code not in [206, 416]:
+            if not (hasattr(self.writer, "seekable") and self.writer.seekable()):
+                raise ValueError("Download restarted and the content already written cannot be rewound")
+            self.writer.seek(0)
+            self.writer.truncate()
+            self.digest = hashlib.sha256()
+            self.written = 0
+
+    def write(self: object, chunk: bytes) -> None:
+        """
+        Writes a chunk of content to the writer.
+        """
+        if chunk:
+            self.writer.write(chunk)
+            self.digest.update(chunk)
+            self.written += len(chunk)
+
+    def tell(self: object) -> int:
+        """
+        Returns the number of bytes written.
+        """
+        return self.written
+
+    def close(self: object) -> None:
+        """
+        Leaves the writer open so the transfer can be resumed.
+        """
+
+    def complete(self: object) -> dict:
+        """
+        Verifies the content written.
+        """
+        if hasattr(self.writer, "flush"):
+            self.writer.flush()
+        calculated = self.digest.hexdigest()
+        if self.sha256 and calculated != self.sha256:
+            returned = generate_error_result(f"SHA-256 verification failed, expected {self.sha256} "
+                                             f"but received {calculated}")
+        else:
+            returned = generate_ok_result(message="Download successful")
+            returned["body"]["resources"] = [{"size": self.written, "sha256": calculated}]
+
+        return returned
+
+
+def download_target(destination: object, sha256: str = None) -> object:
+    """
+    Returns the download target for a file path or a writable file-like object.
+    """
+    if hasattr(destination, "write"):
+        return WriterDownload(destination, sha256)
+
+    return PartialDownload(destination, sha256)
+
+
+def expected_size(response: object, offset: int) -> int:
+    """
+    Returns the complete size of the content being downloaded, or None if the response does not state it.
+    """
+    returned = None
+    content_range = response.headers.get("Content-Range", "")
+    if response.status_code == 206 and "/" in content_range and content_range.split("/")[1].isdigit():
+        returned = int(content_range.split("/")[1])
+    elif response.status_code == 200 and response.headers.get("Content-Length", "").isdigit():
+        returned = int(response.headers["Content-Length"])
+    elif response.status_code == 416:
+        returned = offset
+
+    return returned
+
+
+def stream_download(request: callable, target: PartialDownload) -> dict:
+    """
+    Streams a download to disk, resuming interrupted transfers.
+
+    request: callable - Performs the request with the additional headers provided, returning a streaming response
+    target: PartialDownload or WriterDownload - Destination of the download
+    """
+    returned = None
+    try:
+        for _ in range(_DOWNLOAD_RESUME_ATTEMPTS + 1):
+            offset = int(target.resume_headers().get("Range", "bytes=0-")[6:-1])
+            response = request(target.resume_headers())
+            with response:
+                if response.status_code not in [200, 206, 416]:
+                    if response.headers.get("content-type") == "application/json":
+                        returned = Result()(response.status_code, response.headers, response.json())
+                    else:
+                        returned = generate_error_result(f"Download failed: {response.reason}", response.status_code)
+                    break
+                target.begin(response.status_code)
+                expected = expected_size(response, offset)
+                try:
+                    if response.status_code != 416:
+                        for chunk in response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                            target.write(chunk)
+                    if expected is not None and target.handle.tell() < expected:
+                        raise requests.exceptions.ChunkedEncodingError(f"Received {target.handle.tell()} of {expected} bytes")
+                except (requests.exceptions.RequestException, ConnectionError) as err:
+                    # The partial file is retained and the remaining content requested by the next attempt
+                    target.close()
+                    returned = generate_error_result(f"Download interrupted: {str(err)}")
+                    continue
+                returned = target.complete()
+                break
+    finally:
+        # Errors writing to disk (OSError) propagate, but never leave the partial file open
+        target.close()
+
+    return returned
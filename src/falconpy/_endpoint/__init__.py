@@ -18,116 +18,121 @@
                                                         |::.|     CrowdStrike Falcon      |::.|
                                                         `---' OAuth2 API SDK for Python 3 `---'
 """
-from .deprecated import _custom_ioa_deprecated
-from .deprecated import _firewall_management_deprecated
-from .deprecated import _identity_protection_deprecated
-from .deprecated import _installation_tokens_deprecated
-from .deprecated import _ioc_deprecated
-from .deprecated import _iocs_deprecated
-from .deprecated import _real_time_response_deprecated
-from .deprecated import _real_time_response_admin_deprecated
-from .deprecated import _report_executions_deprecated
-from .deprecated import _scheduled_reports_deprecated
+import importlib
+import sys
 
-from ._cloud_connect_aws import _cloud_connect_aws_endpoints
-from ._cspm_registration import _cspm_registration_endpoints
-from ._custom_ioa import _custom_ioa_endpoints
-from ._d4c_registration import _d4c_registration_endpoints
-from ._detects import _detects_endpoints
-from ._device_control_policies import _device_control_policies_endpoints
-from ._event_streams import _event_streams_endpoints
-from ._falcon_complete_dashboard import _falcon_complete_dashboard_endpoints
-from ._falconx_sandbox import _falconx_sandbox_endpoints
-from ._firewall_management import _firewall_management_endpoints
-from ._firewall_policies import _firewall_policies_endpoints
-from ._host_group import _host_group_endpoints
-from ._hosts import _hosts_endpoints
-from ._identity_protection import _identity_protection_endpoints
-from ._incidents import _incidents_endpoints
-from ._installation_tokens import _installation_tokens_endpoints
-from ._intel import _intel_endpoints
-from ._ioa_exclusions import _ioa_exclusions_endpoints
-from ._ioc import _ioc_endpoints
-from ._iocs import _iocs_endpoints
-from ._kubernetes_protection import _kubernetes_protection_endpoints
-from ._malquery import _malquery_endpoints
-from ._ml_exclusions import _ml_exclusions_endpoints
-from ._mssp import _mssp_endpoints
-from ._oauth2 import _oauth2_endpoints
-from ._overwatch_dashboard import _overwatch_dashboard_endpoints
-from ._prevention_policies import _prevention_policies_endpoints
-from ._quarantine import _quarantine_endpoints
-from ._quick_scan import _quick_scan_endpoints
-from ._real_time_response import _real_time_response_endpoints
-from ._real_time_response_admin import _real_time_response_admin_endpoints
-from ._recon import _recon_endpoints
-from ._report_executions import _report_executions_endpoints
-from ._response_policies import _response_policies_endpoints
-from ._sample_uploads import _sample_uploads_endpoints
-from ._scheduled_reports import _scheduled_reports_endpoints
-from ._sensor_download import _sensor_download_endpoints
-from ._sensor_update_policies import _sensor_update_policies_endpoints
-from ._sensor_visibility_exclusions import _sensor_visibility_exclusions_endpoints
-from ._spotlight_vulnerabilities import _spotlight_vulnerabilities_endpoints
-from ._user_management import _user_management_endpoints
-from ._zero_trust_assessment import _zero_trust_assessment_endpoints
+# Endpoint modules, in the order they are merged into api_endpoints
+_collections = [
+    "_cloud_connect_aws",
+    "_cspm_registration",
+    "_custom_ioa",
+    "_d4c_registration",
+    "_detects",
+    "_device_control_policies",
+    "_event_streams",
+    "_falcon_complete_dashboard",
+    "_falconx_sandbox",
+    "_firewall_management",
+    "_firewall_policies",
+    "_host_group",
+    "_hosts",
+    "_identity_protection",
+    "_incidents",
+    "_installation_tokens",
+    "_intel",
+    "_ioa_exclusions",
+    "_ioc",
+    "_iocs",
+    "_kubernetes_protection",
+    "_malquery",
+    "_ml_exclusions",
+    "_mssp",
+    "_oauth2",
+    "_overwatch_dashboard",
+    "_prevention_policies",
+    "_quarantine",
+    "_quick_scan",
+    "_real_time_response",
+    "_real_time_response_admin",
+    "_recon",
+    "_report_executions",
+    "_response_policies",
+    "_sample_uploads",
+    "_scheduled_reports",
+    "_sensor_download",
+    "_sensor_update_policies",
+    "_sensor_visibility_exclusions",
+    "_spotlight_vulnerabilities",
+    "_user_management",
+    "_zero_trust_assessment"
+]
 
-api_endpoints = []
-api_endpoints.extend(_cloud_connect_aws_endpoints)
-api_endpoints.extend(_cspm_registration_endpoints)
-api_endpoints.extend(_custom_ioa_endpoints)
-api_endpoints.extend(_d4c_registration_endpoints)
-api_endpoints.extend(_detects_endpoints)
-api_endpoints.extend(_device_control_policies_endpoints)
-api_endpoints.extend(_event_streams_endpoints)
-api_endpoints.extend(_falcon_complete_dashboard_endpoints)
-api_endpoints.extend(_falconx_sandbox_endpoints)
-api_endpoints.extend(_firewall_management_endpoints)
-api_endpoints.extend(_firewall_policies_endpoints)
-api_endpoints.extend(_host_group_endpoints)
-api_endpoints.extend(_hosts_endpoints)
-api_endpoints.extend(_identity_protection_endpoints)
-api_endpoints.extend(_incidents_endpoints)
-api_endpoints.extend(_installation_tokens_endpoints)
-api_endpoints.extend(_intel_endpoints)
-api_endpoints.extend(_ioa_exclusions_endpoints)
-api_endpoints.extend(_ioc_endpoints)
-api_endpoints.extend(_iocs_endpoints)
-api_endpoints.extend(_kubernetes_protection_endpoints)
-api_endpoints.extend(_malquery_endpoints)
-api_endpoints.extend(_ml_exclusions_endpoints)
-api_endpoints.extend(_mssp_endpoints)
-api_endpoints.extend(_oauth2_endpoints)
-api_endpoints.extend(_overwatch_dashboard_endpoints)
-api_endpoints.extend(_prevention_policies_endpoints)
-api_endpoints.extend(_quarantine_endpoints)
-api_endpoints.extend(_quick_scan_endpoints)
-api_endpoints.extend(_real_time_response_endpoints)
-api_endpoints.extend(_real_time_response_admin_endpoints)
-api_endpoints.extend(_recon_endpoints)
-api_endpoints.extend(_report_executions_endpoints)
-api_endpoints.extend(_response_policies_endpoints)
-api_endpoints.extend(_sample_uploads_endpoints)
-api_endpoints.extend(_scheduled_reports_endpoints)
-api_endpoints.extend(_sensor_download_endpoints)
-api_endpoints.extend(_sensor_update_policies_endpoints)
-api_endpoints.extend(_sensor_visibility_exclusions_endpoints)
-api_endpoints.extend(_spotlight_vulnerabilities_endpoints)
-api_endpoints.extend(_user_management_endpoints)
-api_endpoints.extend(_zero_trust_assessment_endpoints)
+# Deprecated endpoint modules (operation IDs maintained for backwards compatibility)
+_deprecated_collections = [
+    "_custom_ioa",
+    "_firewall_management",
+    "_identity_protection",
+    "_installation_tokens",
+    "_ioc",
+    "_iocs",
+    "_real_time_response",
+    "_real_time_response_admin",
+    "_report_executions",
+    "_scheduled_reports"
+]
 
-# Deprecated endpoints
-deprecated_endpoints = []
-deprecated_endpoints.extend(_custom_ioa_deprecated)
-deprecated_endpoints.extend(_firewall_management_deprecated)
-deprecated_endpoints.extend(_identity_protection_deprecated)
-deprecated_endpoints.extend(_installation_tokens_deprecated)
-deprecated_endpoints.extend(_ioc_deprecated)
-deprecated_endpoints.extend(_iocs_deprecated)
-deprecated_endpoints.extend(_real_time_response_deprecated)
-deprecated_endpoints.extend(_real_time_response_admin_deprecated)
-deprecated_endpoints.extend(_report_executions_deprecated)
-deprecated_endpoints.extend(_scheduled_reports_deprecated)
 
-# api_endpoints contains all endpoints, production and deprecated
-api_endpoints.extend(deprecated_endpoints)
+def load_collection(collection: str) -> list:
+    """
+    Imports the endpoint module for the collection on first use and returns its endpoint list.
+    Deprecated collections are specified as "deprecated._module_name".
+    """
+    module = importlib.import_module(f"{__name__}.{collection}")
+
+    return getattr(module, f"{collection.split('.')[-1]}_endpoints")
+
+
+def operation_collection(operation_id: str) -> str:
+    """
+    Returns the name of the collection defining the operation ID, or None if it is not defined.
+    The operation index is only imported when it is first needed.
+    """
+    from ._index import _operation_collections  # pylint: disable=C0415
+
+    return _operation_collections.get(operation_id, None)
+
+
+def __getattr__(name: str):
+    """
+    Endpoint lists are loaded on first access instead of at import time.
+    The combined api_endpoints and deprecated_endpoints lists load every collection.
+    """
+    if name == "deprecated_endpoints":
+        returned = []
+        for collection in _deprecated_collections:
+            returned.extend(load_collection(f"deprecated.{collection}"))
+    elif name == "api_endpoints":
+        # api_endpoints contains all endpoints, production and deprecated
+        returned = []
+        for collection in _collections:
+            returned.extend(load_collection(collection))
+        returned.extend(__getattr__("deprecated_endpoints"))
+    elif name.endswith("_endpoints") and name[:-len("_endpoints")] in _collections:
+        returned = load_collection(name[:-len("_endpoints")])
+    elif name.endswith("_deprecated") and name[:-len("_deprecated")] in _deprecated_collections:
+        returned = load_collection(f"deprecated.{name[:-len('_deprecated')]}")
+    else:
+        raise AttributeError(f"module {__name__} has no attribute {name}")
+    # Cache the result so that subsequent lookups do not return here
+    globals()[name] = returned
+
+    return returned
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) requires Python 3.7, earlier versions load every endpoint list at import time
+    for _collection in _collections:
+        __getattr__(f"{_collection}_endpoints")
+    for _collection in _deprecated_collections:
+        __getattr__(f"{_collection}_deprecated")
+    __getattr__("api_endpoints")
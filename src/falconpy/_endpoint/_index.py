@@ -0,0 +1,504 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+_endpoint._index - Operation ID to endpoint module index (generated, do not edit)
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+
+_operation_collections = {
+    "QueryAWSAccounts": "_cloud_connect_aws",
+    "GetAWSSettings": "_cloud_connect_aws",
+    "GetAWSAccounts": "_cloud_connect_aws",
+    "ProvisionAWSAccounts": "_cloud_connect_aws",
+    "UpdateAWSAccounts": "_cloud_connect_aws",
+    "DeleteAWSAccounts": "_cloud_connect_aws",
+    "CreateOrUpdateAWSSettings": "_cloud_connect_aws",
+    "VerifyAWSAccountAccess": "_cloud_connect_aws",
+    "QueryAWSAccountsForIDs": "_cloud_connect_aws",
+    "GetCSPMAwsAccount": "_cspm_registration",
+    "CreateCSPMAwsAccount": "_cspm_registration",
+    "PatchCSPMAwsAccount": "_cspm_registration",
+    "DeleteCSPMAwsAccount": "_cspm_registration",
+    "GetCSPMAwsConsoleSetupURLs": "_cspm_registration",
+    "GetCSPMAwsAccountScriptsAttachment": "_cspm_registration",
+    "GetCSPMAzureAccount": "_cspm_registration",
+    "CreateCSPMAzureAccount": "_cspm_registration",
+    "DeleteCSPMAzureAccount": "_cspm_registration",
+    "UpdateCSPMAzureAccountClientID": "_cspm_registration",
+    "UpdateCSPMAzureTenantDefaultSubscriptionID": "_cspm_registration",
+    "GetCSPMAzureUserScriptsAttachment": "_cspm_registration",
+    "GetIOAEvents": "_cspm_registration",
+    "GetIOAUsers": "_cspm_registration",
+    "GetCSPMPolicy": "_cspm_registration",
+    "GetCSPMPolicySettings": "_cspm_registration",
+    "UpdateCSPMPolicySettings": "_cspm_registration",
+    "GetCSPMScanSchedule": "_cspm_registration",
+    "UpdateCSPMScanSchedule": "_cspm_registration",
+    "get_patterns": "_custom_ioa",
+    "get_platformsMixin0": "_custom_ioa",
+    "get_rule_groupsMixin0": "_custom_ioa",
+    "create_rule_groupMixin0": "_custom_ioa",
+    "update_rule_groupMixin0": "_custom_ioa",
+    "delete_rule_groupsMixin0": "_custom_ioa",
+    "get_rule_types": "_custom_ioa",
+    "get_rules_get": "_custom_ioa",
+    "get_rulesMixin0": "_custom_ioa",
+    "create_rule": "_custom_ioa",
+    "update_rules": "_custom_ioa",
+    "delete_rules": "_custom_ioa",
+    "validate": "_custom_ioa",
+    "query_patterns": "_custom_ioa",
+    "query_platformsMixin0": "_custom_ioa",
+    "query_rule_groups_full": "_custom_ioa",
+    "query_rule_groupsMixin0": "_custom_ioa",
+    "query_rule_types": "_custom_ioa",
+    "query_rulesMixin0": "_custom_ioa",
+    "GetCSPMAzureUserScripts": "_d4c_registration",
+    "GetCSPMCGPAccount": "_d4c_registration",
+    "CreateCSPMGCPAccount": "_d4c_registration",
+    "GetCSPMGCPUserScriptsAttachment": "_d4c_registration",
+    "GetCSPMGCPUserScripts": "_d4c_registration",
+    "GetAggregateDetects": "_detects",
+    "UpdateDetectsByIdsV2": "_detects",
+    "GetDetectSummaries": "_detects",
+    "QueryDetects": "_detects",
+    "queryCombinedDeviceControlPolicyMembers": "_device_control_policies",
+    "queryCombinedDeviceControlPolicies": "_device_control_policies",
+    "performDeviceControlPoliciesAction": "_device_control_policies",
+    "setDeviceControlPoliciesPrecedence": "_device_control_policies",
+    "getDeviceControlPolicies": "_device_control_policies",
+    "createDeviceControlPolicies": "_device_control_policies",
+    "updateDeviceControlPolicies": "_device_control_policies",
+    "deleteDeviceControlPolicies": "_device_control_policies",
+    "queryDeviceControlPolicyMembers": "_device_control_policies",
+    "queryDeviceControlPolicies": "_device_control_policies",
+    "refreshActiveStreamSession": "_event_streams",
+    "listAvailableStreamsOAuth2": "_event_streams",
+    "AggregateAllowList": "_falcon_complete_dashboard",
+    "AggregateBlockList": "_falcon_complete_dashboard",
+    "AggregateDetections": "_falcon_complete_dashboard",
+    "AggregateDeviceCountCollection": "_falcon_complete_dashboard",
+    "AggregateEscalations": "_falcon_complete_dashboard",
+    "AggregateFCIncidents": "_falcon_complete_dashboard",
+    "AggregateRemediations": "_falcon_complete_dashboard",
+    "QueryAllowListFilter": "_falcon_complete_dashboard",
+    "QueryBlockListFilter": "_falcon_complete_dashboard",
+    "QueryDetectionIdsByFilter": "_falcon_complete_dashboard",
+    "GetDeviceCountCollectionQueriesByFilter": "_falcon_complete_dashboard",
+    "QueryEscalationsFilter": "_falcon_complete_dashboard",
+    "QueryIncidentIdsByFilter": "_falcon_complete_dashboard",
+    "QueryRemediationsFilter": "_falcon_complete_dashboard",
+    "GetArtifacts": "_falconx_sandbox",
+    "GetSummaryReports": "_falconx_sandbox",
+    "GetReports": "_falconx_sandbox",
+    "DeleteReport": "_falconx_sandbox",
+    "GetSubmissions": "_falconx_sandbox",
+    "Submit": "_falconx_sandbox",
+    "QueryReports": "_falconx_sandbox",
+    "QuerySubmissions": "_falconx_sandbox",
+    "GetSampleV2": "_falconx_sandbox",
+    "UploadSampleV2": "_falconx_sandbox",
+    "DeleteSampleV2": "_falconx_sandbox",
+    "QuerySampleV1": "_falconx_sandbox",
+    "aggregate_events": "_firewall_management",
+    "aggregate_policy_rules": "_firewall_management",
+    "aggregate_rule_groups": "_firewall_management",
+    "aggregate_rules": "_firewall_management",
+    "get_events": "_firewall_management",
+    "get_firewall_fields": "_firewall_management",
+    "get_platforms": "_firewall_management",
+    "get_policy_containers": "_firewall_management",
+    "update_policy_container": "_firewall_management",
+    "get_rule_groups": "_firewall_management",
+    "create_rule_group": "_firewall_management",
+    "update_rule_group": "_firewall_management",
+    "delete_rule_groups": "_firewall_management",
+    "get_rules": "_firewall_management",
+    "query_events": "_firewall_management",
+    "query_firewall_fields": "_firewall_management",
+    "query_platforms": "_firewall_management",
+    "query_policy_rules": "_firewall_management",
+    "query_rule_groups": "_firewall_management",
+    "query_rules": "_firewall_management",
+    "queryCombinedFirewallPolicyMembers": "_firewall_policies",
+    "queryCombinedFirewallPolicies": "_firewall_policies",
+    "performFirewallPoliciesAction": "_firewall_policies",
+    "setFirewallPoliciesPrecedence": "_firewall_policies",
+    "getFirewallPolicies": "_firewall_policies",
+    "createFirewallPolicies": "_firewall_policies",
+    "updateFirewallPolicies": "_firewall_policies",
+    "deleteFirewallPolicies": "_firewall_policies",
+    "queryFirewallPolicyMembers": "_firewall_policies",
+    "queryFirewallPolicies": "_firewall_policies",
+    "queryCombinedGroupMembers": "_host_group",
+    "queryCombinedHostGroups": "_host_group",
+    "performGroupAction": "_host_group",
+    "getHostGroups": "_host_group",
+    "createHostGroups": "_host_group",
+    "updateHostGroups": "_host_group",
+    "deleteHostGroups": "_host_group",
+    "queryGroupMembers": "_host_group",
+    "queryHostGroups": "_host_group",
+    "QueryDeviceLoginHistory": "_hosts",
+    "QueryGetNetworkAddressHistoryV1": "_hosts",
+    "PerformActionV2": "_hosts",
+    "UpdateDeviceTags": "_hosts",
+    "GetDeviceDetails": "_hosts",
+    "QueryHiddenDevices": "_hosts",
+    "QueryDevicesByFilterScroll": "_hosts",
+    "QueryDevicesByFilter": "_hosts",
+    "api_preempt_proxy_post_graphql": "_identity_protection",
+    "CrowdScore": "_incidents",
+    "GetBehaviors": "_incidents",
+    "PerformIncidentAction": "_incidents",
+    "GetIncidents": "_incidents",
+    "QueryBehaviors": "_incidents",
+    "QueryIncidents": "_incidents",
+    "audit_events_read": "_installation_tokens",
+    "customer_settings_read": "_installation_tokens",
+    "tokens_read": "_installation_tokens",
+    "tokens_create": "_installation_tokens",
+    "tokens_update": "_installation_tokens",
+    "tokens_delete": "_installation_tokens",
+    "audit_events_query": "_installation_tokens",
+    "tokens_query": "_installation_tokens",
+    "QueryIntelActorEntities": "_intel",
+    "QueryIntelIndicatorEntities": "_intel",
+    "QueryIntelReportEntities": "_intel",
+    "GetIntelActorEntities": "_intel",
+    "GetIntelIndicatorEntities": "_intel",
+    "GetIntelReportPDF": "_intel",
+    "GetIntelReportEntities": "_intel",
+    "GetIntelRuleFile": "_intel",
+    "GetLatestIntelRuleFile": "_intel",
+    "GetIntelRuleEntities": "_intel",
+    "QueryIntelActorIds": "_intel",
+    "QueryIntelIndicatorIds": "_intel",
+    "QueryIntelReportIds": "_intel",
+    "QueryIntelRuleIds": "_intel",
+    "getIOAExclusionsV1": "_ioa_exclusions",
+    "createIOAExclusionsV1": "_ioa_exclusions",
+    "updateIOAExclusionsV1": "_ioa_exclusions",
+    "deleteIOAExclusionsV1": "_ioa_exclusions",
+    "queryIOAExclusionsV1": "_ioa_exclusions",
+    "indicator_combined_v1": "_ioc",
+    "indicator_get_v1": "_ioc",
+    "indicator_create_v1": "_ioc",
+    "indicator_update_v1": "_ioc",
+    "indicator_delete_v1": "_ioc",
+    "indicator_search_v1": "_ioc",
+    "DevicesCount": "_iocs",
+    "GetIOC": "_iocs",
+    "CreateIOC": "_iocs",
+    "UpdateIOC": "_iocs",
+    "DeleteIOC": "_iocs",
+    "DevicesRanOn": "_iocs",
+    "QueryIOCs": "_iocs",
+    "ProcessesRanOn": "_iocs",
+    "entities_processes": "_iocs",
+    "GetAWSAccountsMixin0": "_kubernetes_protection",
+    "CreateAWSAccount": "_kubernetes_protection",
+    "UpdateAWSAccount": "_kubernetes_protection",
+    "DeleteAWSAccountsMixin0": "_kubernetes_protection",
+    "GetLocations": "_kubernetes_protection",
+    "GetHelmValuesYaml": "_kubernetes_protection",
+    "RegenerateAPIKey": "_kubernetes_protection",
+    "GetClusters": "_kubernetes_protection",
+    "TriggerScan": "_kubernetes_protection",
+    "GetMalQueryQuotasV1": "_malquery",
+    "PostMalQueryFuzzySearchV1": "_malquery",
+    "GetMalQueryDownloadV1": "_malquery",
+    "GetMalQueryMetadataV1": "_malquery",
+    "GetMalQueryRequestV1": "_malquery",
+    "GetMalQueryEntitiesSamplesFetchV1": "_malquery",
+    "PostMalQueryEntitiesSamplesMultidownloadV1": "_malquery",
+    "PostMalQueryExactSearchV1": "_malquery",
+    "PostMalQueryHuntV1": "_malquery",
+    "getMLExclusionsV1": "_ml_exclusions",
+    "createMLExclusionsV1": "_ml_exclusions",
+    "updateMLExclusionsV1": "_ml_exclusions",
+    "deleteMLExclusionsV1": "_ml_exclusions",
+    "queryMLExclusionsV1": "_ml_exclusions",
+    "getChildren": "_mssp",
+    "getCIDGroupMembersBy": "_mssp",
+    "addCIDGroupMembers": "_mssp",
+    "deleteCIDGroupMembers": "_mssp",
+    "getCIDGroupById": "_mssp",
+    "createCIDGroups": "_mssp",
+    "updateCIDGroups": "_mssp",
+    "deleteCIDGroups": "_mssp",
+    "getRolesByID": "_mssp",
+    "addRole": "_mssp",
+    "deletedRoles": "_mssp",
+    "getUserGroupMembersByID": "_mssp",
+    "addUserGroupMembers": "_mssp",
+    "deleteUserGroupMembers": "_mssp",
+    "getUserGroupsByID": "_mssp",
+    "createUserGroups": "_mssp",
+    "updateUserGroups": "_mssp",
+    "deleteUserGroups": "_mssp",
+    "queryChildren": "_mssp",
+    "queryCIDGroupMembers": "_mssp",
+    "queryCIDGroups": "_mssp",
+    "queryRoles": "_mssp",
+    "queryUserGroupMembers": "_mssp",
+    "queryUserGroups": "_mssp",
+    "oauth2RevokeToken": "_oauth2",
+    "oauth2AccessToken": "_oauth2",
+    "AggregatesDetectionsGlobalCounts": "_overwatch_dashboard",
+    "AggregatesEventsCollections": "_overwatch_dashboard",
+    "AggregatesEvents": "_overwatch_dashboard",
+    "AggregatesIncidentsGlobalCounts": "_overwatch_dashboard",
+    "AggregatesOWEventsGlobalCounts": "_overwatch_dashboard",
+    "queryCombinedPreventionPolicyMembers": "_prevention_policies",
+    "queryCombinedPreventionPolicies": "_prevention_policies",
+    "performPreventionPoliciesAction": "_prevention_policies",
+    "setPreventionPoliciesPrecedence": "_prevention_policies",
+    "getPreventionPolicies": "_prevention_policies",
+    "createPreventionPolicies": "_prevention_policies",
+    "updatePreventionPolicies": "_prevention_policies",
+    "deletePreventionPolicies": "_prevention_policies",
+    "queryPreventionPolicyMembers": "_prevention_policies",
+    "queryPreventionPolicies": "_prevention_policies",
+    "ActionUpdateCount": "_quarantine",
+    "GetAggregateFiles": "_quarantine",
+    "GetQuarantineFiles": "_quarantine",
+    "UpdateQuarantinedDetectsByIds": "_quarantine",
+    "QueryQuarantineFiles": "_quarantine",
+    "UpdateQfByQuery": "_quarantine",
+    "GetScansAggregates": "_quick_scan",
+    "GetScans": "_quick_scan",
+    "ScanSamples": "_quick_scan",
+    "QuerySubmissionsMixin0": "_quick_scan",
+    "RTR_AggregateSessions": "_real_time_response",
+    "BatchActiveResponderCmd": "_real_time_response",
+    "BatchCmd": "_real_time_response",
+    "BatchGetCmdStatus": "_real_time_response",
+    "BatchGetCmd": "_real_time_response",
+    "BatchInitSessions": "_real_time_response",
+    "BatchRefreshSessions": "_real_time_response",
+    "RTR_CheckActiveResponderCommandStatus": "_real_time_response",
+    "RTR_ExecuteActiveResponderCommand": "_real_time_response",
+    "RTR_CheckCommandStatus": "_real_time_response",
+    "RTR_ExecuteCommand": "_real_time_response",
+    "RTR_GetExtractedFileContents": "_real_time_response",
+    "RTR_ListFiles": "_real_time_response",
+    "RTR_DeleteFile": "_real_time_response",
+    "RTR_ListQueuedSessions": "_real_time_response",
+    "RTR_DeleteQueuedSession": "_real_time_response",
+    "RTR_PulseSession": "_real_time_response",
+    "RTR_ListSessions": "_real_time_response",
+    "RTR_InitSession": "_real_time_response",
+    "RTR_DeleteSession": "_real_time_response",
+    "RTR_ListAllSessions": "_real_time_response",
+    "BatchAdminCmd": "_real_time_response_admin",
+    "RTR_CheckAdminCommandStatus": "_real_time_response_admin",
+    "RTR_ExecuteAdminCommand": "_real_time_response_admin",
+    "RTR_GetPut_Files": "_real_time_response_admin",
+    "RTR_CreatePut_Files": "_real_time_response_admin",
+    "RTR_DeletePut_Files": "_real_time_response_admin",
+    "RTR_GetScripts": "_real_time_response_admin",
+    "RTR_CreateScripts": "_real_time_response_admin",
+    "RTR_UpdateScripts": "_real_time_response_admin",
+    "RTR_DeleteScripts": "_real_time_response_admin",
+    "RTR_ListPut_Files": "_real_time_response_admin",
+    "RTR_ListScripts": "_real_time_response_admin",
+    "AggregateNotificationsV1": "_recon",
+    "PreviewRuleV1": "_recon",
+    "GetActionsV1": "_recon",
+    "CreateActionsV1": "_recon",
+    "UpdateActionV1": "_recon",
+    "DeleteActionV1": "_recon",
+    "GetNotificationsDetailedTranslatedV1": "_recon",
+    "GetNotificationsDetailedV1": "_recon",
+    "GetNotificationsTranslatedV1": "_recon",
+    "GetNotificationsV1": "_recon",
+    "UpdateNotificationsV1": "_recon",
+    "DeleteNotificationsV1": "_recon",
+    "GetRulesV1": "_recon",
+    "CreateRulesV1": "_recon",
+    "UpdateRulesV1": "_recon",
+    "DeleteRulesV1": "_recon",
+    "QueryActionsV1": "_recon",
+    "QueryNotificationsV1": "_recon",
+    "QueryRulesV1": "_recon",
+    "report_executions_download_get": "_report_executions",
+    "report_executions_get": "_report_executions",
+    "report_executions_query": "_report_executions",
+    "queryCombinedRTResponsePolicyMembers": "_response_policies",
+    "queryCombinedRTResponsePolicies": "_response_policies",
+    "performRTResponsePoliciesAction": "_response_policies",
+    "setRTResponsePoliciesPrecedence": "_response_policies",
+    "getRTResponsePolicies": "_response_policies",
+    "createRTResponsePolicies": "_response_policies",
+    "updateRTResponsePolicies": "_response_policies",
+    "deleteRTResponsePolicies": "_response_policies",
+    "queryRTResponsePolicyMembers": "_response_policies",
+    "queryRTResponsePolicies": "_response_policies",
+    "GetSampleV3": "_sample_uploads",
+    "UploadSampleV3": "_sample_uploads",
+    "DeleteSampleV3": "_sample_uploads",
+    "scheduled_reports_get": "_scheduled_reports",
+    "scheduled_reports_query": "_scheduled_reports",
+    "GetCombinedSensorInstallersByQuery": "_sensor_download",
+    "DownloadSensorInstallerById": "_sensor_download",
+    "GetSensorInstallersEntities": "_sensor_download",
+    "GetSensorInstallersCCIDByQuery": "_sensor_download",
+    "GetSensorInstallersByQuery": "_sensor_download",
+    "revealUninstallToken": "_sensor_update_policies",
+    "queryCombinedSensorUpdateBuilds": "_sensor_update_policies",
+    "queryCombinedSensorUpdatePolicyMembers": "_sensor_update_policies",
+    "queryCombinedSensorUpdatePolicies": "_sensor_update_policies",
+    "queryCombinedSensorUpdatePoliciesV2": "_sensor_update_policies",
+    "performSensorUpdatePoliciesAction": "_sensor_update_policies",
+    "setSensorUpdatePoliciesPrecedence": "_sensor_update_policies",
+    "getSensorUpdatePolicies": "_sensor_update_policies",
+    "createSensorUpdatePolicies": "_sensor_update_policies",
+    "updateSensorUpdatePolicies": "_sensor_update_policies",
+    "deleteSensorUpdatePolicies": "_sensor_update_policies",
+    "getSensorUpdatePoliciesV2": "_sensor_update_policies",
+    "createSensorUpdatePoliciesV2": "_sensor_update_policies",
+    "updateSensorUpdatePoliciesV2": "_sensor_update_policies",
+    "querySensorUpdatePolicyMembers": "_sensor_update_policies",
+    "querySensorUpdatePolicies": "_sensor_update_policies",
+    "getSensorVisibilityExclusionsV1": "_sensor_visibility_exclusions",
+    "createSVExclusionsV1": "_sensor_visibility_exclusions",
+    "updateSensorVisibilityExclusionsV1": "_sensor_visibility_exclusions",
+    "deleteSensorVisibilityExclusionsV1": "_sensor_visibility_exclusions",
+    "querySensorVisibilityExclusionsV1": "_sensor_visibility_exclusions",
+    "getRemediationsV2": "_spotlight_vulnerabilities",
+    "getVulnerabilities": "_spotlight_vulnerabilities",
+    "queryVulnerabilities": "_spotlight_vulnerabilities",
+    "getRemediations": "_spotlight_vulnerabilities",
+    "GetRoles": "_user_management",
+    "GrantUserRoleIds": "_user_management",
+    "RevokeUserRoleIds": "_user_management",
+    "GetAvailableRoleIds": "_user_management",
+    "GetUserRoleIds": "_user_management",
+    "RetrieveUser": "_user_management",
+    "CreateUser": "_user_management",
+    "UpdateUser": "_user_management",
+    "DeleteUser": "_user_management",
+    "RetrieveEmailsByCID": "_user_management",
+    "RetrieveUserUUIDsByCID": "_user_management",
+    "RetrieveUserUUID": "_user_management",
+    "getAssessmentV1": "_zero_trust_assessment",
+    "getComplianceV1": "_zero_trust_assessment",
+    "get-patterns": "deprecated._custom_ioa",
+    "get-platformsMixin0": "deprecated._custom_ioa",
+    "get-rule-groupsMixin0": "deprecated._custom_ioa",
+    "create-rule-groupMixin0": "deprecated._custom_ioa",
+    "update-rule-groupMixin0": "deprecated._custom_ioa",
+    "delete-rule-groupsMixin0": "deprecated._custom_ioa",
+    "get-rule-types": "deprecated._custom_ioa",
+    "get-rules-get": "deprecated._custom_ioa",
+    "get-rulesMixin0": "deprecated._custom_ioa",
+    "create-rule": "deprecated._custom_ioa",
+    "update-rules": "deprecated._custom_ioa",
+    "delete-rules": "deprecated._custom_ioa",
+    "query-patterns": "deprecated._custom_ioa",
+    "query-platformsMixin0": "deprecated._custom_ioa",
+    "query-rule-groups-full": "deprecated._custom_ioa",
+    "query-rule-groupsMixin0": "deprecated._custom_ioa",
+    "query-rule-types": "deprecated._custom_ioa",
+    "query-rulesMixin0": "deprecated._custom_ioa",
+    "aggregate-events": "deprecated._firewall_management",
+    "aggregate-policy-rules": "deprecated._firewall_management",
+    "aggregate-rule-groups": "deprecated._firewall_management",
+    "aggregate-rules": "deprecated._firewall_management",
+    "get-events": "deprecated._firewall_management",
+    "get-firewall-fields": "deprecated._firewall_management",
+    "get-platforms": "deprecated._firewall_management",
+    "get-policy-containers": "deprecated._firewall_management",
+    "update-policy-container": "deprecated._firewall_management",
+    "get-rule-groups": "deprecated._firewall_management",
+    "create-rule-group": "deprecated._firewall_management",
+    "update-rule-group": "deprecated._firewall_management",
+    "delete-rule-groups": "deprecated._firewall_management",
+    "get-rules": "deprecated._firewall_management",
+    "query-events": "deprecated._firewall_management",
+    "query-firewall-fields": "deprecated._firewall_management",
+    "query-platforms": "deprecated._firewall_management",
+    "query-policy-rules": "deprecated._firewall_management",
+    "query-rule-groups": "deprecated._firewall_management",
+    "query-rules": "deprecated._firewall_management",
+    "api.preempt.proxy.post.graphql": "deprecated._identity_protection",
+    "audit-events-read": "deprecated._installation_tokens",
+    "customer-settings-read": "deprecated._installation_tokens",
+    "tokens-read": "deprecated._installation_tokens",
+    "tokens-create": "deprecated._installation_tokens",
+    "tokens-update": "deprecated._installation_tokens",
+    "tokens-delete": "deprecated._installation_tokens",
+    "audit-events-query": "deprecated._installation_tokens",
+    "tokens-query": "deprecated._installation_tokens",
+    "indicator.combined.v1": "deprecated._ioc",
+    "indicator.get.v1": "deprecated._ioc",
+    "indicator.create.v1": "deprecated._ioc",
+    "indicator.update.v1": "deprecated._ioc",
+    "indicator.delete.v1": "deprecated._ioc",
+    "indicator.search.v1": "deprecated._ioc",
+    "entities.processes": "deprecated._iocs",
+    "RTR-AggregateSessions": "deprecated._real_time_response",
+    "RTR-CheckActiveResponderCommandStatus": "deprecated._real_time_response",
+    "RTR-ExecuteActiveResponderCommand": "deprecated._real_time_response",
+    "RTR-CheckCommandStatus": "deprecated._real_time_response",
+    "RTR-ExecuteCommand": "deprecated._real_time_response",
+    "RTR-GetExtractedFileContents": "deprecated._real_time_response",
+    "RTR-ListFiles": "deprecated._real_time_response",
+    "RTR-DeleteFile": "deprecated._real_time_response",
+    "RTR-ListQueuedSessions": "deprecated._real_time_response",
+    "RTR-DeleteQueuedSession": "deprecated._real_time_response",
+    "RTR-PulseSession": "deprecated._real_time_response",
+    "RTR-ListSessions": "deprecated._real_time_response",
+    "RTR-InitSession": "deprecated._real_time_response",
+    "RTR-DeleteSession": "deprecated._real_time_response",
+    "RTR-ListAllSessions": "deprecated._real_time_response",
+    "RTR-CheckAdminCommandStatus": "deprecated._real_time_response_admin",
+    "RTR-ExecuteAdminCommand": "deprecated._real_time_response_admin",
+    "RTR-GetPut-Files": "deprecated._real_time_response_admin",
+    "RTR-CreatePut-Files": "deprecated._real_time_response_admin",
+    "RTR-DeletePut-Files": "deprecated._real_time_response_admin",
+    "RTR-GetScripts": "deprecated._real_time_response_admin",
+    "RTR-CreateScripts": "deprecated._real_time_response_admin",
+    "RTR-UpdateScripts": "deprecated._real_time_response_admin",
+    "RTR-DeleteScripts": "deprecated._real_time_response_admin",
+    "RTR-ListPut-Files": "deprecated._real_time_response_admin",
+    "RTR-ListScripts": "deprecated._real_time_response_admin",
+    "report-executions-download.get": "deprecated._report_executions",
+    "report-executions.get": "deprecated._report_executions",
+    "report-executions.query": "deprecated._report_executions",
+    "scheduled-reports.get": "deprecated._scheduled_reports",
+    "scheduled-reports.query": "deprecated._scheduled_reports"
+}
@@ -30,24 +30,40 @@
 # These operation IDs are maintained for backwards compatibility purposes only, Move all code
 # references to use the new operations IDs defined above that align with the IDs defined in
 # the service classes.
-from ._custom_ioa import _custom_ioa_endpoints
-from ._firewall_management import _firewall_management_endpoints
-from ._identity_protection import _identity_protection_endpoints
-from ._installation_tokens import _installation_tokens_endpoints
-from ._ioc import _ioc_endpoints
-from ._iocs import _iocs_endpoints
-from ._real_time_response import _real_time_response_endpoints
-from ._real_time_response_admin import _real_time_response_admin_endpoints
-from ._report_executions import _report_executions_endpoints
-from ._scheduled_reports import _scheduled_reports_endpoints
+import importlib
+import sys
 
-_custom_ioa_deprecated = _custom_ioa_endpoints
-_firewall_management_deprecated = _firewall_management_endpoints
-_identity_protection_deprecated = _identity_protection_endpoints
-_installation_tokens_deprecated = _installation_tokens_endpoints
-_ioc_deprecated = _ioc_endpoints
-_iocs_deprecated = _iocs_endpoints
-_real_time_response_deprecated = _real_time_response_endpoints
-_real_time_response_admin_deprecated = _real_time_response_admin_endpoints
-_report_executions_deprecated = _report_executions_endpoints
-_scheduled_reports_deprecated = _scheduled_reports_endpoints
+_deprecated_collections = [
+    "_custom_ioa",
+    "_firewall_management",
+    "_identity_protection",
+    "_installation_tokens",
+    "_ioc",
+    "_iocs",
+    "_real_time_response",
+    "_real_time_response_admin",
+    "_report_executions",
+    "_scheduled_reports"
+]
+
+
+def __getattr__(name: str):
+    """
+    Deprecated endpoint lists are loaded on first access instead of at import time.
+    """
+    if name.endswith("_deprecated") and name[:-len("_deprecated")] in _deprecated_collections:
+        collection = name[:-len("_deprecated")]
+        module = importlib.import_module(f"{__name__}.{collection}")
+        returned = getattr(module, f"{collection}_endpoints")
+    else:
+        raise AttributeError(f"module {__name__} has no attribute {name}")
+    # Cache the result so that subsequent lookups do not return here
+    globals()[name] = returned
+
+    return returned
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) requires Python 3.7, earlier versions load every endpoint list at import time
+    for _collection in _deprecated_collections:
+        __getattr__(f"{_collection}_deprecated")
@@ -0,0 +1,162 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+_rate_limit - Client-side rate limiting for the CrowdStrike Falcon API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+import time
+
+# Number of times a request is retried after receiving a 429 response
+_RATE_LIMIT_RETRIES = 5
+# The API limit is expressed as requests per minute
+_RATE_LIMIT_PERIOD = 60
+# Wait used when a 429 response does not specify when to retry
+_RATE_LIMIT_DEFAULT_WAIT = 1
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every thread and Service Class using the same credentials.
+
+    The bucket is sized using the X-RateLimit-Limit response header, refilled at the rate it
+    allows, and corrected using X-RateLimit-Remaining after every response. Once the remaining
+    allowance is spent requests are spaced out at the refill rate instead of receiving 429 responses.
+    When a 429 response is received, every request waits until the time specified by the
+    X-Ratelimit-Retryafter header and the throttled request is retried.
+
+    Until the first response is received no limit is known and requests are not delayed.
+    """
+    def __init__(self: object, max_retries: int = _RATE_LIMIT_RETRIES) -> object:
+        """
+        Initializes the bucket and its metrics.
+        """
+        self.max_retries = max_retries
+        self.lock = threading.Lock()
+        self.limit = None
+        self.remaining = None
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.throttled_time = 0.0
+        self.retries = 0
+
+    def _refill(self: object, now: float) -> None:
+        """
+        Adds the tokens accrued since the last update. Must be called while holding the lock.
+        """
+        if self.limit:
+            self.tokens = min(float(self.limit), self.tokens + (now - self.updated) * self.limit / _RATE_LIMIT_PERIOD)
+        self.updated = now
+
+    def reserve(self: object) -> float:
+        """
+        Reserves capacity for a request, returning the number of seconds to wait before performing it.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.requests += 1
+            delay = max(self.blocked_until - now, 0)
+            if self.limit:
+                self.tokens -= 1
+                if self.tokens < 0:
+                    delay = max(delay, -self.tokens * _RATE_LIMIT_PERIOD / self.limit)
+            if delay:
+                self.throttled += 1
+                self.throttled_time += delay
+
+        return delay
+
+    def wait(self: object) -> None:
+        """
+        Blocks until capacity is available for a request.
+        """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    def update(self: object, status_code: int, headers: dict) -> None:
+        """
+        Updates the bucket using the rate limit headers of a response.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            known = bool(self.limit)
+            try:
+                self.limit = int(headers.get("X-RateLimit-Limit", self.limit))
+                self.remaining = int(headers.get("X-RateLimit-Remaining", self.remaining))
+                # Requests already reserved but not yet answered are accounted for by the bucket
+                self.tokens = min(self.tokens, float(self.remaining)) if known else float(self.remaining)
+            except (TypeError, ValueError):
+                pass  # Response does not contain rate limit headers
+            if status_code == 429:
+                wait = _RATE_LIMIT_DEFAULT_WAIT
+                try:
+                    # The header contains the epoch time at which requests are accepted again
+                    wait = max(float(headers.get("X-Ratelimit-Retryafter")) - time.time(), 0)
+                except (TypeError, ValueError):
+                    pass
+                self.blocked_until = max(self.blocked_until, now + wait)
+                self.tokens = min(self.tokens, 0.0)
+
+    def retry(self: object, status_code: int, attempt: int) -> bool:
+        """
+        Returns a boolean indicating if a request that received the status code should be retried.
+        attempt is the number of retries already performed for the request.
+        """
+        returned = bool(status_code == 429 and attempt < self.max_retries)
+        if returned:
+            with self.lock:
+                self.retries += 1
+
+        return returned
+
+    def metrics(self: object) -> dict:
+        """
+        Returns the rate limit state and the time spent throttled.
+        """
+        with self.lock:
+            return {
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "throttled_time": self.throttled_time,
+                "retries": self.retries
+            }
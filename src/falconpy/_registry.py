@@ -0,0 +1,205 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+_registry - Operation registry for constant time API endpoint lookups
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import re
+from ._endpoint import load_collection, operation_collection
+# pylint: disable=R0903  # Using a class so that the record has attributes
+
+# Intel indicator queries return a Next-Page header containing a _marker filter, allowing them to page past the offset limit
+_MARKER_OPERATIONS = frozenset(["QueryIntelIndicatorEntities", "QueryIntelIndicatorIds"])
+
+
+# Maximum number of IDs per request, when not stated by the endpoint definition
+_ID_LIMIT_QUERY = 100  # Keeps the query string within common URL length limits
+_ID_LIMIT_BODY = 500
+_ID_LIMIT_PATTERN = re.compile(r"\(max:? (\d+)\)|max (\d+) per request", re.IGNORECASE)
+
+
+def id_location(params: dict) -> str:
+    """
+    Returns where an entity operation accepts IDs, "query" or "body", or None if it does not accept IDs.
+    Body payloads are assumed to contain an ids list.
+    """
+    returned = None
+    if params.get("ids", {}).get("in", None) == "query":
+        returned = "query"
+    elif "body" in params and "ids" in params["body"].get("description", "ids").lower():
+        returned = "body"
+
+    return returned
+
+
+def id_limit(params: dict, location: str) -> int:
+    """
+    Returns the maximum number of IDs accepted per request, as stated by the endpoint definition or the default.
+    """
+    returned = None
+    if location:
+        returned = _ID_LIMIT_QUERY if location == "query" else _ID_LIMIT_BODY
+        found = _ID_LIMIT_PATTERN.search(params["ids" if location == "query" else "body"].get("description", ""))
+        if found:
+            returned = int(found.group(1) or found.group(2))
+
+    return returned
+
+
+# Methods that can safely be repeated
+_IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE"])
+# POST operations that only retrieve or aggregate entities (their endpoints end in /GET/v1)
+_READ_OPERATIONS = frozenset([
+    "GetAggregateDetects", "GetAggregateFiles", "GetBehaviors", "GetDetectSummaries", "GetIncidents",
+    "GetIntelIndicatorEntities", "GetQuarantineFiles", "GetScansAggregates", "get-rules-get", "get_rules_get",
+    "AggregateAllowList", "AggregateBlockList", "AggregateDetections", "AggregateDeviceCountCollection",
+    "AggregateEscalations", "AggregateFCIncidents", "AggregateNotificationsV1", "AggregateRemediations",
+    "AggregatesEvents", "AggregatesEventsCollections", "PreviewRuleV1", "QuerySampleV1",
+    "RTR-AggregateSessions", "RTR-ListQueuedSessions", "RTR-ListSessions",
+    "RTR_AggregateSessions", "RTR_ListQueuedSessions", "RTR_ListSessions",
+    "aggregate-events", "aggregate-policy-rules", "aggregate-rule-groups", "aggregate-rules",
+    "aggregate_events", "aggregate_policy_rules", "aggregate_rule_groups", "aggregate_rules"
+    ])
+
+
+def is_idempotent(operation_id: str, method: str) -> bool:
+    """
+    Determines if an operation can safely be retried. PATCH operations are not retried, as updates
+    are not guaranteed to be idempotent. POST operations that only read entities (GetDetectSummaries,
+    GetIncidents, etc.) are listed in _READ_OPERATIONS and are also considered idempotent.
+    """
+    return bool(method.upper() in _IDEMPOTENT_METHODS or operation_id in _READ_OPERATIONS)
+
+
+def pagination_style(operation_id: str, params: dict) -> str:
+    """
+    Determines the pagination style of an operation from its parameter definitions.
+    Returns "after", "marker", "token" (offset is a scroll token), "offset", or None if the operation does not paginate.
+    """
+    returned = None
+    if "after" in params:
+        returned = "after"
+    elif "offset" in params:
+        returned = "offset"
+        if operation_id in _MARKER_OPERATIONS:
+            returned = "marker"
+        elif params["offset"].get("type", None) == "string" and "next result set" in params["offset"].get("description", ""):
+            returned = "token"
+
+    return returned
+
+
+class Operation:
+    """
+    Precomputed record for a single API operation.
+
+    Built once from an endpoint definition so that per-call dispatch does not
+    need to rescan the endpoint list or the operation's parameter list.
+    """
+    __slots__ = ["operation_id", "method", "url", "path", "collection", "params", "array_params",
+                 "pagination", "id_location", "id_limit",
+                 "idempotent"
+                 ]
+
+    def __init__(self: object, endpoint: list) -> object:
+        """
+        Instantiates the record from an endpoint definition.
+        [operation_id, method, url, description, collection, parameters]
+        """
+        self.operation_id = endpoint[0]
+        self.method = endpoint[1]
+        self.url = endpoint[2]
+        # ID replacement is performed here so it only happens once per operation
+        self.path = endpoint[2].replace("?ids={}", "")
+        self.collection = endpoint[4]
+        self.params = {param["name"]: param for param in endpoint[5]}
+        self.array_params = frozenset(
+            param["name"] for param in endpoint[5] if param.get("type", None) == "array"
+            )
+        self.pagination = pagination_style(self.operation_id, self.params)
+        self.id_location = id_location(self.params)
+        self.id_limit = id_limit(self.params, self.id_location)
+        self.idempotent = is_idempotent(self.operation_id, self.method)
+
+
+# Operation lookups, keyed by the id of the endpoint list they were built from
+_INDEXES = {}
+
+
+def build_operation_index(endpoints: list) -> dict:
+    """
+    Builds a dictionary of Operation records keyed by operation ID.
+    When an operation ID is defined more than once, the first definition is used.
+    """
+    index = {}
+    for endpoint in endpoints:
+        if endpoint[0] not in index:
+            index[endpoint[0]] = Operation(endpoint)
+
+    return index
+
+
+def operation_index(endpoints: list) -> dict:
+    """
+    Returns the operation lookup for the provided endpoint list, building it on first use.
+    """
+    entry = _INDEXES.get(id(endpoints), None)
+    # Confirm the entry was built from this list and not a prior list that shared its id
+    if not entry or entry[0] is not endpoints:
+        entry = (endpoints, build_operation_index(endpoints))
+        _INDEXES[id(endpoints)] = entry
+
+    return entry[1]
+
+
+def find_operation(endpoints: list, operation_id: str) -> Operation:
+    """
+    Retrieves the Operation record for the operation ID from the provided endpoint list.
+    Returns None if the operation ID is not found.
+    """
+    return operation_index(endpoints).get(operation_id, None)
+
+
+def uber_operation(operation_id: str) -> Operation:
+    """
+    Retrieves the Operation record for any operation ID available to the Uber class.
+    Only the endpoint module defining the operation is loaded. Returns None if the operation ID is not found.
+    """
+    returned = None
+    collection = operation_collection(operation_id)
+    if collection:
+        returned = find_operation(load_collection(collection), operation_id)
+
+    return returned
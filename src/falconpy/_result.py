@@ -37,6 +37,10 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 # pylint: disable=R0903  # Using a class so that the data structure is callable
+import json
+
+# Body of results whose response content is empty or cannot be decoded, matches generate_ok_result
+_NO_CONTENT_BODY = {"message": "No content returned", "resources": []}
 
 
 class Result:
@@ -58,3 +62,136 @@ class Result:
         self.result_obj['body'] = body
 
         return self.result_obj
+
+
+class LazyResult(dict):
+    """
+    Result dictionary for JSON responses that retains the raw response content.
+
+    The body is decoded the first time it is accessed, and the headers are copied into a standard
+    dictionary the first time they are accessed. Results forwarded without inspecting the body
+    (using raw or content) are never decoded. In every other respect the result behaves as the
+    dictionary returned by Result, containing status_code, headers and body.
+    """
+    def __init__(self: object, status_code: int, headers, content: bytes, loads: callable = None) -> dict:
+        """
+        Initializes the result. No decoding is performed. The body is decoded using
+        the loads callable when specified, or the standard library otherwise.
+        """
+        super().__init__(status_code=status_code)
+        self._headers = headers
+        self._content = content
+        self._loads = loads or json.loads
+
+    @property
+    def content(self: object) -> bytes:
+        """
+        Returns the raw response content.
+        """
+        return self._content
+
+    @property
+    def raw(self: object) -> memoryview:
+        """
+        Returns a read-only view of the raw response content, without copying it.
+        """
+        return memoryview(self._content)
+
+    @property
+    def decoded(self: object) -> bool:
+        """
+        Returns a boolean indicating if the body has been decoded.
+        """
+        return dict.__contains__(self, "body")
+
+    def _materialize(self: object, key: str = None) -> None:
+        """
+        Populates the headers and / or body, as required for the key specified (or both when key is None).
+        """
+        if key in (None, "headers") and not dict.__contains__(self, "headers"):
+            dict.__setitem__(self, "headers", dict(self._headers))  # force standard dictionary to prevent json issues
+        if key in (None, "body") and not dict.__contains__(self, "body"):
+            try:
+                body = self._loads(self._content)
+            except ValueError:
+                # No response content, but a successful request was made
+                body = dict(_NO_CONTENT_BODY)
+            dict.__setitem__(self, "body", body)
+
+    def __getitem__(self: object, key: str):
+        self._materialize(key)
+        return dict.__getitem__(self, key)
+
+    def get(self: object, key: str, default=None):
+        self._materialize(key)
+        return dict.get(self, key, default)
+
+    def __contains__(self: object, key: str) -> bool:
+        return key in ("status_code", "headers", "body") or dict.__contains__(self, key)
+
+    def __iter__(self: object):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def __len__(self: object) -> int:
+        self._materialize()
+        return dict.__len__(self)
+
+    def __repr__(self: object) -> str:
+        self._materialize()
+        return dict.__repr__(self)
+
+    def __eq__(self: object, other: object) -> bool:
+        self._materialize()
+        if isinstance(other, LazyResult):
+            other._materialize()  # pylint: disable=W0212  # Comparisons read the underlying dictionary
+        return dict.__eq__(self, other)
+
+    def __ne__(self: object, other: object) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __setitem__(self: object, key: str, value) -> None:
+        self._materialize()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self: object, key: str) -> None:
+        self._materialize()
+        dict.__delitem__(self, key)
+
+    def __reduce__(self: object):
+        self._materialize()
+        return (dict, (dict(dict.items(self)),))
+
+    def keys(self: object):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self: object):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self: object):
+        self._materialize()
+        return dict.items(self)
+
+    def copy(self: object) -> dict:
+        self._materialize()
+        return dict(dict.items(self))
+
+    def pop(self: object, key: str, *args):
+        self._materialize()
+        return dict.pop(self, key, *args)
+
+    def popitem(self: object) -> tuple:
+        self._materialize()
+        return dict.popitem(self)
+
+    def setdefault(self: object, key: str, default=None):
+        self._materialize()
+        return dict.setdefault(self, key, default)
+
+    def update(self: object, *args, **kwargs) -> None:
+        self._materialize()
+        dict.update(self, *args, **kwargs)
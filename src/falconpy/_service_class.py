@@ -36,7 +36,12 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
+from ._util import create_session, _POOL_CONNECTIONS, _POOL_MAXSIZE
+from ._registry import uber_operation
 from .oauth2 import OAuth2 as FalconAuth
+from .paginator import Paginator
+from .hydrator import Hydrator, _HYDRATE_WORKERS
+from .codec import json_codec as resolve_codec
 
 # pylint: disable=R0902  # Eight is reasonable here
 
@@ -56,6 +61,8 @@ class ServiceClass:
         self.refreshable = False
         client_id = kwargs.get("client_id", None)
         client_secret = kwargs.get("client_secret", None)
+        pool_connections = kwargs.get("pool_connections", _POOL_CONNECTIONS)
+        pool_maxsize = kwargs.get("pool_maxsize", _POOL_MAXSIZE)
         if client_id and client_secret and not creds:
             # Passing client_id and client_secret will not
             # overwrite the contents of the creds dictionary
@@ -63,23 +70,21 @@ class ServiceClass:
                 "client_id": client_id,
                 "client_secret": client_secret
             }
+        self.access_token = access_token
+        # Assigned tokens take precedence over the authentication object's token
+        self.token_override = None
+        # Default headers are mutable, only the Authorization header is updated when the token changes
+        self.default_headers = {}
+        self.header_token = None
         if auth_object:
             self.auth_object = auth_object
-            if not self.authenticated():
-                _ = self.auth_object.token()
-                if _["status_code"] == 201:
-                    self.token = _["body"]["access_token"]
-                    self.headers = {'Authorization': 'Bearer {}'.format(self.token)}
-                else:
-                    self.token = False
-                    self.headers = {}
-            else:
-                self.token = self.auth_object.token_value
-                self.headers = {'Authorization': 'Bearer {}'.format(self.token)}
-
+            # Only one token request is performed when the object is shared by multiple Service Classes
+            self.auth_object.renew_token()
             self.base_url = auth_object.base_url
             self.ssl_verify = auth_object.ssl_verify
             self.proxy = auth_object.proxy
+            # Share the authentication object's connection pool
+            self.session = auth_object.session
             # At this point in time, you cannot override the auth_object's timeout per class
             self.timeout = auth_object.timeout
             self.refreshable = True
@@ -89,23 +94,76 @@ class ServiceClass:
                                          base_url=base_url,
                                          proxy=proxy,
                                          ssl_verify=self.ssl_verify,
-                                         timeout=self.timeout
+                                         timeout=self.timeout,
+                                         pool_connections=pool_connections,
+                                         pool_maxsize=pool_maxsize,
+                                         background_renewal=kwargs.get("background_renewal", False),
+                                         token_cache=kwargs.get("token_cache", None),
+                                         rate_limit=kwargs.get("rate_limit", False),
+                                         retry_policy=kwargs.get("retry_policy", None),
+                                         json_codec=kwargs.get("json_codec", None),
+                                         response_cache=kwargs.get("response_cache", None),
+                                         coalesce=kwargs.get("coalesce", False)
                                          )
                 self.auth_object = auth_object
-                _ = self.auth_object.token()
-                if _["status_code"] == 201:
-                    self.token = _["body"]["access_token"]
-                    self.headers = {'Authorization': 'Bearer {}'.format(self.token)}
-                else:
-                    self.token = False
-                    self.headers = {}
+                self.auth_object.renew_token()
                 self.refreshable = True
             else:
                 self.auth_object = None
-                self.headers = {'Authorization': 'Bearer {}'.format(access_token)}
 
             self.base_url = base_url
             self.proxy = proxy
+            if self.auth_object:
+                self.session = self.auth_object.session
+            else:
+                self.session = create_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        # A codec specified for this Service Class takes precedence over the authentication object's codec
+        self.json_codec = resolve_codec(kwargs.get("json_codec", None)) or getattr(self.auth_object, "json_codec", None)
+
+    @property
+    def token(self: object) -> str:
+        """
+        Returns the current bearer token. When an authentication object is in use,
+        the token is always read from it so that every Service Class sharing it uses the current token.
+        """
+        returned = self.access_token
+        if self.token_override:
+            returned = self.token_override
+        elif self.auth_object:
+            returned = self.auth_object.token_value
+
+        return returned
+
+    @token.setter
+    def token(self: object, value: str) -> None:
+        """
+        Overrides the bearer token used by this Service Class.
+        """
+        self.token_override = value
+
+    @property
+    def headers(self: object) -> dict:
+        """
+        Returns the default HTTP headers for this Service Class. The Authorization header is
+        updated whenever the token changes, other changes made to the headers are retained.
+        """
+        token = self.token
+        if token != self.header_token:
+            self.header_token = token
+            if token:
+                self.default_headers["Authorization"] = 'Bearer {}'.format(token)
+            else:
+                self.default_headers.pop("Authorization", None)
+
+        return self.default_headers
+
+    @headers.setter
+    def headers(self: object, value: dict) -> None:
+        """
+        Replaces the default HTTP headers for this Service Class.
+        """
+        self.default_headers = value
+        self.header_token = self.token
 
     def authenticated(self):
         """
@@ -127,6 +185,76 @@ class ServiceClass:
 
         return result
 
+    def _resolve_operation(self: object, method: object) -> tuple:
+        """
+        Returns the bound method and the Operation record for a method of this Service Class or its operation ID.
+        The Operation is None if the method does not perform a known API operation.
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        operation = None
+        function = getattr(method, "__func__", method)
+        # Operation IDs are available as aliases of each Service Class method
+        for name in dir(type(self)):
+            if getattr(type(self), name, None) is function:
+                operation = uber_operation(name)
+                if operation:
+                    break
+
+        return method, operation
+
+    def paginate(self: object, method: object, page_size: int = None, prefetch: bool = True,
+                 parameters: dict = None, **kwargs) -> Paginator:
+        """
+        Returns a Paginator that iterates over every page of a query operation, yielding IDs or resources.
+        method can be a method of this Service Class or its operation ID. Remaining keywords
+        are passed to the method for every page.
+
+            for device_id in hosts.paginate(hosts.query_devices_by_filter_scroll, page_size=5000):
+                ...
+        """
+        method, operation = self._resolve_operation(method)
+        if not operation or not operation.pagination:
+            raise ValueError(f"{getattr(method, '__name__', method)} is not a paginated query operation.")
+        # Query string keywords are managed by the paginator, anything else is passed through
+        query = {**(parameters or {}), **{key: val for key, val in kwargs.items() if key in operation.params}}
+        passed = {key: val for key, val in kwargs.items() if key not in operation.params}
+
+        return Paginator(request=lambda page: method(parameters=page, **passed),
+                         style=operation.pagination,
+                         parameters=query,
+                         page_size=page_size,
+                         prefetch=prefetch
+                         )
+
+    def hydrate(self: object, method: object, ids, batch_size: int = None,  # pylint: disable=R0913
+                max_workers: int = _HYDRATE_WORKERS, ordered: bool = True, **kwargs) -> Hydrator:
+        """
+        Returns a Hydrator that retrieves the entities for a stream of IDs using an entity operation,
+        yielding records. IDs are batched to the operation's limit and retrieved concurrently.
+        method can be a method of this Service Class or its operation ID. Remaining keywords
+        are passed to the method for every batch.
+
+            detections = detects.hydrate(detects.get_detect_summaries, detects.paginate(detects.query_detects))
+        """
+        method, operation = self._resolve_operation(method)
+        if not operation or not operation.id_location:
+            raise ValueError(f"{getattr(method, '__name__', method)} does not retrieve entities by ID.")
+        body = kwargs.pop("body", {})
+        if operation.id_location == "query":
+            def request(batch):
+                return method(ids=batch, **kwargs)
+        else:
+            def request(batch):
+                return method(body={**body, "ids": batch}, **kwargs)
+
+        return Hydrator(request=request,
+                        ids=ids,
+                        batch_size=batch_size or operation.id_limit,
+                        max_workers=max_workers,
+                        ordered=ordered
+                        )
+
     @staticmethod
     def parse_keywords(passed_keywords: dict):
         """
@@ -0,0 +1,122 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+_token_renewal - Background token renewal for the CrowdStrike Falcon OAuth2 API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+
+# Seconds before the on-request renewal window that a background renewal is performed
+_RENEWAL_LEAD = 60
+# Seconds to wait before retrying a failed background renewal
+_RENEWAL_RETRY = 5
+
+
+class TokenRenewal:
+    """
+    Renews an authorization token ahead of expiration on a daemon timer thread,
+    so that API requests never wait on authentication.
+
+    renew: callable - Requests a new token, returning a boolean indicating success
+    seconds_remaining: callable - Returns the number of seconds until the token enters its renewal window
+    lock: threading.RLock - Token lock of the owner, held while renewing so that a token requested by
+                            another thread (such as the first token at startup) is not requested again
+    """
+    def __init__(self: object, renew: callable, seconds_remaining: callable, lead: float = _RENEWAL_LEAD,
+                 lock: object = None) -> object:
+        """
+        Initializes the renewal timer. The timer is not started until start is called.
+        """
+        self.renew = renew
+        self.seconds_remaining = seconds_remaining
+        self.lead = lead
+        self.lock = lock or threading.RLock()
+        self.retry = _RENEWAL_RETRY
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    @property
+    def running(self: object) -> bool:
+        """
+        Returns a boolean indicating if background renewal is active.
+        """
+        return bool(self.thread and self.thread.is_alive())
+
+    def start(self: object) -> None:
+        """
+        Starts background renewal. Calling start when renewal is already active has no effect.
+        """
+        if not self.running:
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name="falconpy-token-renewal", daemon=True)
+            self.thread.start()
+
+    def stop(self: object) -> None:
+        """
+        Stops background renewal, waiting for an in-progress renewal to complete.
+        """
+        self.stop_event.set()
+        if self.running and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def renew_once(self: object) -> bool:
+        """
+        Renews the token unless another thread renewed it while waiting on the token lock.
+        Returns a boolean indicating if a valid token is available.
+        """
+        remaining = self.seconds_remaining()
+        with self.lock:
+            # The time remaining only grows when another thread obtained a token while we waited
+            returned = self.seconds_remaining() > remaining
+            if not returned:
+                returned = self.renew()
+
+        return returned
+
+    def _run(self: object) -> None:
+        """
+        Timer loop, sleeps until the token is within the lead time of its renewal window and then renews it.
+        """
+        while not self.stop_event.is_set():
+            delay = self.seconds_remaining() - self.lead
+            if delay <= 0:
+                delay = self.retry
+                if self.renew_once():
+                    remaining = self.seconds_remaining()
+                    # Tokens with a lifetime shorter than the lead time are renewed halfway through their lifetime
+                    delay = remaining - self.lead if remaining > 2 * self.lead else max(remaining / 2, 1)
+            # Waiting on the event allows stop to interrupt the timer immediately
+            self.stop_event.wait(delay)
@@ -0,0 +1,251 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+_upload - Streaming file uploads for the CrowdStrike Falcon API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import inspect
+import io
+import mmap
+import os
+import uuid
+
+# Size of each chunk read from an upload while it is sent
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def open_upload(file_data: object) -> object:
+    """
+    Returns a request body for the file data provided.
+
+    Paths (os.PathLike, such as pathlib.Path) are memory-mapped so that their content is paged in
+    as it is sent instead of being read into memory. File-like objects are streamed as they are.
+    Anything else (bytes or str content) is returned unchanged. Close the returned object once the
+    request completes.
+    """
+    returned = file_data
+    if isinstance(file_data, os.PathLike):
+        with open(file_data, "rb") as upload:
+            if os.fstat(upload.fileno()).st_size:
+                returned = mmap.mmap(upload.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # Empty files cannot be memory-mapped
+                returned = b""
+
+    return returned
+
+
+def close_upload(file_data: object, body: object) -> None:
+    """
+    Closes a request body created by open_upload. File-like objects provided by the caller are left open.
+    """
+    if body is not file_data and isinstance(body, mmap.mmap):
+        body.close()
+
+
+def close_after(returned: object, close: callable) -> object:
+    """
+    Calls close once the request returning the result provided has completed. Requests performed by
+    asyncio Service Classes return an awaitable, which is wrapped so that close is called once it is awaited.
+    """
+    if not inspect.isawaitable(returned):
+        close()
+        return returned
+
+    async def completed():
+        try:
+            return await returned
+        finally:
+            close()
+
+    return completed()
+
+
+def upload_length(body: object) -> int:
+    """
+    Returns the number of bytes remaining in a streamed request body, or None when it cannot be determined.
+    """
+    returned = None
+    try:
+        if hasattr(body, "__len__"):
+            returned = len(body) - body.tell()
+        elif hasattr(body, "fileno"):
+            returned = os.fstat(body.fileno()).st_size - body.tell()
+    except (OSError, ValueError):
+        pass  # Pipes and other unseekable streams
+
+    return returned
+
+
+class UploadReader(io.RawIOBase):
+    """
+    Read-only io.IOBase view of a streamed request body (memory-mapped file, file-like object
+    or MultipartStream), for HTTP clients such as aiohttp that only stream io.IOBase objects.
+    Closing the reader leaves the body open, it is closed by its owner once the request completes.
+    """
+    def __init__(self: object, body: object) -> object:
+        """
+        Initializes the reader. Reads start from the current position of the body.
+        """
+        super().__init__()
+        self.body = body
+
+    def readable(self: object) -> bool:
+        return True
+
+    def seekable(self: object) -> bool:
+        try:
+            self.body.tell()
+        except (AttributeError, OSError, ValueError):
+            return False
+        return True
+
+    def readinto(self: object, buffer) -> int:
+        """
+        Reads up to the length of the buffer from the body into it, returning the number of bytes read.
+        """
+        chunk = self.body.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+
+        return len(chunk)
+
+    def seek(self: object, offset: int, whence: int = io.SEEK_SET) -> int:
+        self.body.seek(offset, whence)
+
+        return self.body.tell()
+
+    def tell(self: object) -> int:
+        return self.body.tell()
+
+
+class MultipartStream:
+    """
+    Streams a multipart/form-data request body containing form fields and a single file,
+    without reading the file into memory. The length of the body is calculated up front
+    so that the request is sent with a Content-Length header.
+
+    fields: dict - Form fields, sent before the file
+    field_name: str - Name of the file field
+    file_name: str - File name sent with the file
+    file_data: object - Path (os.PathLike), file-like object, bytes or str
+    content_type: str - Content type of the file
+    """
+    def __init__(self: object, fields: dict, field_name: str, file_name: str,  # pylint: disable=R0913
+                 file_data: object, content_type: str = "application/octet-stream") -> object:
+        """
+        Prepares the body. Paths are opened (and memory-mapped) immediately.
+        """
+        self.boundary = uuid.uuid4().hex
+        self.file_data = file_data
+        self.body = open_upload(file_data)
+        if isinstance(self.body, str):
+            self.body = self.body.encode("utf-8")
+        if isinstance(self.body, (bytes, bytearray)):
+            self.body = io.BytesIO(self.body)
+        self.start = self.body.tell()
+        preamble = b"".join(
+            f"--{self.boundary}\r\nContent-Disposition: form-data; name=\"{key}\"\r\n\r\n{val}\r\n".encode("utf-8")
+            for key, val in (fields or {}).items()
+            )
+        preamble += (f"--{self.boundary}\r\nContent-Disposition: form-data; name=\"{field_name}\"; "
+                     f"filename=\"{file_name}\"\r\nContent-Type: {content_type}\r\n\r\n").encode("utf-8")
+        self.preamble = io.BytesIO(preamble)
+        self.epilogue = io.BytesIO(f"\r\n--{self.boundary}--\r\n".encode("utf-8"))
+        self.length = len(preamble) + self._file_length() + len(self.epilogue.getvalue())
+
+    @property
+    def content_type(self: object) -> str:
+        """
+        Returns the Content-Type header for the body.
+        """
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _file_length(self: object) -> int:
+        """
+        Returns the number of bytes remaining in the file from its starting position.
+        """
+        self.body.seek(0, io.SEEK_END)
+        end = self.body.tell()
+        self.body.seek(self.start)
+
+        return end - self.start
+
+    def read(self: object, size: int = -1) -> bytes:
+        """
+        Reads up to size bytes of the body, reading everything remaining when size is negative.
+        """
+        returned = b""
+        for part in [self.preamble, self.body, self.epilogue]:
+            if 0 <= size <= len(returned):
+                break
+            returned += part.read(size - len(returned) if size >= 0 else -1)
+
+        return returned
+
+    def seek(self: object, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Rewinds the body so it can be sent again. Only rewinding to the start is supported.
+        """
+        if offset or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("MultipartStream can only be rewound to the start")
+        self.preamble.seek(0)
+        self.body.seek(self.start)
+        self.epilogue.seek(0)
+
+        return 0
+
+    def tell(self: object) -> int:
+        """
+        Returns the current position within the body.
+        """
+        return self.preamble.tell() + (self.body.tell() - self.start) + self.epilogue.tell()
+
+    def __len__(self: object) -> int:
+        return self.length
+
+    def __iter__(self: object):
+        """
+        Yields the body in chunks.
+        """
+        chunk = self.read(_UPLOAD_CHUNK_SIZE)
+        while chunk:
+            yield chunk
+            chunk = self.read(_UPLOAD_CHUNK_SIZE)
+
+    def close(self: object) -> None:
+        """
+        Closes the body, file-like objects provided by the caller are left open.
+        """
+        close_upload(self.file_data, self.body)
@@ -38,19 +38,25 @@ For more information, please refer to <https://unlicense.org>
 """
 import base64
 import functools
-from json.decoder import JSONDecodeError
+import time
+from http.cookiejar import DefaultCookiePolicy
 # pylint: disable=E0401  # Pylint might not have these in our path
 import requests
+from requests.adapters import HTTPAdapter
 import urllib3
 from urllib3.exceptions import InsecureRequestWarning
 from ._version import _TITLE, _VERSION
-from ._result import Result
+from ._result import Result, LazyResult
+from ._registry import Operation, find_operation, _IDEMPOTENT_METHODS
 urllib3.disable_warnings(InsecureRequestWarning)
 
 # Restrict requests to only allowed HTTP methods
 _ALLOWED_METHODS = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'UPDATE']
 # Default user-agent string
 _USER_AGENT = f"{_TITLE}/{str(_VERSION)}"
+# Default connection pool sizing for persistent sessions
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 10
 
 
 def validate_payload(validator: dict, params: dict, required: list = None) -> bool:
@@ -160,6 +166,28 @@ def force_default(defaults: list, default_types: list = None):
     return wrapper
 
 
+def create_session(pool_connections: int = _POOL_CONNECTIONS,
+                   pool_maxsize: int = _POOL_MAXSIZE,
+                   pool_block: bool = False
+                   ) -> requests.Session:
+    """
+    Creates a persistent requests Session with a pooled HTTP adapter mounted.
+    Connections are kept alive and reused by every request performed using this session.
+
+    pool_connections: int - Number of host connection pools to cache
+    pool_maxsize: int - Maximum number of connections to keep open per host
+    pool_block: bool - Block when the pool is exhausted instead of opening a throw-away connection
+    """
+    session = requests.Session()
+    # The API is stateless, do not let cookies leak between requests sharing this session
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
 def service_request(caller: object = None, **kwargs) -> object:  # May return dict or object datatypes
     """
     Checks for token expiration, refreshing if possible and then performs the request.
@@ -167,12 +195,12 @@ def service_request(caller: object = None, **kwargs) -> object:  # May return di
     if caller:
         try:
             if caller.auth_object:
-                if caller.auth_object.token_expired():
-                    auth_response = caller.auth_object.token()
-                    if auth_response["status_code"] == 201:
-                        caller.headers['Authorization'] = 'Bearer {}'.format(auth_response['body']['access_token'])
-                    else:
-                        caller.headers['Authorization'] = 'Bearer '
+                # Renewal is performed once for all threads sharing the authentication object, and the
+                # bearer token is always read from it so every Service Class uses the current token
+                if caller.auth_object.renew_token():
+                    kwargs["headers"]['Authorization'] = 'Bearer {}'.format(caller.token)
+                else:
+                    kwargs["headers"]['Authorization'] = 'Bearer '
         except AttributeError:
             pass
 
@@ -186,11 +214,205 @@ def service_request(caller: object = None, **kwargs) -> object:  # May return di
         except AttributeError:
             timeout = None
 
-    returned = perform_request(proxy=proxy, timeout=timeout, **kwargs)
+        try:
+            session = caller.session
+        except AttributeError:
+            session = None
+
+        try:
+            rate_limiter = caller.auth_object.rate_limiter
+            retry_policy = caller.auth_object.retry_policy
+        except AttributeError:
+            rate_limiter = None
+            retry_policy = None
+
+        json_codec = getattr(caller, "json_codec", None)
+        response_cache = getattr(getattr(caller, "auth_object", None), "response_cache", None)
+        coalescer = getattr(getattr(caller, "auth_object", None), "coalescer", None)
+
+    returned = perform_request(proxy=proxy, timeout=timeout, session=session, rate_limiter=rate_limiter,
+                               retry_policy=retry_policy, json_codec=json_codec, response_cache=response_cache,
+                               coalescer=coalescer, **kwargs)
+
+    return returned
+
+
+def send_request(send: callable, rate_limiter: object = None, retry_policy: object = None,
+                 idempotent: bool = True, retryable: bool = True) -> object:
+    """
+    Performs a request using the send callable, returning the response.
+    Waits for the rate limiter before every attempt and retries throttled (429) requests, then
+    retries failures permitted by the retry policy after its backoff delay. When a failure is not
+    retried, the failing response is returned or the exception raised by send is raised.
+    Requests whose body cannot be sent again (retryable is False) are never retried.
+    """
+    attempt = 1
+    throttled = 0
+    if retry_policy:
+        retry_policy.started()
+    while True:
+        if rate_limiter:
+            rate_limiter.wait()
+        try:
+            response = send()
+        except Exception as err:  # pylint: disable=W0703  # Reraised unless the retry policy accepts it
+            delay = retry_policy.retry_delay(attempt, idempotent, exception=err) if retry_policy and retryable else None
+            if delay is None:
+                raise
+        else:
+            delay = None
+            if rate_limiter:
+                rate_limiter.update(response.status_code, response.headers)
+                if retryable and rate_limiter.retry(response.status_code, throttled):
+                    throttled += 1
+                    response.close()  # Releases the connection of streamed responses
+                    continue
+            if retry_policy and retryable:
+                delay = retry_policy.retry_delay(attempt, idempotent, status_code=response.status_code)
+            if delay is None:
+                return response
+            response.close()
+        attempt += 1
+        time.sleep(delay)
+
+
+def upload_position(data: object) -> int:
+    """
+    Returns the current position of seekable request data, or None when the data cannot be rewound.
+    """
+    position = None
+    if hasattr(data, "seek") and hasattr(data, "tell"):
+        try:
+            position = data.tell()
+        except (OSError, ValueError):
+            pass  # Pipes and other unseekable streams can only be sent once
+
+    return position
+
+
+def upload_positions(data: object, files: object) -> list:
+    """
+    Returns the starting position of the streamed request data and of every file object uploaded,
+    as a list of (stream, position) tuples, or None when a stream cannot be rewound.
+    """
+    entries = files.values() if isinstance(files, dict) else [entry[1] for entry in files or []]
+    streams = [data] + [entry[1] if isinstance(entry, (tuple, list)) else entry for entry in entries]
+    returned = []
+    for stream in streams:
+        if hasattr(stream, "read"):
+            position = upload_position(stream)
+            if position is None:
+                returned = None
+                break
+            returned.append((stream, position))
 
     return returned
 
 
+def rewind_uploads(positions: list) -> None:
+    """
+    Rewinds streamed request data and uploaded files to their starting positions
+    so that retried requests resend the entire body.
+    """
+    for stream, position in positions or []:
+        stream.seek(position)
+
+
+def encode_body(codec: object, headers: dict, kwargs: dict) -> tuple:
+    """
+    Returns the data and json payloads for a request. When a codec is specified, the body is
+    encoded using it and sent as data, mirroring how requests encodes the json payload.
+    """
+    data = kwargs.get("data", None)
+    body = kwargs.get("body", None)
+    if codec and body is not None and not data and not kwargs.get("files", None):
+        data = codec.dumps(body)
+        body = None
+        if not any(key.lower() == "content-type" for key in headers):
+            headers["Content-Type"] = "application/json"
+
+    return data, body
+
+
+def send_api_request(requester: object, method: str, endpoint: str, headers: dict, kwargs: dict) -> object:
+    """
+    Performs a request for perform_request, returning the response.
+    """
+    data, body = encode_body(kwargs.get("json_codec", None), headers, kwargs)
+    positions = upload_positions(data, kwargs.get("files", None))
+
+    def send():
+        rewind_uploads(positions)
+        return requester.request(method.upper(), endpoint, params=kwargs.get("params", None),
+                                 headers=headers, json=body, data=data, files=kwargs.get("files", []),
+                                 verify=kwargs.get("verify", True), proxies=kwargs.get("proxy", None),
+                                 timeout=kwargs.get("timeout", None)
+                                 )
+
+    return send_request(
+        send,
+        rate_limiter=kwargs.get("rate_limiter", None),
+        retry_policy=kwargs.get("retry_policy", None),
+        idempotent=kwargs.get("idempotent", method.upper() in _IDEMPOTENT_METHODS),
+        retryable=positions is not None
+        )
+
+
+def request_sender(requester: object, method: str, endpoint: str, headers: dict, kwargs: dict) -> callable:
+    """
+    Returns a callable performing the request for perform_request with any additional headers provided.
+    When a request coalescer is provided, identical concurrent GET requests share a single request.
+    """
+    coalescer = kwargs.get("coalescer", None)
+    operation_id = kwargs.get("operation_id", None)
+
+    def send(extra: dict) -> object:
+        return send_api_request(requester, method, endpoint, {**headers, **extra}, kwargs)
+
+    returned = send
+    if coalescer and coalescer.coalescable(method, operation_id):
+        def coalesced(extra: dict) -> object:
+            return coalescer.perform(operation_id, endpoint, kwargs.get("params", None), extra, send)
+
+        returned = coalesced
+
+    return returned
+
+
+def response_result(response: object, loads: callable = None) -> object:
+    """
+    Returns the result for a response. JSON responses are returned as a result dictionary
+    (decoded when the body is first accessed), anything else as bytes.
+    """
+    returned = response.content
+    if response.headers.get('content-type') == "application/json":
+        returned = LazyResult(response.status_code, response.headers, response.content, loads=loads)
+
+    return returned
+
+
+def stream_to_file(requester: object, method: str, endpoint: str, headers: dict, kwargs: dict) -> dict:
+    """
+    Performs a download request for perform_request, streaming the content to the path specified by the
+    download_to keyword. The content is verified against the sha256 keyword when provided.
+    """
+    from ._download import download_target, stream_download  # pylint: disable=C0415  # Avoids a circular import
+
+    return stream_download(
+        lambda resume: send_request(
+            lambda: requester.request(method.upper(), endpoint, params=kwargs.get("params", None),
+                                      headers={**headers, **resume}, verify=kwargs.get("verify", True),
+                                      proxies=kwargs.get("proxy", None), timeout=kwargs.get("timeout", None),
+                                      stream=True
+                                      ),
+            rate_limiter=kwargs.get("rate_limiter", None),
+            retry_policy=kwargs.get("retry_policy", None),
+            idempotent=kwargs.get("idempotent", method.upper() in _IDEMPOTENT_METHODS)
+            ),
+        download_target(kwargs["download_to"], kwargs.get("sha256", None))
+        )
+
+
 @force_default(defaults=["headers"], default_types=["dict"])
 def perform_request(endpoint: str = "", headers: dict = None, **kwargs) -> object:  # May return dict or object datatypes
     """
@@ -208,7 +430,7 @@ def perform_request(endpoint: str = "", headers: dict = None, **kwargs) -> objec
         - Example: {"ids": "123456789abcdefg,987654321zyxwvutsr"}
     verify: bool - Enable / Disable SSL certificate checks
         - Example: True
-    data - Encoded data to send to the API
+    data - Encoded data to send to the API, seekable streams are rewound before each attempt
         - Example: PAYLOAD = open(FILENAME, 'rb').read()
     files: list - List of files to upload
         - Example: [('file',('testfile2.jpg',open('testfile2.jpg','rb'),'image/jpeg'))]
@@ -222,6 +444,22 @@ def perform_request(endpoint: str = "", headers: dict = None, **kwargs) -> objec
         Float representing the global timeout for requests or a tuple containing the connect / read timeouts.
         - Example: 30
         - Example: (5.05, 25)
+    session: requests.Session - Persistent (pooled) session to perform the request with
+        - When not provided, a one-time connection is created for this request
+        - Example: create_session(pool_connections=10, pool_maxsize=32)
+    rate_limiter: RateLimiter - Client-side rate limiter shared by requests using the same credentials
+        - When provided, requests wait for capacity and 429 responses are retried
+    retry_policy: RetryPolicy - Retry and backoff policy for failed requests
+        - When provided, failures accepted by the policy are retried
+    idempotent: bool - Whether the request can safely be retried, defaults to True for GET, HEAD, PUT and DELETE
+    download_to: str or file-like object - Streams the response content to this file path (or writer) instead of returning it
+        - Interrupted transfers are resumed, the file is only created once the transfer completes
+    sha256: str - Expected SHA-256 of the downloaded content, the download fails if it does not match
+    json_codec: JSONCodec - Codec used to encode the body and decode JSON responses
+        - When not provided, the standard library is used
+    response_cache: ResponseCache - Cache for responses to read-mostly GET operations
+    operation_id: str - Operation ID of the request, used to determine if the response can be cached or coalesced
+    coalescer: RequestCoalescer - Shares a single in-flight request between identical concurrent GET requests
     """
     method = kwargs.get("method", "GET")
     body = kwargs.get("body", None)
@@ -245,24 +483,26 @@ def perform_request(endpoint: str = "", headers: dict = None, **kwargs) -> objec
         # Perform the request
         if perform:
             headers["User-Agent"] = _USER_AGENT  # Force all requests to pass the User-Agent identifier
+            requester = kwargs.get("session", None) or requests
             try:
-                response = requests.request(method.upper(), endpoint, params=kwargs.get("params", None),
-                                            headers=headers, json=kwargs.get("body", None), data=kwargs.get("data", None),
-                                            files=kwargs.get("files", []), verify=kwargs.get("verify", True),
-                                            proxies=kwargs.get("proxy", None), timeout=kwargs.get("timeout", None)
-                                            )
-
-                if response.headers.get('content-type') == "application/json":
-                    returned = Result()(response.status_code, response.headers, response.json())
+                if kwargs.get("download_to", None):
+                    # Large binaries are streamed to disk instead of being held in memory
+                    returned = stream_to_file(requester, method, endpoint, headers, kwargs)
                 else:
-                    returned = response.content
-            except JSONDecodeError:
-                # No response content, but a successful request was made
-                returned = generate_ok_result(
-                    message="No content returned",
-                    code=response.status_code,
-                    headers=response.headers
-                    )
+                    loads = getattr(kwargs.get("json_codec", None), "loads", None)
+                    send = request_sender(requester, method, endpoint, headers, kwargs)
+                    cache = kwargs.get("response_cache", None)
+                    if cache and cache.cacheable(method, kwargs.get("operation_id", None)):
+                        # Fresh cached responses are returned without performing a request
+                        returned = cache.fetch(
+                            kwargs["operation_id"], endpoint, kwargs.get("params", None),
+                            send=send,
+                            respond=lambda response: response_result(response, loads),
+                            loads=loads
+                            )
+                    else:
+                        # Every caller sharing a coalesced response is returned its own result
+                        returned = response_result(send({}), loads)
             except Exception as err:  # pylint: disable=W0703  # General catch-all for anything coming out of requests
                 returned = generate_error_result(message=f"{str(err)}")
     else:
@@ -336,20 +576,18 @@ def args_to_params(payload: dict, passed_arguments: dict, endpoints: list, epnam
 
     This function will convert passed comma-delimited strings to list data types when necessary.
     """
+    operation = find_operation(endpoints, epname)
+    if not operation and passed_arguments:
+        # Fall back to a partial operation ID match
+        operation = Operation([ep for ep in endpoints if epname in ep[0]][0])
     for arg in passed_arguments:
-        eps = [ep[5] for ep in endpoints if epname in ep[0]][0]
-        try:
-            argument = [param for param in eps if param["name"] == arg][0]
-            if argument:
-                arg_name = argument["name"]
-                if argument["type"] == "array":
-                    if isinstance(passed_arguments[arg_name], (str)):
-                        passed_arguments[arg_name] = passed_arguments[arg_name].split(",")
-                # More data type validation can go here
-                payload[arg_name] = passed_arguments[arg_name]
-        except IndexError:
-            # Unrecognized argument
-            pass
+        # Unrecognized arguments are ignored
+        if arg in operation.params:
+            if arg in operation.array_params:
+                if isinstance(passed_arguments[arg], (str)):
+                    passed_arguments[arg] = passed_arguments[arg].split(",")
+            # More data type validation can go here
+            payload[arg] = passed_arguments[arg]
 
     return payload
 
@@ -376,14 +614,16 @@ def process_service_request(calling_object: object,
         partition: ID of the partition to open (Event Streams API)
         body_validator: Dictionary containing details regarding body payload validation
         body_required: List of required body payload parameters
+        download_to: Path (or writable file-like object) to stream the response content to, instead of returning it
+        sha256: Expected SHA-256 of the content streamed to download_to
     """
-    target_endpoint = [ep for ep in endpoints if operation_id == ep[0]][0]
-    # ID replacement happening at the end of this statement planned for removal in v0.6.0+
+    target_endpoint = find_operation(endpoints, operation_id)
+    # ID replacement is performed once when the operation record is built and is planned for removal in v0.6.0+
     # (after the uber class has been updated to no longer need it and the _endpoints module has been updated)
-    target_url = f"{calling_object.base_url}{target_endpoint[2]}".replace("?ids={}", "")
-    target_method = target_endpoint[1]
+    target_url = f"{calling_object.base_url}{target_endpoint.path}"
+    target_method = target_endpoint.method
     passed_partition = kwargs.get("partition", None)
-    if passed_partition:
+    if passed_partition is not None:  # Partition 0 is valid
         target_url = target_url.format(str(passed_partition))
     # Retrieve our keyword arguments
     passed_keywords = kwargs.get("keywords", None)
@@ -391,7 +631,8 @@ def process_service_request(calling_object: object,
     parameter_payload = None
     if passed_keywords or passed_params:
         parameter_payload = args_to_params(passed_params, passed_keywords, endpoints, operation_id)
-    passed_headers = kwargs.get("headers", None) if kwargs.get("headers", None) else calling_object.headers
+    # Default headers are copied, they are updated for this request and may be shared by other threads
+    passed_headers = kwargs.get("headers", None) if kwargs.get("headers", None) else dict(calling_object.headers)
     new_keywords = {
         "caller": calling_object,
         "method": target_method,
@@ -403,7 +644,19 @@ def process_service_request(calling_object: object,
         "data": kwargs.get("data", None),
         "files": kwargs.get("files", None),
         "body_validator": kwargs.get("body_validator", None),   # May be deprecated after BODY payload abstraction
-        "body_required": kwargs.get("body_required", None)      # May be deprecated after BODY payload abstraction
+        "body_required": kwargs.get("body_required", None),     # May be deprecated after BODY payload abstraction
+        "idempotent": target_endpoint.idempotent,
+        "operation_id": target_endpoint.operation_id
     }
+    if kwargs.get("download_to", None):
+        new_keywords["download_to"] = kwargs["download_to"]
+        new_keywords["sha256"] = kwargs.get("sha256", None)
+    if getattr(calling_object, "asynchronous", False):
+        # Asyncio flavoured Service Classes are returned an awaitable
+        from ._async_util import async_service_request  # pylint: disable=C0415  # Optional dependency
+
+        returned = async_service_request(**new_keywords)
+    else:
+        returned = service_request(**new_keywords)
 
-    return service_request(**new_keywords)
+    return returned
@@ -37,9 +37,17 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 import time
+import threading
 from ._util import _ALLOWED_METHODS
-from ._util import perform_request, generate_b64cred, generate_error_result, calc_url_from_args
-from ._endpoint import api_endpoints
+from ._util import perform_request, generate_b64cred, generate_error_result, calc_url_from_args, create_session
+from ._util import _POOL_CONNECTIONS, _POOL_MAXSIZE
+from ._registry import Operation, find_operation, uber_operation, _IDEMPOTENT_METHODS
+from ._token_renewal import TokenRenewal
+from ._rate_limit import RateLimiter
+from .codec import json_codec as resolve_codec
+from .coalescer import RequestCoalescer
+from .paginator import Paginator
+from .hydrator import Hydrator, _HYDRATE_WORKERS
 
 
 class APIHarness:
@@ -53,11 +61,29 @@ class APIHarness:
                  creds: dict = None,
                  client_id: str = None, client_secret: str = None,
                  ssl_verify: bool = True, proxy: dict = None,
-                 timeout: float or tuple = None) -> object:
+                 timeout: float or tuple = None,
+                 pool_connections: int = _POOL_CONNECTIONS,
+                 pool_maxsize: int = _POOL_MAXSIZE,
+                 background_renewal: bool = False,
+                 token_cache: object = None,
+                 rate_limit: bool = False,
+                 retry_policy: object = None,
+                 json_codec: object = None,
+                 response_cache: object = None,
+                 coalesce: bool = False) -> object:
         """
         Instantiates an instance of the base class, ingests credentials,
         the base URL and the SSL verification boolean.
         Afterwards class attributes are initialized.
+
+        All requests are performed using a persistent, pooled HTTP session.
+        When background_renewal is enabled, the token is renewed ahead of expiration on a background thread.
+        When a token_cache (TokenCache) is specified, tokens are shared on disk with other processes.
+        When rate_limit is enabled, requests are throttled using the API's rate limit headers and 429 responses are retried.
+        When a retry_policy (RetryPolicy) is specified, failed requests are retried according to the policy.
+        When a json_codec ("auto", "orjson", "ujson" or a JSONCodec) is specified, it is used to encode and decode bodies.
+        When a response_cache (ResponseCache) is specified, responses to read-mostly GET operations are cached.
+        When coalesce is enabled, identical concurrent GET commands share a single in-flight request.
         """
         if client_id and client_secret and not creds:
             creds = {
@@ -71,12 +97,57 @@ class APIHarness:
         self.ssl_verify = ssl_verify
         self.proxy = proxy
         self.timeout = timeout
+        self.token_cache = token_cache
+        self.rate_limiter = RateLimiter() if rate_limit else None
+        self.retry_policy = retry_policy
+        self.json_codec = resolve_codec(json_codec)
+        self.response_cache = response_cache
+        self.coalescer = RequestCoalescer() if coalesce else None
+        self.session = create_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
         self.token = False
         self.token_expiration = 0
         self.token_time = time.time()
         self.authenticated = False
         self.headers = lambda: {'Authorization': 'Bearer {}'.format(self.token)} if self.token else {}
-        self.commands = api_endpoints
+        # Operations assigned to commands replace the operations available to the Uber class
+        self.assigned_commands = None
+        # Serializes token requests so that concurrent commands result in a single request
+        self.token_lock = threading.RLock()
+        self.renewal = TokenRenewal(
+            renew=self._renew_token,
+            seconds_remaining=lambda: (self.token_time + self.token_expiration - self.TOKEN_RENEW_WINDOW) - time.time(),
+            lock=self.token_lock
+            )
+        if background_renewal:
+            self.renewal.start()
+
+    @property
+    def commands(self: object) -> list:
+        """
+        Returns the list of all available API operations.
+        Endpoint modules are loaded on demand, accessing this list will load all of them.
+        """
+        if self.assigned_commands is not None:
+            return self.assigned_commands
+        from ._endpoint import api_endpoints  # pylint: disable=C0415  # Deferred until requested
+
+        return api_endpoints
+
+    @commands.setter
+    def commands(self: object, value: list) -> None:
+        """
+        Replaces the list of available API operations, operations are looked up from this list.
+        """
+        self.assigned_commands = value
+
+    def _operation(self: object, action: str) -> Operation:
+        """
+        Returns the Operation record for the action, or None if it is not an available operation.
+        """
+        if self.assigned_commands is not None:
+            return find_operation(self.assigned_commands, action)
+
+        return uber_operation(action)
 
     def valid_cred_format(self: object) -> bool:
         """Returns a boolean indicating if the client_id and client_secret are present in the creds dictionary."""
@@ -94,9 +165,8 @@ class APIHarness:
 
         return retval
 
-    def authenticate(self: object) -> bool:
-        """ Generates an authorization token. """
-        target = self.base_url+'/oauth2/token'
+    def _token_request(self: object) -> dict:
+        """Returns the keywords necessary to perform a token request."""
         data_payload = {}
         if self.valid_cred_format():
             data_payload = {
@@ -106,14 +176,18 @@ class APIHarness:
         if "member_cid" in self.creds:
             data_payload["member_cid"] = self.creds["member_cid"]
 
-        result = perform_request(method="POST",
-                                 endpoint=target,
-                                 data=data_payload,
-                                 headers={},
-                                 verify=self.ssl_verify,
-                                 proxy=self.proxy,
-                                 timeout=self.timeout
-                                 )
+        return {
+            "method": "POST",
+            "endpoint": self.base_url+'/oauth2/token',
+            "data": data_payload,
+            "headers": {},
+            "verify": self.ssl_verify,
+            "proxy": self.proxy,
+            "timeout": self.timeout
+        }
+
+    def _store_token(self: object, result: dict) -> bool:
+        """Stores the token from a token request result and returns the authentication status."""
         if result["status_code"] == 201:
             self.token = result["body"]["access_token"]
             self.token_expiration = result["body"]["expires_in"]
@@ -124,25 +198,54 @@ class APIHarness:
 
         return self.authenticated
 
-    def deauthenticate(self: object) -> bool:
-        """ Revokes the specified authorization token. """
-        target = str(self.base_url)+'/oauth2/revoke'
+    def authenticate(self: object) -> bool:
+        """ Generates an authorization token. """
+        with self.token_lock:
+            if self.token_cache:
+                result = self.token_cache.fetch(self.creds, self.base_url, self.TOKEN_RENEW_WINDOW, self.token,
+                                                lambda: perform_request(session=self.session, **self._token_request())
+                                                )
+            else:
+                result = perform_request(session=self.session, **self._token_request())
+
+            return self._store_token(result)
+
+    def _renew_token(self: object) -> bool:
+        """ Generates an authorization token using the persistent session. Used for background renewal. """
+        return APIHarness.authenticate(self)
+
+    def _revoke_request(self: object) -> dict:
+        """Returns the keywords necessary to revoke the current token."""
         header_payload = {'Authorization': 'basic {}'.format(generate_b64cred(self.creds["client_id"],
                                                                               self.creds["client_secret"]
                                                                               ))}
-        data_payload = {'token': '{}'.format(self.token)}
+        return {
+            "method": "POST",
+            "endpoint": str(self.base_url)+'/oauth2/revoke',
+            "data": {'token': '{}'.format(self.token)},
+            "headers": header_payload,
+            "verify": self.ssl_verify,
+            "proxy": self.proxy,
+            "timeout": self.timeout
+        }
+
+    def _store_revoke(self: object, result: dict) -> bool:
+        """Clears the current token if the revoke request succeeded, returning the result."""
         revoked = False
-        if perform_request(method="POST", endpoint=target, data=data_payload,
-                           headers=header_payload, verify=self.ssl_verify, proxy=self.proxy, timeout=self.timeout
-                           )["status_code"] == 200:
+        if result["status_code"] == 200:
+            if self.token_cache:
+                self.token_cache.discard(self.creds, self.base_url, self.token)
             self.authenticated = False
             self.token = False
             revoked = True
-        else:
-            revoked = False
 
         return revoked
 
+    def deauthenticate(self: object) -> bool:
+        """ Revokes the specified authorization token. Background renewal is stopped. """
+        self.renewal.stop()
+        return self._store_revoke(perform_request(session=self.session, **self._revoke_request()))
+
     def _create_header_payload(self: object, passed_arguments: dict) -> dict:
         """Creates the HTTP header payload based upon the existing class headers and passed arguments."""
         payload = self.headers()
@@ -154,27 +257,13 @@ class APIHarness:
 
         return payload
 
-    def command(self: object, *args, **kwargs):
-        """ Checks token expiration, renewing when necessary, then performs the request.
-
-            Accepted arguments (name: type = default)
-            action: str = ""                                    - API Operation to perform
-            parameters: dict = {}                               - Parameter payload (Query string)
-            body: dict = {}                                     - Body payload (Body)
-            data: dict = {}                                     - Data payload (Data)
-            headers: dict = {}                                  - Headers dictionary (HTTP Headers)
-            ids: list or str = None                             - ID list (IDs to handle)
-            partition: int or str = None                        - Partition number
-            override: str = None   (format: 'METHOD,ENDPOINT')  - Override method and endpoint
-            action_name: str = None                             - Action to perform (API specific)
-            files: list = []                                    - List of files to upload
-            file_name: str = None                               - Name of the file to upload
-            content_type: str = None                            - Content_Type HTTP header
+    def _prepare_command(self: object, args: tuple, kwargs: dict) -> tuple:
         """
-
-        if self.token_expired():
-            # Authenticate them if we can
-            self.authenticate()
+        Calculates the request to perform for the command method.
+        Returns a tuple containing the request keywords and None, or None and an error result.
+        """
+        request = None
+        returned = None
         try:
             if not kwargs.get("action", None):
                 # Assume they're passing it in as the first param
@@ -182,13 +271,22 @@ class APIHarness:
 
         except IndexError:
             pass  # They didn't specify an action, use the default and try for an override instead
-        uber_command = [a for a in self.commands if a[0] == kwargs["action"]]
+        uber_command = None
+        idempotent = None
+        operation_id = None
+        operation = self._operation(kwargs.get("action", None))
+        if operation:
+            uber_command = [operation.method, operation.url]
+            idempotent = operation.idempotent
+            operation_id = operation.operation_id
         if "override" in kwargs:
             if kwargs["override"]:
-                uber_command = [["Manual"] + kwargs["override"].split(",")]
+                uber_command = kwargs["override"].split(",")
+                idempotent = None
+                operation_id = None
         if uber_command:
             # Calculate our target endpoint based upon arguments passed to the function
-            target = calc_url_from_args(f"{self.base_url}{uber_command[0][2]}", kwargs)
+            target = calc_url_from_args(f"{self.base_url}{uber_command[1]}", kwargs)
             # Calculate our header payload using arguments passed to the function and our token
             header_payload = self._create_header_payload(kwargs)
             # These have their defaults set by the force_defaults decorator
@@ -198,19 +296,22 @@ class APIHarness:
             parameter_payload = kwargs.get("parameters", {})
             # Check for authentication
             if self.authenticated:
-                selected_method = uber_command[0][1].upper()            # Which HTTP method to execute
+                selected_method = uber_command[0].upper()               # Which HTTP method to execute
                 if selected_method in _ALLOWED_METHODS:                 # Only accept allowed HTTP methods
-                    returned = perform_request(method=selected_method,
-                                               endpoint=target,
-                                               body=body_payload,
-                                               data=data_payload,
-                                               params=parameter_payload,
-                                               headers=header_payload,
-                                               files=file_list,
-                                               verify=self.ssl_verify,
-                                               proxy=self.proxy,
-                                               timeout=self.timeout
-                                               )
+                    request = {
+                        "method": selected_method,
+                        "endpoint": target,
+                        "body": body_payload,
+                        "data": data_payload,
+                        "params": parameter_payload,
+                        "headers": header_payload,
+                        "files": file_list,
+                        "verify": self.ssl_verify,
+                        "proxy": self.proxy,
+                        "timeout": self.timeout,
+                        "idempotent": selected_method in _IDEMPOTENT_METHODS if idempotent is None else idempotent,
+                        "operation_id": operation_id
+                    }
                 else:
                     # Bad HTTP method
                     returned = generate_error_result(message="Invalid HTTP method specified.", code=405)
@@ -221,4 +322,83 @@ class APIHarness:
             # That command doesn't exist, have a cup of tea instead
             returned = generate_error_result(message="Invalid API operation specified.", code=418)
 
+        return request, returned
+
+    def paginate(self: object, action: str, page_size: int = None, prefetch: bool = True,
+                 parameters: dict = None, **kwargs) -> Paginator:
+        """
+        Returns a Paginator that iterates over every page of a query operation, yielding IDs or resources.
+        Remaining keywords are passed to the command method for every page.
+
+            for device_id in falcon.paginate("QueryDevicesByFilterScroll", parameters={"limit": 5000}):
+                ...
+        """
+        operation = self._operation(action)
+        if not operation or not operation.pagination:
+            raise ValueError(f"{action} is not a paginated query operation.")
+
+        return Paginator(request=lambda page: self.command(action, parameters=page, **kwargs),
+                         style=operation.pagination,
+                         parameters=parameters,
+                         page_size=page_size,
+                         prefetch=prefetch
+                         )
+
+    def hydrate(self: object, action: str, ids, batch_size: int = None,  # pylint: disable=R0913
+                max_workers: int = _HYDRATE_WORKERS, ordered: bool = True, **kwargs) -> Hydrator:
+        """
+        Returns a Hydrator that retrieves the entities for a stream of IDs using an entity operation,
+        yielding records. IDs are batched to the operation's limit and retrieved concurrently.
+        Remaining keywords are passed to the command method for every batch.
+
+            devices = falcon.hydrate("GetDeviceDetails", falcon.paginate("QueryDevicesByFilterScroll"))
+        """
+        operation = self._operation(action)
+        if not operation or not operation.id_location:
+            raise ValueError(f"{action} does not retrieve entities by ID.")
+        body = kwargs.pop("body", {})
+        parameters = kwargs.pop("parameters", {})
+        if operation.id_location == "query":
+            def request(batch):
+                return self.command(action, parameters={**parameters, "ids": batch}, **kwargs)
+        else:
+            def request(batch):
+                return self.command(action, body={**body, "ids": batch}, **kwargs)
+
+        return Hydrator(request=request,
+                        ids=ids,
+                        batch_size=batch_size or operation.id_limit,
+                        max_workers=max_workers,
+                        ordered=ordered
+                        )
+
+    def command(self: object, *args, **kwargs):
+        """ Checks token expiration, renewing when necessary, then performs the request.
+
+            Accepted arguments (name: type = default)
+            action: str = ""                                    - API Operation to perform
+            parameters: dict = {}                               - Parameter payload (Query string)
+            body: dict = {}                                     - Body payload (Body)
+            data: dict = {}                                     - Data payload (Data)
+            headers: dict = {}                                  - Headers dictionary (HTTP Headers)
+            ids: list or str = None                             - ID list (IDs to handle)
+            partition: int or str = None                        - Partition number
+            override: str = None   (format: 'METHOD,ENDPOINT')  - Override method and endpoint
+            action_name: str = None                             - Action to perform (API specific)
+            files: list = []                                    - List of files to upload
+            file_name: str = None                               - Name of the file to upload
+            content_type: str = None                            - Content_Type HTTP header
+        """
+
+        if self.token_expired():
+            with self.token_lock:
+                # Authenticate them if we can, unless another thread already has
+                if self.token_expired():
+                    self.authenticate()
+        request, returned = self._prepare_command(args, kwargs)
+        if request:
+            returned = perform_request(session=self.session, rate_limiter=self.rate_limiter,
+                                       retry_policy=self.retry_policy, json_codec=self.json_codec,
+                                       response_cache=self.response_cache, coalescer=self.coalescer, **request)
+
         return returned
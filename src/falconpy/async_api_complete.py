@@ -0,0 +1,122 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+async_api_complete - Asyncio flavoured all-in-one CrowdStrike Falcon OAuth2 API harness
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from ._async_util import AsyncTransport, async_perform_request, async_cached_token, _ASYNC_POOL_MAXSIZE
+from .api_complete import APIHarness
+
+
+class AsyncAPIHarness(APIHarness):
+    """
+    Asyncio flavour of the Uber class. The authenticate, deauthenticate
+    and command methods are coroutines, all other functionality is inherited
+    apart from paginate and hydrate, which raise TypeError.
+
+        async with AsyncAPIHarness(client_id=CLIENT_ID, client_secret=CLIENT_SECRET) as falcon:
+            results = await asyncio.gather(*[falcon.command("GetDeviceDetails", ids=aid) for aid in aid_list])
+    """
+    def __init__(self: object,  # pylint: disable=R0913
+                 base_url: str = "https://api.crowdstrike.com",
+                 creds: dict = None,
+                 client_id: str = None, client_secret: str = None,
+                 ssl_verify: bool = True, proxy: dict = None,
+                 timeout: float or tuple = None,
+                 pool_maxsize: int = _ASYNC_POOL_MAXSIZE,
+                 background_renewal: bool = False,
+                 token_cache: object = None,
+                 rate_limit: bool = False,
+                 retry_policy: object = None,
+                 json_codec: object = None) -> object:
+        """
+        Instantiates the class, requests are performed using a pooled asyncio transport (aiohttp).
+        Background renewal runs on a timer thread and does not block the event loop.
+        """
+        super().__init__(base_url=base_url, creds=creds, client_id=client_id, client_secret=client_secret,
+                         ssl_verify=ssl_verify, proxy=proxy, timeout=timeout, background_renewal=background_renewal,
+                         token_cache=token_cache, rate_limit=rate_limit, retry_policy=retry_policy,
+                         json_codec=json_codec
+                         )
+        self.transport = AsyncTransport(pool_maxsize=pool_maxsize)
+
+    async def authenticate(self: object) -> bool:
+        """ Generates an authorization token. """
+        return self._store_token(await async_cached_token(self.token_cache, self.creds, self.base_url,
+                                                          self.TOKEN_RENEW_WINDOW, self.token,
+                                                          self._token_request(), self.transport
+                                                          ))
+
+    async def deauthenticate(self: object) -> bool:
+        """ Revokes the specified authorization token. Background renewal is stopped. """
+        self.renewal.stop()
+        return self._store_revoke(await async_perform_request(transport=self.transport, **self._revoke_request()))
+
+    async def command(self: object, *args, **kwargs):
+        """ Checks token expiration, renewing when necessary, then performs the request.
+            Accepts the same arguments as the command method of the Uber class.
+        """
+        if self.token_expired():
+            async with self.transport.refresh_lock():
+                # Only the first of many concurrent commands needs to authenticate
+                if self.token_expired():
+                    await self.authenticate()
+        request, returned = self._prepare_command(args, kwargs)
+        if request:
+            returned = await async_perform_request(transport=self.transport, rate_limiter=self.rate_limiter,
+                                                   retry_policy=self.retry_policy, json_codec=self.json_codec, **request)
+
+        return returned
+
+    def paginate(self: object, *args, **kwargs):
+        """ Pagination performs synchronous commands and is not available for the asyncio Uber class. """
+        raise TypeError("paginate is not available for the asyncio Uber class, use APIHarness.")
+
+    def hydrate(self: object, *args, **kwargs):
+        """ Hydration performs synchronous commands and is not available for the asyncio Uber class. """
+        raise TypeError("hydrate is not available for the asyncio Uber class, use APIHarness.")
+
+    async def close(self: object) -> None:
+        """
+        Stops background renewal and closes the asyncio transport and all pooled connections.
+        """
+        self.renewal.stop()
+        await self.transport.close()
+
+    async def __aenter__(self: object) -> object:
+        return self
+
+    async def __aexit__(self: object, *args) -> None:
+        await self.close()
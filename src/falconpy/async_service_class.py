@@ -0,0 +1,204 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+async_service_class - Asyncio flavoured Service Class base for the CrowdStrike Falcon OAuth2 API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import functools
+import inspect
+from ._async_util import AsyncTransport, _ASYNC_POOL_MAXSIZE
+from ._endpoint import operation_collection
+from ._service_class import ServiceClass
+from .oauth2 import OAuth2 as FalconAuth
+from .codec import json_codec as resolve_codec
+
+
+def awaitable_method(method):
+    """
+    Wraps a Service Class method so that it can be awaited.
+    API requests performed by the method are awaited, results returned directly
+    by the method (such as validation errors) are passed through unchanged.
+    """
+    @functools.wraps(method)
+    async def wrapped(*args, **kwargs):
+        returned = method(*args, **kwargs)
+        if inspect.isawaitable(returned):
+            returned = await returned
+
+        return returned
+
+    return wrapped
+
+
+def operation_method(method, operations: list) -> bool:
+    """
+    Returns a boolean indicating if a Service Class method performs an API operation.
+    Operation methods are exposed using the ID of an operation in the registry (operations),
+    or perform their request using process_service_request.
+    """
+    return method in operations or "process_service_request" in inspect.unwrap(method).__code__.co_names
+
+
+def unsupported_method(name: str):
+    """
+    Returns a method raising TypeError, replacing a synchronous helper (such as a batch
+    orchestrator or result iterator) that cannot be used with an asyncio flavoured Service Class.
+    """
+    def unsupported(*args, **kwargs):
+        raise TypeError(f"{name} is not available for asyncio Service Classes, use the synchronous Service Class.")
+
+    unsupported.__name__ = name
+    return unsupported
+
+
+class AsyncServiceClass(ServiceClass):
+    """
+    Base class of all asyncio flavoured Service Classes.
+
+    Combine with any Service Class to create its asyncio equivalent,
+    every API operation method of the resulting class is a coroutine.
+
+        class AsyncHosts(AsyncServiceClass, Hosts):
+            pass
+
+        async with AsyncHosts(auth_object=falcon_auth) as hosts:
+            results = await asyncio.gather(*[hosts.get_device_details(ids=aid) for aid in aid_list])
+
+    Requests share the same endpoint definitions and parameter handling as the synchronous
+    Service Classes and are performed using a pooled asyncio transport (aiohttp). Tokens are
+    refreshed without blocking the event loop, with concurrent requests (including those of
+    synchronous Service Classes sharing the authentication object) waiting for a single refresh.
+
+    Synchronous helpers (paginate, hydrate, batch orchestrators and result iterators) raise
+    TypeError. Response caching, request coalescing and streaming downloads (download_to)
+    are not supported and are rejected.
+    """
+    asynchronous = True
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Converts the API operation methods inherited from the Service Class to coroutines,
+        replacing every other synchronous helper with a method raising TypeError.
+        """
+        super().__init_subclass__(**kwargs)
+        operations = [getattr(cls, name) for name in dir(cls) if operation_collection(name)]
+        for name in dir(cls):
+            method = getattr(cls, name)
+            if not name.startswith("_") and not hasattr(AsyncServiceClass, name) \
+                    and inspect.isfunction(method) and not inspect.iscoroutinefunction(method):
+                if operation_method(method, operations):
+                    setattr(cls, name, awaitable_method(method))
+                else:
+                    setattr(cls, name, unsupported_method(name))
+
+    def __init__(self: object, auth_object: object = None,  # pylint: disable=W0231  # Tokens are requested on first use
+                 creds: dict = None, base_url: str = "https://api.crowdstrike.com",
+                 proxy: dict = None, **kwargs) -> object:
+        """
+        Instantiates the base class, ingesting the authorization object, credentials or token.
+        Unlike synchronous Service Classes, no token is requested until the first API request.
+        """
+        for keyword in ["response_cache", "coalesce"]:
+            if kwargs.get(keyword, None):
+                raise TypeError(f"{keyword} is not supported by asyncio Service Classes.")
+        access_token, self.ssl_verify, self.timeout = self.parse_keywords(kwargs)
+        client_id = kwargs.get("client_id", None)
+        client_secret = kwargs.get("client_secret", None)
+        pool_maxsize = kwargs.get("pool_maxsize", _ASYNC_POOL_MAXSIZE)
+        if client_id and client_secret and not creds:
+            creds = {
+                "client_id": client_id,
+                "client_secret": client_secret
+            }
+        if not auth_object and creds:
+            auth_object = FalconAuth(creds=creds,
+                                     base_url=base_url,
+                                     proxy=proxy,
+                                     ssl_verify=self.ssl_verify,
+                                     timeout=self.timeout,
+                                     token_cache=kwargs.get("token_cache", None),
+                                     rate_limit=kwargs.get("rate_limit", False),
+                                     retry_policy=kwargs.get("retry_policy", None),
+                                     json_codec=kwargs.get("json_codec", None)
+                                     )
+        self.auth_object = auth_object
+        self.access_token = access_token
+        self.token_override = None
+        self.default_headers = {}
+        self.header_token = None
+        if auth_object:
+            self.base_url = auth_object.base_url
+            self.ssl_verify = auth_object.ssl_verify
+            self.proxy = auth_object.proxy
+            self.timeout = auth_object.timeout
+            self.session = auth_object.session
+            # Share the asyncio connection pool between every Service Class using this authentication object
+            if not auth_object.async_transport:
+                auth_object.async_transport = AsyncTransport(pool_maxsize=pool_maxsize)
+            self.transport = auth_object.async_transport
+            self.refreshable = True
+        else:
+            self.base_url = base_url
+            self.proxy = proxy
+            self.session = None
+            self.transport = AsyncTransport(pool_maxsize=pool_maxsize)
+            self.refreshable = False
+        # A codec specified for this Service Class takes precedence over the authentication object's codec
+        self.json_codec = resolve_codec(kwargs.get("json_codec", None)) or getattr(self.auth_object, "json_codec", None)
+
+    paginate = unsupported_method("paginate")
+    hydrate = unsupported_method("hydrate")
+
+    async def close(self: object) -> None:
+        """
+        Closes the asyncio transport. When created using an authentication object,
+        the transport is shared with every other Service Class using that object.
+        """
+        await self.transport.close()
+
+    async def __aenter__(self: object) -> object:
+        return self
+
+    async def __aexit__(self: object, *args) -> None:
+        await self.close()
+
+
+def asynchronous(service_class: type) -> type:
+    """
+    Returns the asyncio flavoured equivalent of the provided Service Class.
+
+        AsyncHosts = asynchronous(Hosts)
+    """
+    return type(f"Async{service_class.__name__}", (AsyncServiceClass, service_class), {})
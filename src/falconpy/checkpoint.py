@@ -0,0 +1,264 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+checkpoint - Event Streams offset checkpoints for the CrowdStrike Falcon API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+
+# Seconds between background commits of recorded offsets
+_CHECKPOINT_INTERVAL = 5
+# Number of recorded events that triggers a commit before the interval lapses
+_CHECKPOINT_BATCH = 1000
+
+
+class CheckpointStore(ABC):
+    """
+    Interface for durable offset storage. Offsets are the offset of the last event processed,
+    keyed by application ID and partition. Subclass and implement load and save to provide
+    an alternative backend, stores missing either method cannot be created.
+    """
+    @abstractmethod
+    def load(self: object, app_id: str) -> dict:
+        """
+        Returns the stored offsets for the application, as a dictionary keyed by partition.
+        """
+
+    @abstractmethod
+    def save(self: object, app_id: str, offsets: dict) -> None:
+        """
+        Durably stores the offsets (keyed by partition) for the application.
+        """
+
+    def close(self: object) -> None:
+        """
+        Releases any resources held by the store.
+        """
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Stores offsets in a JSON file. The file is atomically replaced on every save.
+
+        store = FileCheckpointStore("/var/lib/falcon/offsets.json")
+    """
+    def __init__(self: object, path: str) -> object:
+        """
+        Initializes the store, creating the parent folder of the file if it does not exist.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def _read(self: object) -> dict:
+        """
+        Returns the contents of the checkpoint file, or an empty dictionary if it does not exist or is unreadable.
+        """
+        returned = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as checkpoint_file:
+                returned = json.load(checkpoint_file)
+        except (OSError, ValueError):
+            pass
+
+        return returned
+
+    def load(self: object, app_id: str) -> dict:
+        """
+        Returns the stored offsets for the application, as a dictionary keyed by partition.
+        """
+        with self.lock:
+            return {int(partition): offset for partition, offset in self._read().get(app_id, {}).items()}
+
+    def save(self: object, app_id: str, offsets: dict) -> None:
+        """
+        Atomically stores the offsets for the application, preserving those of other applications.
+        """
+        with self.lock:
+            content = self._read()
+            content[app_id] = {**content.get(app_id, {}), **{str(key): val for key, val in offsets.items()}}
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as checkpoint_file:
+                json.dump(content, checkpoint_file)
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+            os.replace(temporary, self.path)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Stores offsets in a SQLite database, updating only the partitions that changed on every save.
+
+        store = SQLiteCheckpointStore("/var/lib/falcon/offsets.db")
+    """
+    def __init__(self: object, path: str) -> object:
+        """
+        Initializes the store, creating the database and checkpoint table if they do not exist.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS checkpoints (app_id TEXT NOT NULL, "
+                                    "partition INTEGER NOT NULL, offset INTEGER NOT NULL, PRIMARY KEY (app_id, partition))"
+                                    )
+
+    def load(self: object, app_id: str) -> dict:
+        """
+        Returns the stored offsets for the application, as a dictionary keyed by partition.
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT partition, offset FROM checkpoints WHERE app_id = ?", (app_id,))
+            return dict(rows.fetchall())
+
+    def save(self: object, app_id: str, offsets: dict) -> None:
+        """
+        Stores the offsets for the application in a single transaction.
+        """
+        with self.lock, self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO checkpoints (app_id, partition, offset) VALUES (?, ?, ?)",
+                                        [(app_id, int(key), int(val)) for key, val in offsets.items()]
+                                        )
+
+    def close(self: object) -> None:
+        """
+        Closes the database connection.
+        """
+        with self.lock:
+            self.connection.close()
+
+
+class Checkpointer:
+    """
+    Records processed offsets in memory and commits them to a checkpoint store on a background
+    thread, so that storage is never performed on the event processing path. Commits are made
+    every interval seconds, or sooner once batch events have been recorded.
+
+    Offsets must only be recorded once the event has been processed. After a restart,
+    events processed since the last commit are delivered again (at-least-once delivery).
+
+    store: CheckpointStore - Durable offset storage
+    app_id: str - Label that identifies the connection
+    interval: float - Seconds between commits
+    batch: int - Number of recorded events that triggers a commit
+    """
+    def __init__(self: object, store: CheckpointStore, app_id: str,
+                 interval: float = _CHECKPOINT_INTERVAL, batch: int = _CHECKPOINT_BATCH) -> object:
+        """
+        Initializes the checkpointer. Commits are not performed in the background until start is called.
+        """
+        self.store = store
+        self.app_id = app_id
+        self.interval = interval
+        self.batch = batch
+        self.pending = {}
+        self.recorded = 0
+        self.commits = 0
+        self.lock = threading.Lock()
+        self.commit_lock = threading.Lock()
+        self.commit_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def load(self: object) -> dict:
+        """
+        Returns the committed offsets, keyed by partition.
+        """
+        return self.store.load(self.app_id)
+
+    def record(self: object, partition: int, offset: int) -> None:
+        """
+        Records the offset of a processed event.
+        """
+        with self.lock:
+            self.pending[partition] = offset
+            self.recorded += 1
+            if self.recorded >= self.batch:
+                self.commit_event.set()
+
+    def commit(self: object) -> None:
+        """
+        Commits the recorded offsets to the store.
+        """
+        with self.commit_lock:
+            with self.lock:
+                offsets = self.pending
+                self.pending = {}
+                self.recorded = 0
+            if offsets:
+                try:
+                    self.store.save(self.app_id, offsets)
+                    self.commits += 1
+                except Exception:  # pylint: disable=W0703  # Offsets are retried on the next commit
+                    with self.lock:
+                        self.pending = {**offsets, **self.pending}
+                    raise
+
+    def start(self: object) -> None:
+        """
+        Starts background commits. Calling start when commits are already active has no effect.
+        """
+        if not (self.thread and self.thread.is_alive()):
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name="falconpy-checkpoint", daemon=True)
+            self.thread.start()
+
+    def stop(self: object) -> None:
+        """
+        Stops background commits and commits any remaining offsets.
+        """
+        self.stop_event.set()
+        self.commit_event.set()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+        self.commit()
+
+    def _run(self: object) -> None:
+        """
+        Commit loop, commits whenever the interval lapses or a batch has been recorded.
+        """
+        while not self.stop_event.is_set():
+            self.commit_event.wait(self.interval)
+            self.commit_event.clear()
+            try:
+                self.commit()
+            except Exception:  # pylint: disable=W0703  # Storage failures are retried on the next commit
+                pass
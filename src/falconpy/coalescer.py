@@ -0,0 +1,125 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+coalescer - In-flight request coalescing for the CrowdStrike Falcon API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+from .response_cache import normalize_params
+
+
+class _Flight:
+    """
+    A request in flight, shared by every caller performing the same request.
+    """
+    __slots__ = ["done", "response", "error"]
+
+    def __init__(self: object) -> object:
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class RequestCoalescer:
+    """
+    Single-flight coalescing of identical concurrent GET requests.
+
+    While a request is in flight, identical requests (same operation ID, endpoint, query string
+    parameters and additional headers) wait for it instead of being performed, and every caller
+    receives a result for the same response. Nothing is kept once the request completes.
+
+        falcon = OAuth2(client_id=CLIENT_ID, client_secret=CLIENT_SECRET, coalesce=True)
+
+    The coalescer is shared by every Service Class using the authentication object it is created for.
+    """
+    def __init__(self: object) -> object:
+        """
+        Initializes the coalescer.
+        """
+        self.flights = {}
+        self.lock = threading.Lock()
+        self.counters = {"requests": 0, "coalesced": 0}
+
+    @staticmethod
+    def coalescable(method: str, operation_id: str) -> bool:
+        """
+        Returns a boolean indicating if identical concurrent requests can share a single request.
+        """
+        return bool(method.upper() == "GET" and operation_id)
+
+    def perform(self: object, operation_id: str, endpoint: str, params: dict,  # pylint: disable=R0913
+                extra: dict, send: callable) -> object:
+        """
+        Performs the request, or waits for an identical request already in flight, returning the response.
+        Exceptions raised performing the request are raised for every caller.
+
+        extra: dict - Additional headers sent with the request
+        send: callable - Performs the request with the additional headers provided, returning the response
+        """
+        key = (operation_id, endpoint, normalize_params(params), tuple(sorted(extra.items())))
+        with self.lock:
+            flight = self.flights.get(key, None)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self.flights[key] = flight
+                self.counters["requests"] += 1
+            else:
+                self.counters["coalesced"] += 1
+        if leader:
+            try:
+                flight.response = send(extra)
+            except Exception as err:  # pylint: disable=W0703  # Raised for every caller below
+                flight.error = err
+            finally:
+                with self.lock:
+                    del self.flights[key]
+                flight.done.set()
+        else:
+            flight.done.wait()
+        if flight.error:
+            raise flight.error
+
+        return flight.response
+
+    def metrics(self: object) -> dict:
+        """
+        Returns the number of requests performed and the number of requests that were coalesced.
+        """
+        with self.lock:
+            returned = dict(self.counters)
+            returned["in_flight"] = len(self.flights)
+
+        return returned
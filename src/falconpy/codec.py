@@ -0,0 +1,115 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+codec - Pluggable JSON codecs for the CrowdStrike Falcon API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import json
+try:
+    import orjson  # pylint: disable=E0401  # Optional dependency
+except ImportError:
+    orjson = None
+try:
+    import ujson  # pylint: disable=E0401  # Optional dependency
+except ImportError:
+    ujson = None
+
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    name: str - Name of the codec
+    dumps: callable - Serializes an object, returning bytes
+    loads: callable - Deserializes bytes or a string
+    """
+    def __init__(self: object, name: str, dumps: callable, loads: callable) -> object:
+        """
+        Initializes the codec.
+        """
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self: object) -> str:
+        return f"JSONCodec({self.name})"
+
+
+def _stdlib_codec() -> JSONCodec:
+    """
+    Returns the standard library codec. Output is compact, as sent by requests.
+    """
+    return JSONCodec("json", lambda obj: json.dumps(obj, separators=(",", ":")).encode("utf-8"), json.loads)
+
+
+def _orjson_codec() -> JSONCodec:
+    """
+    Returns the orjson codec. Non-string dictionary keys are permitted, as they are by the standard library.
+    """
+    return JSONCodec("orjson", lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), orjson.loads)
+
+
+def _ujson_codec() -> JSONCodec:
+    """
+    Returns the ujson codec.
+    """
+    return JSONCodec("ujson", lambda obj: ujson.dumps(obj, ensure_ascii=False).encode("utf-8"), ujson.loads)
+
+
+def json_codec(codec: object = None) -> JSONCodec:
+    """
+    Returns the codec specified, which can be the name of a codec ("json", "orjson" or "ujson"),
+    "auto" for the fastest installed codec, or a JSONCodec. Returns None when codec is None,
+    in which case bodies are encoded and decoded using the standard library.
+
+        hosts = Hosts(client_id=CLIENT_ID, client_secret=CLIENT_SECRET, json_codec="auto")
+    """
+    returned = codec
+    if isinstance(codec, str):
+        name = codec.lower()
+        if name == "auto":
+            name = "orjson" if orjson else "ujson" if ujson else "json"
+        if name == "json":
+            returned = _stdlib_codec()
+        elif name in ("orjson", "ujson"):
+            if not {"orjson": orjson, "ujson": ujson}[name]:
+                raise ImportError(f"The {name} package is required for the {name} JSON codec. "
+                                  f"Install it with: python3 -m pip install {name}"
+                                  )
+            returned = _orjson_codec() if name == "orjson" else _ujson_codec()
+        else:
+            raise ValueError(f"Unknown JSON codec: {codec}")
+
+    return returned
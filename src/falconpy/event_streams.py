@@ -38,6 +38,7 @@ For more information, please refer to <https://unlicense.org>
 """
 from ._util import force_default, process_service_request
 from ._service_class import ServiceClass
+from .stream_consumer import StreamConsumer, _STREAM_QUEUE_SIZE
 from ._endpoint._event_streams import _event_streams_endpoints as Endpoints
 
 
@@ -76,6 +77,26 @@ class EventStreams(ServiceClass):
             params=parameters
             )
 
+    def consume(self: object, app_id: str, partitions: list = None, offsets: dict = None,  # pylint: disable=R0913
+                max_queue: int = _STREAM_QUEUE_SIZE, stream_format: str = None,
+                checkpoint: object = None) -> StreamConsumer:
+        """
+        Returns a StreamConsumer that reads every available partition in parallel, yielding events as they arrive.
+        Provide a checkpoint store (FileCheckpointStore or SQLiteCheckpointStore) to resume after restarts.
+
+            with streams.consume(app_id="my-app") as consumer:
+                for event in consumer:
+                    ...
+        """
+        return StreamConsumer(service=self,
+                              app_id=app_id,
+                              partitions=partitions,
+                              offsets=offsets,
+                              max_queue=max_queue,
+                              stream_format=stream_format,
+                              checkpoint=checkpoint
+                              )
+
     # These method names align to the operation IDs in the API but
     # do not conform to snake_case / PEP8 and are defined here for
     # backwards compatibility / ease of use purposes
@@ -36,8 +36,8 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-import json
 from ._util import force_default, process_service_request
+from ._upload import open_upload, close_upload, close_after
 from ._service_class import ServiceClass
 from ._endpoint._falconx_sandbox import _falconx_sandbox_endpoints as Endpoints
 
@@ -55,10 +55,8 @@ class FalconXSandbox(ServiceClass):
         Download IOC packs, PCAP files, and other analysis artifacts.
         """
         # [GET] https://assets.falcon.crowdstrike.com/support/api/swagger.html#/falconx-sandbox/GetArtifacts
-        # Create a copy of our default header dictionary
-        header_payload = json.loads(json.dumps(self.headers))
-        # Set our content-type header
-        header_payload['Accept-Encoding'] = 'gzip'  # Force gzip compression
+        # Force gzip compression
+        header_payload = {**self.headers, "Accept-Encoding": "gzip"}
         return process_service_request(
             calling_object=self,
             endpoints=Endpoints,
@@ -146,20 +144,25 @@ class FalconXSandbox(ServiceClass):
         use `/falconx/entities/submissions/v1` to start analyzing the file.
         """
         # [POST] https://assets.falcon.crowdstrike.com/support/api/swagger.html#/falconx-sandbox/UploadSampleV2
-        # Create a copy of our default header dictionary
-        header_payload = json.loads(json.dumps(self.headers))
-        # Set our content-type header
-        header_payload["Content-Type"] = "application/octet-stream"
-        return process_service_request(
-            calling_object=self,
-            endpoints=Endpoints,
-            operation_id="UploadSampleV2",
-            body=body,
-            data=file_data,
-            params=parameters,
-            keywords=kwargs,
-            headers=header_payload
-            )
+        # Paths are memory-mapped and file-like objects streamed instead of being read into memory
+        upload = open_upload(file_data)
+        returned = None
+        try:
+            returned = process_service_request(
+                calling_object=self,
+                endpoints=Endpoints,
+                operation_id="UploadSampleV2",
+                body=body,
+                data=upload,
+                params=parameters,
+                keywords=kwargs,
+                headers={**self.headers, "Content-Type": "application/octet-stream"}
+                )
+        finally:
+            # Requests of asyncio Service Classes are performed once awaited
+            returned = close_after(returned, lambda: close_upload(file_data, upload))
+
+        return returned
 
     @force_default(defaults=["parameters"], default_types=["dict"])
     def get_reports(self: object, parameters: dict = None, **kwargs) -> object:
@@ -0,0 +1,132 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+hydrator - Concurrent entity retrieval for IDs returned by CrowdStrike Falcon API query operations
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+
+# Default number of concurrent entity requests, within the default connection pool size
+_HYDRATE_WORKERS = 8
+
+
+def batched(ids, size: int):
+    """
+    Lazily splits an iterable of IDs into lists of the size specified.
+    """
+    iterator = iter(ids)
+    batch = list(islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, size))
+
+
+class Hydrator:
+    """
+    Retrieves the entities for a stream of IDs, yielding hydrated records.
+
+    IDs are consumed lazily and split into batches no larger than the entity operation
+    accepts per request. Batches are retrieved concurrently on a bounded worker pool,
+    with no more than two batches per worker in flight at once.
+
+        devices = hosts.hydrate(hosts.get_device_details, hosts.paginate(hosts.query_devices_by_filter_scroll))
+        for device in devices:
+            ...
+
+    Records are yielded in the order of the IDs provided, or as each batch completes when
+    ordered is False. Results of failed batches are collected in the failed attribute.
+
+    request: callable - Performs the request for the list of IDs provided, returning the result
+    ids: iterable - IDs to retrieve, can be a generator or Paginator
+    batch_size: int - Maximum number of IDs per request
+    max_workers: int - Maximum number of concurrent requests
+    ordered: bool - Yield records in the order of the IDs provided
+    """
+    def __init__(self: object, request: callable, ids, batch_size: int,  # pylint: disable=R0913
+                 max_workers: int = _HYDRATE_WORKERS, ordered: bool = True) -> object:
+        """
+        Initializes the hydrator. No requests are performed until iteration begins.
+        """
+        self.request = request
+        self.ids = ids
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.ordered = ordered
+        self.failed = []
+
+    def results(self: object):
+        """
+        Generator yielding the result of each batch, including failed results.
+        """
+        batches = batched(self.ids, self.batch_size)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for batch in batches:
+                    pending.append(executor.submit(self.request, batch))
+                    # Bounds the number of IDs read ahead of the caller
+                    while len(pending) >= self.max_workers * 2:
+                        yield from self._completed(pending)
+                while pending:
+                    yield from self._completed(pending)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _completed(self: object, pending: deque):
+        """
+        Removes and yields the next completed result from the pending requests.
+        """
+        if self.ordered:
+            completed = [pending.popleft()]
+        else:
+            completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in completed:
+                pending.remove(future)
+        for future in completed:
+            result = future.result()
+            if not isinstance(result, dict) or result.get("status_code", None) != 200:
+                self.failed.append(result)
+            yield result
+
+    def __iter__(self: object):
+        """
+        Yields the records (resources) retrieved for every batch.
+        """
+        for result in self.results():
+            if isinstance(result, dict) and result.get("status_code", None) == 200:
+                yield from result["body"].get("resources", []) or []
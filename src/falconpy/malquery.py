@@ -38,6 +38,8 @@ For more information, please refer to <https://unlicense.org>
 """
 from ._util import process_service_request, force_default, handle_single_argument
 from ._service_class import ServiceClass
+from .malquery_download import BulkDownloader, _MULTIDOWNLOAD_BATCH_SIZE, _MULTIDOWNLOAD_WORKERS
+from .malquery_results import ResultStream
 from ._endpoint._malquery import _malquery_endpoints as Endpoints
 
 
@@ -57,6 +59,26 @@ class MalQuery(ServiceClass):
             operation_id="GetMalQueryQuotasV1"
             )
 
+    def bulk_download(self: object, samples, directory: str = ".", state: str = None,  # pylint: disable=R0913
+                      batch_size: int = _MULTIDOWNLOAD_BATCH_SIZE, max_workers: int = _MULTIDOWNLOAD_WORKERS,
+                      respect_quota: bool = True) -> BulkDownloader:
+        """
+        Returns a BulkDownloader that submits multidownload requests for the samples provided in batches,
+        polls them concurrently and streams their archives to disk, yielding the result of every request.
+        Interrupted runs are resumed using the state file (defaults to .malquery-downloads.json within directory).
+
+            for job in malquery.bulk_download(hashes, directory="/data/malquery"):
+                ...
+        """
+        return BulkDownloader(service=self,
+                              samples=samples,
+                              directory=directory,
+                              state=state,
+                              batch_size=batch_size,
+                              max_workers=max_workers,
+                              respect_quota=respect_quota
+                              )
+
     def fuzzy_search(self: object, body: dict) -> dict:
         """
         Search Falcon MalQuery quickly, but with more potential for false positives.
@@ -72,18 +94,33 @@ class MalQuery(ServiceClass):
             )
 
     @force_default(defaults=["parameters"], default_types=["dict"])
-    def get_download(self: object, *args, parameters: dict = None, **kwargs) -> dict:  # pylint: disable=C0103
+    def get_download(self: object, *args, parameters: dict = None, download_to: object = None,  # pylint: disable=C0103
+                     **kwargs) -> dict:
         """
         Download a file indexed by MalQuery. Specify the file using its SHA256.
         Only one file is supported at this time.
+
+        When download_to (a file path or writable file-like object) is provided, the file is streamed
+        to it in chunks and verified against the requested SHA256 instead of being returned.
         """
         # [GET] https://assets.falcon.crowdstrike.com/support/api/swagger.html#/malquery/GetMalQueryDownloadV1
+        parameters = handle_single_argument(args, parameters, "ids")
+        download = {}
+        if download_to is not None:
+            sha256 = parameters.get("ids", kwargs.get("ids", None))
+            if isinstance(sha256, list) and len(sha256) == 1:
+                sha256 = sha256[0]
+            download = {
+                "download_to": download_to,
+                "sha256": sha256 if isinstance(sha256, str) and "," not in sha256 else None
+            }
         return process_service_request(
             calling_object=self,
             endpoints=Endpoints,
             operation_id="GetMalQueryDownloadV1",
             keywords=kwargs,
-            params=handle_single_argument(args, parameters, "ids")
+            params=parameters,
+            **download
             )
 
     @force_default(defaults=["parameters"], default_types=["dict"])
@@ -116,18 +153,25 @@ class MalQuery(ServiceClass):
             )
 
     @force_default(defaults=["parameters"], default_types=["dict"])
-    def get_samples(self: object, *args, parameters: dict = None, **kwargs) -> dict:  # pylint: disable=C0103
+    def get_samples(self: object, *args, parameters: dict = None, download_to: object = None,  # pylint: disable=C0103
+                    **kwargs) -> dict:
         """
         Fetch a zip archive with password 'infected' containing the samples.
         Call this once the /entities/samples-multidownload request has finished processing
+
+        When download_to (a file path or writable file-like object) is provided, the archive is
+        streamed to it in chunks instead of being returned. Downloads to a path are written to a
+        partial file and renamed once complete, an interrupted download is resumed.
         """
         # [GET] https://assets.falcon.crowdstrike.com/support/api/swagger.html#/malquery/GetMalQueryEntitiesSamplesFetchV1
+        download = {"download_to": download_to} if download_to is not None else {}
         return process_service_request(
             calling_object=self,
             endpoints=Endpoints,
             operation_id="GetMalQueryEntitiesSamplesFetchV1",
             keywords=kwargs,
-            params=handle_single_argument(args, parameters, "ids")
+            params=handle_single_argument(args, parameters, "ids"),
+            **download
             )
 
     def samples_multidownload(self: object, body: dict) -> dict:
@@ -171,6 +215,36 @@ class MalQuery(ServiceClass):
             body=body
             )
 
+    def stream_hunt(self: object, body: dict) -> ResultStream:
+        """
+        Schedules a YARA-based search, returning a ResultStream that waits for the request to finish
+        and yields its matches as they are decoded.
+
+            for match in malquery.stream_hunt(body={"yara_rule": rule}):
+                ...
+        """
+        return ResultStream(service=self, operation_id="PostMalQueryHuntV1", body=body)
+
+    def stream_exact_search(self: object, body: dict) -> ResultStream:
+        """
+        Submits an exact search, returning a ResultStream that waits for the request to finish
+        and yields its matches as they are decoded.
+        """
+        return ResultStream(service=self, operation_id="PostMalQueryExactSearchV1", body=body)
+
+    def stream_fuzzy_search(self: object, body: dict) -> ResultStream:
+        """
+        Performs a fuzzy search, returning a ResultStream yielding its matches as they are decoded.
+        """
+        return ResultStream(service=self, operation_id="PostMalQueryFuzzySearchV1", body=body)
+
+    def stream_request(self: object, request_id: str) -> ResultStream:
+        """
+        Returns a ResultStream that waits for a hunt or exact search request already submitted
+        to finish and yields its matches as they are decoded.
+        """
+        return ResultStream(service=self, request_id=request_id)
+
     # These method names align to the operation IDs in the API but
     # do not conform to snake_case / PEP8 and are defined here for
     # backwards compatibility / ease of use purposes
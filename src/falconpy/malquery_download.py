@@ -0,0 +1,320 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+malquery_download - Concurrent, resumable MalQuery sample downloads
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import json
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .hydrator import batched
+
+# Default number of samples per multidownload request
+_MULTIDOWNLOAD_BATCH_SIZE = 100
+# Default number of requests polled and downloaded concurrently
+_MULTIDOWNLOAD_WORKERS = 4
+# Seconds before a request is first polled
+_MULTIDOWNLOAD_INITIAL_INTERVAL = 1.0
+# Maximum seconds between polls of a request
+_MULTIDOWNLOAD_MAX_INTERVAL = 30.0
+# Multiplier applied to the interval after every poll of a request that has not finished
+_MULTIDOWNLOAD_BACKOFF = 1.5
+# Seconds after which a request that has not finished is abandoned
+_MULTIDOWNLOAD_TIMEOUT = 3600
+
+
+def remaining_quota(quotas: dict, reserved: int = 0) -> int:
+    """
+    Returns the number of sample downloads remaining in the MalQuery quota once the reserved
+    samples (submitted but not yet downloaded) are downloaded, or None when the quota could not be determined.
+    """
+    returned = None
+    if quotas.get("status_code", None) == 200:
+        meta = quotas["body"].get("meta", None) or {}
+        if isinstance(meta.get("download_limit", None), int) and isinstance(meta.get("download_count", None), int):
+            returned = max(meta["download_limit"] - meta["download_count"] - reserved, 0)
+
+    return returned
+
+
+class DownloadState:
+    """
+    Records the multidownload requests of a downloader in a JSON file, so that an interrupted run can be resumed.
+    The file is atomically replaced on every update.
+    """
+    def __init__(self: object, path: str) -> object:
+        """
+        Initializes the state, reading the requests recorded by a previous run.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.jobs = {}
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            with open(path, "r", encoding="utf-8") as state_file:
+                self.jobs = json.load(state_file).get("jobs", {})
+        except (OSError, ValueError):
+            pass
+
+    def unfinished(self: object) -> list:
+        """
+        Returns the IDs of the requests that have not been downloaded or failed.
+        """
+        with self.lock:
+            return [request_id for request_id, job in self.jobs.items() if job["status"] in ["submitted", "done"]]
+
+    def covered(self: object) -> set:
+        """
+        Returns the samples of every request that has not failed.
+        """
+        with self.lock:
+            return {sample for job in self.jobs.values() if job["status"] != "failed" for sample in job["samples"]}
+
+    def update(self: object, request_id: str, **kwargs) -> dict:
+        """
+        Atomically records changes to a request, returning the request.
+        """
+        with self.lock:
+            job = self.jobs.setdefault(request_id, {"samples": [], "status": "submitted"})
+            job.update(kwargs)
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as state_file:
+                json.dump({"jobs": self.jobs}, state_file, indent=2, sort_keys=True)
+                state_file.flush()
+                os.fsync(state_file.fileno())
+            os.replace(temporary, self.path)
+
+            return dict(job)
+
+
+class BulkDownloader:
+    """
+    Downloads MalQuery samples in bulk, yielding the result of every multidownload request.
+
+    Samples are submitted in multidownload requests of batch_size samples, no more than max_workers
+    requests are in progress at once. Each request is polled with an interval growing by backoff up
+    to max_interval, and its archive is streamed to <request ID>.zip within directory once it is ready.
+    The SHA-256 and size of every archive are recorded in the state file.
+
+        downloader = malquery.bulk_download(samples, directory="/data/malquery")
+        for job in downloader:
+            print(job["request_id"], job["status"], job["path"])
+
+    Requests are recorded in the state file as they are submitted. When a run is interrupted, the next
+    run using the same state file resumes polling and downloading the requests that have not completed
+    (resuming partially downloaded archives) instead of submitting their samples again. Samples already
+    downloaded are not submitted again. When the download quota (from get_quotas), less the samples
+    of the requests being resumed, is insufficient, samples beyond the quota are not submitted and
+    are recorded in the over_quota attribute.
+
+    Results of failed requests are collected in the failed attribute. When iteration is stopped
+    early, requests that have not finished are recorded in failed with a status of "pending",
+    and are resumed by the next run.
+
+    service: MalQuery - Service Class used to submit, poll and download requests
+    samples: iterable - SHA-256 of the samples to download
+    directory: str - Directory archives are saved to
+    state: str - State file path, defaults to .malquery-downloads.json within directory
+    batch_size: int - Maximum number of samples per multidownload request
+    max_workers: int - Maximum number of requests in progress at once
+    respect_quota: bool - Do not submit more samples than the remaining download quota
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self: object, service: object, samples, directory: str = ".",  # pylint: disable=R0913
+                 state: str = None, batch_size: int = _MULTIDOWNLOAD_BATCH_SIZE,
+                 max_workers: int = _MULTIDOWNLOAD_WORKERS, respect_quota: bool = True) -> object:
+        """
+        Initializes the downloader. No requests are performed until iteration begins.
+        """
+        self.service = service
+        self.samples = samples
+        self.directory = directory
+        self.state = DownloadState(state or os.path.join(directory, ".malquery-downloads.json"))
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.respect_quota = respect_quota
+        self.initial_interval = _MULTIDOWNLOAD_INITIAL_INTERVAL
+        self.max_interval = _MULTIDOWNLOAD_MAX_INTERVAL
+        self.backoff = _MULTIDOWNLOAD_BACKOFF
+        self.timeout = _MULTIDOWNLOAD_TIMEOUT
+        self.over_quota = []
+        self.failed = []
+        self.counts = {"samples": 0, "requests": 0, "resumed": 0, "downloaded": 0, "failed": 0, "pending": 0,
+                       "skipped": 0}
+        self.stop_event = threading.Event()
+
+    def _failed(self: object, request_id: str, result: dict, message: str) -> dict:
+        """
+        Records a request as failed, returning the request.
+        """
+        body = result.get("body", None) if isinstance(result, dict) else None
+        errors = (body.get("errors", None) if isinstance(body, dict) else None) or [{"message": message}]
+
+        return self.state.update(request_id, status="failed", errors=errors)
+
+    def _complete(self: object, request_id: str) -> dict:
+        """
+        Waits for a request to finish and streams its archive to disk, returning the request.
+        """
+        started = time.monotonic()
+        interval = self.initial_interval
+        while True:
+            status = self.service.get_request(ids=request_id)
+            if status["status_code"] != 200:
+                return self._failed(request_id, status, "Unable to retrieve the status of the request")
+            progress = (status["body"].get("meta", None) or {}).get("status", None)
+            if progress == "done":
+                break
+            if progress == "failed":
+                return self._failed(request_id, status, "The request failed")
+            if time.monotonic() - started + interval > self.timeout:
+                return self._failed(request_id, {}, f"The request did not finish within {self.timeout} seconds")
+            if self.stop_event.wait(interval):
+                return self.state.update(request_id)
+            interval = min(interval * self.backoff, self.max_interval)
+        path = os.path.join(self.directory, f"{request_id}.zip")
+        self.state.update(request_id, status="done", path=path)
+        archive = self.service.get_samples(ids=request_id, download_to=path)
+        if archive["status_code"] != 200:
+            return self._failed(request_id, archive, "Unable to download the archive")
+        if not zipfile.is_zipfile(path):
+            os.remove(path)
+            return self._failed(request_id, {}, "The downloaded archive is not a valid zip file")
+
+        return self.state.update(request_id, status="downloaded", sha256=archive["body"]["resources"][0]["sha256"],
+                                 size=os.path.getsize(path), errors=[])
+
+    def _submit(self: object, samples: list) -> tuple:
+        """
+        Submits a multidownload request, returning its request ID (or None) and the submission result.
+        """
+        submitted = self.service.samples_multidownload(body={"samples": samples})
+        request_id = None
+        if submitted["status_code"] in [200, 201]:
+            request_id = (submitted["body"].get("meta", None) or {}).get("reqid", None)
+        if request_id:
+            self.state.update(request_id, samples=samples, status="submitted")
+
+        return request_id, submitted
+
+    def _pending_samples(self: object, quota: int):
+        """
+        Generator yielding the samples to submit, within the quota.
+        """
+        covered = self.state.covered()
+        queued = set()
+        for sample in self.samples:
+            sample = sample.lower()
+            self.counts["samples"] += 1
+            if sample in covered or sample in queued:
+                self.counts["skipped"] += 1
+            elif quota is not None and len(queued) >= quota:
+                self.over_quota.append(sample)
+            else:
+                queued.add(sample)
+                yield sample
+
+    def _result(self: object, request_id: str, job: dict) -> dict:
+        """
+        Returns the result for a request, recording its outcome. Requests that have not finished are pending.
+        """
+        status = job["status"] if job["status"] in ["downloaded", "failed"] else "pending"
+        self.counts[status] += 1
+        errors = job.get("errors", [])
+        if status == "pending":
+            errors = [{"message": "The download was stopped before the request finished, it is resumed by the next run"}]
+        returned = {"request_id": request_id, "samples": job["samples"], "status": status,
+                    "path": job.get("path", None) if status == "downloaded" else None,
+                    "sha256": job.get("sha256", None), "size": job.get("size", None), "errors": errors}
+        if status != "downloaded":
+            self.failed.append(returned)
+
+        return returned
+
+    def __iter__(self: object):
+        """
+        Yields the result of every request as it completes, starting with the requests of an interrupted run.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        resumed = self.state.unfinished()
+        quota = None
+        if self.respect_quota:
+            # Samples of the requests being resumed are downloaded before any new request is submitted
+            reserved = sum(len(self.state.jobs[request_id]["samples"]) for request_id in resumed)
+            quota = remaining_quota(self.service.get_quotas(), reserved)
+        batches = batched(self._pending_samples(quota), self.batch_size)
+        pending = {}
+        self.stop_event.clear()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                while True:
+                    while len(pending) < self.max_workers:
+                        if resumed:
+                            request_id = resumed.pop(0)
+                            self.counts["resumed"] += 1
+                        else:
+                            samples = next(batches, None)
+                            if not samples:
+                                break
+                            request_id, submitted = self._submit(samples)
+                            if not request_id:
+                                self.counts["failed"] += 1
+                                self.failed.append({"request_id": None, "samples": samples, "status": "failed",
+                                                    "path": None, "sha256": None, "size": None,
+                                                    "errors": submitted["body"].get("errors", None) or []})
+                                yield self.failed[-1]
+                                continue
+                            self.counts["requests"] += 1
+                        pending[executor.submit(self._complete, request_id)] = request_id
+                    if not pending:
+                        break
+                    completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        request_id = pending.pop(future)
+                        yield self._result(request_id, future.result())
+            finally:
+                # Requests in progress remain recorded as submitted, and are resumed by the next run
+                self.stop_event.set()
+                for future, request_id in pending.items():
+                    if not future.cancel() and not future.exception():
+                        self._result(request_id, future.result())
+                    else:
+                        self._result(request_id, self.state.jobs[request_id])
+                for request_id in resumed:
+                    self._result(request_id, self.state.jobs[request_id])
@@ -0,0 +1,299 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+malquery_results - Streaming MalQuery search results for the CrowdStrike Falcon API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import codecs
+import json
+import time
+import requests
+from ._registry import find_operation, is_idempotent
+from ._util import generate_error_result, send_request, _USER_AGENT
+from .hydrator import batched
+from ._endpoint._malquery import _malquery_endpoints as Endpoints
+
+# Size of each chunk read from a results response
+_RESULTS_CHUNK_SIZE = 64 * 1024
+# Default number of matched samples per get_metadata request
+_RESULTS_METADATA_BATCH_SIZE = 100
+# Seconds before a request is first polled
+_RESULTS_INITIAL_INTERVAL = 1.0
+# Maximum seconds between polls of a request
+_RESULTS_MAX_INTERVAL = 30.0
+# Multiplier applied to the interval after every poll of a request that has not finished
+_RESULTS_BACKOFF = 1.5
+# Seconds after which a request that has not finished is abandoned
+_RESULTS_TIMEOUT = 3600
+
+# Positions within the top level object of a response body
+(_OBJECT, _FIRST_KEY, _KEY, _COLON, _VALUE, _NEXT_KEY,
+ _FIRST_ITEM, _ITEM, _NEXT_ITEM, _END) = range(10)
+# Punctuation expected at each position and the position that follows it
+_TRANSITIONS = {(_OBJECT, "{"): _FIRST_KEY, (_FIRST_KEY, "}"): _END, (_COLON, ":"): _VALUE,
+                (_NEXT_KEY, ","): _KEY, (_NEXT_KEY, "}"): _END,
+                (_FIRST_ITEM, "]"): _NEXT_KEY, (_NEXT_ITEM, ","): _ITEM, (_NEXT_ITEM, "]"): _NEXT_KEY
+                }
+# Positions where a key or value is decoded and the position that follows it
+_DECODED = {_FIRST_KEY: _COLON, _KEY: _COLON, _VALUE: _NEXT_KEY, _FIRST_ITEM: _NEXT_ITEM, _ITEM: _NEXT_ITEM}
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+
+
+def decode_resources(chunks, fields: dict):
+    """
+    Generator incrementally decoding a JSON response body read in chunks, yielding each element of the
+    resources array as soon as it has been read. Every other top level value (meta, errors) is stored in fields.
+
+    Only the element being decoded is held in memory, regardless of the size of the response.
+    Raises ValueError when the body is not a JSON object or ends prematurely.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    state = _OBJECT
+    key = None
+    chunks = iter(chunks)
+    while state != _END:
+        chunk = next(chunks, None)
+        final = chunk is None
+        buffer = buffer[position:] + text.decode(chunk or b"", final=final)
+        position = 0
+        while state != _END:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position >= len(buffer):
+                break
+            char = buffer[position]
+            if (state, char) in _TRANSITIONS:
+                state = _TRANSITIONS[(state, char)]
+                position += 1
+                continue
+            if state == _VALUE and key == "resources" and char == "[":
+                state = _FIRST_ITEM
+                position += 1
+                continue
+            if state not in _DECODED:
+                raise ValueError(f"Unexpected character {char!r} in response body")
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # The value continues in the next chunk
+            if not final and (end >= len(buffer) or buffer[end] not in _DELIMITERS):
+                break  # Numbers and literals may continue in the next chunk
+            position = end
+            if state in [_FIRST_KEY, _KEY]:
+                if not isinstance(value, str):
+                    raise ValueError("Response body keys must be strings")
+                key = value
+            elif state == _VALUE:
+                fields[key] = value
+            else:
+                yield value
+            state = _DECODED[state]
+        if final and state != _END:
+            raise ValueError("The response body ended prematurely")
+
+
+class ResultStream:
+    """
+    Iterates over the matches of a MalQuery hunt, exact or fuzzy search, decoding them
+    as they are read from the response instead of materializing the entire result.
+
+        for match in malquery.stream_hunt(body={"yara_rule": rule}):
+            print(match["sha256"])
+
+    Hunts and exact searches are submitted, then their request is polled with a growing interval
+    until it is done, and its results are read using a streaming response. Matches returned while the
+    request is in progress (or once it has failed) are partial and are not yielded. Fuzzy searches are
+    synchronous and their results are read from the search response.
+
+    Iteration ends without raising when the search cannot be submitted or does not complete.
+    The failing result is available as failed, the meta and errors of the last response as meta and errors.
+
+    service: object - MalQuery Service Class used to submit searches and retrieve metadata
+    operation_id: str - Search operation, PostMalQueryHuntV1, PostMalQueryExactSearchV1 or PostMalQueryFuzzySearchV1
+    body: dict - Search body payload
+    request_id: str - Identifier of a request already submitted, used instead of submitting a search
+    """
+    def __init__(self: object, service: object, operation_id: str = None,  # pylint: disable=R0913
+                 body: dict = None, request_id: str = None) -> object:
+        self.service = service
+        self.operation_id = operation_id
+        self.body = body
+        self.request_id = request_id
+        self.initial_interval = _RESULTS_INITIAL_INTERVAL
+        self.max_interval = _RESULTS_MAX_INTERVAL
+        self.backoff = _RESULTS_BACKOFF
+        self.timeout = _RESULTS_TIMEOUT
+        self.chunk_size = _RESULTS_CHUNK_SIZE
+        self.meta = {}
+        self.errors = []
+        self.failed = None
+        self.counts = {"polls": 0, "matches": 0}
+
+    def _open(self: object, operation_id: str, **kwargs) -> object:
+        """
+        Performs a request for the operation specified, returning the streaming response. The token is
+        renewed before every request, and requests are throttled and retried like other API requests.
+        """
+        operation = find_operation(Endpoints, operation_id)
+        requester = getattr(self.service, "session", None) or requests
+        auth_object = getattr(self.service, "auth_object", None)
+        renewed = auth_object.renew_token() if auth_object else True  # Searches can outlive the token
+        headers = {**self.service.headers, "User-Agent": _USER_AGENT}
+        if auth_object:
+            headers["Authorization"] = f"Bearer {self.service.token}" if renewed else "Bearer "
+
+        return send_request(
+            lambda: requester.request(operation.method, f"{self.service.base_url}{operation.path}", stream=True,
+                                      headers=headers,
+                                      verify=self.service.ssl_verify,
+                                      proxies=getattr(self.service, "proxy", None),
+                                      timeout=getattr(self.service, "timeout", None),
+                                      **kwargs
+                                      ),
+            rate_limiter=getattr(auth_object, "rate_limiter", None),
+            retry_policy=getattr(auth_object, "retry_policy", None),
+            idempotent=is_idempotent(operation_id, operation.method)
+            )
+
+    def _read(self: object, response: object, ready: callable = None):
+        """
+        Generator yielding the matches of a response, recording its meta and errors once it has been read.
+        When ready is provided, it is called with the fields decoded so far and matches are only yielded
+        when it returns True, the remaining matches are decoded and discarded. Returns the number discarded.
+        """
+        fields = {}
+        discarded = 0
+        try:
+            for match in decode_resources(response.iter_content(chunk_size=self.chunk_size), fields):
+                if ready and not ready(fields):
+                    discarded += 1
+                    continue
+                self.counts["matches"] += 1
+                yield match
+        finally:
+            response.close()  # Releases the connection when iteration is stopped early
+        self.meta = fields.get("meta", None) or {}
+        self.errors = fields.get("errors", None) or []
+        if response.status_code != 200:
+            self._fail(self.errors[0].get("message", None) if self.errors else None, response.status_code)
+
+        return discarded
+
+    def _fail(self: object, message: str, code: int = 500) -> None:
+        """
+        Records the result of a search that did not complete.
+        """
+        self.failed = generate_error_result(message or "Unable to retrieve the search results", code)
+        if self.errors:
+            self.failed["body"]["errors"] = self.errors
+
+    def _submit(self: object) -> str:
+        """
+        Submits the search, returning its request ID or None when the search could not be submitted.
+        """
+        submitted = getattr(self.service, self.operation_id)(body=self.body)
+        request_id = None
+        if submitted["status_code"] in [200, 201]:
+            request_id = (submitted["body"].get("meta", None) or {}).get("reqid", None)
+        if not request_id:
+            self.failed = submitted
+        self.request_id = request_id
+
+        return request_id
+
+    def _poll(self: object, request_id: str):
+        """
+        Generator polling a request until it is done, yielding its matches.
+        """
+        started = time.monotonic()
+        interval = self.initial_interval
+        while True:
+            self.counts["polls"] += 1
+            # Matches returned by a request in progress are partial, only those of a finished request are yielded
+            discarded = yield from self._read(self._open("GetMalQueryRequestV1", params={"ids": request_id}),
+                                              ready=lambda fields: (fields.get("meta", None) or {}).get("status") == "done")
+            status = self.meta.get("status", None)
+            if status == "failed" and not self.failed:
+                self._fail("The request failed")
+            if status == "done" and discarded and not self.failed:
+                # The status followed the matches in the response, they are read again now that it is known
+                yield from self._read(self._open("GetMalQueryRequestV1", params={"ids": request_id}))
+            if self.failed or status == "done":
+                break
+            if time.monotonic() - started + interval > self.timeout:
+                self._fail(f"The request did not finish within {self.timeout} seconds", 408)
+                break
+            time.sleep(interval)
+            interval = min(interval * self.backoff, self.max_interval)
+
+    def __iter__(self: object):
+        """
+        Yields every match of the search as it is decoded.
+        """
+        self.failed = None
+        try:
+            if self.operation_id == "PostMalQueryFuzzySearchV1":
+                yield from self._read(self._open(self.operation_id, json=self.body))
+            elif self.request_id or self._submit():
+                yield from self._poll(self.request_id)
+        except (requests.exceptions.RequestException, ValueError) as err:
+            self._fail(str(err))
+
+    def sha256s(self: object):
+        """
+        Generator yielding the SHA-256 of every sample matched by the search.
+        """
+        for match in self:
+            if match.get("sha256", None):
+                yield match["sha256"]
+
+    def metadata(self: object, batch_size: int = _RESULTS_METADATA_BATCH_SIZE):
+        """
+        Generator yielding the metadata of every sample matched by the search, retrieved using
+        get_metadata in batches of batch_size as matches are read. Failing batches are skipped
+        and their results are available as failed.
+        """
+        for sha256s in batched(self.sha256s(), batch_size):
+            result = self.service.get_metadata(ids=sha256s)
+            if result["status_code"] != 200:
+                self.failed = result
+                continue
+            yield from result["body"].get("resources", None) or []
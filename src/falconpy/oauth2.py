@@ -37,7 +37,13 @@ OTHER DEALINGS IN THE SOFTWARE.
 For more information, please refer to <https://unlicense.org>
 """
 import time
-from ._util import perform_request, generate_b64cred, generate_error_result
+import threading
+from ._util import perform_request, generate_b64cred, generate_error_result, create_session
+from ._util import _POOL_CONNECTIONS, _POOL_MAXSIZE
+from ._token_renewal import TokenRenewal
+from ._rate_limit import RateLimiter
+from .codec import json_codec as resolve_codec
+from .coalescer import RequestCoalescer
 from ._endpoint._oauth2 import _oauth2_endpoints as Endpoints
 
 
@@ -56,10 +62,41 @@ class OAuth2:
     # pylint: disable=too-many-instance-attributes,too-many-arguments
     def __init__(self: object, base_url: str = "https://api.crowdstrike.com",
                  ssl_verify: bool = True, proxy: dict = None, timeout: float or tuple = None,
-                 creds: dict = None, client_id: str = None, client_secret: str = None):
+                 creds: dict = None, client_id: str = None, client_secret: str = None,
+                 pool_connections: int = _POOL_CONNECTIONS, pool_maxsize: int = _POOL_MAXSIZE,
+                 background_renewal: bool = False, token_cache: object = None, rate_limit: bool = False,
+                 retry_policy: object = None, json_codec: object = None, response_cache: object = None,
+                 coalesce: bool = False):
         """
         Initializes the base class by ingesting credentials, the proxies dictionary and specifications
         for the base URL, SSL verification, and timeouts.
+
+        A persistent, pooled HTTP session is created and shared with every Service Class
+        instantiated using this authentication object. Connection pool sizing can be
+        customized using the pool_connections and pool_maxsize keywords.
+
+        When background_renewal is enabled, the token is renewed ahead of expiration on a
+        background thread so that API requests never wait on authentication.
+
+        When a token_cache (TokenCache) is specified, tokens are shared on disk with
+        every other process using the same credentials and base URL. The cache is
+        consulted before a token request is performed.
+
+        When rate_limit is enabled, requests are throttled client-side using the rate limit
+        headers returned by the API, and requests receiving a 429 response are retried.
+        The rate limiter is shared by every Service Class using this authentication object.
+
+        When a retry_policy (RetryPolicy) is specified, failed requests performed by every
+        Service Class using this authentication object are retried according to the policy.
+
+        When a json_codec is specified ("auto", "orjson", "ujson" or a JSONCodec), request and
+        response bodies are encoded and decoded using it instead of the standard library.
+
+        When a response_cache (ResponseCache) is specified, responses to read-mostly GET operations
+        are cached and shared by every Service Class using this authentication object.
+
+        When coalesce is enabled, identical concurrent GET requests performed by Service Classes
+        using this authentication object share a single in-flight request and its response.
         """
         if client_id and client_secret and not creds:
             creds = {
@@ -73,22 +110,40 @@ class OAuth2:
         self.ssl_verify = ssl_verify
         self.timeout = timeout
         self.proxy = proxy
+        self.token_cache = token_cache
+        self.rate_limiter = RateLimiter() if rate_limit else None
+        self.retry_policy = retry_policy
+        self.json_codec = resolve_codec(json_codec)
+        self.response_cache = response_cache
+        self.coalescer = RequestCoalescer() if coalesce else None
+        self.session = create_session(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        # Created on first use by asyncio flavoured Service Classes
+        self.async_transport = None
         self.token_expiration = 0
         self.token_renew_window = 20
         self.token_time = time.time()
         self.token_value = False
+        # Serializes token requests so that concurrent renewals result in a single request
+        self.token_lock = threading.RLock()
         self.token_expired = lambda: bool(
             (time.time() - self.token_time) >= (self.token_expiration - self.token_renew_window)
             )
         self.authenticated = lambda: not bool(self.token_expired())
+        self.token_remaining = lambda: (self.token_time + self.token_expiration - self.token_renew_window) - time.time()
+        self.renewal = TokenRenewal(renew=lambda: self.token()["status_code"] == 201,
+                                    seconds_remaining=self.token_remaining,
+                                    lock=self.token_lock
+                                    )
+        if background_renewal:
+            self.renewal.start()
 
-    def token(self: object) -> dict:
+    def prepare_token_request(self: object) -> dict:
         """
-        Generates an authorization token.
+        Returns the keywords necessary to perform a token request,
+        or None if a valid set of credentials has not been provided.
         """
+        returned = None
         operation_id = "oauth2AccessToken"
-        target_url = f"{self.base_url}{[ep[2] for ep in Endpoints if operation_id in ep[0]][0]}"
-        header_payload = {}
         if "client_id" in self.creds and "client_secret" in self.creds:
             data_payload = {
                 'client_id': self.creds['client_id'],
@@ -96,21 +151,69 @@ class OAuth2:
             }
             if "member_cid" in self.creds:
                 data_payload["member_cid"] = self.creds["member_cid"]
-            returned = perform_request(method="POST", endpoint=target_url, data=data_payload, headers=header_payload,
-                                       verify=self.ssl_verify, proxy=self.proxy, timeout=self.timeout)
-            if returned["status_code"] == 201:
-                self.token_expiration = returned["body"]["expires_in"]
-                self.token_time = time.time()
-                self.token_value = returned["body"]["access_token"]
+            returned = {
+                "method": "POST",
+                "endpoint": f"{self.base_url}{[ep[2] for ep in Endpoints if operation_id in ep[0]][0]}",
+                "data": data_payload,
+                "headers": {},
+                "verify": self.ssl_verify,
+                "proxy": self.proxy,
+                "timeout": self.timeout
+            }
+
+        return returned
+
+    def store_token(self: object, returned: dict) -> dict:
+        """
+        Stores the token details from a successful token request result.
+        """
+        if returned["status_code"] == 201:
+            self.token_expiration = returned["body"]["expires_in"]
+            self.token_time = time.time()
+            self.token_value = returned["body"]["access_token"]
+
+        return returned
+
+    def token(self: object) -> dict:
+        """
+        Generates an authorization token. When a token cache is in use, a valid
+        token cached by another process is used instead of requesting a new one.
+        """
+        token_request = self.prepare_token_request()
+        if token_request:
+            with self.token_lock:
+                if self.token_cache:
+                    returned = self.token_cache.fetch(self.creds, self.base_url, self.token_renew_window, self.token_value,
+                                                      lambda: perform_request(session=self.session, **token_request)
+                                                      )
+                else:
+                    returned = perform_request(session=self.session, **token_request)
+                returned = self.store_token(returned)
         else:
             returned = generate_error_result("Invalid credentials specified", 403)
 
         return returned
 
+    def renew_token(self: object) -> bool:
+        """
+        Generates a new authorization token if the current token has expired or is within the renewal window.
+        When multiple threads detect expiration at the same time only one token request is performed,
+        the remaining threads wait for it to complete and then use the new token.
+        Returns a boolean indicating if a valid token is available.
+        """
+        if self.token_expired():
+            with self.token_lock:
+                # Another thread may have renewed the token while we were waiting
+                if self.token_expired():
+                    self.token()
+
+        return self.authenticated()
+
     def revoke(self: object, token: str) -> dict:
         """
-        Revokes the specified authorization token.
+        Revokes the specified authorization token. Background renewal is stopped.
         """
+        self.renewal.stop()
         operation_id = "oauth2RevokeToken"
         target_url = f"{self.base_url}{[ep[2] for ep in Endpoints if operation_id in ep[0]][0]}"
         if "client_id" in self.creds and "client_secret" in self.creds:
@@ -119,10 +222,20 @@ class OAuth2:
                 )}
             data_payload = {'token': '{}'.format(token)}
             returned = perform_request(method="POST", endpoint=target_url, data=data_payload, headers=header_payload,
-                                       verify=self.ssl_verify, proxy=self.proxy, timeout=self.timeout)
+                                       verify=self.ssl_verify, proxy=self.proxy, timeout=self.timeout,
+                                       session=self.session)
+            if self.token_cache:
+                self.token_cache.discard(self.creds, self.base_url, token)
             self.token_expiration = 0
             self.token_value = False
         else:
             returned = generate_error_result("Invalid credentials specified", 403)
 
         return returned
+
+    def close(self: object) -> None:
+        """
+        Stops background renewal and closes the persistent session and all pooled connections.
+        """
+        self.renewal.stop()
+        self.session.close()
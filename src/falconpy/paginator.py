@@ -0,0 +1,163 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+paginator - Automatic pagination for CrowdStrike Falcon API query operations
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs
+
+
+def _pagination(result: dict) -> dict:
+    """
+    Returns the pagination details from the meta branch of a result.
+    """
+    meta = result.get("body", {}).get("meta", {}) or {}
+
+    return meta.get("pagination", {}) or {}
+
+
+def _header(result: dict, name: str) -> str:
+    """
+    Returns the value of a response header regardless of case, or None if it is not present.
+    """
+    returned = None
+    for key, val in result.get("headers", {}).items():
+        if key.lower() == name.lower():
+            returned = val
+
+    return returned
+
+
+class Paginator:
+    """
+    Iterates over every page of a query operation, yielding IDs or resources lazily.
+
+    The pagination style (offset, scroll token, after token or marker) is determined
+    from the operation's endpoint definition. While the caller processes a page,
+    the next page is requested on a background worker.
+
+        for device_id in hosts.paginate(hosts.query_devices_by_filter_scroll, filter="platform_name:'Windows'"):
+            ...
+
+    Iterating the paginator yields the resources of each page. Use the pages method to
+    retrieve each page's complete result instead. When a page fails, iteration stops and
+    the failing result is available as the failed attribute.
+
+    request: callable - Performs the request for the parameters provided, returning the result
+    style: str - Pagination style of the operation ("offset", "token", "after" or "marker")
+    parameters: dict - Query string parameters for the first page
+    page_size: int - Number of records to request per page, defaults to the limit in parameters or the API default
+    prefetch: bool - Request the next page in the background while the current page is processed
+    """
+    def __init__(self: object, request: callable, style: str, parameters: dict = None,
+                 page_size: int = None, prefetch: bool = True) -> object:
+        """
+        Initializes the paginator. No requests are performed until iteration begins.
+        """
+        self.request = request
+        self.style = style
+        self.parameters = dict(parameters or {})
+        if page_size:
+            self.parameters["limit"] = page_size
+        self.prefetch = prefetch
+        self.failed = None
+        self.total = None
+
+    def next_parameters(self: object, parameters: dict, result: dict, retrieved: int) -> dict:
+        """
+        Calculates the parameters for the page following the result provided,
+        returns None when there are no further pages. retrieved is the number of
+        records received so far, including this result.
+        """
+        returned = None
+        pagination = _pagination(result)
+        resources = result["body"].get("resources", []) or []
+        self.total = pagination.get("total", self.total)
+        remaining = bool(resources) and (self.total is None or retrieved < self.total)
+        if self.style == "after":
+            if remaining and pagination.get("after", None):
+                returned = {**parameters, "after": pagination["after"]}
+        elif self.style == "token":
+            if remaining and pagination.get("offset", None):
+                returned = {**parameters, "offset": pagination["offset"]}
+        elif self.style == "marker" and _header(result, "Next-Page"):
+            # The header contains the complete query for the next page, including the _marker filter
+            if resources:
+                query = parse_qs(urlparse(_header(result, "Next-Page")).query)
+                returned = {**parameters, **{key: val[0] for key, val in query.items()}}
+                returned.pop("offset", None)
+        elif remaining:
+            returned = {**parameters, "offset": int(parameters.get("offset", 0) or 0) + len(resources)}
+
+        return returned
+
+    def pages(self: object):
+        """
+        Generator yielding the result of each page, including a final failing result if a request fails.
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        pending = None
+        parameters = self.parameters
+        retrieved = 0
+        try:
+            result = self.request(parameters)
+            while result:
+                if not isinstance(result, dict) or result.get("status_code", None) != 200:
+                    self.failed = result
+                    yield result
+                    break
+                retrieved += len(result["body"].get("resources", []) or [])
+                parameters = self.next_parameters(parameters, result, retrieved)
+                if parameters is not None and executor:
+                    pending = executor.submit(self.request, parameters)
+                yield result
+                if parameters is None:
+                    break
+                result = pending.result() if pending else self.request(parameters)
+                pending = None
+        finally:
+            if executor:
+                if pending:
+                    pending.cancel()
+                executor.shutdown(wait=False)
+
+    def __iter__(self: object):
+        """
+        Yields the resources (IDs or entities) of every page.
+        """
+        for page in self.pages():
+            if page is not self.failed:
+                yield from page["body"].get("resources", []) or []
@@ -39,6 +39,8 @@ For more information, please refer to <https://unlicense.org>
 # pylint: disable=R0904  # Aligning method count to API service collection operation count
 from ._util import force_default, process_service_request, handle_single_argument
 from ._service_class import ServiceClass
+from .rtr_batch import BatchOrchestrator, _BATCH_SIZE, _BATCH_WORKERS, _BATCH_RETRIES, _BATCH_TIMEOUT
+from .rtr_extract import FileExtractor, _EXTRACT_WORKERS, _EXTRACT_PASSWORD
 from ._endpoint._real_time_response import _real_time_response_endpoints as Endpoints
 
 
@@ -47,6 +49,34 @@ class RealTimeResponse(ServiceClass):
     The only requirement to instantiate an instance of this class
     is a valid token provided by the Falcon API SDK OAuth2 class.
     """
+    def run_batch(self: object, host_ids, base_command: str, command_string: str = None,  # pylint: disable=R0913
+                  command: callable = None, batch_size: int = _BATCH_SIZE, max_workers: int = _BATCH_WORKERS,
+                  retries: int = _BATCH_RETRIES, timeout: int = _BATCH_TIMEOUT, deadline: float = None,
+                  queue_offline: bool = False, retry_incomplete: bool = False) -> BatchOrchestrator:
+        """
+        Returns a BatchOrchestrator that executes a command across the hosts provided using batch sessions,
+        yielding the result for every host. Sessions are kept alive, and hosts that could not be reached
+        are retried. Hosts whose command did not complete are only retried when retry_incomplete is
+        enabled. command defaults to batch_command, use batch_active_responder_command
+        (or RealTimeResponseAdmin.batch_admin_command) for active responder (or admin) commands.
+
+            for host in rtr.run_batch(hosts.paginate(hosts.query_devices_by_filter_scroll), "ps"):
+                ...
+        """
+        return BatchOrchestrator(sessions=self,
+                                 host_ids=host_ids,
+                                 base_command=base_command,
+                                 command_string=command_string,
+                                 command=command,
+                                 batch_size=batch_size,
+                                 max_workers=max_workers,
+                                 retries=retries,
+                                 timeout=timeout,
+                                 deadline=deadline,
+                                 queue_offline=queue_offline,
+                                 retry_incomplete=retry_incomplete
+                                 )
+
     def aggregate_sessions(self: object, body: dict) -> dict:
         """
         Get aggregates on session data.
@@ -205,19 +235,48 @@ class RealTimeResponse(ServiceClass):
             )
 
     @force_default(defaults=["parameters"], default_types=["dict"])
-    def get_extracted_file_contents(self: object, parameters: dict = None, **kwargs) -> dict:
+    def get_extracted_file_contents(self: object, parameters: dict = None, download_to: object = None, **kwargs) -> dict:
         """
         Get RTR extracted file contents for specified session and sha256.
+
+        When download_to (a file path or writable file-like object) is provided, the 7z archive is
+        streamed to it in chunks instead of being returned. Downloads to a path are written to a
+        partial file and renamed once complete, an interrupted download is resumed.
         """
         # [GET] https://assets.falcon.crowdstrike.com/support/api/swagger.html#/real-time-response/RTR_GetExtractedFileContents
+        download = {"download_to": download_to} if download_to is not None else {}
         return process_service_request(
             calling_object=self,
             endpoints=Endpoints,
             operation_id="RTR_GetExtractedFileContents",
             keywords=kwargs,
-            params=parameters
+            params=parameters,
+            **download
             )
 
+    def extract_files(self: object, files=None, session_ids=None, directory: str = ".",  # pylint: disable=R0913
+                      sink: callable = None, max_workers: int = _EXTRACT_WORKERS, decompress: bool = False,
+                      password: str = _EXTRACT_PASSWORD) -> FileExtractor:
+        """
+        Returns a FileExtractor that streams extracted files to disk (or to the writers returned by sink)
+        concurrently, yielding the result for every file. Files with the same SHA-256 are retrieved once.
+
+        files: iterable - Dictionaries containing the session_id and sha256 of each file
+        session_ids: iterable - Retrieve every file extracted by these sessions (using list_files)
+
+            for file in rtr.extract_files(session_ids=sessions, directory="/cases/1234", decompress=True):
+                ...
+        """
+        return FileExtractor(service=self,
+                             files=files,
+                             session_ids=session_ids,
+                             directory=directory,
+                             sink=sink,
+                             max_workers=max_workers,
+                             decompress=decompress,
+                             password=password
+                             )
+
     @force_default(defaults=["parameters"], default_types=["dict"])
     def list_files(self: object, *args, parameters: dict = None, **kwargs) -> dict:
         """
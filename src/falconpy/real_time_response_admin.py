@@ -36,8 +36,11 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
+import os
 from ._util import force_default, process_service_request
+from ._upload import MultipartStream, close_after
 from ._service_class import ServiceClass
+from .rtr_sync import ContentSync
 from ._endpoint._real_time_response_admin import _real_time_response_admin_endpoints as Endpoints
 
 
@@ -48,6 +51,75 @@ class RealTimeResponseAdmin(ServiceClass):
     authorization object (oauth2.py) or a credential dictionary with
     client_id and client_secret containing valid API credentials.
     """
+    def _upload_file(self: object, operation_id: str, data: dict, files: list, file_data: object) -> dict:
+        """
+        Performs a multipart upload. When file_data (a pathlib.Path or file-like object) is provided
+        the file is streamed in chunks instead of being read into memory.
+        """
+        if file_data is None:
+            returned = process_service_request(
+                calling_object=self,
+                endpoints=Endpoints,
+                operation_id=operation_id,
+                data=data,
+                files=files
+                )
+        else:
+            file_name = (data or {}).get("name", None)
+            if not file_name and isinstance(file_data, os.PathLike):
+                file_name = os.path.basename(file_data)
+            stream = MultipartStream(fields=data, field_name="file", file_name=file_name or "file", file_data=file_data)
+            returned = None
+            try:
+                returned = process_service_request(
+                    calling_object=self,
+                    endpoints=Endpoints,
+                    operation_id=operation_id,
+                    headers={**self.headers, "Content-Type": stream.content_type},
+                    data=stream
+                    )
+            finally:
+                # Requests of asyncio Service Classes are performed once awaited
+                returned = close_after(returned, stream.close)
+
+        return returned
+
+    def sync_put_files(self: object, files, manifest: object = None, description: str = None,  # pylint: disable=R0913
+                       comment: str = None, verify: bool = False) -> dict:
+        """
+        Uploads local files as put-files only when their content is new or has changed, returning a result
+        containing the action performed for every file (created, replaced, unchanged or failed).
+
+        files: dict or list - Local file paths keyed by put-file name, or a list of paths (named after the file)
+        manifest: str or SyncManifest - Manifest file recording uploaded content. Files matching the manifest
+            are skipped without performing any requests, unless verify is True.
+        description: str - Description of the put-files, defaults to their name
+        comment: str - Audit log comment
+        """
+        return ContentSync(self, "put_files", manifest=manifest, verify=verify).sync(
+            files, fields={"description": description, "comments_for_audit_log": comment or ""}
+            )
+
+    def sync_scripts(self: object, files, manifest: object = None, description: str = None,  # pylint: disable=R0913
+                     comment: str = None, permission_type: str = "private", platform: str = "windows",
+                     verify: bool = False) -> dict:
+        """
+        Uploads local files as custom-scripts only when their content is new or has changed, returning a result
+        containing the action performed for every file (created, updated, unchanged or failed).
+
+        files: dict or list - Local file paths keyed by script name, or a list of paths (named after the file)
+        manifest: str or SyncManifest - Manifest file recording uploaded content. Files matching the manifest
+            are skipped without performing any requests, unless verify is True.
+        description: str - Description of the scripts, defaults to their name
+        comment: str - Audit log comment
+        permission_type: str - private, group or public
+        platform: str - windows, mac or linux
+        """
+        return ContentSync(self, "scripts", manifest=manifest, verify=verify).sync(
+            files, fields={"description": description, "comments_for_audit_log": comment or "",
+                           "permission_type": permission_type, "platform": platform}
+            )
+
     @force_default(defaults=["parameters"], default_types=["dict"])
     def batch_admin_command(self: object, body: dict, parameters: dict = None, **kwargs) -> dict:
         """
@@ -105,18 +177,14 @@ class RealTimeResponseAdmin(ServiceClass):
             params=parameters
             )
 
-    def create_put_files(self: object, data: dict, files: list) -> dict:
+    @force_default(defaults=["files"], default_types=["list"])
+    def create_put_files(self: object, data: dict, files: list = None, file_data: object = None) -> dict:
         """
         Upload a new put-file to use for the RTR `put` command.
+        Provide file_data (a pathlib.Path or file-like object) instead of files to stream the upload.
         """
         # [POST] https://assets.falcon.crowdstrike.com/support/api/swagger.html#/real-time-response-admin/RTR_CreatePut_Files
-        return process_service_request(
-            calling_object=self,
-            endpoints=Endpoints,
-            operation_id="RTR_CreatePut_Files",
-            data=data,
-            files=files
-            )
+        return self._upload_file("RTR_CreatePut_Files", data, files, file_data)
 
     @force_default(defaults=["parameters"], default_types=["dict"])
     def delete_put_files(self: object, parameters: dict = None, **kwargs) -> dict:
@@ -147,18 +215,13 @@ class RealTimeResponseAdmin(ServiceClass):
             )
 
     @force_default(defaults=["files"], default_types=["list"])
-    def create_scripts(self: object, data, files: list = None) -> dict:
+    def create_scripts(self: object, data, files: list = None, file_data: object = None) -> dict:
         """
         Upload a new custom-script to use for the RTR `runscript` command.
+        Provide file_data (a pathlib.Path or file-like object) instead of files to stream the upload.
         """
         # [POST] https://assets.falcon.crowdstrike.com/support/api/swagger.html#/real-time-response-admin/RTR_CreateScripts
-        return process_service_request(
-            calling_object=self,
-            endpoints=Endpoints,
-            operation_id="RTR_CreateScripts",
-            data=data,
-            files=files
-            )
+        return self._upload_file("RTR_CreateScripts", data, files, file_data)
 
     @force_default(defaults=["parameters"], default_types=["dict"])
     def delete_scripts(self: object, parameters: dict = None, **kwargs) -> dict:
@@ -174,18 +237,14 @@ class RealTimeResponseAdmin(ServiceClass):
             params=parameters
             )
 
-    def update_scripts(self: object, data, files) -> dict:
+    @force_default(defaults=["files"], default_types=["list"])
+    def update_scripts(self: object, data, files: list = None, file_data: object = None) -> dict:
         """
         Upload a new scripts to replace an existing one.
+        Provide file_data (a pathlib.Path or file-like object) instead of files to stream the upload.
         """
         # [PATCH] https://assets.falcon.crowdstrike.com/support/api/swagger.html#/real-time-response-admin/RTR_UpdateScripts
-        return process_service_request(
-            calling_object=self,
-            endpoints=Endpoints,
-            operation_id="RTR_UpdateScripts",
-            data=data,
-            files=files
-            )
+        return self._upload_file("RTR_UpdateScripts", data, files, file_data)
 
     @force_default(defaults=["parameters"], default_types=["dict"])
     def list_put_files(self: object, parameters: dict = None, **kwargs) -> dict:
@@ -0,0 +1,209 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+response_cache - Response cache for the CrowdStrike Falcon API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+import time
+from collections import OrderedDict
+from ._result import LazyResult
+
+# Seconds a cached response is considered fresh
+_CACHE_TTL = 300
+# Maximum number of cached responses
+_CACHE_ENTRIES = 1024
+# Read-mostly operations returning near-static reference data, cached by default
+_CACHEABLE_OPERATIONS = [
+    "get_platforms",                        # Firewall Management
+    "query_firewall_fields",                # Firewall Management
+    "get_firewall_fields",                  # Firewall Management
+    "get_platformsMixin0",                  # Custom IOA
+    "get_rule_types",                       # Custom IOA
+    "get_patterns",                         # Custom IOA
+    "GetAvailableRoleIds",                  # User Management
+    "GetRoles",                             # User Management
+    "GetIntelActorEntities",                # Intel
+    "queryCombinedSensorUpdateBuilds"       # Sensor Update Policy
+]
+
+
+def normalize_params(params: dict) -> tuple:
+    """
+    Returns a hashable representation of query string parameters that does not depend upon their order or type.
+    """
+    returned = []
+    for key, val in sorted((params or {}).items()):
+        if isinstance(val, (list, tuple)):
+            val = tuple(str(item) for item in val)
+        elif val is not None:
+            val = str(val)
+        returned.append((key, val))
+
+    return tuple(returned)
+
+
+class _CacheEntry:
+    """
+    Cached response content.
+    """
+    __slots__ = ["status_code", "headers", "content", "etag", "expires"]
+
+    def __init__(self: object, response: object, expires: float) -> object:
+        self.status_code = response.status_code
+        self.headers = dict(response.headers)
+        self.content = response.content
+        self.etag = response.headers.get("ETag", None)
+        self.expires = expires
+
+    def result(self: object, loads: callable = None) -> dict:
+        """
+        Returns a new result for the cached content, so that changes made by the caller are not cached.
+        """
+        return LazyResult(self.status_code, self.headers, self.content, loads=loads)
+
+
+class ResponseCache:
+    """
+    Size-bounded, least recently used cache of successful GET responses for read-mostly operations.
+
+    Responses are keyed by operation ID, endpoint and normalized query string parameters, and are
+    fresh for the TTL of their operation. Once a response with an ETag expires, it is revalidated
+    using If-None-Match and reused when the API responds with 304 Not Modified.
+
+        falcon = OAuth2(client_id=CLIENT_ID, client_secret=CLIENT_SECRET, response_cache=ResponseCache())
+
+    The cache is shared by every Service Class using the authentication object it is provided to.
+    Do not share a cache between authentication objects for different CIDs.
+
+    ttl: float - Seconds a response is fresh for the default cacheable operations
+    ttls: dict - TTL per operation ID, adds operations to the cache or disables them (0)
+    max_entries: int - Maximum number of cached responses, the least recently used response is evicted
+    """
+    def __init__(self: object, ttl: float = _CACHE_TTL, ttls: dict = None,
+                 max_entries: int = _CACHE_ENTRIES) -> object:
+        """
+        Initializes the cache.
+        """
+        self.ttls = {**{operation: ttl for operation in _CACHEABLE_OPERATIONS}, **(ttls or {})}
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "revalidated": 0, "evictions": 0}
+
+    def cacheable(self: object, method: str, operation_id: str) -> bool:
+        """
+        Returns a boolean indicating if responses to the request can be cached.
+        """
+        return bool(method.upper() == "GET" and self.ttls.get(operation_id, None))
+
+    def _count(self: object, counter: str) -> None:
+        """
+        Increments a metrics counter.
+        """
+        with self.lock:
+            self.counters[counter] += 1
+
+    def _lookup(self: object, key: tuple) -> _CacheEntry:
+        """
+        Returns the entry for the key, marking it as most recently used.
+        """
+        with self.lock:
+            entry = self.entries.get(key, None)
+            if entry:
+                self.entries.move_to_end(key)
+
+        return entry
+
+    def _store(self: object, key: tuple, entry: _CacheEntry) -> None:
+        """
+        Stores an entry, evicting the least recently used entries beyond the size limit.
+        """
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.counters["evictions"] += 1
+
+    def fetch(self: object, operation_id: str, endpoint: str, params: dict,  # pylint: disable=R0913
+              send: callable, respond: callable, loads: callable = None) -> dict:
+        """
+        Returns the cached result for the request when it is fresh, otherwise performs it.
+
+        send: callable - Performs the request with the additional headers provided, returning the response
+        respond: callable - Returns the result for a response that is not cached
+        loads: callable - JSON decoder used for cached results
+        """
+        key = (operation_id, endpoint, normalize_params(params))
+        ttl = self.ttls[operation_id]
+        entry = self._lookup(key)
+        if entry and entry.expires > time.monotonic():
+            self._count("hits")
+            returned = entry.result(loads)
+        else:
+            response = send({"If-None-Match": entry.etag} if entry and entry.etag else {})
+            if entry and response.status_code == 304:
+                self._count("revalidated")
+                entry.expires = time.monotonic() + ttl
+                self._store(key, entry)
+                returned = entry.result(loads)
+            else:
+                self._count("misses")
+                if response.status_code == 200 and response.headers.get("content-type") == "application/json":
+                    self._store(key, _CacheEntry(response, time.monotonic() + ttl))
+                returned = respond(response)
+
+        return returned
+
+    def invalidate(self: object, operation_id: str = None) -> None:
+        """
+        Removes the cached responses for an operation, or every cached response when operation_id is None.
+        """
+        with self.lock:
+            for key in [key for key in self.entries if operation_id is None or key[0] == operation_id]:
+                del self.entries[key]
+
+    def metrics(self: object) -> dict:
+        """
+        Returns the cache counters, the hit ratio and the number of cached responses.
+        """
+        with self.lock:
+            returned = dict(self.counters)
+            returned["entries"] = len(self.entries)
+        requests = returned["hits"] + returned["revalidated"] + returned["misses"]
+        returned["hit_ratio"] = (returned["hits"] + returned["revalidated"]) / requests if requests else 0.0
+
+        return returned
@@ -0,0 +1,156 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+retry - Retry and backoff policies for CrowdStrike Falcon API requests
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import asyncio
+import random
+import threading
+import requests
+try:
+    import aiohttp  # pylint: disable=E0401  # Optional dependency
+    _AIOHTTP_EXCEPTIONS = (aiohttp.ClientConnectionError,)
+except ImportError:
+    _AIOHTTP_EXCEPTIONS = ()
+
+# Server errors that indicate a transient failure
+_RETRY_STATUSES = frozenset([500, 502, 503, 504])
+# Connection failures and timeouts raised by requests, aiohttp and the standard library
+_RETRY_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                     ConnectionError, TimeoutError, asyncio.TimeoutError) + _AIOHTTP_EXCEPTIONS
+
+
+class RetryPolicy:
+    """
+    Retries failed requests using exponential backoff with full jitter.
+
+    A request is retried when it raises one of retry_exceptions or returns one of
+    retry_statuses, up to max_attempts attempts in total. Only idempotent operations are
+    retried unless retry_non_idempotent is enabled. Idempotency is determined from the
+    operation's endpoint definition (GET, PUT, DELETE and read-only POST operations).
+
+    Retries are limited by a budget shared by every request using the policy, so that an
+    outage does not multiply the load placed on the API. Each request adds budget_ratio to
+    the budget and each retry spends one, with budget_reserve retries available up front.
+
+        policy = RetryPolicy(max_attempts=5, retry_statuses=[500, 502, 503, 504, 408])
+        falcon = OAuth2(client_id=CLIENT_ID, client_secret=CLIENT_SECRET, retry_policy=policy)
+
+    Custom rules can be provided by overriding should_retry.
+    """
+    def __init__(self: object, max_attempts: int = 3,  # pylint: disable=R0913
+                 backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 retry_statuses: list = None, retry_exceptions: tuple = None,
+                 retry_non_idempotent: bool = False,
+                 budget_ratio: float = 0.2, budget_reserve: int = 10) -> object:
+        """
+        Initializes the policy and its counters.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses) if retry_statuses is not None else _RETRY_STATUSES
+        self.retry_exceptions = tuple(retry_exceptions) if retry_exceptions is not None else _RETRY_EXCEPTIONS
+        self.retry_non_idempotent = retry_non_idempotent
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self.budget = float(budget_reserve)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.reasons = {}
+
+    def backoff(self: object, attempt: int) -> float:
+        """
+        Returns the number of seconds to wait before the retry following the attempt number specified (1 based).
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+
+    def started(self: object) -> None:
+        """
+        Records a new request, adding to the retry budget.
+        """
+        with self.lock:
+            self.requests += 1
+            self.budget = min(self.budget + self.budget_ratio, float(self.budget_reserve) * 2)
+
+    def should_retry(self: object, idempotent: bool, status_code: int = None, exception: Exception = None) -> bool:
+        """
+        Returns a boolean indicating if the status code or exception is retryable for the request.
+        """
+        returned = False
+        if idempotent or self.retry_non_idempotent:
+            if exception is not None:
+                returned = isinstance(exception, self.retry_exceptions)
+            else:
+                returned = status_code in self.retry_statuses
+
+        return returned
+
+    def retry_delay(self: object, attempt: int, idempotent: bool,
+                    status_code: int = None, exception: Exception = None) -> float:
+        """
+        Returns the number of seconds to wait before retrying a failed attempt (1 based),
+        or None if the request should not be retried.
+        """
+        returned = None
+        if attempt < self.max_attempts and self.should_retry(idempotent, status_code, exception):
+            reason = type(exception).__name__ if exception is not None else str(status_code)
+            with self.lock:
+                if self.budget >= 1:
+                    self.budget -= 1
+                    self.retries += 1
+                    self.reasons[reason] = self.reasons.get(reason, 0) + 1
+                    returned = self.backoff(attempt)
+                else:
+                    self.exhausted += 1
+
+        return returned
+
+    def metrics(self: object) -> dict:
+        """
+        Returns the retry counters. amplification is the ratio of attempts performed to requests made.
+        """
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "budget_exhausted": self.exhausted,
+                "budget": self.budget,
+                "reasons": dict(self.reasons),
+                "amplification": (self.requests + self.retries) / self.requests if self.requests else 1.0
+            }
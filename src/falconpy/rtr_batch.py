@@ -0,0 +1,281 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+rtr_batch - Real Time Response batch command orchestration
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .hydrator import batched
+
+# Default number of hosts per batch session
+_BATCH_SIZE = 500
+# Default number of batches executing concurrently, within the default connection pool size
+_BATCH_WORKERS = 4
+# Default number of additional attempts for hosts that could not be reached or failed
+_BATCH_RETRIES = 1
+# Seconds the API waits for hosts to respond to a session or command request (maximum 600)
+_BATCH_TIMEOUT = 30
+# Seconds between session refreshes, batch sessions expire after 10 minutes
+_BATCH_REFRESH_INTERVAL = 300
+
+
+def host_result(aid: str, attempts: int, response: dict = None, errors: list = None) -> dict:
+    """
+    Returns the normalized result for a host from its session or command response.
+    """
+    response = response or {}
+    errors = errors or response.get("errors", None) or []
+    return {
+        "aid": aid,
+        "session_id": response.get("session_id", None),
+        "complete": bool(response.get("complete", False) and not errors),
+        "offline_queued": bool(response.get("offline_queued", False)),
+        "stdout": response.get("stdout", ""),
+        "stderr": response.get("stderr", ""),
+        "errors": errors,
+        "attempts": attempts
+    }
+
+
+def result_errors(result: dict) -> list:
+    """
+    Returns the errors of a failed API result.
+    """
+    body = result.get("body", {}) if isinstance(result, dict) else {}
+    errors = body.get("errors", None) if isinstance(body, dict) else None
+
+    return errors or [{"code": result.get("status_code", 500) if isinstance(result, dict) else 500,
+                       "message": "Batch request failed"}]
+
+
+def transport_error(result: dict) -> bool:
+    """
+    Returns a boolean indicating if a request failed before the API responded to it.
+    """
+    return bool(result.get("status_code", None) == 500 and not result.get("headers", None))
+
+
+class BatchOrchestrator:
+    """
+    Executes a Real Time Response command across a fleet of hosts, yielding the result for every host.
+
+    Hosts are consumed lazily and split into batch sessions, and no more than max_workers batches
+    are initialized and executing at once. Sessions are refreshed in the background while their
+    batch is running. Hosts that could not be reached, and hosts whose command request failed
+    before the API responded, are retried in a new batch session up to retries times. Hosts
+    whose command was executed but did not complete are only run again when retry_incomplete
+    is enabled, as commands that change the host are not safe to repeat.
+
+        sweep = rtr.run_batch(host_ids, "ls", command_string="ls C:\\\\Windows\\\\Temp", timeout=60)
+        for host in sweep:
+            if host["complete"]:
+                print(host["aid"], host["stdout"])
+
+    Results are yielded as each batch completes. Every host is yielded exactly once, the results
+    of hosts that did not complete are collected in the failed attribute.
+
+    sessions: RealTimeResponse - Service Class used to initialize and refresh batch sessions
+    host_ids: iterable - AIDs of the hosts to execute the command on, can be a generator or Paginator
+    base_command: str - Command to execute, for example "ls"
+    command_string: str - Full command line, defaults to base_command
+    command: callable - Batch command method, defaults to sessions.batch_command. Use
+        batch_active_responder_command, or RealTimeResponseAdmin.batch_admin_command, for other commands
+    batch_size: int - Maximum number of hosts per batch session
+    max_workers: int - Maximum number of batches executing concurrently
+    retries: int - Additional attempts for hosts that could not be reached
+    timeout: int - Seconds the API waits for hosts to respond (maximum 600)
+    deadline: float - Seconds after which no further attempts are started, remaining hosts are failed
+    queue_offline: bool - Queue the command for offline hosts, queued hosts are not retried
+    retry_incomplete: bool - Also retry hosts whose command was executed but did not complete
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self: object, sessions: object, host_ids, base_command: str,  # pylint: disable=R0913
+                 command_string: str = None, command: callable = None, batch_size: int = _BATCH_SIZE,
+                 max_workers: int = _BATCH_WORKERS, retries: int = _BATCH_RETRIES, timeout: int = _BATCH_TIMEOUT,
+                 deadline: float = None, queue_offline: bool = False, retry_incomplete: bool = False) -> object:
+        """
+        Initializes the orchestrator. No requests are performed until iteration begins.
+        """
+        self.sessions = sessions
+        self.host_ids = host_ids
+        self.base_command = base_command
+        self.command_string = command_string or base_command
+        self.command = command or sessions.batch_command
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.retries = retries
+        self.timeout = timeout
+        self.deadline = deadline
+        self.queue_offline = queue_offline
+        self.retry_incomplete = retry_incomplete
+        self.refresh_interval = _BATCH_REFRESH_INTERVAL
+        self.failed = []
+        self.counts = {"hosts": 0, "complete": 0, "failed": 0, "retried": 0, "batches": 0}
+        self.active = set()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+
+    def _keep_alive(self: object) -> None:
+        """
+        Refreshes the sessions of running batches until the orchestrator stops.
+        """
+        while not self.stop_event.wait(self.refresh_interval):
+            with self.lock:
+                batch_ids = list(self.active)
+            for batch_id in batch_ids:
+                self.sessions.batch_refresh_sessions(body={"batch_id": batch_id, "hosts_to_remove": []},
+                                                     timeout=self.timeout
+                                                     )
+
+    def _run(self: object, hosts: list, attempts: dict) -> list:
+        """
+        Initializes a batch session for the hosts and executes the command, returning a (result, retryable)
+        tuple for every host. Results are retryable when the command was not executed on the host.
+        """
+        started = self.sessions.batch_init_sessions(body={"host_ids": hosts, "queue_offline": self.queue_offline},
+                                                    timeout=self.timeout
+                                                    )
+        if started.get("status_code", None) not in [200, 201]:
+            return [(host_result(aid, attempts[aid], errors=result_errors(started)), True) for aid in hosts]
+        batch_id = started["body"].get("batch_id", None)
+        connected = started["body"].get("resources", None) or {}
+        returned = []
+        for aid in hosts:
+            session = connected.get(aid, None) or {}
+            if not session.get("session_id", None) or session.get("errors", None):
+                # The host could not be reached
+                returned.append((host_result(aid, attempts[aid], session, session.get("errors", None) or [
+                    {"code": 404, "message": "Host not connected"}
+                    ]), True))
+        unreachable = {result["aid"] for result, _ in returned}
+        if len(unreachable) == len(hosts):
+            return returned
+        with self.lock:
+            self.active.add(batch_id)
+        try:
+            executed = self.command(body={"base_command": self.base_command, "batch_id": batch_id,
+                                          "command_string": self.command_string,
+                                          "optional_hosts": [aid for aid in hosts if aid not in unreachable]},
+                                    timeout=self.timeout
+                                    )
+        finally:
+            with self.lock:
+                self.active.discard(batch_id)
+        if executed.get("status_code", None) not in [200, 201]:
+            errors = result_errors(executed)
+            # The command may have run when the API responded with an error, but not when the request failed
+            return returned + [(host_result(aid, attempts[aid], errors=errors), transport_error(executed))
+                               for aid in hosts if aid not in unreachable]
+        # Batch command responses are returned within the combined key, unlike batch session responses
+        responses = (executed["body"].get("combined", None) or {}).get("resources", None) or {}
+        for aid in hosts:
+            if aid not in unreachable:
+                returned.append((host_result(aid, attempts[aid], responses.get(aid, None), None if aid in responses else [
+                    {"code": 404, "message": "No response returned for host"}
+                    ]), False))
+
+        return returned
+
+    def _expired(self: object, started: float) -> bool:
+        """
+        Returns a boolean indicating if the deadline has passed.
+        """
+        return bool(self.deadline is not None and time.monotonic() - started >= self.deadline)
+
+    def __iter__(self: object):
+        """
+        Yields the result for every host as its batch completes.
+        """
+        started = time.monotonic()
+        batches = batched(self.host_ids, self.batch_size)
+        retry = deque()
+        attempts = {}
+        pending = set()
+        self.stop_event.clear()
+        keep_alive = threading.Thread(target=self._keep_alive, name="falconpy-rtr-keep-alive", daemon=True)
+        keep_alive.start()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                while True:
+                    # Hosts awaiting another attempt are scheduled before new hosts are read
+                    while len(pending) < self.max_workers and not self._expired(started):
+                        hosts = [retry.popleft() for _ in range(min(len(retry), self.batch_size))]
+                        if not hosts:
+                            hosts = next(batches, [])
+                            self.counts["hosts"] += len(hosts)
+                        if not hosts:
+                            break
+                        for aid in hosts:
+                            attempts[aid] = attempts.get(aid, 0) + 1
+                        self.counts["batches"] += 1
+                        pending.add(executor.submit(self._run, hosts, {aid: attempts[aid] for aid in hosts}))
+                    if not pending:
+                        break
+                    completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        pending.remove(future)
+                        for result, retryable in future.result():
+                            if not result["complete"] and not result["offline_queued"] \
+                                    and (retryable or self.retry_incomplete) \
+                                    and result["attempts"] <= self.retries and not self._expired(started):
+                                self.counts["retried"] += 1
+                                retry.append(result["aid"])
+                            else:
+                                yield self._finish(result)
+                # Hosts remaining once the deadline has passed
+                for aid in list(retry) + [aid for hosts in batches for aid in hosts]:
+                    if aid not in attempts:
+                        self.counts["hosts"] += 1
+                    yield self._finish(host_result(aid, attempts.get(aid, 0),
+                                                   errors=[{"code": 408, "message": "Deadline exceeded"}]))
+            finally:
+                self.stop_event.set()
+                for future in pending:
+                    future.cancel()
+
+    def _finish(self: object, result: dict) -> dict:
+        """
+        Records the final result for a host.
+        """
+        if result["complete"]:
+            self.counts["complete"] += 1
+        else:
+            self.counts["failed"] += 1
+            self.failed.append(result)
+
+        return result
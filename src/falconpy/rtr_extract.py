@@ -0,0 +1,244 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+rtr_extract - Bulk retrieval of Real Time Response extracted files
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from ._util import generate_error_result
+try:
+    import py7zr  # pylint: disable=E0401  # Optional dependency
+except ImportError:
+    py7zr = None
+
+# Default number of concurrent file retrievals, within the default connection pool size
+_EXTRACT_WORKERS = 8
+# Password of the 7z archives returned by the API
+_EXTRACT_PASSWORD = "infected"
+
+
+def file_name(file: dict) -> str:
+    """
+    Returns the base name of an extracted file, which may be a Windows or POSIX path on the host.
+    """
+    name = file.get("name", None) or file.get("filename", None) or ""
+
+    return name.replace("\\", "/").split("/")[-1]
+
+
+class FileExtractor:
+    """
+    Retrieves the files extracted by Real Time Response sessions, yielding the result for every file.
+
+    Each 7z archive is streamed straight to disk (or to the writer returned by sink) in chunks,
+    with no more than max_workers retrievals running at once. Files are retrieved once per SHA-256,
+    identical files extracted from other hosts are reported as duplicates of the first retrieval
+    (and retrieved from the next session when the first retrieval fails).
+
+        for file in rtr.extract_files(session_ids=sessions, directory="/cases/1234"):
+            if file["status_code"] == 200:
+                print(file["name"], file["path"])
+
+    Archives are saved as <sha256>.7z within directory. When decompress is enabled (requires py7zr),
+    each archive is extracted to a <sha256> directory as it is read from disk and then removed.
+    The 7z format stores its index at the end of the archive, so it is decompressed from the
+    downloaded archive rather than from the response.
+
+    Results are yielded as each retrieval completes, and results of failed retrievals are collected
+    in the failed attribute. Errors raised by the sink, the writer it returns, the file system or
+    py7zr fail the file being retrieved (with a status_code of 500) without stopping iteration.
+
+    service: RealTimeResponse - Service Class used to list and retrieve files
+    files: iterable - Dictionaries containing the session_id and sha256 (and optionally name) of each file
+    session_ids: iterable - Sessions to retrieve every extracted file from, listed using list_files
+    directory: str - Directory archives are saved to
+    sink: callable - Called with the file dictionary, returning a writable file-like object the archive is
+        streamed to instead of a file. The writer is closed once the archive has been retrieved.
+    max_workers: int - Maximum number of concurrent retrievals
+    decompress: bool - Extract the contents of each archive, removing the archive
+    password: str - Password of the archives
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self: object, service: object, files=None, session_ids=None,  # pylint: disable=R0913
+                 directory: str = ".", sink: callable = None, max_workers: int = _EXTRACT_WORKERS,
+                 decompress: bool = False, password: str = _EXTRACT_PASSWORD) -> object:
+        """
+        Initializes the extractor. No requests are performed until iteration begins.
+        """
+        if decompress and not py7zr:
+            raise ImportError("py7zr is not installed. Install it with: python3 -m pip install py7zr")
+        self.service = service
+        self.files = files or []
+        self.session_ids = session_ids or []
+        self.directory = directory
+        self.sink = sink
+        self.max_workers = max_workers
+        self.decompress = decompress and not sink
+        self.password = password
+        self.failed = []
+        self.counts = {"files": 0, "retrieved": 0, "duplicates": 0, "failed": 0, "bytes": 0}
+
+    def extracted_files(self: object):
+        """
+        Generator yielding the files provided, followed by every file extracted by the sessions provided.
+        """
+        yield from self.files
+        for session_id in self.session_ids:
+            listed = self.service.list_files(session_id=session_id)
+            if listed.get("status_code", None) == 200:
+                yield from listed["body"].get("resources", None) or []
+            else:
+                self.failed.append({"session_id": session_id, "sha256": None, "name": None, "path": None,
+                                    "size": None, "status_code": listed.get("status_code", 500),
+                                    "errors": listed["body"].get("errors", []), "duplicate": False})
+
+    def _retrieve(self: object, file: dict) -> dict:
+        """
+        Streams the archive for a file to its destination, returning the result for the file.
+        """
+        sha256 = file["sha256"].lower()
+        parameters = {"session_id": file["session_id"], "sha256": sha256}
+        if file_name(file):
+            parameters["filename"] = file_name(file)
+        path = None
+        size = None
+        try:
+            if self.sink:
+                writer = self.sink(file)
+                try:
+                    result = self.service.get_extracted_file_contents(parameters=parameters, download_to=writer)
+                finally:
+                    if hasattr(writer, "close"):
+                        writer.close()
+            else:
+                path = os.path.join(self.directory, f"{sha256}.7z")
+                result = self.service.get_extracted_file_contents(parameters=parameters, download_to=path)
+            if result["status_code"] == 200:
+                size = result["body"]["resources"][0].get("size", None)
+                if size is None and path:
+                    size = os.path.getsize(path)
+                if self.decompress:
+                    path = self._decompress(path, os.path.join(self.directory, sha256))
+        except Exception as err:  # pylint: disable=W0703  # Sink, file system and py7zr errors only fail this file
+            result = generate_error_result(message=f"{str(err)}")
+        retrieved = result["status_code"] == 200
+
+        return {"session_id": file["session_id"], "sha256": sha256, "name": file_name(file) or None,
+                "path": path if retrieved else None, "size": size if retrieved else None,
+                "status_code": result["status_code"], "errors": result["body"].get("errors", None) or [],
+                "duplicate": False}
+
+    def _decompress(self: object, archive: str, destination: str) -> str:
+        """
+        Extracts the contents of an archive to the destination directory, removing the archive.
+        """
+        with py7zr.SevenZipFile(archive, mode="r", password=self.password) as contents:
+            contents.extractall(path=destination)
+        os.remove(archive)
+
+        return destination
+
+    @staticmethod
+    def _duplicate(file: dict, retrieved: dict) -> dict:
+        """
+        Returns the result for a file that is identical to a file already retrieved.
+        """
+        return {**retrieved, "session_id": file["session_id"], "name": file_name(file) or retrieved["name"],
+                "duplicate": True}
+
+    def _finish(self: object, result: dict) -> dict:
+        """
+        Records the result for a file.
+        """
+        if result["status_code"] != 200:
+            self.counts["failed"] += 1
+            self.failed.append(result)
+        elif result["duplicate"]:
+            self.counts["duplicates"] += 1
+        else:
+            self.counts["retrieved"] += 1
+            self.counts["bytes"] += result["size"] or 0
+
+        return result
+
+    def _completed(self: object, executor: ThreadPoolExecutor, pending: dict, waiting: dict, retrieved: dict):
+        """
+        Yields the results of the next completed retrievals and of the duplicates waiting on them.
+        """
+        completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in completed:
+            sha256 = pending.pop(future)
+            result = future.result()
+            yield self._finish(result)
+            if result["status_code"] == 200:
+                retrieved[sha256] = result
+                for file in waiting.pop(sha256):
+                    yield self._finish(self._duplicate(file, result))
+            elif waiting[sha256]:
+                # Retrieve the file from the next session it was extracted by
+                pending[executor.submit(self._retrieve, waiting[sha256].pop(0))] = sha256
+            else:
+                del waiting[sha256]
+
+    def __iter__(self: object):
+        """
+        Yields the result for every file as its retrieval completes.
+        """
+        retrieved = {}
+        waiting = {}
+        pending = {}
+        if not self.sink:
+            os.makedirs(self.directory, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for file in self.extracted_files():
+                    self.counts["files"] += 1
+                    sha256 = file["sha256"].lower()
+                    if sha256 in retrieved:
+                        yield self._finish(self._duplicate(file, retrieved[sha256]))
+                    elif sha256 in waiting:
+                        waiting[sha256].append(file)
+                    else:
+                        waiting[sha256] = []
+                        pending[executor.submit(self._retrieve, file)] = sha256
+                        # Bounds the number of files read ahead of the caller
+                        while len(pending) >= self.max_workers * 2:
+                            yield from self._completed(executor, pending, waiting, retrieved)
+                while pending:
+                    yield from self._completed(executor, pending, waiting, retrieved)
+            finally:
+                for future in pending:
+                    future.cancel()
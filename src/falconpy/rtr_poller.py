@@ -0,0 +1,252 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+rtr_poller - Multiplexed Real Time Response command status poller
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from ._util import generate_error_result
+
+# Default number of concurrent status requests, within the default connection pool size
+_POLL_WORKERS = 8
+# Seconds before a command is first polled
+_POLL_INITIAL_INTERVAL = 0.1
+# Maximum seconds between polls of a long-running command
+_POLL_MAX_INTERVAL = 5.0
+# Multiplier applied to the interval after every incomplete poll
+_POLL_BACKOFF = 1.5
+# Seconds after which a command that has not completed is abandoned, RTR commands time out after 10 minutes
+_POLL_TIMEOUT = 600
+
+
+class _Poll:
+    """
+    An outstanding command.
+    """
+    __slots__ = ["check", "cloud_request_id", "sequence_id", "future", "interval", "expires", "polls"]
+
+    def __init__(self: object, check: callable, cloud_request_id: str, sequence_id: int,  # pylint: disable=R0913
+                 interval: float, expires: float) -> object:
+        self.check = check
+        self.cloud_request_id = cloud_request_id
+        self.sequence_id = sequence_id
+        self.future = Future()
+        self.interval = interval
+        self.expires = expires
+        self.polls = 0
+
+
+class CommandPoller:
+    """
+    Polls the status of many outstanding Real Time Response commands on a shared worker pool.
+
+    Each command is polled shortly after it is submitted, then with an interval that grows
+    by backoff after every incomplete poll up to max_interval, so that quick commands complete
+    quickly and long-running commands are not polled needlessly. A single scheduler thread
+    tracks every command, so thousands of commands do not need thousands of waiting threads.
+
+        with CommandPoller() as poller:
+            futures = []
+            for session_id in sessions:
+                executed = rtr.execute_command(body={"base_command": "ls", "command_string": "ls",
+                                                     "session_id": session_id})
+                futures.append(poller.submit(rtr.check_command_status,
+                                             executed["body"]["resources"][0]["cloud_request_id"]))
+            for future in as_completed(futures):
+                print(future.result()["body"]["resources"][0]["stdout"])
+
+    Futures resolve with the final status result: the result of the poll reporting the command
+    as complete, the first failed result, or a 408 error result once the command times out.
+
+    max_workers: int - Maximum number of concurrent status requests
+    initial_interval: float - Seconds before a command is first polled
+    max_interval: float - Maximum seconds between polls of a command
+    backoff: float - Multiplier applied to the interval after every incomplete poll
+    timeout: float - Seconds after which a command that has not completed is abandoned
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self: object, max_workers: int = _POLL_WORKERS,  # pylint: disable=R0913
+                 initial_interval: float = _POLL_INITIAL_INTERVAL, max_interval: float = _POLL_MAX_INTERVAL,
+                 backoff: float = _POLL_BACKOFF, timeout: float = _POLL_TIMEOUT) -> object:
+        """
+        Initializes the poller. The scheduler thread is started when the first command is submitted.
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="falconpy-rtr-poll")
+        self.schedule = []
+        self.sequence = itertools.count()
+        self.outstanding = set()
+        self.condition = threading.Condition()
+        self.closed = False
+        self.thread = None
+        self.counts = {"submitted": 0, "polls": 0, "complete": 0, "failed": 0}
+
+    def submit(self: object, check: callable, cloud_request_id: str, sequence_id: int = 0,
+               callback: callable = None) -> Future:
+        """
+        Tracks an executed command, returning a Future resolving with its final status result.
+
+        check: callable - Status method for the command, for example RealTimeResponse.check_command_status,
+            check_active_responder_command_status or RealTimeResponseAdmin.check_admin_command_status
+        cloud_request_id: str - Cloud request ID returned when the command was executed
+        sequence_id: int - Sequence ID of the output chunk to retrieve
+        callback: callable - Called with the final status result once the command completes
+        """
+        now = time.monotonic()
+        poll = _Poll(check, cloud_request_id, sequence_id, self.initial_interval, now + self.timeout)
+        if callback:
+            poll.future.add_done_callback(lambda future: None if future.cancelled() else callback(future.result()))
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("Cannot submit commands to a closed poller.")
+            if not self.thread:
+                self.thread = threading.Thread(target=self._dispatch, name="falconpy-rtr-poller", daemon=True)
+                self.thread.start()
+            self.counts["submitted"] += 1
+            self.outstanding.add(poll.future)
+            poll.future.add_done_callback(self._discard)
+            self._schedule(poll, now + poll.interval)
+
+        return poll.future
+
+    def _discard(self: object, future: Future) -> None:
+        """
+        Stops tracking a resolved or cancelled command.
+        """
+        with self.condition:
+            self.outstanding.discard(future)
+
+    def _schedule(self: object, poll: _Poll, due: float) -> None:
+        """
+        Schedules the next poll of a command. Called with the condition held.
+        """
+        heapq.heappush(self.schedule, (due, next(self.sequence), poll))
+        self.condition.notify()
+
+    def _dispatch(self: object) -> None:
+        """
+        Submits every poll to the worker pool when it is due.
+        """
+        with self.condition:
+            while not self.closed:
+                now = time.monotonic()
+                if self.schedule and self.schedule[0][0] <= now:
+                    _, _, poll = heapq.heappop(self.schedule)
+                    if not poll.future.done():
+                        self.executor.submit(self._poll, poll)
+                else:
+                    self.condition.wait(self.schedule[0][0] - now if self.schedule else None)
+
+    def _poll(self: object, poll: _Poll) -> None:
+        """
+        Retrieves the status of a command, resolving its future or scheduling the next poll.
+        """
+        try:
+            result = poll.check(parameters={"cloud_request_id": poll.cloud_request_id, "sequence_id": poll.sequence_id})
+        except Exception as err:  # pylint: disable=W0703  # Raised by the future
+            if not poll.future.cancelled():
+                poll.future.set_exception(err)
+            return
+        poll.polls += 1
+        status = result.get("status_code", None) if isinstance(result, dict) else None
+        resources = result["body"].get("resources", None) if status == 200 else None
+        with self.condition:
+            self.counts["polls"] += 1
+            if status != 200:
+                self.counts["failed"] += 1
+            elif resources and resources[0].get("complete", False):
+                self.counts["complete"] += 1
+            elif time.monotonic() + poll.interval >= poll.expires:
+                self.counts["failed"] += 1
+                result = generate_error_result(message=f"Command {poll.cloud_request_id} did not complete "
+                                                       f"within {self.timeout} seconds.", code=408)
+            else:
+                poll.interval = min(poll.interval * self.backoff, self.max_interval)
+                if not self.closed:
+                    self._schedule(poll, time.monotonic() + poll.interval)
+                    return
+                result = None
+        if poll.future.cancelled():
+            return
+        if result is None:
+            poll.future.cancel()
+        else:
+            poll.future.set_result(result)
+
+    @property
+    def pending(self: object) -> int:
+        """
+        Returns the number of commands that have not completed.
+        """
+        with self.condition:
+            return len(self.outstanding)
+
+    def close(self: object, cancel: bool = False) -> None:
+        """
+        Stops the poller once every outstanding command has completed, or cancels them when cancel is True.
+        """
+        if not cancel:
+            with self.condition:
+                outstanding = list(self.outstanding)
+            wait(outstanding)
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+            cancelled = [poll.future for _, _, poll in self.schedule]
+            self.schedule = []
+        for future in cancelled:
+            future.cancel()
+        if self.thread:
+            self.thread.join()
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self: object) -> object:
+        """
+        Returns the poller for use as a context manager.
+        """
+        return self
+
+    def __exit__(self: object, exc_type, exc_value, traceback) -> None:
+        """
+        Closes the poller once every outstanding command has completed, or cancels them on error.
+        """
+        self.close(cancel=exc_type is not None)
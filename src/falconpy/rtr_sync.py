@@ -0,0 +1,250 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+rtr_sync - Content synchronization for Real Time Response put-files and scripts
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import hashlib
+import json
+import os
+import pathlib
+import threading
+from ._result import Result
+from .hydrator import batched
+
+# Size of each chunk read when hashing local files
+_SYNC_CHUNK_SIZE = 1024 * 1024
+# Maximum number of names or IDs per list and get request
+_SYNC_BATCH_SIZE = 100
+
+
+def file_sha256(path: str) -> str:
+    """
+    Returns the SHA-256 of a local file, read in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as local_file:
+        for chunk in iter(lambda: local_file.read(_SYNC_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class SyncManifest:
+    """
+    Records the ID and SHA-256 of content uploaded to the API in a JSON file, so that
+    unchanged content can be skipped without performing any requests. The file is
+    atomically replaced on every update.
+
+    Entries are stored by namespace (the API base URL and client ID) and content type.
+    """
+    def __init__(self: object, path: str) -> object:
+        """
+        Initializes the manifest, creating the parent folder of the file if it does not exist.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def _read(self: object) -> dict:
+        """
+        Returns the contents of the manifest, or an empty dictionary if it does not exist or is unreadable.
+        """
+        returned = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as manifest_file:
+                returned = json.load(manifest_file)
+        except (OSError, ValueError):
+            pass
+
+        return returned
+
+    def load(self: object, namespace: str, kind: str) -> dict:
+        """
+        Returns the recorded entries for the content type, keyed by name.
+        """
+        with self.lock:
+            return self._read().get(namespace, {}).get(kind, {})
+
+    def update(self: object, namespace: str, kind: str, entries: dict) -> None:
+        """
+        Atomically records entries for the content type, keyed by name. Entries set to None are removed.
+        """
+        with self.lock:
+            content = self._read()
+            recorded = content.setdefault(namespace, {}).setdefault(kind, {})
+            for name, entry in entries.items():
+                if entry is None:
+                    recorded.pop(name, None)
+                else:
+                    recorded[name] = entry
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as manifest_file:
+                json.dump(content, manifest_file, indent=2, sort_keys=True)
+                manifest_file.flush()
+                os.fsync(manifest_file.fileno())
+            os.replace(temporary, self.path)
+
+
+class ContentSync:
+    """
+    Uploads local files as put-files or scripts only when their content is new or has changed.
+
+    Files are hashed locally and compared with the manifest (when provided) and then with the
+    SHA-256 reported by the API for content of the same name. New content is created, changed
+    scripts are updated and changed put-files (which cannot be updated) are replaced.
+
+    service: RealTimeResponseAdmin - Service Class used to list, retrieve and upload content
+    kind: str - "put_files" or "scripts"
+    manifest: str or SyncManifest - Manifest file recording uploaded content
+    verify: bool - Compare content recorded in the manifest with the API
+    """
+    def __init__(self: object, service: object, kind: str, manifest: object = None, verify: bool = False) -> object:
+        """
+        Initializes the synchronization.
+        """
+        if kind not in ["put_files", "scripts"]:
+            raise ValueError(f"{kind} is not a valid content type, specify put_files or scripts.")
+        self.service = service
+        self.kind = kind
+        self.manifest = SyncManifest(manifest) if isinstance(manifest, (str, os.PathLike)) else manifest
+        self.verify = verify
+        auth_object = getattr(service, "auth_object", None)
+        client_id = (getattr(auth_object, "creds", None) or {}).get("client_id", "")
+        self.namespace = f"{service.base_url}|{client_id}"
+
+    def remote(self: object, names: list) -> tuple:
+        """
+        Returns the content of the names provided that is stored in the API keyed by name,
+        and the result of the request that failed (or None).
+        """
+        list_content = getattr(self.service, f"list_{self.kind}")
+        get_content = getattr(self.service, f"get_{self.kind}")
+        returned = {}
+        for batch in batched(names, _SYNC_BATCH_SIZE):
+            quoted = ",".join("'{}'".format(name.replace("'", "\\'")) for name in batch)
+            listed = list_content(filter=f"name:[{quoted}]", limit=_SYNC_BATCH_SIZE)
+            if listed["status_code"] != 200:
+                return returned, listed
+            ids = listed["body"].get("resources", None) or []
+            if ids:
+                retrieved = get_content(ids=ids)
+                if retrieved["status_code"] != 200:
+                    return returned, retrieved
+                for entity in retrieved["body"].get("resources", None) or []:
+                    returned[entity["name"]] = entity
+
+        return returned, None
+
+    def _upload(self: object, name: str, path: str, fields: dict, existing: dict) -> tuple:
+        """
+        Uploads content, returning the action performed and the result of the upload.
+        """
+        data = {**fields, "name": name, "description": fields.get("description", None) or name}
+        if existing and self.kind == "scripts":
+            action = "updated"
+            result = self.service.update_scripts(data={**data, "id": existing["id"]}, file_data=pathlib.Path(path))
+        else:
+            action = "created"
+            if existing:
+                action = "replaced"
+                deleted = self.service.delete_put_files(ids=existing["id"])
+                if deleted["status_code"] != 200:
+                    return action, deleted
+            create_content = getattr(self.service, f"create_{self.kind}")
+            result = create_content(data=data, file_data=pathlib.Path(path))
+
+        return action, result
+
+    def sync(self: object, files, fields: dict = None) -> dict:
+        """
+        Uploads new and changed content, returning a result containing the action performed for every file.
+
+        files: dict or list - Local file paths keyed by name, or a list of paths (named after the file)
+        fields: dict - Form fields sent with every upload (description, comments_for_audit_log, etc.)
+        """
+        if not isinstance(files, dict):
+            files = {os.path.basename(path): path for path in files}
+        local = {name: (path, file_sha256(path)) for name, path in files.items()}
+        recorded = self.manifest.load(self.namespace, self.kind) if self.manifest else {}
+        resources = []
+        errors = []
+        status_code = 200
+        updates = {}
+        changed = []
+        for name, (path, sha256) in local.items():
+            if not self.verify and recorded.get(name, {}).get("sha256", None) == sha256:
+                resources.append({"name": name, "id": recorded[name].get("id", None), "sha256": sha256,
+                                  "action": "unchanged"})
+            else:
+                changed.append(name)
+        remote, failed = self.remote(changed) if changed else ({}, None)
+        if failed:
+            return failed
+        for name in changed:
+            path, sha256 = local[name]
+            existing = remote.get(name, None)
+            if existing and (existing.get("sha256", None) or "").lower() == sha256:
+                action = "unchanged"
+                content_id = existing["id"]
+            else:
+                action, result = self._upload(name, path, fields or {}, existing)
+                if result["status_code"] not in [200, 201]:
+                    status_code = result["status_code"] if status_code == 200 else status_code
+                    errors.extend(result["body"].get("errors", None) or [{"message": f"Unable to upload {name}"}])
+                    updates[name] = None
+                    resources.append({"name": name, "id": None, "sha256": sha256, "action": "failed"})
+                    continue
+                created = result["body"].get("resources", None) or [{}]
+                content_id = created[0].get("id", None) if isinstance(created[0], dict) else None
+                if action == "updated":
+                    content_id = existing["id"]
+            updates[name] = {"id": content_id, "sha256": sha256}
+            resources.append({"name": name, "id": content_id, "sha256": sha256, "action": action})
+        unresolved = [resource for resource in resources if resource["action"] in ["created", "replaced"]
+                      and not resource["id"]]
+        if unresolved:
+            # Uploads do not always return the new content, retrieve its ID by name.
+            # Content whose ID cannot be retrieved is not recorded, and is compared with the API next time.
+            listed, _ = self.remote([resource["name"] for resource in unresolved])
+            for resource in unresolved:
+                resource["id"] = (listed.get(resource["name"], None) or {}).get("id", None)
+                updates[resource["name"]] = {"id": resource["id"], "sha256": resource["sha256"]} if resource["id"] else None
+        if self.manifest and updates:
+            self.manifest.update(self.namespace, self.kind, updates)
+
+        return Result()(status_code=status_code, headers={}, body={"errors": errors, "resources": resources})
+
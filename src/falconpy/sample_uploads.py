@@ -36,8 +36,8 @@ OTHER DEALINGS IN THE SOFTWARE.
 
 For more information, please refer to <https://unlicense.org>
 """
-import json
 from ._util import force_default, process_service_request
+from ._upload import open_upload, close_upload, close_after
 from ._service_class import ServiceClass
 from ._endpoint._sample_uploads import _sample_uploads_endpoints as Endpoints
 
@@ -71,20 +71,25 @@ class SampleUploads(ServiceClass):
         """
         Upload a file for further cloud analysis. After uploading, call the specific analysis API endpoint.
         """
-        # Create a copy of our default header dictionary
-        header_payload = json.loads(json.dumps(self.headers))
-        # Set our content-type header
-        header_payload["Content-Type"] = "application/octet-stream"
-        return process_service_request(
-            calling_object=self,
-            endpoints=Endpoints,
-            operation_id="UploadSampleV3",
-            headers=header_payload,  # Pass our custom headers
-            body=body,
-            data=file_data,
-            keywords=kwargs,
-            params=parameters
-            )
+        # Paths are memory-mapped and file-like objects streamed instead of being read into memory
+        upload = open_upload(file_data)
+        returned = None
+        try:
+            returned = process_service_request(
+                calling_object=self,
+                endpoints=Endpoints,
+                operation_id="UploadSampleV3",
+                headers={**self.headers, "Content-Type": "application/octet-stream"},
+                body=body,
+                data=upload,
+                keywords=kwargs,
+                params=parameters
+                )
+        finally:
+            # Requests of asyncio Service Classes are performed once awaited
+            returned = close_after(returned, lambda: close_upload(file_data, upload))
+
+        return returned
 
     @force_default(defaults=["parameters"], default_types=["dict"])
     def delete_sample(self: object, parameters: dict = None, **kwargs) -> dict:
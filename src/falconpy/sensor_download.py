@@ -73,22 +73,28 @@ class SensorDownload(ServiceClass):
                                   **kwargs) -> object:
         """
         Download the sensor by the sha256 id, into the specified directory.
-        The path will be created for the user if it does not already exist
+        The path will be created for the user if it does not already exist.
+
+        When a file_name and download_path are provided, the installer is streamed to disk in chunks
+        and verified against the requested SHA-256. The file is written to a partial file and renamed
+        once complete, an interrupted download is resumed from where it left off.
         """
         # [GET] https://assets.falcon.crowdstrike.com/support/api/swagger.html#/sensor-download/DownloadSensorInstallerById
+        parameters = handle_single_argument(args, parameters, "ids")
+        download = {}
+        if file_name and download_path:
+            download = {
+                "download_to": os.path.join(download_path, file_name),
+                "sha256": parameters.get("id", kwargs.get("id", None))
+            }
         returned = process_service_request(
                         calling_object=self,
                         endpoints=Endpoints,
                         operation_id="DownloadSensorInstallerById",
                         keywords=kwargs,
-                        params=handle_single_argument(args, parameters, "ids")
+                        params=parameters,
+                        **download
                         )
-        if file_name and download_path and isinstance(returned, bytes):
-            os.makedirs(download_path, exist_ok=True)
-            # write the newly downloaded sensor into the aforementioned directory with provided file name
-            with open(os.path.join(download_path, file_name), "wb") as sensor:
-                sensor.write(returned)
-            returned = generate_ok_result(message="Download successful")
 
         return returned
 
@@ -0,0 +1,311 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+stream_consumer - Event Streams consumer for the CrowdStrike Falcon API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import json
+import queue
+import threading
+import time
+from urllib.parse import urlparse
+import requests
+from ._token_renewal import TokenRenewal
+from .checkpoint import Checkpointer
+
+# Maximum number of events read ahead of the caller before the partition readers pause
+_STREAM_QUEUE_SIZE = 1000
+# Seconds to wait before reconnecting to a partition whose stream has ended or failed
+_STREAM_RECONNECT_DELAY = 5
+# Seconds before the session refresh interval lapses that the session is refreshed
+_STREAM_REFRESH_LEAD = 60
+# Seconds between checks for a stop request while waiting on the queue
+_STREAM_POLL_INTERVAL = 0.1
+
+
+def decode_events(response: object):
+    """
+    Generator yielding the events of a streaming datafeed response as they arrive.
+    Events are newline-delimited JSON, blank lines (keep-alives) are skipped.
+    """
+    for line in response.iter_lines():
+        if line.strip():
+            yield json.loads(line)
+
+
+def stream_partition(stream: dict, default: int) -> int:
+    """
+    Returns the partition of a stream returned by list_available_streams,
+    which is the last segment of its refresh URL.
+    """
+    returned = default
+    segment = urlparse(stream.get("refreshActiveSessionURL", "")).path.rsplit("/", 1)[-1]
+    if segment.isdigit():
+        returned = int(segment)
+
+    return returned
+
+
+def event_offset(event: dict) -> int:
+    """
+    Returns the offset of an event, or None if the event does not contain one.
+    """
+    return (event.get("metadata", {}) or {}).get("offset", None)
+
+
+class StreamConsumer:
+    """
+    Consumes the event streams available to an application, yielding events as they arrive.
+
+    Each partition's datafeed is read on its own thread using a streaming response, with
+    events decoded one line at a time. Decoded events are placed on a bounded queue, when
+    the caller falls behind the readers pause, applying backpressure to the datafeeds.
+    Each partition's session is refreshed before its refresh interval lapses, and streams
+    that end or fail are rediscovered and reopened after the last event read.
+
+        with streams.consume(app_id="my-app") as consumer:
+            for event in consumer:
+                ...
+
+    Iteration ends once the consumer is stopped and every queued event has been yielded, or
+    when every reader has ended. A failing list_available_streams result is available as the
+    failed attribute. The offset of the last event processed by the caller for each partition
+    is available using the offsets attribute.
+
+    When a checkpoint store is provided, processed offsets are committed to it in the background
+    and consumption resumes after the committed offsets when the consumer is next started.
+    Events processed since the last commit are delivered again after a restart.
+
+    service: object - EventStreams Service Class used to discover and refresh streams
+    app_id: str - Label that identifies the connection
+    partitions: list - Partitions to consume, defaults to every available partition
+    offsets: dict - Offset of the last event processed per partition, consumption resumes after it
+    max_queue: int - Maximum number of events read ahead of the caller
+    stream_format: str - Format for streaming events (json or flatjson)
+    checkpoint: CheckpointStore - Durable storage for processed offsets
+    """
+    def __init__(self: object, service: object, app_id: str,  # pylint: disable=R0913
+                 partitions: list = None, offsets: dict = None, max_queue: int = _STREAM_QUEUE_SIZE,
+                 stream_format: str = None, checkpoint: object = None) -> object:
+        """
+        Initializes the consumer. Streams are not opened until the consumer is started or iterated.
+        """
+        self.service = service
+        self.app_id = app_id
+        self.partitions = partitions
+        self.offsets = dict(offsets or {})
+        self.read_offsets = dict(self.offsets)
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.stream_format = stream_format
+        self.reconnect_delay = _STREAM_RECONNECT_DELAY
+        self.refresh_lead = _STREAM_REFRESH_LEAD
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.readers = []
+        self.renewals = {}
+        self.refreshed = {}
+        self.responses = {}
+        self.failed = None
+        self.checkpointer = Checkpointer(checkpoint, app_id) if checkpoint else None
+
+    def discover(self: object) -> dict:
+        """
+        Retrieves the available streams, returning a dictionary of streams keyed by partition.
+        """
+        returned = {}
+        parameters = {"appId": self.app_id}
+        if self.stream_format:
+            parameters["format"] = self.stream_format
+        result = self.service.list_available_streams(parameters=parameters)
+        if isinstance(result, dict) and result.get("status_code", None) == 200:
+            for position, stream in enumerate(result["body"].get("resources", []) or []):
+                partition = stream_partition(stream, position)
+                if self.partitions is None or partition in self.partitions:
+                    returned[partition] = stream
+        else:
+            self.failed = result
+
+        return returned
+
+    def refresh(self: object, partition: int) -> bool:
+        """
+        Refreshes the session of the partition specified, returning a boolean indicating success.
+        """
+        result = self.service.refresh_active_stream(partition=partition, action_name="refresh_active_stream_session",
+                                                    appId=self.app_id
+                                                    )
+        returned = bool(isinstance(result, dict) and result.get("status_code", None) == 200)
+        if returned:
+            self.refreshed[partition] = (self.refreshed[partition][0], time.monotonic())
+
+        return returned
+
+    def _refresh_remaining(self: object, partition: int) -> float:
+        """
+        Returns the number of seconds until the session refresh interval of the partition lapses.
+        """
+        interval, refreshed = self.refreshed[partition]
+
+        return interval - (time.monotonic() - refreshed)
+
+    def start(self: object) -> None:
+        """
+        Discovers the available streams and starts a reader and session refresh for each partition.
+        Calling start when the consumer is running has no effect.
+        """
+        if not self.readers:
+            self.stop_event.clear()
+            if self.checkpointer:
+                # Offsets specified by the caller take precedence over committed offsets
+                committed = self.checkpointer.load()
+                self.offsets = {**committed, **self.offsets}
+                self.read_offsets = {**committed, **self.read_offsets}
+                self.checkpointer.start()
+            for partition, stream in self.discover().items():
+                self.refreshed[partition] = (int(stream.get("refreshActiveSessionInterval", 1800)), time.monotonic())
+                self.renewals[partition] = TokenRenewal(renew=lambda part=partition: self.refresh(part),
+                                                        seconds_remaining=lambda part=partition: self._refresh_remaining(part),
+                                                        lead=self.refresh_lead
+                                                        )
+                self.renewals[partition].start()
+                reader = threading.Thread(target=self._read, args=(partition, stream),
+                                          name=f"falconpy-stream-{partition}", daemon=True)
+                self.readers.append(reader)
+                reader.start()
+
+    def stop(self: object) -> None:
+        """
+        Stops the readers and session refreshes, closing any open datafeeds.
+        Events that have already been queued are still yielded.
+        """
+        self.stop_event.set()
+        for renewal in self.renewals.values():
+            renewal.stop()
+        with self.lock:
+            responses = list(self.responses.values())
+        for response in responses:
+            # Closing the response interrupts a reader waiting on the datafeed
+            response.close()
+        for reader in self.readers:
+            if reader is not threading.current_thread():
+                reader.join()
+        self.readers = []
+        self.renewals = {}
+        if self.checkpointer:
+            self.checkpointer.stop()
+
+    def _open(self: object, partition: int, stream: dict) -> object:
+        """
+        Opens the datafeed of a stream, resuming after the last event read from the partition.
+        """
+        parameters = {}
+        if self.read_offsets.get(partition, None) is not None:
+            parameters["offset"] = int(self.read_offsets[partition]) + 1
+        requester = getattr(self.service, "session", None) or requests
+
+        return requester.get(stream["dataFeedURL"], params=parameters, stream=True,
+                             headers={"Authorization": f"Token {stream['sessionToken']['token']}",
+                                      "Connection": "Keep-Alive"
+                                      },
+                             verify=self.service.ssl_verify,
+                             proxies=getattr(self.service, "proxy", None),
+                             timeout=getattr(self.service, "timeout", None)
+                             )
+
+    def _put(self: object, item: tuple) -> bool:
+        """
+        Places an item on the queue, waiting while the queue is full. Returns False if the consumer is stopped.
+        """
+        while not self.stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=_STREAM_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _read(self: object, partition: int, stream: dict) -> None:
+        """
+        Reader loop for a partition, queuing each event read from its datafeed and reopening the stream when it ends.
+        """
+        while stream and not self.stop_event.is_set():
+            try:
+                response = self._open(partition, stream)
+                with self.lock:
+                    self.responses[partition] = response
+                try:
+                    if response.status_code == 200:
+                        for event in decode_events(response):
+                            if not self._put((partition, event)):
+                                break
+                            if event_offset(event) is not None:
+                                self.read_offsets[partition] = event_offset(event)
+                finally:
+                    with self.lock:
+                        self.responses.pop(partition, None)
+                    response.close()
+            except (requests.exceptions.RequestException, ValueError, AttributeError):
+                pass  # The stream is reopened below, errors caused by stop closing the response are expected
+            if self.stop_event.wait(self.reconnect_delay):
+                break
+            # Session tokens expire, so the stream is rediscovered before it is reopened
+            stream = self.discover().get(partition, None)
+
+    def __enter__(self: object) -> object:
+        self.start()
+        return self
+
+    def __exit__(self: object, *args) -> None:
+        self.stop()
+
+    def __iter__(self: object):
+        """
+        Yields events from every partition as they arrive, starting the consumer if it is not running.
+        """
+        self.start()
+        while True:
+            try:
+                partition, event = self.queue.get(timeout=_STREAM_POLL_INTERVAL)
+            except queue.Empty:
+                if self.stop_event.is_set() or not any(reader.is_alive() for reader in self.readers):
+                    break
+                continue
+            yield event
+            # Offsets are recorded once the caller requests the next event, after this one has been processed
+            if event_offset(event) is not None:
+                self.offsets[partition] = event_offset(event)
+                if self.checkpointer:
+                    self.checkpointer.record(partition, event_offset(event))
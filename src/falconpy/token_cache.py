@@ -0,0 +1,224 @@
+"""
+ _______                        __ _______ __        __ __
+|   _   .----.-----.--.--.--.--|  |   _   |  |_.----|__|  |--.-----.
+|.  1___|   _|  _  |  |  |  |  _  |   1___|   _|   _|  |    <|  -__|
+|.  |___|__| |_____|________|_____|____   |____|__| |__|__|__|_____|
+|:  1   |                         |:  1   |
+|::.. . |   CROWDSTRIKE FALCON    |::.. . |    FalconPy
+`-------'                         `-------'
+
+OAuth2 API - Customer SDK
+
+token_cache - Cross-process persistent token cache for the CrowdStrike Falcon OAuth2 API
+
+This is free and unencumbered software released into the public domain.
+
+Anyone is free to copy, modify, publish, use, compile, sell, or
+distribute this software, either in source code form or as a compiled
+binary, for any purpose, commercial or non-commercial, and by any
+means.
+
+In jurisdictions that recognize copyright laws, the author or authors
+of this software dedicate any and all copyright interest in the
+software to the public domain. We make this dedication for the benefit
+of the public at large and to the detriment of our heirs and
+successors. We intend this dedication to be an overt act of
+relinquishment in perpetuity of all present and future rights to this
+software under copyright law.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+OTHER DEALINGS IN THE SOFTWARE.
+
+For more information, please refer to <https://unlicense.org>
+"""
+import base64
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt  # pylint: disable=E0401
+try:
+    from cryptography.fernet import Fernet, InvalidToken  # pylint: disable=E0401  # Optional dependency
+except ImportError:
+    Fernet = None
+    InvalidToken = ValueError
+
+# Default location of the token cache, Lambda functions should specify a path beneath /tmp
+_DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".falconpy", "token_cache")
+
+
+class TokenCache:
+    """
+    On-disk token cache shared by every process using the same credentials.
+
+    Tokens are keyed by client_id, member_cid and base_url. Access is serialized
+    between processes using file locks, so when many short-lived processes start
+    at once only one of them performs a token request. Cache files are created with
+    owner-only permissions and are encrypted at rest using Fernet, with a key derived
+    from the client_secret unless an encryption_key is specified.
+
+        cache = TokenCache(path="/tmp/falconpy")
+        hosts = Hosts(client_id=CLIENT_ID, client_secret=CLIENT_SECRET, token_cache=cache)
+    """
+    def __init__(self: object, path: str = _DEFAULT_CACHE_PATH, encrypt: bool = True,
+                 encryption_key: bytes = None) -> object:
+        """
+        Initializes the cache. Encryption requires the optional cryptography dependency,
+        specify encrypt=False to rely solely upon file permissions.
+        """
+        if encrypt and not Fernet:
+            raise ImportError("The cryptography package is required for token cache encryption. "
+                              "Install it with: python3 -m pip install crowdstrike-falconpy[cache]"
+                              )
+        self.path = path
+        self.encrypt = encrypt
+        self.encryption_key = encryption_key
+
+    @staticmethod
+    def cache_key(creds: dict, base_url: str) -> str:
+        """
+        Returns the cache key for the credentials and base URL specified.
+        """
+        identity = "|".join([creds.get("client_id", ""), creds.get("member_cid", ""), base_url.rstrip("/")])
+
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _cipher(self: object, creds: dict) -> object:
+        """
+        Returns the Fernet cipher used to encrypt cache entries for these credentials.
+        """
+        key = self.encryption_key
+        if not key:
+            # Client secrets are high entropy, a single digest is sufficient to derive a key
+            digest = hashlib.sha256(f"falconpy-token-cache:{creds.get('client_secret', '')}".encode("utf-8")).digest()
+            key = base64.urlsafe_b64encode(digest)
+
+        return Fernet(key)
+
+    def _file(self: object, creds: dict, base_url: str) -> str:
+        """
+        Returns the path to the cache file for the credentials and base URL specified.
+        """
+        return os.path.join(self.path, self.cache_key(creds, base_url))
+
+    @contextmanager
+    def locked(self: object, creds: dict, base_url: str):
+        """
+        Holds an exclusive, cross-process lock on the cache entry for the credentials and base URL specified.
+        """
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        handle = os.open(f"{self._file(creds, base_url)}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            else:
+                while True:
+                    try:
+                        msvcrt.locking(handle, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        pass  # LK_LOCK gives up after 10 seconds, keep waiting
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                os.lseek(handle, 0, os.SEEK_SET)
+                msvcrt.locking(handle, msvcrt.LK_UNLCK, 1)
+            os.close(handle)
+
+    def read(self: object, creds: dict, base_url: str) -> dict:
+        """
+        Returns the cache entry for the credentials and base URL specified,
+        or None if there is no entry or it cannot be read.
+        """
+        returned = None
+        try:
+            with open(self._file(creds, base_url), "rb") as cache_file:
+                content = cache_file.read()
+            if self.encrypt:
+                content = self._cipher(creds).decrypt(content)
+            returned = json.loads(content)
+        except (OSError, ValueError, InvalidToken):
+            pass  # Missing, corrupt or encrypted using different credentials
+
+        return returned
+
+    def write(self: object, creds: dict, base_url: str, entry: dict) -> None:
+        """
+        Atomically replaces the cache entry for the credentials and base URL specified.
+        """
+        content = json.dumps(entry).encode("utf-8")
+        if self.encrypt:
+            content = self._cipher(creds).encrypt(content)
+        target = self._file(creds, base_url)
+        temporary = f"{target}.{os.getpid()}.tmp"
+        handle = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(handle, "wb") as cache_file:
+            cache_file.write(content)
+        os.replace(temporary, target)
+
+    def lookup(self: object, creds: dict, base_url: str, renew_window: int, current: str = None) -> dict:
+        """
+        Returns a token result built from the cache entry if it is outside of the renewal window
+        and differs from the current token, otherwise None. The expires_in value of the result
+        reflects the remaining lifetime of the cached token.
+        """
+        returned = None
+        entry = self.read(creds, base_url)
+        if entry and entry.get("access_token") != current:
+            remaining = int(entry["token_time"] + entry["expires_in"] - time.time())
+            if remaining > renew_window:
+                returned = {
+                    "status_code": 201,
+                    "headers": {},
+                    "body": {"access_token": entry["access_token"], "expires_in": remaining, "token_type": "bearer"}
+                }
+
+        return returned
+
+    def store(self: object, creds: dict, base_url: str, result: dict, requested: float) -> None:
+        """
+        Stores the token from a successful token request result that was requested at the time specified.
+        """
+        if result["status_code"] == 201:
+            self.write(creds, base_url, {"access_token": result["body"]["access_token"],
+                                         "expires_in": result["body"]["expires_in"],
+                                         "token_time": requested
+                                         })
+
+    def fetch(self: object, creds: dict, base_url: str, renew_window: int, current: str, request: callable) -> dict:
+        """
+        Returns a cached token result, or performs the token request and caches the result.
+        The lock is held throughout, so concurrent processes perform a single token request.
+        """
+        with self.locked(creds, base_url):
+            returned = self.lookup(creds, base_url, renew_window, current)
+            if not returned:
+                requested = time.time()
+                returned = request()
+                self.store(creds, base_url, returned, requested)
+
+        return returned
+
+    def discard(self: object, creds: dict, base_url: str, token: str) -> None:
+        """
+        Removes the cache entry for the credentials and base URL specified if it contains the token specified.
+        """
+        with self.locked(creds, base_url):
+            entry = self.read(creds, base_url)
+            if entry and entry.get("access_token") == token:
+                try:
+                    os.remove(self._file(creds, base_url))
+                except OSError:
+                    pass
@@ -0,0 +1,132 @@
+# stand_in_api.py
+# Local HTTPS stand-in for the CrowdStrike Falcon API.
+#
+# Used by the unit tests and benchmarks that exercise the request layer
+# (transport, pagination, rate limiting, retries, etc.) without requiring
+# API credentials or network access. Routes are registered per method and
+# path, and each handler returns a (status_code, headers, body) tuple.
+import hashlib
+import json
+import os
+import socket
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+CERT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stand_in.crt")
+KEY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stand_in.key")
+
+
+def json_response(body: dict, status_code: int = 200, headers: dict = None):
+    """Returns a handler result containing a JSON encoded body."""
+    returned_headers = {"Content-Type": "application/json"}
+    if headers:
+        returned_headers.update(headers)
+    return status_code, returned_headers, json.dumps(body).encode("utf-8")
+
+
+def token_handler(request):  # pylint: disable=W0613
+    """Default handler for the token endpoint."""
+    return json_response({"access_token": "stand-in-token", "expires_in": 1799}, 201)
+
+
+class StandInAPI:
+    """Threaded HTTPS server that impersonates the Falcon API."""
+
+    def __init__(self, use_ssl: bool = True, keep_bodies: bool = True):
+        self.routes = {("POST", "/oauth2/token"): token_handler}
+        self.requests = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Keep-alive capable request handler."""
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                with stand_in.lock:
+                    stand_in.connections += 1
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                super().setup()
+
+            def log_message(self, format, *args):  # pylint: disable=W0622
+                pass
+
+            def _dispatch(self):
+                parsed = urlparse(self.path)
+                length = int(self.headers.get("Content-Length", 0) or 0)
+                request = {
+                    "method": self.command,
+                    "path": parsed.path,
+                    "params": parse_qs(parsed.query),
+                    "headers": dict(self.headers),
+                    "body": b""
+                }
+                if self.headers.get("Transfer-Encoding", "") == "chunked":
+                    # Bodies of unknown length, such as piped uploads, arrive in chunks
+                    size = int(self.rfile.readline().split(b";")[0], 16)
+                    while size:
+                        request["body"] += self.rfile.read(size)
+                        self.rfile.readline()
+                        size = int(self.rfile.readline().split(b";")[0], 16)
+                    self.rfile.readline()
+                elif keep_bodies:
+                    request["body"] = self.rfile.read(length) if length else b""
+                else:
+                    # Large uploads are hashed as they arrive instead of being held in memory
+                    digest = hashlib.sha256()
+                    while length:
+                        chunk = self.rfile.read(min(length, 65536))
+                        if not chunk:
+                            break
+                        digest.update(chunk)
+                        length -= len(chunk)
+                    request["sha256"] = digest.hexdigest()
+                with stand_in.lock:
+                    stand_in.requests.append(request)
+                handler = stand_in.routes.get((self.command, parsed.path), None)
+                if handler:
+                    status_code, headers, body = handler(request)
+                else:
+                    status_code, headers, body = json_response({"errors": [{"message": "Not found"}]}, 404)
+                self.send_response(status_code)
+                for key, val in headers.items():
+                    self.send_header(key, val)
+                if "Content-Length" in headers:
+                    # Declaring more content than is sent simulates an interrupted transfer
+                    self.close_connection = int(headers["Content-Length"]) > len(body)
+                else:
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = _dispatch
+            do_POST = _dispatch
+            do_PATCH = _dispatch
+            do_PUT = _dispatch
+            do_DELETE = _dispatch
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        scheme = "http"
+        if use_ssl:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(CERT_PATH, KEY_PATH)
+            self.server.socket = context.wrap_socket(self.server.socket, server_side=True)
+            scheme = "https"
+        self.base_url = f"{scheme}://localhost:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def route(self, method: str, path: str, handler):
+        """Registers a handler for the method and path specified."""
+        self.routes[(method.upper(), path)] = handler
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,193 @@
+# test_async.py
+# Tests the asyncio flavoured Service Class and Uber class using a local HTTPS stand-in.
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+import pytest
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+pytest.importorskip("aiohttp")
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.hosts import Hosts
+from falconpy.malquery import MalQuery
+from falconpy.real_time_response import RealTimeResponse
+from falconpy.async_service_class import AsyncServiceClass, asynchronous
+from falconpy.async_api_complete import AsyncAPIHarness
+from falconpy.token_cache import TokenCache
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+CONCURRENCY = 200
+DETAILS_PATH = "/devices/entities/devices/v1"
+
+
+def details_handler(request):
+    return json_response({"resources": [{"device_id": aid} for aid in request["params"].get("ids", [])]})
+
+
+class AsyncHosts(AsyncServiceClass, Hosts):
+    pass
+
+
+class TestAsync:
+    def async_service_class(self):
+        async def run(base_url):
+            auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=base_url, ssl_verify=CERT_PATH)
+            async with AsyncHosts(auth_object=auth) as hosts:
+                results = await asyncio.gather(*[hosts.get_device_details(ids=str(num)) for num in range(CONCURRENCY)])
+                # Methods returning a result without performing a request can still be awaited
+                invalid = await hosts.perform_action(action_name="not_an_action", body={})
+            return results, invalid
+
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", DETAILS_PATH, details_handler)
+            results, invalid = asyncio.run(run(stand_in.base_url))
+            tokens = len([req for req in stand_in.requests if req["path"] == "/oauth2/token"])
+
+        success = bool(tokens == 1 and invalid["status_code"] == 500)
+        for num, result in enumerate(results):
+            if result["status_code"] != 200 or result["body"]["resources"][0]["device_id"] != str(num):
+                success = False
+
+        return success
+
+    def async_factory(self):
+        async_hosts = asynchronous(Hosts)
+        return bool(async_hosts.__name__ == "AsyncHosts"
+                    and asyncio.iscoroutinefunction(async_hosts.get_device_details)
+                    and asyncio.iscoroutinefunction(async_hosts.GetDeviceDetails)
+                    )
+
+    def async_uber(self):
+        async def run(base_url):
+            async with AsyncAPIHarness(client_id="whatever", client_secret="whatever",
+                                       base_url=base_url, ssl_verify=CERT_PATH) as falcon:
+                results = await asyncio.gather(*[falcon.command("GetDeviceDetails", ids=str(num))
+                                                 for num in range(CONCURRENCY)])
+                invalid = await falcon.command("NotARealOperation")
+            return results, invalid
+
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", DETAILS_PATH, details_handler)
+            results, invalid = asyncio.run(run(stand_in.base_url))
+            tokens = len([req for req in stand_in.requests if req["path"] == "/oauth2/token"])
+
+        return bool(tokens == 1 and invalid["status_code"] == 418
+                    and all(result["status_code"] == 200 for result in results)
+                    )
+
+    def async_unsupported(self):
+        async def run(auth):
+            async with asynchronous(MalQuery)(auth_object=auth) as malquery:
+                try:
+                    await malquery.get_download(ids="a" * 64, download_to="sample.bin")
+                    return False
+                except TypeError:
+                    return True
+
+        async_rtr = asynchronous(RealTimeResponse)
+        async_malquery = asynchronous(MalQuery)
+        auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url="https://localhost:1")
+        success = bool(asyncio.iscoroutinefunction(async_rtr.batch_init_sessions)
+                       and asyncio.iscoroutinefunction(async_rtr.get_extracted_file_contents)
+                       and asyncio.run(run(auth))
+                       )
+        # Synchronous helpers and unsupported keywords raise instead of failing silently
+        for helper in [lambda: async_rtr(auth_object=auth).run_batch(host_ids=["1"], base_command="ls"),
+                       lambda: async_malquery(auth_object=auth).stream_hunt(body={}),
+                       lambda: async_malquery(auth_object=auth).bulk_download(["a" * 64]),
+                       lambda: async_malquery(auth_object=auth).paginate("get_request"),
+                       lambda: AsyncAPIHarness(client_id="whatever", client_secret="whatever").hydrate("GetDeviceDetails", []),
+                       lambda: async_malquery(auth_object=auth, response_cache=object()),
+                       lambda: async_malquery(auth_object=auth, coalesce=True)]:
+            try:
+                helper()
+                success = False
+            except TypeError:
+                pass
+        return success
+
+    def async_token_cache(self):
+        creds = {"client_id": "whatever", "client_secret": "whatever"}
+
+        async def run(base_url, cache):
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                for _ in range(20):
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            async with AsyncAPIHarness(creds=creds, base_url=base_url, ssl_verify=CERT_PATH, token_cache=cache) as falcon:
+                await asyncio.gather(falcon.authenticate(), ticker())
+            return falcon.token, ticks
+
+        def other_process(cache, base_url, holding):
+            # Holds the cache lock while it requests a token, as another process would
+            with cache.locked(creds, base_url):
+                holding.set()
+                time.sleep(0.5)
+                cache.write(creds, base_url, {"access_token": "cached", "expires_in": 1799, "token_time": time.time()})
+
+        with StandInAPI() as stand_in, tempfile.TemporaryDirectory() as cache_path:
+            cache = TokenCache(path=cache_path, encrypt=False)
+            holding = threading.Event()
+            other = threading.Thread(target=other_process, args=(cache, stand_in.base_url, holding))
+            other.start()
+            holding.wait()
+            token, ticks = asyncio.run(run(stand_in.base_url, cache))
+            other.join()
+            tokens = len([req for req in stand_in.requests if req["path"] == "/oauth2/token"])
+
+        # The cached token is used once the lock is released, without blocking the event loop while waiting
+        return bool(token == "cached" and tokens == 0 and ticks == 20)
+
+    def async_shared_renewal(self):
+        def slow_token(request):  # pylint: disable=W0613
+            time.sleep(0.3)
+            return json_response({"access_token": "renewed", "expires_in": 1799}, 201)
+
+        async def run(auth):
+            async with AsyncHosts(auth_object=auth) as hosts:
+                return await asyncio.gather(*[hosts.get_device_details(ids=str(num)) for num in range(10)])
+
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", DETAILS_PATH, details_handler)
+            auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                              ssl_verify=CERT_PATH)
+            hosts = Hosts(auth_object=auth)
+            stand_in.route("POST", "/oauth2/token", slow_token)
+            auth.token_expiration = 0
+            # Synchronous and asyncio Service Classes sharing the authentication object renew at the same time
+            sync_results = []
+            sync_thread = threading.Thread(target=lambda: sync_results.append(hosts.get_device_details(ids="sync")))
+            sync_thread.start()
+            async_results = asyncio.run(run(auth))
+            sync_thread.join()
+            tokens = len([req for req in stand_in.requests if req["path"] == "/oauth2/token"])
+
+        return bool(tokens == 2 and auth.token_value == "renewed" and sync_results[0]["status_code"] == 200
+                    and all(result["status_code"] == 200 for result in async_results)
+                    )
+
+    def test_AsyncServiceClass(self):
+        assert self.async_service_class() is True
+
+    def test_AsyncFactory(self):
+        assert self.async_factory() is True
+
+    def test_AsyncUber(self):
+        assert self.async_uber() is True
+
+    def test_AsyncUnsupported(self):
+        assert self.async_unsupported() is True
+
+    def test_AsyncTokenCache(self):
+        assert self.async_token_cache() is True
+
+    def test_AsyncSharedRenewal(self):
+        assert self.async_shared_renewal() is True
@@ -0,0 +1,121 @@
+# test_checkpoint.py
+# Tests durable Event Streams offset checkpoints and resuming
+# the consumer from committed offsets using a local HTTPS stand-in.
+import os
+import sys
+import time
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.checkpoint import CheckpointStore, FileCheckpointStore, SQLiteCheckpointStore, Checkpointer
+from tests.stand_in_api import StandInAPI
+from tests.test_stream_consumer import stand_in_streams, APP_ID, FEED_PATH
+
+
+class SlowStore(SQLiteCheckpointStore):
+    def __init__(self, path):
+        super().__init__(path)
+        self.saves = []
+
+    def save(self, app_id, offsets):
+        time.sleep(0.2)
+        self.saves.append(dict(offsets))
+        super().save(app_id, offsets)
+
+
+class MemoryStore(CheckpointStore):
+    def __init__(self):
+        self.offsets = {}
+
+    def load(self, app_id):
+        return dict(self.offsets.get(app_id, {}))
+
+    def save(self, app_id, offsets):
+        self.offsets[app_id] = {**self.offsets.get(app_id, {}), **offsets}
+
+
+class LoadOnlyStore(CheckpointStore):
+    def load(self, app_id):
+        return {}
+
+
+class TestCheckpoint:
+    def checkpoint_stores(self, tmp_path):
+        success = True
+        for store in [FileCheckpointStore(str(tmp_path / "state" / "offsets.json")),
+                      SQLiteCheckpointStore(str(tmp_path / "offsets.db"))]:
+            store.save(APP_ID, {0: 10, 1: 20})
+            store.save(APP_ID, {1: 25})
+            store.save("another-app", {0: 5})
+            if store.load(APP_ID) != {0: 10, 1: 25} or store.load("another-app") != {0: 5} or store.load("none") != {}:
+                success = False
+            store.close()
+        # Offsets survive reopening the store
+        return bool(success and SQLiteCheckpointStore(str(tmp_path / "offsets.db")).load(APP_ID) == {0: 10, 1: 25}
+                    and FileCheckpointStore(str(tmp_path / "state" / "offsets.json")).load(APP_ID) == {0: 10, 1: 25}
+                    )
+
+    def checkpoint_interface(self):
+        success = True
+        # Stores must implement both load and save
+        for incomplete in [CheckpointStore, LoadOnlyStore]:
+            try:
+                incomplete()
+                success = False
+            except TypeError:
+                pass
+        store = MemoryStore()
+        store.save(APP_ID, {0: 10})
+        store.save(APP_ID, {1: 20})
+        store.close()
+        return bool(success and store.load(APP_ID) == {0: 10, 1: 20})
+
+    def checkpoint_batched(self, tmp_path):
+        store = SlowStore(str(tmp_path / "offsets.db"))
+        checkpointer = Checkpointer(store, APP_ID, interval=60, batch=100)
+        checkpointer.start()
+        started = time.perf_counter()
+        for offset in range(250):
+            checkpointer.record(offset % 2, offset)
+        recording = time.perf_counter() - started
+        time.sleep(0.5)
+        batched = len(store.saves)
+        checkpointer.stop()
+
+        # Recording never waits on storage, batches are committed in the background and the remainder on stop
+        return bool(recording < 0.1 and 1 <= batched < 250 and store.load(APP_ID) == {0: 248, 1: 249}
+                    and len(store.saves) == checkpointer.commits
+                    )
+
+    def checkpoint_consumer_resume(self, tmp_path):
+        path = str(tmp_path / "offsets.db")
+        with StandInAPI() as stand_in:
+            streams = stand_in_streams(stand_in)
+            processed = 0
+            with streams.consume(app_id=APP_ID, partitions=[0], checkpoint=SQLiteCheckpointStore(path)) as consumer:
+                for _ in consumer:
+                    processed += 1
+                    if processed == 100:
+                        break
+            committed = SQLiteCheckpointStore(path).load(APP_ID)
+            # A new consumer resumes after the committed offset
+            with streams.consume(app_id=APP_ID, partitions=[0], checkpoint=SQLiteCheckpointStore(path)) as consumer:
+                first = next(iter(consumer))
+            feeds = [req for req in stand_in.requests if req["path"] == FEED_PATH.format(0)]
+
+        # The 100th event was not processed before iteration stopped, so it is delivered again
+        return bool(committed == {0: 98} and first["metadata"]["offset"] == 99
+                    and "offset" not in feeds[0]["params"] and feeds[1]["params"]["offset"] == ["99"]
+                    )
+
+    def test_Stores(self, tmp_path):
+        assert self.checkpoint_stores(tmp_path) is True
+
+    def test_Interface(self):
+        assert self.checkpoint_interface() is True
+
+    def test_Batched(self, tmp_path):
+        assert self.checkpoint_batched(tmp_path) is True
+
+    def test_ConsumerResume(self, tmp_path):
+        assert self.checkpoint_consumer_resume(tmp_path) is True
@@ -0,0 +1,109 @@
+# test_endpoint_loading.py
+# Tests on-demand loading of the endpoint modules and benchmarks
+# import time using the interpreter's -X importtime option.
+import os
+import subprocess
+import sys
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy import _endpoint
+from falconpy._registry import uber_operation
+from falconpy.api_complete import APIHarness
+
+IMPORT_TARGETS = ["falconpy.api_complete", "falconpy.hosts"]
+
+
+def import_times(module: str) -> dict:
+    """Imports the module in a fresh interpreter and returns the cumulative import time (us) per module."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.abspath("src")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True
+                            )
+    returned = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                returned[name.strip()] = int(cumulative)
+
+    return returned
+
+
+class TestEndpointLoading:
+    def loading_index_in_sync(self):
+        # The first definition of each operation within api_endpoints must match the generated index
+        seen = set()
+        for endpoint in _endpoint.api_endpoints:
+            if endpoint[0] in seen:
+                continue
+            seen.add(endpoint[0])
+            collection = _endpoint.operation_collection(endpoint[0])
+            if not collection or endpoint not in _endpoint.load_collection(collection):
+                return False
+            operation = uber_operation(endpoint[0])
+            if operation.method != endpoint[1] or operation.url != endpoint[2]:
+                return False
+        from falconpy._endpoint._index import _operation_collections
+        return bool(len(seen) == len(_operation_collections))
+
+    def loading_legacy_names(self):
+        from falconpy._endpoint import _hosts_endpoints, deprecated_endpoints
+        from falconpy._endpoint.deprecated import _ioc_deprecated
+        from falconpy._endpoint._hosts import _hosts_endpoints as hosts_module_endpoints
+        return bool(_hosts_endpoints is hosts_module_endpoints
+                    and _ioc_deprecated[0] in deprecated_endpoints
+                    and uber_operation("NotARealOperation") is None
+                    )
+
+    def loading_eager_fallback(self):
+        # Interpreters without module __getattr__ support load every endpoint list at import time
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.path.abspath("src")
+        check = ("import sys; sys.version_info = (3, 6, 15)\n"
+                 "import falconpy._endpoint as endpoint, falconpy._endpoint.deprecated as deprecated\n"
+                 "print(all(name in vars(endpoint) for name in ['api_endpoints', 'deprecated_endpoints', "
+                 "'_hosts_endpoints', '_ioc_deprecated']) and '_ioc_deprecated' in vars(deprecated))")
+        result = subprocess.run([sys.executable, "-c", check], env=env, stdout=subprocess.PIPE,
+                                universal_newlines=True, check=True
+                                )
+        return bool(result.stdout.strip() == "True")
+
+    def loading_assigned_commands(self):
+        falcon = APIHarness(client_id="whatever", client_secret="whatever")
+        default = falcon.commands
+        falcon.commands = [endpoint for endpoint in default if endpoint[0] != "GetDeviceDetails"]
+        # Only the assigned operations are available
+        unavailable = falcon.command("GetDeviceDetails", ids="12345")
+        return bool(default is _endpoint.api_endpoints and len(falcon.commands) < len(default)
+                    and unavailable["status_code"] == 418
+                    )
+
+    def loading_import_benchmark(self):
+        success = True
+        for target in IMPORT_TARGETS:
+            times = import_times(target)
+            loaded = [name for name in times if name.startswith("falconpy._endpoint.")]
+            print(f"\n[importtime] {target}: {times[target]} us total, "
+                  f"{times.get('falconpy._endpoint', 0)} us endpoint package, {len(loaded)} endpoint modules loaded")
+            # At most the operation index, OAuth2 and the service class' own endpoint modules should be imported
+            if len(loaded) > 3:
+                success = False
+
+        return success
+
+    def test_IndexInSync(self):
+        assert self.loading_index_in_sync() is True
+
+    def test_LegacyNames(self):
+        assert self.loading_legacy_names() is True
+
+    def test_EagerFallback(self):
+        assert self.loading_eager_fallback() is True
+
+    def test_AssignedCommands(self):
+        assert self.loading_assigned_commands() is True
+
+    def test_ImportBenchmark(self):
+        assert self.loading_import_benchmark() is True
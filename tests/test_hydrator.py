@@ -0,0 +1,114 @@
+# test_hydrator.py
+# Tests the query-then-hydrate pipeline using a local HTTPS stand-in,
+# and benchmarks concurrent entity retrieval against sequential retrieval.
+import json
+import os
+import random
+import sys
+import time
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.hosts import Hosts
+from falconpy.detects import Detects
+from falconpy.api_complete import APIHarness
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+DEVICES = [f"device-{num}" for num in range(2000)]
+REQUEST_DELAY = 0.02
+
+
+def query_handler(request):
+    start = int(request["params"].get("offset", ["0"])[0])
+    limit = int(request["params"].get("limit", ["100"])[0])
+    resources = DEVICES[start:start + limit]
+    return json_response({"meta": {"pagination": {"offset": start, "total": len(DEVICES)}}, "resources": resources})
+
+
+def details_handler(request):
+    # Randomized latency means batches complete out of order
+    time.sleep(REQUEST_DELAY * random.random())
+    ids = request["params"].get("ids", [])
+    if len(ids) > 100:
+        return json_response({"errors": [{"message": "Too many IDs"}]}, 400)
+    return json_response({"resources": [{"device_id": aid} for aid in ids]})
+
+
+def summaries_handler(request):
+    ids = json.loads(request["body"])["ids"]
+    if "detect-bad" in ids:
+        return json_response({"errors": [{"message": "Invalid ID"}]}, 400)
+    return json_response({"resources": [{"detection_id": did} for did in ids]})
+
+
+def slow_details_handler(request):
+    time.sleep(REQUEST_DELAY)
+    return json_response({"resources": [{"device_id": aid} for aid in request["params"].get("ids", [])]})
+
+
+class TestHydrator:
+    def hydrate_pipeline(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", "/devices/queries/devices/v1", query_handler)
+            stand_in.route("GET", "/devices/entities/devices/v1", details_handler)
+            hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                          ssl_verify=CERT_PATH)
+            ordered = [device["device_id"] for device in hosts.hydrate(
+                hosts.get_device_details, hosts.paginate(hosts.query_devices_by_filter, page_size=500)
+                )]
+            completed = hosts.hydrate("GetDeviceDetails", iter(DEVICES), ordered=False)
+            unordered = [device["device_id"] for device in completed]
+            batches = [len(req["params"]["ids"]) for req in stand_in.requests if req["path"].startswith("/devices/ent")]
+
+        # The definition does not state a limit for this operation, so the query string default is used
+        return bool(ordered == DEVICES and sorted(unordered) == sorted(DEVICES) and not completed.failed
+                    and max(batches) == 100
+                    )
+
+    def hydrate_body_failure(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", "/detects/entities/summaries/GET/v1", summaries_handler)
+            detects = Detects(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                              ssl_verify=CERT_PATH)
+            detections = [f"detect-{num}" for num in range(2500)]
+            # The definition limits this operation to 1000 IDs per request
+            hydrator = detects.hydrate(detects.get_detect_summaries, detections + ["detect-bad"], max_workers=2)
+            records = [record["detection_id"] for record in hydrator]
+            falcon = APIHarness(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                ssl_verify=CERT_PATH)
+            uber = [record["detection_id"] for record in falcon.hydrate("GetDetectSummaries", detections[:10])]
+            try:
+                detects.hydrate(detects.query_detects, detections)
+                rejected = False
+            except ValueError:
+                rejected = True
+            batches = [len(json.loads(req["body"])["ids"]) for req in stand_in.requests if req["method"] == "POST"
+                       and req["path"].startswith("/detects")]
+
+        return bool(records == detections[:2000] and len(hydrator.failed) == 1 and uber == detections[:10]
+                    and rejected and sorted(batches[:3]) == [501, 1000, 1000]
+                    )
+
+    def hydrate_benchmark(self):
+        elapsed = {}
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", "/devices/entities/devices/v1", slow_details_handler)
+            hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                          ssl_verify=CERT_PATH)
+            for workers in [1, 8]:
+                start = time.perf_counter()
+                count = len(list(hosts.hydrate(hosts.get_device_details, DEVICES, max_workers=workers)))
+                elapsed[workers] = time.perf_counter() - start
+        print(f"\n[hydrator] {count} records: {elapsed[1] * 1000:.0f} ms sequential -> "
+              f"{elapsed[8] * 1000:.0f} ms with 8 workers")
+
+        return bool(count == len(DEVICES) and elapsed[8] < elapsed[1] / 2)
+
+    def test_Pipeline(self):
+        assert self.hydrate_pipeline() is True
+
+    def test_BodyFailure(self):
+        assert self.hydrate_body_failure() is True
+
+    def test_Benchmark(self):
+        assert self.hydrate_benchmark() is True
@@ -0,0 +1,137 @@
+# test_json_codec.py
+# Tests the pluggable JSON codecs using a local HTTPS stand-in and benchmarks
+# their throughput on large detection summary and vulnerability payloads.
+import json
+import os
+import sys
+import timeit
+import pytest
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.detects import Detects
+from falconpy.spotlight_vulnerabilities import SpotlightVulnerabilities
+from falconpy.api_complete import APIHarness
+from falconpy.codec import json_codec, JSONCodec, ujson
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+SUMMARIES_PATH = "/detects/entities/summaries/GET/v1"
+VULNERABILITIES_PATH = "/spotlight/entities/vulnerabilities/v2"
+ITERATIONS = 5
+
+
+def detection(num):
+    return {"detection_id": f"ldt:{num:032x}:{num}", "cid": "0" * 32, "created_timestamp": "2021-09-01T00:00:00Z",
+            "device": {"device_id": f"{num:032x}", "hostname": f"host-{num}", "platform_name": "Windows",
+                       "os_version": "Windows 10", "tags": ["SensorGroupingTags/example"], "groups": [f"{num:032x}"]},
+            "behaviors": [{"behavior_id": str(10000 + step), "filename": "powershell.exe", "severity": 70,
+                           "confidence": 80, "cmdline": "powershell.exe -enc " + "A" * 200, "sha256": "f" * 64,
+                           "tactic": "Execution", "technique": "PowerShell", "parent_details": {"parent_sha256": "e" * 64}}
+                          for step in range(5)],
+            "max_severity": 70, "status": "new", "email_sent": False, "seconds_to_triaged": 0}
+
+
+def vulnerability(num):
+    return {"id": f"{num:032x}_{num:032x}", "cid": "0" * 32, "aid": f"{num:032x}", "status": "open",
+            "created_timestamp": "2021-09-01T00:00:00Z", "updated_timestamp": "2021-09-02T00:00:00Z",
+            "cve": {"id": f"CVE-2021-{num:05d}", "base_score": 7.5, "severity": "HIGH", "exploit_status": 0,
+                    "description": "Remote code execution vulnerability. " * 10},
+            "app": {"product_name_version": "Example Product 1.2.3"},
+            "host_info": {"hostname": f"host-{num}", "local_ip": "10.0.0.1", "os_version": "Windows 10"},
+            "remediation": {"ids": [f"{num:032x}"]}}
+
+
+DETECTIONS = {"meta": {"query_time": 0.1}, "errors": [], "resources": [detection(num) for num in range(2000)]}
+VULNERABILITIES = {"meta": {"query_time": 0.1}, "errors": [], "resources": [vulnerability(num) for num in range(5000)]}
+
+
+def echo_handler(request):
+    return json_response({"resources": [json.loads(request["body"])],
+                          "meta": {"content_type": request["headers"].get("Content-Type")}})
+
+
+class TestJSONCodec:
+    def codec_resolution(self):
+        try:
+            json_codec("yaml")
+            return False
+        except ValueError:
+            pass
+        if not ujson:
+            try:
+                json_codec("ujson")
+                return False
+            except ImportError:
+                pass
+        custom = JSONCodec("custom", lambda obj: json.dumps(obj).encode("utf-8"), json.loads)
+        return bool(json_codec(None) is None and json_codec("json").name == "json" and json_codec(custom) is custom
+                    and json_codec("auto").name in ["orjson", "ujson", "json"]
+                    and json_codec("json").dumps({"a": 1}) == b'{"a":1}'
+                    )
+
+    def codec_round_trip(self):
+        pytest.importorskip("orjson")
+        body = {"ids": ["ldt:1", "ldt:2", "ldt:café"]}
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", SUMMARIES_PATH, echo_handler)
+            auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                              ssl_verify=CERT_PATH, json_codec="orjson")
+            shared = Detects(auth_object=auth)
+            # A codec specified for a Service Class takes precedence over the authentication object's codec
+            override = Detects(auth_object=auth, json_codec="json")
+            uber = APIHarness(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                              ssl_verify=CERT_PATH, json_codec="auto")
+            results = [shared.get_detect_summaries(body=body), override.get_detect_summaries(body=body),
+                       uber.command("GetDetectSummaries", body=body)]
+            # Non-string keys are encoded as strings, as they are by the standard library
+            mixed = uber.command("GetDetectSummaries", body={**body, 1: "non-string key"})
+
+        return bool(shared.json_codec.name == "orjson" and override.json_codec.name == "json"
+                    and all(result["status_code"] == 200 for result in results)
+                    and all(result["body"]["resources"][0] == body for result in results)
+                    and mixed["body"]["resources"][0] == {**body, "1": "non-string key"}
+                    and all(result["body"]["meta"]["content_type"] == "application/json" for result in results)
+                    )
+
+    def codec_benchmark(self):
+        pytest.importorskip("orjson")
+        success = True
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", SUMMARIES_PATH, lambda request: json_response(DETECTIONS))
+            stand_in.route("GET", VULNERABILITIES_PATH, lambda request: json_response(VULNERABILITIES))
+            timings = {}
+            for codec in [None, "orjson"]:
+                auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                  ssl_verify=CERT_PATH, json_codec=codec)
+                detects = Detects(auth_object=auth)
+                spotlight = SpotlightVulnerabilities(auth_object=auth)
+                summaries = detects.get_detect_summaries(body={"ids": ["ldt:1"]})
+                vulnerabilities = spotlight.get_vulnerabilities(ids="1234")
+                if summaries["body"] != DETECTIONS or vulnerabilities["body"] != VULNERABILITIES:
+                    success = False
+                # Serialization cost alone: decoding the responses and encoding the payloads as request bodies
+                codec_object = auth.json_codec or json_codec("json")
+                for name, result in [("get_detect_summaries", summaries), ("get_vulnerabilities", vulnerabilities)]:
+                    content = result.content
+                    timings[(name, codec or "json")] = timeit.timeit(
+                        lambda: codec_object.dumps(codec_object.loads(content)), number=ITERATIONS
+                        ) / ITERATIONS
+
+        for name, payload in [("get_detect_summaries", DETECTIONS), ("get_vulnerabilities", VULNERABILITIES)]:
+            size = len(json.dumps(payload)) / 1e6
+            print(f"\n[codec] {name} ({size:.1f} MB): json {size / timings[(name, 'json')]:.0f} MB/s, "
+                  f"orjson {size / timings[(name, 'orjson')]:.0f} MB/s")
+            if timings[(name, "orjson")] >= timings[(name, "json")]:
+                success = False
+
+        return success
+
+    def test_Resolution(self):
+        assert self.codec_resolution() is True
+
+    def test_RoundTrip(self):
+        assert self.codec_round_trip() is True
+
+    def test_Benchmark(self):
+        assert self.codec_benchmark() is True
@@ -0,0 +1,103 @@
+# test_lazy_result.py
+# Tests lazily decoded JSON results using a local HTTPS stand-in and benchmarks
+# forwarding raw response content against decoding and re-encoding it.
+import copy
+import json
+import os
+import sys
+import timeit
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.hosts import Hosts
+from falconpy._result import Result, LazyResult
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+DETAILS_PATH = "/devices/entities/devices/v1"
+ITERATIONS = 50
+LARGE_BODY = {"meta": {"query_time": 0.01}, "errors": [],
+              "resources": [{"device_id": f"{num:032x}", "hostname": f"host-{num}", "tags": ["a", "b"],
+                             "policies": [{"policy_type": "prevention", "applied": True}]} for num in range(5000)]}
+
+
+class TestLazyResult:
+    def lazy_result_parity(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", DETAILS_PATH, lambda request: json_response(LARGE_BODY, headers={"X-Test": "value"}))
+            hosts = Hosts(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                                 base_url=stand_in.base_url, ssl_verify=CERT_PATH))
+            result = hosts.get_device_details(ids="1234")
+
+        undecoded = bool(isinstance(result, dict) and not result.decoded and result["status_code"] == 200
+                         and "body" in result and not result.decoded
+                         )
+        expected = Result()(200, dict(result["headers"]), LARGE_BODY)
+        return bool(undecoded
+                    and result["body"] == LARGE_BODY and result.decoded
+                    and result == expected and dict(result) == expected and {**result} == expected
+                    and json.loads(json.dumps(result)) == json.loads(json.dumps(expected))
+                    and copy.deepcopy(result) == expected and result.copy() == expected
+                    and list(result.keys()) == ["status_code", "headers", "body"]
+                    and result.get("headers")["X-Test"] == "value"
+                    and isinstance(result["headers"], dict)
+                    )
+
+    def lazy_result_dict_operations(self):
+        result = LazyResult(200, {"Content-Type": "application/json"}, b'{"resources": [1, 2]}')
+        # Iterating, serializing or comparing the result decodes it
+        serialized = json.dumps(result)
+        result["body"]["resources"].append(3)
+        result["status_code"] = 201
+        return bool(json.loads(serialized)["body"] == {"resources": [1, 2]}
+                    and result == {"status_code": 201, "headers": {"Content-Type": "application/json"},
+                                   "body": {"resources": [1, 2, 3]}}
+                    and len(result) == 3
+                    # Neither result has been accessed before they are compared
+                    and LazyResult(200, {}, b'{"a": 1}') == LazyResult(200, {}, b'{"a": 1}')
+                    )
+
+    def lazy_result_no_content(self):
+        result = LazyResult(202, {}, b"")
+        return bool(result["body"] == {"message": "No content returned", "resources": []}
+                    and result["status_code"] == 202
+                    )
+
+    def lazy_result_raw(self):
+        content = json.dumps(LARGE_BODY).encode("utf-8")
+        result = LazyResult(200, {}, content)
+        raw = result.raw
+        return bool(raw.obj is content and raw.readonly and result.content is content and not result.decoded)
+
+    def lazy_result_benchmark(self):
+        content = json.dumps(LARGE_BODY).encode("utf-8")
+        headers = {"Content-Type": "application/json", "X-RateLimit-Limit": "6000"}
+
+        def eager():
+            # Previous behaviour, the forwarded body is re-encoded from the decoded result
+            return json.dumps(Result()(200, headers, json.loads(content))["body"]).encode("utf-8")
+
+        def lazy():
+            return LazyResult(200, headers, content).raw
+
+        eager_time = timeit.timeit(eager, number=ITERATIONS) / ITERATIONS
+        lazy_time = timeit.timeit(lazy, number=ITERATIONS) / ITERATIONS
+        print(f"\n[result] forwarding a {len(content) // 1024} KB body: decode and re-encode {eager_time * 1e3:.2f} ms, "
+              f"raw {lazy_time * 1e6:.2f} us")
+
+        return bool(lazy_time * 100 < eager_time)
+
+    def test_Parity(self):
+        assert self.lazy_result_parity() is True
+
+    def test_DictOperations(self):
+        assert self.lazy_result_dict_operations() is True
+
+    def test_NoContent(self):
+        assert self.lazy_result_no_content() is True
+
+    def test_Raw(self):
+        assert self.lazy_result_raw() is True
+
+    def test_Benchmark(self):
+        assert self.lazy_result_benchmark() is True
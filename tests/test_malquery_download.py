@@ -0,0 +1,207 @@
+# test_malquery_download.py
+# Tests concurrent, resumable MalQuery bulk sample downloads using a local HTTPS stand-in
+# simulating multidownload requests that take time to finish.
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+import zipfile
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.malquery import MalQuery
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+QUOTAS_PATH = "/malquery/aggregates/quotas/v1"
+MULTIDOWNLOAD_PATH = "/malquery/entities/samples-multidownload/v1"
+REQUESTS_PATH = "/malquery/entities/requests/v1"
+FETCH_PATH = "/malquery/entities/samples-fetch/v1"
+DOWNLOAD_PATH = "/malquery/entities/download-files/v1"
+SAMPLES = [hashlib.sha256(f"sample-{num}".encode()).hexdigest() for num in range(230)]
+
+
+def archive(samples):
+    packed = io.BytesIO()
+    with zipfile.ZipFile(packed, "w") as contents:
+        for sample in samples:
+            # A fixed timestamp keeps the archive identical every time it is served
+            contents.writestr(zipfile.ZipInfo(sample, date_time=(2021, 9, 1, 0, 0, 0)), sample.encode() * 512)
+    return packed.getvalue()
+
+
+class StandInMalQuery:
+    def __init__(self, delay=0.2, download_limit=1000, download_count=0, stagger=False):
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.delay = delay
+        self.stagger = stagger
+        self.quota = {"download_limit": download_limit, "download_count": download_count, "hunt_limit": 100}
+
+    def multidownload(self, request):
+        samples = json.loads(request["body"])["samples"]
+        with self.lock:
+            request_id = f"request-{len(self.jobs)}"
+            # Staggered requests take longer to finish the later they were submitted
+            delay = self.delay * (len(self.jobs) + 1) if self.stagger else self.delay
+            self.jobs[request_id] = {"samples": samples, "ready": time.monotonic() + delay}
+        return json_response({"meta": {"reqid": request_id}, "resources": []})
+
+    def status(self, request):
+        job = self.jobs.get(request["params"]["ids"][0], None)
+        if not job:
+            return json_response({"errors": [{"code": 404, "message": "Request not found"}], "resources": []}, 404)
+        done = time.monotonic() >= job["ready"]
+        return json_response({"meta": {"status": "done" if done else "inprogress"}, "resources": []})
+
+    def fetch(self, request):
+        content = archive(self.jobs[request["params"]["ids"][0]]["samples"])
+        start = int(request["headers"].get("Range", "bytes=0-")[6:-1])
+        headers = {"Content-Type": "application/zip"}
+        if start:
+            headers["Content-Range"] = f"bytes {start}-{len(content) - 1}/{len(content)}"
+        return 206 if start else 200, headers, content[start:]
+
+    def routes(self, stand_in):
+        stand_in.route("GET", QUOTAS_PATH, lambda request: json_response({"meta": self.quota, "resources": []}))
+        stand_in.route("POST", MULTIDOWNLOAD_PATH, self.multidownload)
+        stand_in.route("GET", REQUESTS_PATH, self.status)
+        stand_in.route("GET", FETCH_PATH, self.fetch)
+        return MalQuery(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                               base_url=stand_in.base_url, ssl_verify=CERT_PATH))
+
+
+def requests_to(stand_in, path):
+    return [req for req in stand_in.requests if req["path"] == path]
+
+
+def fast(downloader):
+    downloader.initial_interval = 0.02
+    downloader.max_interval = 0.1
+    return downloader
+
+
+class TestMalQueryDownload:
+    def download_bulk(self, tmp_path):
+        malquery_api = StandInMalQuery()
+        with StandInAPI() as stand_in:
+            malquery = malquery_api.routes(stand_in)
+            downloader = fast(malquery.bulk_download(iter(SAMPLES + SAMPLES[:10]), directory=str(tmp_path),
+                                                     batch_size=50, max_workers=3))
+            jobs = list(downloader)
+            submitted = [json.loads(req["body"])["samples"] for req in requests_to(stand_in, MULTIDOWNLOAD_PATH)]
+            polls = len(requests_to(stand_in, REQUESTS_PATH))
+            # Samples already downloaded are not submitted again
+            again = list(fast(malquery.bulk_download(SAMPLES[:20], directory=str(tmp_path))))
+            resubmitted = len(requests_to(stand_in, MULTIDOWNLOAD_PATH)) - len(submitted)
+
+        downloaded = set()
+        for job in jobs:
+            with zipfile.ZipFile(job["path"]) as contents:
+                downloaded.update(contents.namelist())
+        with open(tmp_path / ".malquery-downloads.json", "r", encoding="utf-8") as state_file:
+            state = json.load(state_file)["jobs"]
+        return bool(len(jobs) == 5 and all(job["status"] == "downloaded" for job in jobs)
+                    and [len(samples) for samples in submitted] == [50, 50, 50, 50, 30]
+                    and downloaded == set(SAMPLES)
+                    and all(job["sha256"] == hashlib.sha256(open(job["path"], "rb").read()).hexdigest() for job in jobs)
+                    and all(state[job["request_id"]]["status"] == "downloaded" for job in jobs)
+                    # Requests are polled with a growing interval, not continuously
+                    and polls < 40
+                    and again == [] and resubmitted == 0
+                    and downloader.counts == {"samples": 240, "requests": 5, "resumed": 0, "downloaded": 5,
+                                              "failed": 0, "pending": 0, "skipped": 10}
+                    )
+
+    def download_resume(self, tmp_path):
+        malquery_api = StandInMalQuery(delay=0.2, stagger=True)
+        with StandInAPI() as stand_in:
+            malquery = malquery_api.routes(stand_in)
+            # The first run is interrupted once its first request completes
+            first_run = fast(malquery.bulk_download(SAMPLES[:100], directory=str(tmp_path), batch_size=20, max_workers=5))
+            interrupted = iter(first_run)
+            first = next(interrupted)
+            interrupted.close()
+            submitted = len(requests_to(stand_in, MULTIDOWNLOAD_PATH))
+            # The second run resumes the remaining requests, one of which was partially downloaded
+            partial = archive(malquery_api.jobs["request-4"]["samples"])
+            with open(tmp_path / "request-4.zip.part", "wb") as partial_file:
+                partial_file.write(partial[:len(partial) // 2])
+            second_run = fast(malquery.bulk_download(SAMPLES[:100], directory=str(tmp_path)))
+            resumed = list(second_run)
+            fetches = requests_to(stand_in, FETCH_PATH)
+
+        resumed_ranges = [req["headers"].get("Range", None) for req in fetches if req["params"]["ids"] == ["request-4"]]
+        unfinished = sorted(job["request_id"] for job in first_run.failed)
+        return bool(first["status"] == "downloaded" and submitted == 5
+                    # Requests that had not finished when the first run stopped are reported as pending
+                    and unfinished == sorted(f"request-{num}" for num in range(5) if f"request-{num}" != first["request_id"])
+                    and all(job["status"] == "pending" and job["errors"] for job in first_run.failed)
+                    and first_run.counts["pending"] == 4 and first_run.counts["downloaded"] == 1
+                    and len(requests_to(stand_in, MULTIDOWNLOAD_PATH)) == 5
+                    and sorted(job["request_id"] for job in resumed) == sorted(f"request-{num}" for num in range(5)
+                                                                             if f"request-{num}" != first["request_id"])
+                    and all(job["status"] == "downloaded" for job in resumed)
+                    and second_run.counts["resumed"] == 4 and second_run.counts["requests"] == 0
+                    and f"bytes={len(partial) // 2}-" in resumed_ranges
+                    and open(tmp_path / "request-4.zip", "rb").read() == partial
+                    )
+
+    def download_quota_and_failures(self, tmp_path):
+        malquery_api = StandInMalQuery(delay=0, download_limit=100, download_count=60)
+        with StandInAPI() as stand_in:
+            malquery = malquery_api.routes(stand_in)
+            downloader = fast(malquery.bulk_download(SAMPLES[:50], directory=str(tmp_path), batch_size=25))
+            jobs = list(downloader)
+            # Requests that no longer exist fail, and their samples are submitted again by the next run
+            state_path = tmp_path / ".malquery-downloads.json"
+            state = json.loads(state_path.read_text())
+            state["jobs"]["request-expired"] = {"samples": SAMPLES[60:62], "status": "submitted"}
+            state_path.write_text(json.dumps(state))
+            expired = list(fast(malquery.bulk_download([], directory=str(tmp_path), respect_quota=False)))
+            retried = list(fast(malquery.bulk_download(SAMPLES[60:62], directory=str(tmp_path), respect_quota=False)))
+            # Samples of requests being resumed are deducted from the quota before new samples are submitted
+            reserved_path = tmp_path / "reserved" / ".malquery-downloads.json"
+            reserved_path.parent.mkdir()
+            reserved_path.write_text(json.dumps({"jobs": {"request-old": {"samples": SAMPLES[200:215],
+                                                                          "status": "submitted"}}}))
+            reserved = fast(malquery.bulk_download(SAMPLES[100:150], directory=str(tmp_path / "reserved")))
+            reserved_jobs = list(reserved)
+
+        return bool(len(jobs) == 2 and sum(len(job["samples"]) for job in jobs) == 40
+                    and downloader.over_quota == SAMPLES[40:50]
+                    and expired[0]["status"] == "failed" and expired[0]["errors"][0]["message"] == "Request not found"
+                    and retried[0]["status"] == "downloaded" and retried[0]["samples"] == SAMPLES[60:62]
+                    and reserved.over_quota == SAMPLES[125:150]
+                    and sum(len(job["samples"]) for job in reserved_jobs if job["status"] == "downloaded") == 25
+                    )
+
+    def download_single_file(self, tmp_path):
+        content = b"MZ" + os.urandom(4096)
+        sha256 = hashlib.sha256(content).hexdigest()
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", DOWNLOAD_PATH, lambda request: (200, {"Content-Type": "application/octet-stream"},
+                                                                  content))
+            malquery = MalQuery(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                                       base_url=stand_in.base_url, ssl_verify=CERT_PATH))
+            verified = malquery.get_download(sha256, download_to=str(tmp_path / "sample.bin"))
+            mismatch = malquery.get_download(ids=["0" * 64], download_to=str(tmp_path / "other.bin"))
+
+        return bool(verified["status_code"] == 200 and (tmp_path / "sample.bin").read_bytes() == content
+                    and mismatch["status_code"] == 500 and not (tmp_path / "other.bin").exists()
+                    )
+
+    def test_Bulk(self, tmp_path):
+        assert self.download_bulk(tmp_path) is True
+
+    def test_Resume(self, tmp_path):
+        assert self.download_resume(tmp_path) is True
+
+    def test_QuotaAndFailures(self, tmp_path):
+        assert self.download_quota_and_failures(tmp_path) is True
+
+    def test_SingleFile(self, tmp_path):
+        assert self.download_single_file(tmp_path) is True
@@ -0,0 +1,233 @@
+# test_malquery_results.py
+# Tests streaming MalQuery hunt, exact and fuzzy search results using a local HTTPS stand-in
+# and measures the memory used to iterate over a large result.
+import hashlib
+import itertools
+import json
+import os
+import sys
+import time
+import tracemalloc
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.malquery import MalQuery
+from falconpy.malquery_results import decode_resources
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+HUNT_PATH = "/malquery/queries/hunt/v1"
+EXACT_PATH = "/malquery/queries/exact-search/v1"
+FUZZY_PATH = "/malquery/combined/fuzzy-search/v1"
+REQUESTS_PATH = "/malquery/entities/requests/v1"
+METADATA_PATH = "/malquery/entities/metadata/v1"
+MATCHES = [{"sha256": hashlib.sha256(f"sample-{num}".encode()).hexdigest(), "filesize": num * 1024,
+            "label": "malware", "family": "Ünïcode family", "filetype": "PE32", "first_seen": "2021/09/01"}
+           for num in range(20000)]
+# The meta precedes the resources, as it does in API responses
+RESULTS = {status: ('{"meta": {"status": "' + status + '", "reqid": "hunt-1"}, "resources": '
+                    + json.dumps(MATCHES) + '}').encode("utf-8") for status in ["done", "failed"]}
+# The meta follows the resources, the status is only known once every match has been read
+LATE_META = ('{"resources": ' + json.dumps(MATCHES) + ', "meta": {"status": "done", "reqid": "hunt-1"}}').encode("utf-8")
+
+
+class StandInMalQuery:
+    def __init__(self, polls=2, status="done", late_meta=False):
+        self.polls = polls
+        self.status = status
+        self.late_meta = late_meta
+        self.checked = 0
+
+    def request(self, request):
+        self.checked += 1
+        if request["params"]["ids"] != ["hunt-1"]:
+            return json_response({"errors": [{"code": 404, "message": "Request not found"}], "resources": []}, 404)
+        if self.checked <= self.polls:
+            # Requests in progress already return some of their matches
+            if self.late_meta:
+                return json_response({"resources": MATCHES[:100], "meta": {"status": "inprogress", "reqid": "hunt-1"}})
+            return json_response({"meta": {"status": "inprogress", "reqid": "hunt-1"}, "resources": MATCHES[:100]})
+        return 200, {"Content-Type": "application/json"}, LATE_META if self.late_meta else RESULTS[self.status]
+
+    def routes(self, stand_in, **kwargs):
+        stand_in.route("POST", HUNT_PATH, lambda request: json_response({"meta": {"reqid": "hunt-1"}, "resources": []}))
+        stand_in.route("POST", EXACT_PATH, lambda request: json_response({"errors": [{"message": "Invalid"}]}, 400))
+        stand_in.route("POST", FUZZY_PATH, lambda request: json_response({"meta": {"status": "done"},
+                                                                         "resources": MATCHES[:50]}))
+        stand_in.route("GET", REQUESTS_PATH, self.request)
+        stand_in.route("GET", METADATA_PATH, lambda request: json_response({"resources": [
+            {"sha256": sha256, "family": "example"} for sha256 in request["params"]["ids"]
+            ]}))
+        return MalQuery(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                               base_url=stand_in.base_url, ssl_verify=CERT_PATH, **kwargs))
+
+
+def fast(stream):
+    stream.initial_interval = 0.02
+    stream.max_interval = 0.1
+    return stream
+
+
+def requests_to(stand_in, path):
+    return [req for req in stand_in.requests if req["path"] == path]
+
+
+class TestMalQueryResults:
+    def results_decoding(self):
+        body = {"meta": {"query_time": 1.5, "nested": [[1], {"a": "]}"}]}, "resources": [
+            {"sha256": "a" * 64, "name": "quote \" and brace }", "size": 12345},
+            "café", 1e10, 42, -7, True, None, [], {}
+        ], "errors": None, "count": 10}
+        content = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        success = True
+        for size in [1, 2, 7, 64, len(content)]:
+            fields = {}
+            chunks = [content[pos:pos + size] for pos in range(0, len(content), size)]
+            if list(decode_resources(chunks, fields)) != body["resources"] or fields != {
+                    "meta": body["meta"], "errors": None, "count": 10}:
+                success = False
+        for malformed in [content[:-1], b'["not", "an", "object"]', b'{"resources": [1 2]}']:
+            try:
+                list(decode_resources([malformed], {}))
+                success = False
+            except ValueError:
+                pass
+        return success
+
+    def results_hunt(self):
+        malquery_api = StandInMalQuery()
+        with StandInAPI() as stand_in:
+            malquery = malquery_api.routes(stand_in)
+            stream = fast(malquery.stream_hunt(body={"yara_rule": "rule test { condition: true }"}))
+            tracemalloc.start()
+            count = 0
+            matched = hashlib.sha256()
+            for match in stream:
+                count += 1
+                matched.update(match["sha256"].encode())
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            submitted = requests_to(stand_in, HUNT_PATH)
+            polled = requests_to(stand_in, REQUESTS_PATH)
+            # A request submitted earlier can be read without submitting a search
+            existing = [match["sha256"] for match in malquery.stream_request("hunt-1")]
+
+        body_size = len(RESULTS["done"])
+        print(f"\n[malquery] {count} matches ({body_size // 1024} KB body), peak memory {peak // 1024} KB")
+        expected = hashlib.sha256("".join(match["sha256"] for match in MATCHES).encode()).hexdigest()
+        return bool(count == len(MATCHES) and matched.hexdigest() == expected
+                    and json.loads(submitted[0]["body"]) == {"yara_rule": "rule test { condition: true }"}
+                    and len(polled) == 3 and all(req["params"]["ids"] == ["hunt-1"] for req in polled)
+                    and stream.meta == {"status": "done", "reqid": "hunt-1"} and stream.failed is None
+                    and stream.counts == {"polls": 3, "matches": len(MATCHES)}
+                    # Matches are not materialized, the memory used is a fraction of the response body
+                    and peak * 10 < body_size
+                    and existing == [match["sha256"] for match in MATCHES]
+                    )
+
+    def results_metadata(self):
+        with StandInAPI() as stand_in:
+            malquery = StandInMalQuery(polls=0).routes(stand_in)
+            metadata = list(malquery.stream_hunt(body={"yara_rule": "rule"}).metadata(batch_size=500))
+            batches = [req["params"]["ids"] for req in requests_to(stand_in, METADATA_PATH)]
+            fuzzy = malquery.stream_fuzzy_search(body={"patterns": [{"type": "hex", "value": "4D5A"}]})
+            fuzzy_hashes = list(fuzzy.sha256s())
+            fuzzy_requests = requests_to(stand_in, FUZZY_PATH)
+
+        return bool(len(metadata) == len(MATCHES) and all(item["family"] == "example" for item in metadata)
+                    and [len(batch) for batch in batches] == [500] * 40
+                    and sum(batches, []) == [match["sha256"] for match in MATCHES]
+                    and fuzzy_hashes == [match["sha256"] for match in MATCHES[:50]] and len(fuzzy_requests) == 1
+                    and json.loads(fuzzy_requests[0]["body"]) == {"patterns": [{"type": "hex", "value": "4D5A"}]}
+                    )
+
+    def results_in_progress(self):
+        with StandInAPI() as stand_in:
+            malquery = StandInMalQuery(polls=2, late_meta=True).routes(stand_in)
+            stream = fast(malquery.stream_request("hunt-1"))
+            matches = [match["sha256"] for match in stream]
+            polled = requests_to(stand_in, REQUESTS_PATH)
+
+        # Partial matches of the request in progress are discarded, the finished request is read again
+        # as its status followed its matches
+        return bool(matches == [match["sha256"] for match in MATCHES] and stream.failed is None
+                    and len(polled) == 4 and stream.counts == {"polls": 3, "matches": len(MATCHES)}
+                    )
+
+    def results_renewal_and_throttling(self):
+        malquery_api = StandInMalQuery(polls=2)
+        counter = itertools.count(1)
+        throttled = []
+
+        def poll(request):
+            if not throttled:
+                throttled.append(request)
+                return json_response({"errors": [{"message": "API rate limit exceeded."}]}, 429,
+                                     {"X-RateLimit-Limit": "6000", "X-RateLimit-Remaining": "0",
+                                      "X-Ratelimit-Retryafter": str(time.time() + 0.01)})
+            # The token expires while the search is running
+            malquery.auth_object.token_expiration = 0
+            return malquery_api.request(request)
+
+        with StandInAPI() as stand_in:
+            malquery = malquery_api.routes(stand_in, rate_limit=True)
+            stand_in.route("POST", "/oauth2/token",
+                           lambda request: json_response({"access_token": f"token-{next(counter)}", "expires_in": 1799}, 201))
+            stand_in.route("GET", REQUESTS_PATH, poll)
+            stream = fast(malquery.stream_request("hunt-1"))
+            matches = len(list(stream))
+            polled = requests_to(stand_in, REQUESTS_PATH)
+
+        # The throttled poll is retried, and every later poll uses the renewed token
+        return bool(matches == len(MATCHES) and stream.failed is None and len(polled) == 4
+                    and [req["headers"]["Authorization"] for req in polled] == [
+                        "Bearer stand-in-token", "Bearer stand-in-token", "Bearer token-1", "Bearer token-2"]
+                    and all(req["headers"]["User-Agent"].startswith("crowdstrike-falconpy/") for req in polled)
+                    )
+
+    def results_failures(self):
+        with StandInAPI() as stand_in:
+            malquery = StandInMalQuery(polls=1000).routes(stand_in)
+            rejected = malquery.stream_exact_search(body={"patterns": []})
+            rejected_matches = list(rejected)
+            unknown = malquery.stream_request("missing")
+            unknown_matches = list(unknown)
+            slow = fast(malquery.stream_hunt(body={"yara_rule": "rule"}))
+            slow.timeout = 0.3
+            slow_matches = list(slow)
+        with StandInAPI() as stand_in:
+            failing = StandInMalQuery(polls=0, status="failed").routes(stand_in)
+            failed = fast(failing.stream_hunt(body={"yara_rule": "rule"}))
+            failed_matches = list(failed)
+        with StandInAPI() as stand_in:
+            malquery = StandInMalQuery(polls=0).routes(stand_in)
+            # Stopping iteration early closes the response
+            stopped = malquery.stream_hunt(body={"yara_rule": "rule"})
+            first = next(iter(stopped))
+
+        return bool(rejected_matches == [] and rejected.failed["status_code"] == 400
+                    and unknown_matches == [] and unknown.failed["status_code"] == 404
+                    and unknown.failed["body"]["errors"][0]["message"] == "Request not found"
+                    and slow_matches == [] and slow.failed["status_code"] == 408
+                    # Matches of a failed request are not yielded
+                    and failed_matches == [] and failed.failed["status_code"] == 500
+                    and first == MATCHES[0]
+                    )
+
+    def test_Decoding(self):
+        assert self.results_decoding() is True
+
+    def test_Hunt(self):
+        assert self.results_hunt() is True
+
+    def test_Metadata(self):
+        assert self.results_metadata() is True
+
+    def test_InProgress(self):
+        assert self.results_in_progress() is True
+
+    def test_RenewalAndThrottling(self):
+        assert self.results_renewal_and_throttling() is True
+
+    def test_Failures(self):
+        assert self.results_failures() is True
@@ -0,0 +1,86 @@
+# test_operation_registry.py
+# Tests the operation registry used for endpoint lookups and
+# benchmarks per-call dispatch cost against the legacy linear scans.
+import os
+import sys
+import timeit
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy._endpoint import api_endpoints
+from falconpy._endpoint._hosts import _hosts_endpoints
+from falconpy._registry import operation_index, find_operation
+from falconpy._util import args_to_params
+
+ITERATIONS = 2000
+HOST_KEYWORDS = {"filter": "hostname:'example*'", "limit": 500, "offset": 0, "sort": "hostname.asc", "bogus": "ignored"}
+
+
+def legacy_uber_lookup(action):
+    return [a for a in api_endpoints if a[0] == action]
+
+
+def legacy_args_to_params(payload, passed_arguments, endpoints, epname):
+    for arg in passed_arguments:
+        eps = [ep[5] for ep in endpoints if epname in ep[0]][0]
+        try:
+            argument = [param for param in eps if param["name"] == arg][0]
+            if argument:
+                arg_name = argument["name"]
+                if argument["type"] == "array":
+                    if isinstance(passed_arguments[arg_name], (str)):
+                        passed_arguments[arg_name] = passed_arguments[arg_name].split(",")
+                payload[arg_name] = passed_arguments[arg_name]
+        except IndexError:
+            pass
+
+    return payload
+
+
+class TestOperationRegistry:
+    def registry_uber_parity(self):
+        index = operation_index(api_endpoints)
+        for endpoint in api_endpoints:
+            first = legacy_uber_lookup(endpoint[0])[0]
+            operation = index[endpoint[0]]
+            if operation.method != first[1] or operation.url != first[2]:
+                return False
+        return bool(find_operation(api_endpoints, "NotARealOperation") is None)
+
+    def registry_params_parity(self):
+        for keywords in [HOST_KEYWORDS, {"ids": "1234,5678"}, {"ids": ["1234", "5678"]}]:
+            expected = legacy_args_to_params({}, dict(keywords), _hosts_endpoints, "GetDeviceDetails")
+            if args_to_params({}, dict(keywords), _hosts_endpoints, "GetDeviceDetails") != expected:
+                return False
+            expected = legacy_args_to_params({}, dict(keywords), _hosts_endpoints, "QueryDevicesByFilter")
+            if args_to_params({}, dict(keywords), _hosts_endpoints, "QueryDevicesByFilter") != expected:
+                return False
+        return True
+
+    def registry_benchmark(self):
+        # The last operation in the list is the worst case for a linear scan
+        action = api_endpoints[-1][0]
+        uber_legacy = timeit.timeit(lambda: legacy_uber_lookup(action), number=ITERATIONS) / ITERATIONS
+        uber_registry = timeit.timeit(lambda: operation_index(api_endpoints).get(action),
+                                      number=ITERATIONS) / ITERATIONS
+        service_legacy = timeit.timeit(
+            lambda: legacy_args_to_params({}, dict(HOST_KEYWORDS), _hosts_endpoints, "QueryDevicesByFilter"),
+            number=ITERATIONS
+            ) / ITERATIONS
+        service_registry = timeit.timeit(
+            lambda: args_to_params({}, dict(HOST_KEYWORDS), _hosts_endpoints, "QueryDevicesByFilter"),
+            number=ITERATIONS
+            ) / ITERATIONS
+        print(f"\n[registry] uber dispatch: {uber_legacy * 1e6:.2f} us -> {uber_registry * 1e6:.2f} us"
+              f" | service dispatch: {service_legacy * 1e6:.2f} us -> {service_registry * 1e6:.2f} us")
+
+        return bool(uber_registry < uber_legacy and service_registry < service_legacy)
+
+    def test_UberParity(self):
+        assert self.registry_uber_parity() is True
+
+    def test_ParamsParity(self):
+        assert self.registry_params_parity() is True
+
+    def test_Benchmark(self):
+        assert self.registry_benchmark() is True
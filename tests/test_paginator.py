@@ -0,0 +1,140 @@
+# test_paginator.py
+# Tests automatic pagination of query operations using a local HTTPS stand-in,
+# and benchmarks background prefetching of the next page.
+import os
+import sys
+import time
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.hosts import Hosts
+from falconpy.intel import Intel
+from falconpy.spotlight_vulnerabilities import SpotlightVulnerabilities
+from falconpy.api_complete import APIHarness
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+RECORDS = [f"record-{num}" for num in range(1050)]
+PAGE_DELAY = 0.05
+
+
+def page_slice(start, request):
+    limit = int(request["params"].get("limit", ["100"])[0])
+    return RECORDS[start:start + limit], start + limit
+
+
+def offset_handler(request):
+    start = int(request["params"].get("offset", ["0"])[0])
+    resources, _ = page_slice(start, request)
+    return json_response({"meta": {"pagination": {"offset": start, "limit": len(resources), "total": len(RECORDS)}},
+                          "resources": resources})
+
+
+def token_handler(request):
+    # Scroll tokens are opaque strings
+    start = int(request["params"].get("offset", ["token-0"])[0].split("-")[1])
+    resources, following = page_slice(start, request)
+    return json_response({"meta": {"pagination": {"offset": f"token-{following}", "total": len(RECORDS)}},
+                          "resources": resources})
+
+
+def after_handler(request):
+    start = int(request["params"].get("after", ["0"])[0])
+    resources, following = page_slice(start, request)
+    after = str(following) if following < len(RECORDS) else ""
+    return json_response({"meta": {"pagination": {"after": after, "total": len(RECORDS)}}, "resources": resources})
+
+
+def marker_handler(request):
+    marker = request["params"].get("filter", ["_marker:<'0'"])[0]
+    start = int(marker.split("'")[1])
+    resources, following = page_slice(start, request)
+    headers = {}
+    if following < len(RECORDS):
+        headers["Next-Page"] = f"/intel/combined/indicators/v1?filter=_marker%3A%3C%27{following}%27&limit=100"
+    return json_response({"meta": {"pagination": {"offset": 0, "total": len(RECORDS)}}, "resources": resources},
+                         headers=headers)
+
+
+def slow_offset_handler(request):
+    time.sleep(PAGE_DELAY)
+    return offset_handler(request)
+
+
+def page_offsets(stand_in, path, name):
+    return [req["params"].get(name, [None])[0] for req in stand_in.requests if req["path"] == path]
+
+
+class TestPaginator:
+    def paginate_styles(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", "/devices/queries/devices/v1", offset_handler)
+            stand_in.route("GET", "/devices/queries/devices-scroll/v1", token_handler)
+            stand_in.route("GET", "/spotlight/queries/vulnerabilities/v1", after_handler)
+            stand_in.route("GET", "/intel/combined/indicators/v1", marker_handler)
+            auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                              ssl_verify=CERT_PATH)
+            hosts = Hosts(auth_object=auth)
+            results = [
+                list(hosts.paginate(hosts.query_devices_by_filter, page_size=100, filter="platform_name:'Windows'")),
+                list(hosts.paginate("QueryDevicesByFilterScroll", page_size=400)),
+                list(SpotlightVulnerabilities(auth_object=auth).paginate("query_vulnerabilities", limit=400)),
+                list(Intel(auth_object=auth).paginate("query_indicator_entities", page_size=100))
+            ]
+            offsets = page_offsets(stand_in, "/devices/queries/devices/v1", "offset")
+            filters = page_offsets(stand_in, "/devices/queries/devices/v1", "filter")
+            tokens = page_offsets(stand_in, "/devices/queries/devices-scroll/v1", "offset")
+            markers = page_offsets(stand_in, "/intel/combined/indicators/v1", "filter")
+
+        return bool(all(result == RECORDS for result in results)
+                    and offsets == [None] + [str(num) for num in range(100, 1100, 100)]
+                    and set(filters) == {"platform_name:'Windows'"}
+                    and tokens == [None, "token-400", "token-800"]
+                    and markers[1] == "_marker:<'100'" and len(markers) == 11
+                    )
+
+    def paginate_uber_failure(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", "/devices/queries/devices-scroll/v1", token_handler)
+            falcon = APIHarness(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                ssl_verify=CERT_PATH)
+            records = list(falcon.paginate("QueryDevicesByFilterScroll", parameters={"limit": 500}))
+            # The stand-in has no route for this operation
+            missing = falcon.paginate("QueryDetects")
+            failed = list(missing)
+            pages = list(falcon.paginate("QueryDetects").pages())
+            try:
+                falcon.paginate("GetDeviceDetails")
+                rejected = False
+            except ValueError:
+                rejected = True
+
+        return bool(records == RECORDS and failed == [] and missing.failed["status_code"] == 404
+                    and len(pages) == 1 and rejected
+                    )
+
+    def paginate_prefetch_benchmark(self):
+        elapsed = {}
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", "/devices/queries/devices/v1", slow_offset_handler)
+            hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                          ssl_verify=CERT_PATH)
+            for prefetch in [False, True]:
+                start = time.perf_counter()
+                for _ in hosts.paginate(hosts.query_devices_by_filter, page_size=100, prefetch=prefetch).pages():
+                    # Simulates the caller processing each page
+                    time.sleep(PAGE_DELAY)
+                elapsed[prefetch] = time.perf_counter() - start
+        print(f"\n[paginator] 11 pages: {elapsed[False] * 1000:.0f} ms sequential -> "
+              f"{elapsed[True] * 1000:.0f} ms with prefetch")
+
+        return bool(elapsed[True] < elapsed[False] * 0.75)
+
+    def test_Styles(self):
+        assert self.paginate_styles() is True
+
+    def test_UberFailure(self):
+        assert self.paginate_uber_failure() is True
+
+    def test_PrefetchBenchmark(self):
+        assert self.paginate_prefetch_benchmark() is True
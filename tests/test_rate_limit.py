@@ -0,0 +1,125 @@
+# test_rate_limit.py
+# Tests client-side rate limiting and 429 retries using a local HTTPS stand-in
+# that enforces a per-minute request limit.
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.hosts import Hosts
+from falconpy.detects import Detects
+from falconpy.api_complete import APIHarness
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+# 1200 requests per minute (20 per second) with a burst of 20 requests
+LIMIT = 1200
+BURST = 20
+REQUESTS = 60
+QUERY_PATH = "/devices/queries/devices/v1"
+
+
+class LimitedHandler:
+    """Server side token bucket returning the Falcon API rate limit headers."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tokens = float(BURST)
+        self.updated = time.monotonic()
+        self.rejected = 0
+
+    def __call__(self, request):  # pylint: disable=W0613
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(float(BURST), self.tokens + (now - self.updated) * LIMIT / 60)
+            self.updated = now
+            headers = {"X-RateLimit-Limit": str(LIMIT)}
+            if self.tokens < 1:
+                self.rejected += 1
+                headers["X-RateLimit-Remaining"] = "0"
+                headers["X-Ratelimit-Retryafter"] = str(time.time() + (1 - self.tokens) * 60 / LIMIT)
+                return json_response({"errors": [{"code": 429, "message": "API rate limit exceeded."}]}, 429, headers)
+            self.tokens -= 1
+            headers["X-RateLimit-Remaining"] = str(int(self.tokens))
+        return json_response({"resources": []}, 200, headers)
+
+
+def burst(method):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return [result["status_code"] for result in executor.map(lambda _: method(), range(REQUESTS))]
+
+
+class TestRateLimit:
+    def rate_limit_shared(self):
+        with StandInAPI() as stand_in:
+            limited = LimitedHandler()
+            stand_in.route("GET", QUERY_PATH, limited)
+            stand_in.route("GET", "/detects/queries/detects/v1", limited)
+            # Without a rate limiter, the burst receives 429 responses
+            unlimited = burst(Hosts(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                    ssl_verify=CERT_PATH).query_devices_by_filter)
+            time.sleep(BURST * 60 / LIMIT)
+            auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                              ssl_verify=CERT_PATH, rate_limit=True)
+            hosts = Hosts(auth_object=auth)
+            detects = Detects(auth_object=auth)
+            # Both Service Classes share the same limiter
+            limited.rejected = 0
+            start = time.perf_counter()
+            results = burst(hosts.query_devices_by_filter) + burst(detects.query_detects)
+            elapsed = time.perf_counter() - start
+            metrics = auth.rate_limiter.metrics()
+        print(f"\n[rate limit] {2 * REQUESTS} requests in {elapsed:.2f}s, {unlimited.count(429)} rejected without "
+              f"limiter, {limited.rejected} rejected with limiter, {metrics['throttled_time']:.2f}s throttled")
+
+        return bool(unlimited.count(429) > 0 and set(results) == {200}
+                    and metrics["limit"] == LIMIT and metrics["requests"] >= 2 * REQUESTS
+                    and metrics["throttled"] > 0 and metrics["retries"] == limited.rejected
+                    # The bucket smooths requests, so only the initial burst (before a limit is known) is rejected
+                    and limited.rejected <= 8
+                    )
+
+    def rate_limit_retry_exhausted(self):
+        def always_limited(request):  # pylint: disable=W0613
+            return json_response({"errors": [{"message": "API rate limit exceeded."}]}, 429,
+                                 {"X-RateLimit-Limit": str(LIMIT), "X-RateLimit-Remaining": "0",
+                                  "X-Ratelimit-Retryafter": str(time.time() + 0.01)})
+
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", QUERY_PATH, always_limited)
+            falcon = APIHarness(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                ssl_verify=CERT_PATH, rate_limit=True)
+            falcon.rate_limiter.max_retries = 2
+            result = falcon.command("QueryDevicesByFilter")
+            attempts = len([req for req in stand_in.requests if req["path"] == QUERY_PATH])
+
+        return bool(result["status_code"] == 429 and attempts == 3 and falcon.rate_limiter.metrics()["retries"] == 2)
+
+    def rate_limit_async(self):
+        pytest.importorskip("aiohttp")
+        from falconpy.async_service_class import asynchronous
+
+        async def run(base_url):
+            auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=base_url,
+                              ssl_verify=CERT_PATH, rate_limit=True)
+            async with asynchronous(Hosts)(auth_object=auth) as hosts:
+                return await asyncio.gather(*[hosts.query_devices_by_filter() for _ in range(REQUESTS)])
+
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", QUERY_PATH, LimitedHandler())
+            results = asyncio.run(run(stand_in.base_url))
+
+        return bool(all(result["status_code"] == 200 for result in results))
+
+    def test_Shared(self):
+        assert self.rate_limit_shared() is True
+
+    def test_RetryExhausted(self):
+        assert self.rate_limit_retry_exhausted() is True
+
+    def test_Async(self):
+        assert self.rate_limit_async() is True
@@ -0,0 +1,126 @@
+# test_request_coalescing.py
+# Tests single-flight coalescing of identical concurrent GET requests using a local HTTPS stand-in.
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.hosts import Hosts
+from falconpy.api_complete import APIHarness
+from falconpy.coalescer import RequestCoalescer
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+DETAILS_PATH = "/devices/entities/devices/v1"
+LOGINS_PATH = "/devices/combined/devices/login-history/v1"
+WORKERS = 16
+
+
+def slow_details(request):
+    time.sleep(0.3)
+    return json_response({"resources": [{"device_id": device} for device in request["params"]["ids"]]})
+
+
+def slow_logins(request):  # pylint: disable=W0613
+    time.sleep(0.3)
+    return json_response({"resources": []})
+
+
+def requests_to(stand_in, path):
+    return [req for req in stand_in.requests if req["path"] == path]
+
+
+def concurrently(request, count=WORKERS):
+    barrier = threading.Barrier(count)
+
+    def worker(num):
+        barrier.wait()
+        return request(num)
+
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return list(pool.map(worker, range(count)))
+
+
+class TestRequestCoalescing:
+    def coalesce_service_class(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", DETAILS_PATH, slow_details)
+            stand_in.route("POST", LOGINS_PATH, slow_logins)
+            hosts = Hosts(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                                 base_url=stand_in.base_url, ssl_verify=CERT_PATH, coalesce=True))
+            hot = concurrently(lambda num: hosts.get_device_details(ids="hot-aid"))
+            # Changes made by one caller are not seen by the others
+            hot[0]["body"]["resources"].clear()
+            hot_requests = len(requests_to(stand_in, DETAILS_PATH))
+            mixed = concurrently(lambda num: hosts.get_device_details(ids=f"aid-{num % 2}"))
+            mixed_requests = len(requests_to(stand_in, DETAILS_PATH)) - hot_requests
+            # Only GET requests are coalesced
+            concurrently(lambda num: hosts.query_device_login_history(body={"ids": ["hot-aid"]}), count=4)
+            login_requests = len(requests_to(stand_in, LOGINS_PATH))
+
+        metrics = hosts.auth_object.coalescer.metrics()
+        return bool(hot_requests == 1 and all(result["status_code"] == 200 for result in hot)
+                    and all(result["body"]["resources"] == [{"device_id": "hot-aid"}] for result in hot[1:])
+                    and len({id(result) for result in hot}) == WORKERS
+                    and mixed_requests == 2
+                    and all(result["body"]["resources"] == [{"device_id": f"aid-{num % 2}"}]
+                            for num, result in enumerate(mixed))
+                    and login_requests == 4
+                    and metrics["requests"] == 3 and metrics["coalesced"] == WORKERS * 2 - 3 and metrics["in_flight"] == 0
+                    )
+
+    def coalesce_disabled(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", DETAILS_PATH, slow_details)
+            hosts = Hosts(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                                 base_url=stand_in.base_url, ssl_verify=CERT_PATH))
+            concurrently(lambda num: hosts.get_device_details(ids="hot-aid"), count=4)
+            sent = len(requests_to(stand_in, DETAILS_PATH))
+
+        return bool(sent == 4 and hosts.auth_object.coalescer is None)
+
+    def coalesce_uber(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", DETAILS_PATH, slow_details)
+            falcon = APIHarness(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                ssl_verify=CERT_PATH, coalesce=True)
+            results = concurrently(lambda num: falcon.command("GetDeviceDetails", ids="hot-aid"))
+            sent = len(requests_to(stand_in, DETAILS_PATH))
+
+        return bool(sent == 1 and all(result["body"]["resources"] == [{"device_id": "hot-aid"}] for result in results))
+
+    def coalesce_errors(self):
+        coalescer = RequestCoalescer()
+        attempts = []
+
+        def send(extra):  # pylint: disable=W0613
+            attempts.append(1)
+            time.sleep(0.2)
+            raise ConnectionError("connection reset")
+
+        def request(num):  # pylint: disable=W0613
+            try:
+                coalescer.perform("GetDeviceDetails", "/devices", {"ids": ["1"]}, {}, send)
+            except ConnectionError as err:
+                return str(err)
+            return None
+
+        errors = concurrently(request, count=4)
+        # Nothing is kept once the request completes, the next request is performed
+        retried = request(0)
+        return bool(errors == ["connection reset"] * 4 and retried == "connection reset" and len(attempts) == 2)
+
+    def test_ServiceClass(self):
+        assert self.coalesce_service_class() is True
+
+    def test_Disabled(self):
+        assert self.coalesce_disabled() is True
+
+    def test_Uber(self):
+        assert self.coalesce_uber() is True
+
+    def test_Errors(self):
+        assert self.coalesce_errors() is True
@@ -0,0 +1,126 @@
+# test_response_cache.py
+# Tests the TTL / LRU response cache and ETag revalidation using a local HTTPS stand-in.
+import os
+import sys
+import time
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.firewall_management import FirewallManagement
+from falconpy.hosts import Hosts
+from falconpy.api_complete import APIHarness
+from falconpy.response_cache import ResponseCache
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+PLATFORMS_PATH = "/fwmgr/entities/platforms/v1"
+DETAILS_PATH = "/devices/entities/devices/v1"
+
+
+def platforms_handler(request):
+    ids = request["params"].get("ids", [])
+    if "missing" in ids:
+        return json_response({"errors": [{"message": "Not found"}], "resources": []}, 404)
+    if request["headers"].get("If-None-Match") == '"v1"':
+        return 304, {"ETag": '"v1"'}, b""
+    return json_response({"resources": [{"id": platform} for platform in ids]}, headers={"ETag": '"v1"'})
+
+
+def requests_to(stand_in, path):
+    return [req for req in stand_in.requests if req["path"] == path]
+
+
+def firewall(stand_in, cache):
+    return FirewallManagement(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                                     base_url=stand_in.base_url, ssl_verify=CERT_PATH,
+                                                     response_cache=cache))
+
+
+class TestResponseCache:
+    def cache_hits(self):
+        cache = ResponseCache()
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", PLATFORMS_PATH, platforms_handler)
+            stand_in.route("GET", DETAILS_PATH, lambda request: json_response({"resources": [{"device_id": "1"}]}))
+            fwmgr = firewall(stand_in, cache)
+            hosts = Hosts(auth_object=fwmgr.auth_object)
+            first = fwmgr.get_platforms(ids=["windows", "mac"])
+            # Changes made by the caller do not alter the cached response
+            first["body"]["resources"].clear()
+            second = fwmgr.get_platforms(parameters={"ids": ["windows", "mac"]})
+            third = fwmgr.get_platforms(ids="windows,mac")
+            other = fwmgr.get_platforms(ids="linux")
+            missing = [fwmgr.get_platforms(ids="missing") for _ in range(2)]
+            details = [hosts.get_device_details(ids="1") for _ in range(2)]
+            platform_requests = len(requests_to(stand_in, PLATFORMS_PATH))
+            detail_requests = len(requests_to(stand_in, DETAILS_PATH))
+
+        metrics = cache.metrics()
+        return bool(second["body"]["resources"] == [{"id": "windows"}, {"id": "mac"}] and third == second
+                    and other["body"]["resources"] == [{"id": "linux"}]
+                    # Error responses and operations that are not cacheable always perform a request
+                    and all(result["status_code"] == 404 for result in missing) and detail_requests == 2
+                    and all(result["status_code"] == 200 for result in details)
+                    and platform_requests == 4
+                    and metrics["hits"] == 2 and metrics["misses"] == 4 and metrics["entries"] == 2
+                    and metrics["hit_ratio"] == 2 / 6
+                    )
+
+    def cache_revalidation(self):
+        cache = ResponseCache(ttls={"get_platforms": 0.2})
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", PLATFORMS_PATH, platforms_handler)
+            fwmgr = firewall(stand_in, cache)
+            first = fwmgr.get_platforms(ids="windows")
+            time.sleep(0.3)
+            revalidated = fwmgr.get_platforms(ids="windows")
+            fresh = fwmgr.get_platforms(ids="windows")
+            sent = requests_to(stand_in, PLATFORMS_PATH)
+
+        metrics = cache.metrics()
+        return bool(first == revalidated == fresh and len(sent) == 2
+                    and "If-None-Match" not in sent[0]["headers"] and sent[1]["headers"]["If-None-Match"] == '"v1"'
+                    and metrics["revalidated"] == 1 and metrics["hits"] == 1 and metrics["misses"] == 1
+                    )
+
+    def cache_lru(self):
+        cache = ResponseCache(max_entries=2)
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", PLATFORMS_PATH, platforms_handler)
+            fwmgr = firewall(stand_in, cache)
+            for platform in ["windows", "mac", "windows", "linux", "mac"]:
+                fwmgr.get_platforms(ids=platform)
+            sent = [req["params"]["ids"][0] for req in requests_to(stand_in, PLATFORMS_PATH)]
+
+        # windows was used more recently than mac, so mac was evicted when linux was cached
+        return bool(sent == ["windows", "mac", "linux", "mac"] and cache.metrics()["evictions"] == 2)
+
+    def cache_uber(self):
+        cache = ResponseCache()
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", PLATFORMS_PATH, platforms_handler)
+            falcon = APIHarness(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                ssl_verify=CERT_PATH, response_cache=cache)
+            results = [falcon.command("get_platforms", ids="windows") for _ in range(3)]
+            overridden = falcon.command(override=f"GET,{PLATFORMS_PATH}", parameters={"ids": "windows"})
+            sent = len(requests_to(stand_in, PLATFORMS_PATH))
+            cache.invalidate("get_platforms")
+            falcon.command("get_platforms", ids="windows")
+            invalidated = len(requests_to(stand_in, PLATFORMS_PATH))
+
+        # Overridden commands do not identify an operation and are not cached
+        return bool(all(result["body"]["resources"] == [{"id": "windows"}] for result in results)
+                    and overridden["status_code"] == 200 and sent == 2 and invalidated == 3
+                    )
+
+    def test_Hits(self):
+        assert self.cache_hits() is True
+
+    def test_Revalidation(self):
+        assert self.cache_revalidation() is True
+
+    def test_LRU(self):
+        assert self.cache_lru() is True
+
+    def test_Uber(self):
+        assert self.cache_uber() is True
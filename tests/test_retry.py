@@ -0,0 +1,130 @@
+# test_retry.py
+# Tests the retry and backoff policy engine using a local HTTPS stand-in.
+import json
+import os
+import socket
+import sys
+import threading
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.hosts import Hosts
+from falconpy.detects import Detects
+from falconpy.api_complete import APIHarness
+from falconpy.retry import RetryPolicy
+from falconpy._registry import uber_operation, is_idempotent, _READ_OPERATIONS
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+QUERY_PATH = "/devices/queries/devices/v1"
+
+
+class FlakyHandler:
+    """Fails the first requests it receives with a 503 response."""
+    def __init__(self, failures):
+        self.lock = threading.Lock()
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self, request):  # pylint: disable=W0613
+        with self.lock:
+            self.calls += 1
+            if self.calls <= self.failures:
+                return json_response({"errors": [{"message": "Service unavailable"}]}, 503)
+        return json_response({"resources": ["recovered"]})
+
+
+def fast_policy(**kwargs):
+    return RetryPolicy(backoff_base=0.01, **kwargs)
+
+
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestRetry:
+    def retry_statuses(self):
+        with StandInAPI() as stand_in:
+            flaky = FlakyHandler(2)
+            stand_in.route("GET", QUERY_PATH, flaky)
+            auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                              ssl_verify=CERT_PATH, retry_policy=fast_policy(max_attempts=3))
+            result = Hosts(auth_object=auth).query_devices_by_filter()
+            metrics = auth.retry_policy.metrics()
+            # A second request exhausts its attempts
+            stand_in.route("GET", QUERY_PATH, FlakyHandler(5))
+            failed = Hosts(auth_object=auth).query_devices_by_filter()
+
+        return bool(result["status_code"] == 200 and flaky.calls == 3 and metrics["retries"] == 2
+                    and metrics["reasons"] == {"503": 2} and metrics["amplification"] == 3.0
+                    and failed["status_code"] == 503
+                    )
+
+    def retry_idempotency(self):
+        with StandInAPI() as stand_in:
+            action = FlakyHandler(1)
+            summaries = FlakyHandler(1)
+            stand_in.route("POST", "/devices/entities/devices-actions/v2", action)
+            stand_in.route("POST", "/detects/entities/summaries/GET/v1", summaries)
+            update = FlakyHandler(1)
+            stand_in.route("PATCH", "/detects/entities/detects/v2", update)
+            policy = fast_policy()
+            hosts = Hosts(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                          ssl_verify=CERT_PATH, retry_policy=policy)
+            contained = hosts.perform_action(action_name="contain", body={"ids": ["12345678"]})
+            detects = Detects(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                              ssl_verify=CERT_PATH, retry_policy=policy)
+            # Read-only POST operations are safe to retry
+            summary = detects.get_detect_summaries(body={"ids": ["detect-1"]})
+            # Updates are not guaranteed to be idempotent
+            updated = detects.update_detects_by_ids(body={"ids": ["detect-1"], "status": "in_progress"})
+
+        return bool(contained["status_code"] == 503 and action.calls == 1
+                    and summary["status_code"] == 200 and summaries.calls == 2
+                    and updated["status_code"] == 503 and update.calls == 1
+                    # Every read-only POST operation is defined by the API
+                    and all(uber_operation(operation_id) for operation_id in _READ_OPERATIONS)
+                    and not is_idempotent("RTR_UpdateScripts", "PATCH")
+                    )
+
+    def retry_exceptions(self):
+        base_url = f"https://localhost:{closed_port()}"
+        falcon = APIHarness(client_id="whatever", client_secret="whatever", base_url=base_url,
+                            retry_policy=fast_policy(max_attempts=4))
+        falcon.authenticated = True
+        falcon.token_expiration = 1799
+        result = falcon.command("QueryDevicesByFilter")
+        metrics = falcon.retry_policy.metrics()
+
+        return bool(result["status_code"] == 500 and metrics["retries"] == 3
+                    and list(metrics["reasons"]) == ["ConnectionError"]
+                    )
+
+    def retry_budget(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", QUERY_PATH, FlakyHandler(1000))
+            falcon = APIHarness(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                ssl_verify=CERT_PATH,
+                                retry_policy=fast_policy(max_attempts=5, budget_ratio=0.25, budget_reserve=2))
+            results = [falcon.command("QueryDevicesByFilter")["status_code"] for _ in range(10)]
+            metrics = falcon.retry_policy.metrics()
+            attempts = len([req for req in stand_in.requests if req["path"] == QUERY_PATH])
+
+        # The reserve allows 2 retries, then every 4 requests earn another
+        return bool(set(results) == {503} and metrics["retries"] == 4 and attempts == 14
+                    and metrics["budget_exhausted"] == 10
+                    )
+
+    def test_Statuses(self):
+        assert self.retry_statuses() is True
+
+    def test_Idempotency(self):
+        assert self.retry_idempotency() is True
+
+    def test_Exceptions(self):
+        assert self.retry_exceptions() is True
+
+    def test_Budget(self):
+        assert self.retry_budget() is True
@@ -0,0 +1,222 @@
+# test_rtr_batch.py
+# Tests fleet-wide Real Time Response batch command orchestration using a local HTTPS stand-in
+# simulating batch sessions for hosts that are online, intermittently offline or unreachable.
+import json
+import os
+import sys
+import threading
+import time
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.real_time_response import RealTimeResponse
+from falconpy.real_time_response_admin import RealTimeResponseAdmin
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+INIT_PATH = "/real-time-response/combined/batch-init-session/v1"
+REFRESH_PATH = "/real-time-response/combined/batch-refresh-session/v1"
+COMMAND_PATH = "/real-time-response/combined/batch-command/v1"
+ADMIN_PATH = "/real-time-response/combined/batch-admin-command/v1"
+HOSTS = [f"host-{num}" for num in range(2000)]
+UNREACHABLE = {aid for num, aid in enumerate(HOSTS) if num % 500 == 1}
+INTERMITTENT = {aid for num, aid in enumerate(HOSTS) if num % 50 == 0}
+
+
+class StandInFleet:
+    def __init__(self, command_delay=0.0):
+        self.lock = threading.Lock()
+        self.batches = {}
+        self.seen = set()
+        self.running = 0
+        self.max_running = 0
+        self.command_delay = command_delay
+
+    def init(self, request):
+        body = json.loads(request["body"])
+        resources = {}
+        with self.lock:
+            batch_id = f"batch-{len(self.batches)}"
+            for aid in body["host_ids"]:
+                online = aid not in UNREACHABLE and (aid not in INTERMITTENT or aid in self.seen)
+                self.seen.add(aid)
+                if online:
+                    resources[aid] = {"session_id": f"session-{aid}", "complete": True, "errors": []}
+                elif body["queue_offline"]:
+                    resources[aid] = {"session_id": f"session-{aid}", "offline_queued": True, "errors": []}
+                else:
+                    resources[aid] = {"session_id": "", "errors": [{"code": 404, "message": "Could not connect"}]}
+            self.batches[batch_id] = resources
+        return json_response({"batch_id": batch_id, "resources": resources}, 201)
+
+    def command(self, request):
+        body = json.loads(request["body"])
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            sessions = self.batches[body["batch_id"]]
+        time.sleep(self.command_delay)
+        resources = {}
+        for aid in body["optional_hosts"]:
+            if sessions[aid].get("offline_queued", False):
+                resources[aid] = {"aid": aid, "complete": False, "offline_queued": True, "errors": []}
+            else:
+                resources[aid] = {"aid": aid, "session_id": sessions[aid]["session_id"], "complete": True,
+                                  "stdout": f"{body['command_string']} on {aid}", "stderr": "", "errors": []}
+        with self.lock:
+            self.running -= 1
+        return json_response({"combined": {"resources": resources}, "errors": [], "meta": {}}, 201)
+
+    def routes(self, stand_in, command_path=COMMAND_PATH):
+        stand_in.route("POST", INIT_PATH, self.init)
+        stand_in.route("POST", command_path, self.command)
+        stand_in.route("POST", REFRESH_PATH, lambda request: json_response({"resources": {}}, 201))
+
+
+def requests_to(stand_in, path):
+    return [req for req in stand_in.requests if req["path"] == path]
+
+
+def rtr_classes(stand_in):
+    auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url, ssl_verify=CERT_PATH)
+    return RealTimeResponse(auth_object=auth), RealTimeResponseAdmin(auth_object=auth)
+
+
+class TestRTRBatch:
+    def batch_sweep(self):
+        fleet = StandInFleet(command_delay=0.05)
+        with StandInAPI() as stand_in:
+            fleet.routes(stand_in)
+            rtr, _ = rtr_classes(stand_in)
+            sweep = rtr.run_batch(iter(HOSTS), "ls", command_string="ls /tmp", batch_size=200, max_workers=4)
+            results = list(sweep)
+            inits = requests_to(stand_in, INIT_PATH)
+            commands = requests_to(stand_in, COMMAND_PATH)
+
+        by_host = {result["aid"]: result for result in results}
+        complete = [result for result in results if result["complete"]]
+        return bool(len(results) == len(HOSTS) and set(by_host) == set(HOSTS)
+                    and len(complete) == len(HOSTS) - len(UNREACHABLE)
+                    and all(result["stdout"] == f"ls /tmp on {result['aid']}" for result in complete)
+                    # Intermittently offline hosts completed on their second attempt
+                    and all(by_host[aid]["attempts"] == 2 and by_host[aid]["complete"] for aid in INTERMITTENT - UNREACHABLE)
+                    # Unreachable hosts failed after every attempt
+                    and sorted(result["aid"] for result in sweep.failed) == sorted(UNREACHABLE)
+                    and all(result["attempts"] == 2 and result["errors"][0]["message"] == "Could not connect"
+                            for result in sweep.failed)
+                    and all(len(json.loads(req["body"])["host_ids"]) <= 200 for req in inits)
+                    and all(req["params"]["timeout"] == ["30"] for req in inits + commands)
+                    and fleet.max_running <= 4
+                    and sweep.counts == {"hosts": len(HOSTS), "complete": len(complete), "failed": len(UNREACHABLE),
+                                         "retried": len(INTERMITTENT | UNREACHABLE), "batches": len(inits)}
+                    )
+
+    def batch_keep_alive(self):
+        fleet = StandInFleet(command_delay=0.5)
+        with StandInAPI() as stand_in:
+            fleet.routes(stand_in, ADMIN_PATH)
+            rtr, admin = rtr_classes(stand_in)
+            sweep = rtr.run_batch(HOSTS[2:6], "runscript", command_string="runscript -CloudFile=collect",
+                                  command=admin.batch_admin_command, timeout=120)
+            sweep.refresh_interval = 0.1
+            results = list(sweep)
+            refreshes = requests_to(stand_in, REFRESH_PATH)
+            count = len(refreshes)
+            time.sleep(0.3)
+            # Sessions are not refreshed once the batch completes
+            after = len(requests_to(stand_in, REFRESH_PATH))
+
+        return bool(all(result["complete"] for result in results) and len(results) == 4
+                    and count >= 2 and after == count
+                    and all(json.loads(req["body"])["batch_id"] == "batch-0" for req in refreshes)
+                    )
+
+    def batch_queue_offline(self):
+        fleet = StandInFleet()
+        with StandInAPI() as stand_in:
+            fleet.routes(stand_in)
+            rtr, _ = rtr_classes(stand_in)
+            sweep = rtr.run_batch(HOSTS[:60], "ps", queue_offline=True)
+            results = {result["aid"]: result for result in sweep}
+            inits = requests_to(stand_in, INIT_PATH)
+
+        # Queued hosts are not retried
+        return bool(len(inits) == 1 and results["host-0"]["offline_queued"] and not results["host-0"]["complete"]
+                    and results["host-1"]["offline_queued"] and results["host-2"]["complete"]
+                    and len(sweep.failed) == 3
+                    )
+
+    def batch_failures(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", INIT_PATH,
+                           lambda request: json_response({"errors": [{"code": 403, "message": "access denied"}]}, 403))
+            rtr, _ = rtr_classes(stand_in)
+            denied = list(rtr.run_batch(HOSTS[:10], "ls", retries=2))
+            inits = len(requests_to(stand_in, INIT_PATH))
+
+            fleet = StandInFleet(command_delay=0.2)
+            fleet.routes(stand_in)
+            # No further attempts are started once the deadline has passed
+            sweep = rtr.run_batch(HOSTS[:100], "ls", batch_size=10, max_workers=2, deadline=0.3)
+            results = list(sweep)
+
+        expired = [result for result in results if result["errors"] and result["errors"][0]["code"] == 408]
+        return bool(len(denied) == 10 and inits == 3
+                    and all(result["errors"] == [{"code": 403, "message": "access denied"}] and result["attempts"] == 3
+                            for result in denied)
+                    and sorted(result["aid"] for result in results) == sorted(HOSTS[:100])
+                    and 0 < len(expired) < 100 and all(not result["complete"] for result in expired)
+                    )
+
+    def batch_incomplete(self):
+        fleet = StandInFleet()
+        commands = []
+        dropped = []
+
+        def failing_command(request):
+            commands.append(request)
+            if not dropped:
+                dropped.append(request)
+                # The connection drops before the API responds
+                raise ConnectionResetError("Connection dropped")
+            status_code, headers, body = fleet.command(request)
+            resources = json.loads(body)["combined"]["resources"]
+            # The command runs on host-2 but fails
+            resources["host-2"].update({"complete": False, "stderr": "Access is denied", "errors": [
+                {"code": 40006, "message": "Command failed"}]})
+            return status_code, headers, json.dumps({"combined": {"resources": resources}}).encode()
+
+        with StandInAPI() as stand_in:
+            fleet.routes(stand_in)
+            stand_in.route("POST", COMMAND_PATH, failing_command)
+            rtr, _ = rtr_classes(stand_in)
+            # The first attempt is dropped and sent again, the failed command is not run again
+            results = {result["aid"]: result for result in rtr.run_batch(HOSTS[2:5], "rm", command_string="rm tmp")}
+            sent = len(commands)
+            commands.clear()
+            opted_in = {result["aid"]: result for result in rtr.run_batch(HOSTS[2:5], "rm", command_string="rm tmp",
+                                                                          retry_incomplete=True)}
+            rerun = [json.loads(req["body"])["optional_hosts"] for req in commands]
+
+        return bool(sent == 2 and all(result["attempts"] == 2 for result in results.values())
+                    and results["host-3"]["complete"] and results["host-4"]["complete"]
+                    and not results["host-2"]["complete"] and results["host-2"]["stderr"] == "Access is denied"
+                    # Hosts whose command did not complete are run again when opted in
+                    and rerun == [["host-2", "host-3", "host-4"], ["host-2"]]
+                    and opted_in["host-2"]["attempts"] == 2 and opted_in["host-3"]["attempts"] == 1
+                    )
+
+    def test_Sweep(self):
+        assert self.batch_sweep() is True
+
+    def test_KeepAlive(self):
+        assert self.batch_keep_alive() is True
+
+    def test_QueueOffline(self):
+        assert self.batch_queue_offline() is True
+
+    def test_Failures(self):
+        assert self.batch_failures() is True
+
+    def test_Incomplete(self):
+        assert self.batch_incomplete() is True
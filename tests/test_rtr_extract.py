@@ -0,0 +1,235 @@
+# test_rtr_extract.py
+# Tests bulk retrieval of Real Time Response extracted files using a local HTTPS stand-in
+# serving the same artifacts extracted from many hosts.
+import hashlib
+import io
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import pytest
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.real_time_response import RealTimeResponse
+from falconpy.rtr_extract import FileExtractor, py7zr as installed_py7zr
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+CONTENTS_PATH = "/real-time-response/entities/extracted-file-contents/v1"
+LIST_PATH = "/real-time-response/entities/file/v1"
+SESSIONS = [f"session-{num}" for num in range(40)]
+SHARED = ["a" * 64, "b" * 64]
+
+
+def archive(sha256):
+    # Stands in for the 7z archive of the file
+    return hashlib.sha256(sha256.encode()).digest() * 4096
+
+
+def session_files(session_id):
+    return [{"session_id": session_id, "sha256": SHARED[0], "name": "C:\\Windows\\Temp\\dropper.exe"},
+            {"session_id": session_id, "sha256": SHARED[1].upper(), "name": "/tmp/implant"},
+            {"session_id": session_id, "sha256": hashlib.sha256(session_id.encode()).hexdigest(), "name": "notes.txt"}]
+
+
+class StandInSessions:
+    def __init__(self, delay=0.02, unavailable=None, large=None):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.delay = delay
+        self.unavailable = unavailable or set()
+        self.large = large
+
+    def list_files(self, request):
+        return json_response({"resources": session_files(request["params"]["session_id"][0])})
+
+    def contents(self, request):
+        session_id = request["params"]["session_id"][0]
+        sha256 = request["params"]["sha256"][0]
+        if session_id in self.unavailable:
+            return json_response({"errors": [{"code": 404, "message": "File not found"}], "resources": []}, 404)
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        return 200, {"Content-Type": "application/x-7z-compressed"}, self.large or archive(sha256)
+
+    def routes(self, stand_in):
+        stand_in.route("GET", LIST_PATH, self.list_files)
+        stand_in.route("GET", CONTENTS_PATH, self.contents)
+        return RealTimeResponse(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                                       base_url=stand_in.base_url, ssl_verify=CERT_PATH))
+
+
+class ClosingBuffer(io.BytesIO):
+    def close(self):
+        self.contents = self.getvalue()
+        super().close()
+
+
+class TestRTRExtract:
+    def extract_sessions(self, tmp_path):
+        sessions = StandInSessions()
+        with StandInAPI() as stand_in:
+            rtr = sessions.routes(stand_in)
+            extractor = rtr.extract_files(session_ids=iter(SESSIONS), directory=str(tmp_path / "case"), max_workers=4)
+            results = list(extractor)
+            retrievals = [req for req in stand_in.requests if req["path"] == CONTENTS_PATH]
+
+        retrieved = [result for result in results if not result["duplicate"]]
+        shared = [result for result in results if result["sha256"] in SHARED]
+        return bool(len(results) == len(SESSIONS) * 3 and all(result["status_code"] == 200 for result in results)
+                    # Artifacts found on every host are only retrieved once
+                    and len(retrievals) == len(retrieved) == len(SESSIONS) + 2
+                    and sum(result["duplicate"] for result in shared) == len(shared) - 2
+                    and all(open(result["path"], "rb").read() == archive(result["sha256"]) for result in retrieved)
+                    and sorted(os.listdir(tmp_path / "case")) == sorted(f"{result['sha256']}.7z" for result in retrieved)
+                    and {req["params"]["filename"][0] for req in retrievals} == {"dropper.exe", "implant", "notes.txt"}
+                    and sessions.max_running <= 4
+                    and extractor.counts == {"files": len(results), "retrieved": len(retrieved),
+                                             "duplicates": len(results) - len(retrieved), "failed": 0,
+                                             "bytes": sum(len(archive(result["sha256"])) for result in retrieved)}
+                    )
+
+    def extract_sink(self):
+        sessions = StandInSessions(unavailable={"session-0"})
+        writers = {}
+
+        def sink(file):
+            writers[(file["session_id"], file["sha256"])] = ClosingBuffer()
+            return writers[(file["session_id"], file["sha256"])]
+
+        with StandInAPI() as stand_in:
+            rtr = sessions.routes(stand_in)
+            files = [file for session_id in SESSIONS[:3] for file in session_files(session_id)]
+            extractor = rtr.extract_files(files=files, sink=sink)
+            results = list(extractor)
+
+        by_file = {(result["session_id"], result["sha256"]): result for result in results}
+        # The unavailable session's files are retrieved from the next session that extracted them
+        return bool(len(results) == 9 and len(extractor.failed) == 3
+                    and all(result["session_id"] == "session-0" for result in extractor.failed)
+                    and by_file[("session-1", SHARED[0])]["duplicate"] is False
+                    and by_file[("session-2", SHARED[0])]["duplicate"] is True
+                    and all(writer.closed for writer in writers.values())
+                    and all(writers[key].contents == archive(key[1].lower()) for key in writers if key[0] != "session-0")
+                    and all(result["path"] is None for result in results)
+                    )
+
+    def extract_errors(self):
+        sessions = StandInSessions()
+
+        class FailingWriter(io.BytesIO):
+            def close(self):
+                super().close()
+                raise OSError("No space left on device")
+
+        def sink(file):
+            if file["sha256"] == SHARED[0]:
+                raise PermissionError("Evidence store is read-only")
+            if file["name"] == "notes.txt":
+                return FailingWriter()
+            return ClosingBuffer()
+
+        with StandInAPI() as stand_in:
+            rtr = sessions.routes(stand_in)
+            extractor = rtr.extract_files(files=session_files("session-0"), sink=sink)
+            results = {result["name"]: result for result in extractor}
+
+        # A failing sink or writer fails its own file, the remaining files are still retrieved
+        return bool(len(results) == 3 and results["implant"]["status_code"] == 200
+                    and results["dropper.exe"]["status_code"] == 500
+                    and results["dropper.exe"]["errors"] == [{"message": "Evidence store is read-only"}]
+                    and results["notes.txt"]["status_code"] == 500 and results["notes.txt"]["size"] is None
+                    and results["notes.txt"]["errors"] == [{"message": "No space left on device"}]
+                    and sorted(result["name"] for result in extractor.failed) == ["dropper.exe", "notes.txt"]
+                    and extractor.counts["failed"] == 2 and extractor.counts["retrieved"] == 1
+                    )
+
+    def extract_memory(self, tmp_path):
+        large = os.urandom(8 * 1024 * 1024)
+        sessions = StandInSessions(delay=0, large=large)
+        with StandInAPI() as stand_in:
+            rtr = sessions.routes(stand_in)
+            parameters = {"session_id": "session-0", "sha256": SHARED[0]}
+            tracemalloc.start()
+            in_memory = rtr.get_extracted_file_contents(parameters=parameters)
+            memory_peak = tracemalloc.get_traced_memory()[1]
+            del in_memory
+            tracemalloc.reset_peak()
+            result = rtr.get_extracted_file_contents(parameters=parameters, download_to=str(tmp_path / "large.7z"))
+            streaming_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        print(f"\n[rtr extract] 8 MB archive peak memory: {memory_peak / 1e6:.1f} MB in memory -> "
+              f"{streaming_peak / 1e6:.1f} MB streaming")
+
+        return bool(result["status_code"] == 200 and open(tmp_path / "large.7z", "rb").read() == large
+                    and streaming_peak < len(large) / 2 < memory_peak
+                    )
+
+    def extract_decompress(self, tmp_path):
+        py7zr = pytest.importorskip("py7zr")
+        source = tmp_path / "dropper.exe"
+        source.write_bytes(b"MZ" + os.urandom(1024))
+        packed = io.BytesIO()
+        with py7zr.SevenZipFile(packed, mode="w", password="infected") as contents:
+            contents.write(str(source), "dropper.exe")
+        sessions = StandInSessions(large=packed.getvalue())
+        with StandInAPI() as stand_in:
+            rtr = sessions.routes(stand_in)
+            results = list(rtr.extract_files(files=session_files("session-0")[:1], directory=str(tmp_path / "case"),
+                                             decompress=True))
+
+        return bool(results[0]["path"] == str(tmp_path / "case" / SHARED[0])
+                    and (tmp_path / "case" / SHARED[0] / "dropper.exe").read_bytes() == source.read_bytes()
+                    and os.listdir(tmp_path / "case") == [SHARED[0]]
+                    )
+
+    def extract_corrupt_archive(self, tmp_path):
+        pytest.importorskip("py7zr")
+        sessions = StandInSessions()
+        with StandInAPI() as stand_in:
+            rtr = sessions.routes(stand_in)
+            extractor = rtr.extract_files(files=session_files("session-0"), directory=str(tmp_path / "case"),
+                                          decompress=True)
+            results = list(extractor)
+
+        # Archives that cannot be decompressed fail their file without stopping iteration
+        return bool(len(results) == 3 and all(result["status_code"] == 500 and result["errors"] for result in results)
+                    and len(extractor.failed) == 3
+                    )
+
+    def extract_missing_dependency(self):
+        if installed_py7zr:
+            pytest.skip("py7zr is installed")
+        try:
+            FileExtractor(service=None, files=[], decompress=True)
+        except ImportError as err:
+            return "pip install py7zr" in str(err)
+        return False
+
+    def test_Sessions(self, tmp_path):
+        assert self.extract_sessions(tmp_path) is True
+
+    def test_Sink(self):
+        assert self.extract_sink() is True
+
+    def test_Errors(self):
+        assert self.extract_errors() is True
+
+    def test_Memory(self, tmp_path):
+        assert self.extract_memory(tmp_path) is True
+
+    def test_Decompress(self, tmp_path):
+        assert self.extract_decompress(tmp_path) is True
+
+    def test_CorruptArchive(self, tmp_path):
+        assert self.extract_corrupt_archive(tmp_path) is True
+
+    def test_MissingDependency(self):
+        assert self.extract_missing_dependency() is True
@@ -0,0 +1,124 @@
+# test_rtr_poller.py
+# Tests the multiplexed Real Time Response command status poller using a local HTTPS stand-in
+# simulating commands that take varying amounts of time to complete.
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import as_completed
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.real_time_response import RealTimeResponse
+from falconpy.rtr_poller import CommandPoller
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+STATUS_PATH = "/real-time-response/entities/command/v1"
+AR_STATUS_PATH = "/real-time-response/entities/active-responder-command/v1"
+COMMANDS = 1000
+
+
+class StandInCommands:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = {}
+        self.polled = {}
+
+    def status(self, request):
+        # Cloud request IDs are formatted as cmd-<number>-<milliseconds to complete>
+        cloud_request_id = request["params"]["cloud_request_id"][0]
+        now = time.monotonic()
+        with self.lock:
+            started = self.started.setdefault(cloud_request_id, now)
+            self.polled.setdefault(cloud_request_id, []).append(now)
+        if cloud_request_id.startswith("missing"):
+            return json_response({"errors": [{"code": 404, "message": "Cloud request not found"}], "resources": []}, 404)
+        complete = now - started >= int(cloud_request_id.split("-")[-1]) / 1000
+        return json_response({"resources": [{"complete": complete, "stdout": cloud_request_id if complete else "",
+                                             "stderr": "", "sequence_id": int(request["params"]["sequence_id"][0])}]})
+
+
+def stand_in_rtr(stand_in, commands):
+    stand_in.route("GET", STATUS_PATH, commands.status)
+    stand_in.route("GET", AR_STATUS_PATH, commands.status)
+    return RealTimeResponse(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                                   base_url=stand_in.base_url, ssl_verify=CERT_PATH))
+
+
+class TestRTRPoller:
+    def poller_many_commands(self):
+        commands = StandInCommands()
+        random.seed(21)
+        with StandInAPI() as stand_in:
+            rtr = stand_in_rtr(stand_in, commands)
+            threads = threading.active_count()
+            with CommandPoller(max_workers=8, max_interval=0.5) as poller:
+                futures = {poller.submit(rtr.check_command_status if num % 2 else rtr.check_active_responder_command_status,
+                                         f"cmd-{num}-{random.randint(0, 1500)}"): f"cmd-{num}" for num in range(COMMANDS)}
+                peak_threads = threading.active_count() - threads
+                completed = [(futures[future], future.result()) for future in as_completed(futures, timeout=30)]
+                pending = poller.pending
+
+        return bool(len(completed) == COMMANDS and pending == 0
+                    and all(result["status_code"] == 200 and result["body"]["resources"][0]["complete"]
+                            and result["body"]["resources"][0]["stdout"].startswith(f"{name}-")
+                            for name, result in completed)
+                    # Every command is tracked by the scheduler thread, not a thread per command
+                    and peak_threads <= 10
+                    and poller.counts["complete"] == COMMANDS and poller.counts["polls"] < COMMANDS * 10
+                    )
+
+    def poller_adaptive(self):
+        commands = StandInCommands()
+        with StandInAPI() as stand_in:
+            rtr = stand_in_rtr(stand_in, commands)
+            with CommandPoller(initial_interval=0.05, max_interval=0.4, backoff=2) as poller:
+                quick = poller.submit(rtr.check_command_status, "cmd-quick-0")
+                slow = poller.submit(rtr.check_command_status, "cmd-slow-2000")
+                slow.result(timeout=10)
+            polled = commands.polled["cmd-slow-2000"]
+
+        gaps = [after - before for before, after in zip(polled, polled[1:])]
+        # The interval doubles up to the maximum, long-running commands are polled less often
+        return bool(quick.result()["body"]["resources"][0]["complete"] and len(commands.polled["cmd-quick-0"]) == 1
+                    and gaps[0] < 0.2 and 0.35 < gaps[-1] < 0.6 and len(polled) < 12
+                    and all(later >= earlier * 0.8 for earlier, later in zip(gaps, gaps[1:]))
+                    )
+
+    def poller_callbacks_and_failures(self):
+        commands = StandInCommands()
+        results = []
+        with StandInAPI() as stand_in:
+            rtr = stand_in_rtr(stand_in, commands)
+            with CommandPoller(initial_interval=0.01, max_interval=0.05, timeout=0.3) as poller:
+                poller.submit(rtr.check_command_status, "cmd-1-100", sequence_id=2, callback=results.append)
+                missing = poller.submit(rtr.check_command_status, "missing-1")
+                expired = poller.submit(rtr.check_command_status, "cmd-2-60000")
+            polls = len(commands.polled["missing-1"])
+
+            poller = CommandPoller(initial_interval=0.05)
+            abandoned = poller.submit(rtr.check_command_status, "cmd-3-60000")
+            time.sleep(0.2)
+            poller.close(cancel=True)
+            try:
+                poller.submit(rtr.check_command_status, "cmd-4-0")
+                closed = False
+            except RuntimeError:
+                closed = True
+
+        return bool(len(results) == 1 and results[0]["body"]["resources"][0]["sequence_id"] == 2
+                    and missing.result()["status_code"] == 404 and polls == 1
+                    and expired.result()["status_code"] == 408
+                    and abandoned.cancelled() and closed
+                    )
+
+    def test_ManyCommands(self):
+        assert self.poller_many_commands() is True
+
+    def test_Adaptive(self):
+        assert self.poller_adaptive() is True
+
+    def test_CallbacksAndFailures(self):
+        assert self.poller_callbacks_and_failures() is True
@@ -0,0 +1,191 @@
+# test_rtr_sync.py
+# Tests content-hash synchronization of Real Time Response put-files and scripts
+# using a local HTTPS stand-in storing uploaded content.
+import hashlib
+import json
+import os
+import re
+import sys
+from email import policy
+from email.parser import BytesParser
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.real_time_response_admin import RealTimeResponseAdmin
+from falconpy.rtr_sync import SyncManifest
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+ENTITIES_PATH = "/real-time-response/entities/{}/v1"
+QUERIES_PATH = "/real-time-response/queries/{}/v1"
+
+
+def parse_multipart(request) -> dict:
+    message = BytesParser(policy=policy.HTTP).parsebytes(
+        f"Content-Type: {request['headers']['Content-Type']}\r\n\r\n".encode("utf-8") + request["body"]
+        )
+    return {part.get_param("name", header="content-disposition"): part.get_payload(decode=True)
+            for part in message.iter_parts()}
+
+
+class StandInContent:
+    def __init__(self, kind):
+        self.kind = kind
+        self.stored = {}
+        self.failing = set()
+
+    def store(self, content_id, fields):
+        self.stored[content_id] = {"id": content_id, "name": fields["name"].decode(),
+                                   "description": fields["description"].decode(),
+                                   "sha256": hashlib.sha256(fields["file"]).hexdigest()}
+
+    def query(self, request):
+        names = re.findall(r"'([^']*)'", request["params"]["filter"][0])
+        return json_response({"resources": [entity["id"] for entity in self.stored.values() if entity["name"] in names]})
+
+    def entities(self, request):
+        return json_response({"resources": [self.stored[content_id] for content_id in request["params"]["ids"]]})
+
+    def create(self, request):
+        fields = parse_multipart(request)
+        if fields["name"].decode() in self.failing:
+            return json_response({"errors": [{"code": 400, "message": "file is too large"}], "resources": []}, 400)
+        self.store(f"{self.kind}-{len(self.stored)}-{fields['name'].decode()}", fields)
+        return json_response({"meta": {"writes": {"resources_affected": 1}}, "resources": []})
+
+    def update(self, request):
+        fields = parse_multipart(request)
+        self.store(fields["id"].decode(), fields)
+        return json_response({"meta": {"writes": {"resources_affected": 1}}, "resources": []})
+
+    def delete(self, request):
+        del self.stored[request["params"]["ids"][0]]
+        return json_response({"resources": []})
+
+    def routes(self, stand_in):
+        path = "put-files" if self.kind == "put_files" else "scripts"
+        stand_in.route("GET", QUERIES_PATH.format(path), self.query)
+        stand_in.route("GET", ENTITIES_PATH.format(path), self.entities)
+        stand_in.route("POST", ENTITIES_PATH.format(path), self.create)
+        stand_in.route("PATCH", ENTITIES_PATH.format(path), self.update)
+        stand_in.route("DELETE", ENTITIES_PATH.format(path), self.delete)
+
+
+def admin_class(stand_in):
+    return RealTimeResponseAdmin(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                                        base_url=stand_in.base_url, ssl_verify=CERT_PATH))
+
+
+def api_requests(stand_in, start=0):
+    return [f"{req['method']} {req['path'].split('/')[2]}" for req in stand_in.requests[start:]
+            if req["path"] != "/oauth2/token"]
+
+
+def actions(result):
+    return {resource["name"]: resource["action"] for resource in result["body"]["resources"]}
+
+
+class TestRTRSync:
+    def sync_put_files(self, tmp_path):
+        for num in range(3):
+            (tmp_path / f"helper-{num}.ps1").write_bytes(f"Write-Output {num}".encode() * 1000)
+        paths = [str(tmp_path / f"helper-{num}.ps1") for num in range(3)]
+        manifest = str(tmp_path / "state" / "manifest.json")
+        content = StandInContent("put_files")
+        with StandInAPI() as stand_in:
+            content.routes(stand_in)
+            rtra = admin_class(stand_in)
+            first = rtra.sync_put_files(paths, manifest=manifest, comment="pid-dump")
+            sent = len(stand_in.requests)
+            # Nothing has changed, no requests are performed
+            second = rtra.sync_put_files(paths, manifest=manifest)
+            unchanged_requests = api_requests(stand_in, sent)
+            (tmp_path / "helper-1.ps1").write_bytes(b"Write-Output changed")
+            sent = len(stand_in.requests)
+            third = rtra.sync_put_files(paths, manifest=manifest)
+            changed_requests = api_requests(stand_in, sent)
+            # Content already stored in the API is not uploaded again when the manifest is unavailable
+            sent = len(stand_in.requests)
+            fourth = rtra.sync_put_files({"helper-0.ps1": paths[0]})
+            no_manifest_requests = api_requests(stand_in, sent)
+
+        recorded = SyncManifest(manifest).load(f"{stand_in.base_url}|whatever", "put_files")
+        return bool(first["status_code"] == 200 and set(actions(first).values()) == {"created"}
+                    and all(entity["description"] == entity["name"] for entity in content.stored.values())
+                    and set(actions(second).values()) == {"unchanged"} and unchanged_requests == []
+                    and actions(third) == {"helper-0.ps1": "unchanged", "helper-1.ps1": "replaced",
+                                           "helper-2.ps1": "unchanged"}
+                    and changed_requests == ["GET queries", "GET entities", "DELETE entities", "POST entities",
+                                             "GET queries", "GET entities"]
+                    and len(content.stored) == 3
+                    and actions(fourth) == {"helper-0.ps1": "unchanged"}
+                    and no_manifest_requests == ["GET queries", "GET entities"]
+                    and recorded["helper-1.ps1"]["sha256"] == hashlib.sha256(b"Write-Output changed").hexdigest()
+                    # Created content is recorded using the ID retrieved by name
+                    and {name: entry["id"] for name, entry in recorded.items()}
+                    == {entity["name"]: entity["id"] for entity in content.stored.values()}
+                    and recorded["helper-1.ps1"]["id"] == third["body"]["resources"][2]["id"] == "put_files-2-helper-1.ps1"
+                    )
+
+    def sync_scripts(self, tmp_path):
+        script = tmp_path / "collect.ps1"
+        script.write_bytes(b"Get-Process")
+        manifest = str(tmp_path / "manifest.json")
+        content = StandInContent("scripts")
+        with StandInAPI() as stand_in:
+            content.routes(stand_in)
+            rtra = admin_class(stand_in)
+            created = rtra.sync_scripts({"collect": str(script)}, manifest=manifest, permission_type="group")
+            script.write_bytes(b"Get-Process | ConvertTo-Json")
+            sent = len(stand_in.requests)
+            updated = rtra.sync_scripts({"collect": str(script)}, manifest=manifest)
+            update_requests = api_requests(stand_in, sent)
+            # Content recorded in the manifest is compared with the API when verify is enabled
+            content.stored["scripts-0-collect"]["sha256"] = "0" * 64
+            verified = rtra.sync_scripts({"collect": str(script)}, manifest=manifest, verify=True)
+
+        return bool(actions(created) == {"collect": "created"} and actions(updated) == {"collect": "updated"}
+                    and update_requests == ["GET queries", "GET entities", "PATCH entities"]
+                    and actions(verified) == {"collect": "updated"} and len(content.stored) == 1
+                    and content.stored["scripts-0-collect"]["sha256"] == hashlib.sha256(script.read_bytes()).hexdigest()
+                    and updated["body"]["resources"][0]["id"] == "scripts-0-collect"
+                    )
+
+    def sync_failures(self, tmp_path):
+        (tmp_path / "large.bin").write_bytes(b"large")
+        (tmp_path / "small.bin").write_bytes(b"small")
+        manifest = str(tmp_path / "manifest.json")
+        content = StandInContent("put_files")
+        content.failing.add("large.bin")
+        with StandInAPI() as stand_in:
+            content.routes(stand_in)
+            rtra = admin_class(stand_in)
+            result = rtra.sync_put_files([str(tmp_path / "large.bin"), str(tmp_path / "small.bin")], manifest=manifest)
+            stand_in.route("GET", QUERIES_PATH.format("put-files"),
+                           lambda request: json_response({"errors": [{"message": "access denied"}]}, 403))
+            denied = rtra.sync_put_files([str(tmp_path / "large.bin")], manifest=manifest)
+            # The ID of created content cannot be retrieved
+            later = StandInContent("put_files")
+            later.routes(stand_in)
+            stand_in.route("GET", QUERIES_PATH.format("put-files"), lambda request: json_response(
+                {"errors": [{"message": "access denied"}]}, 403) if later.stored else later.query(request))
+            (tmp_path / "later.bin").write_bytes(b"later")
+            unlisted = rtra.sync_put_files([str(tmp_path / "later.bin")], manifest=manifest)
+
+        with open(manifest, "r", encoding="utf-8") as manifest_file:
+            recorded = list(json.load(manifest_file).values())[0]["put_files"]
+        # Failed uploads are not recorded, so they are attempted again by the next synchronization
+        return bool(result["status_code"] == 400 and result["body"]["errors"][0]["message"] == "file is too large"
+                    and actions(result) == {"large.bin": "failed", "small.bin": "created"}
+                    and list(recorded) == ["small.bin"] and denied["status_code"] == 403
+                    and actions(unlisted) == {"later.bin": "created"} and unlisted["body"]["resources"][0]["id"] is None
+                    )
+
+    def test_PutFiles(self, tmp_path):
+        assert self.sync_put_files(tmp_path) is True
+
+    def test_Scripts(self, tmp_path):
+        assert self.sync_scripts(tmp_path) is True
+
+    def test_Failures(self, tmp_path):
+        assert self.sync_failures(tmp_path) is True
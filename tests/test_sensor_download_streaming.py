@@ -0,0 +1,160 @@
+# test_sensor_download_streaming.py
+# Tests streaming, resumable sensor installer downloads using a local HTTPS stand-in,
+# and compares peak memory use against downloading into memory.
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import tracemalloc
+import requests
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.sensor_download import SensorDownload
+from falconpy._download import PartialDownload, stream_download
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+DOWNLOAD_PATH = "/sensors/entities/download-installer/v1"
+INSTALLER = os.urandom(8 * 1024 * 1024)
+INSTALLER_SHA = hashlib.sha256(INSTALLER).hexdigest()
+
+
+class InstallerHandler:
+    """Serves the installer with HTTP Range support, optionally interrupting the first transfers."""
+    def __init__(self, interruptions=0):
+        self.lock = threading.Lock()
+        self.interruptions = interruptions
+        self.ranges = []
+
+    def __call__(self, request):
+        if request["params"].get("id", [None])[0] != INSTALLER_SHA:
+            return json_response({"errors": [{"message": "Installer not found"}]}, 404)
+        start = 0
+        requested = request["headers"].get("Range", None)
+        self.ranges.append(requested)
+        if requested:
+            start = int(requested[6:-1])
+            if start >= len(INSTALLER):
+                return 416, {"Content-Range": f"bytes */{len(INSTALLER)}"}, b""
+        headers = {"Content-Type": "application/octet-stream"}
+        status_code = 206 if start else 200
+        if start:
+            headers["Content-Range"] = f"bytes {start}-{len(INSTALLER) - 1}/{len(INSTALLER)}"
+        body = INSTALLER[start:]
+        with self.lock:
+            if self.interruptions:
+                self.interruptions -= 1
+                # Declares the complete length but only sends part of it
+                headers["Content-Length"] = str(len(body))
+                body = body[:len(body) // 3]
+        return status_code, headers, body
+
+
+class FullDiskDownload(PartialDownload):
+    """Partial download whose writes fail once some content has been received, as on a full disk."""
+    def write(self, chunk):
+        if self.handle.tell():
+            self.opened = self.handle
+            raise OSError(28, "No space left on device")
+        super().write(chunk)
+
+
+class TestSensorDownloadStreaming:
+    def streaming_resume(self):
+        with StandInAPI() as stand_in, tempfile.TemporaryDirectory() as download_path:
+            handler = InstallerHandler(interruptions=2)
+            stand_in.route("GET", DOWNLOAD_PATH, handler)
+            sensors = SensorDownload(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                     ssl_verify=CERT_PATH)
+            result = sensors.download_sensor_installer(id=INSTALLER_SHA, file_name="sensor.rpm",
+                                                       download_path=download_path)
+            with open(os.path.join(download_path, "sensor.rpm"), "rb") as installer:
+                content = installer.read()
+            leftovers = os.listdir(download_path)
+
+        return bool(result["status_code"] == 200 and result["body"]["resources"][0]["sha256"] == INSTALLER_SHA
+                    and content == INSTALLER and leftovers == ["sensor.rpm"]
+                    and handler.ranges[0] is None and handler.ranges[1].startswith("bytes=")
+                    and len(handler.ranges) == 3
+                    )
+
+    def streaming_resume_later(self):
+        with StandInAPI() as stand_in, tempfile.TemporaryDirectory() as download_path:
+            handler = InstallerHandler()
+            stand_in.route("GET", DOWNLOAD_PATH, handler)
+            sensors = SensorDownload(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                     ssl_verify=CERT_PATH)
+            # A partial file left behind by an earlier process is continued
+            with open(os.path.join(download_path, "sensor.rpm.part"), "wb") as partial:
+                partial.write(INSTALLER[:1000])
+            resumed = sensors.download_sensor_installer(id=INSTALLER_SHA, file_name="sensor.rpm",
+                                                        download_path=download_path)
+            # A complete partial file receives a 416 response and is finalized
+            with open(os.path.join(download_path, "done.rpm.part"), "wb") as partial:
+                partial.write(INSTALLER)
+            finished = sensors.download_sensor_installer(id=INSTALLER_SHA, file_name="done.rpm",
+                                                         download_path=download_path)
+            with open(os.path.join(download_path, "sensor.rpm"), "rb") as installer:
+                content = installer.read()
+            # Corrupt partial content fails verification and is discarded
+            with open(os.path.join(download_path, "bad.rpm.part"), "wb") as partial:
+                partial.write(b"not the installer")
+            corrupt = sensors.download_sensor_installer(id=INSTALLER_SHA, file_name="bad.rpm",
+                                                        download_path=download_path)
+            missing = sensors.download_sensor_installer(id="0" * 64, file_name="missing.rpm",
+                                                        download_path=download_path)
+            leftovers = sorted(os.listdir(download_path))
+
+        return bool(resumed["status_code"] == 200 and content == INSTALLER and handler.ranges[0] == "bytes=1000-"
+                    and finished["status_code"] == 200
+                    and corrupt["status_code"] == 500 and "SHA-256" in corrupt["body"]["errors"][0]["message"]
+                    and missing["status_code"] == 404
+                    and leftovers == ["done.rpm", "sensor.rpm"]
+                    )
+
+    def streaming_memory(self):
+        with StandInAPI() as stand_in, tempfile.TemporaryDirectory() as download_path:
+            stand_in.route("GET", DOWNLOAD_PATH, InstallerHandler())
+            sensors = SensorDownload(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                     ssl_verify=CERT_PATH)
+            tracemalloc.start()
+            in_memory = sensors.download_sensor_installer(id=INSTALLER_SHA)
+            memory_peak = tracemalloc.get_traced_memory()[1]
+            del in_memory
+            tracemalloc.reset_peak()
+            sensors.download_sensor_installer(id=INSTALLER_SHA, file_name="sensor.rpm", download_path=download_path)
+            streaming_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        print(f"\n[sensor download] 8 MB installer peak memory: {memory_peak / 1e6:.1f} MB in memory -> "
+              f"{streaming_peak / 1e6:.1f} MB streaming")
+
+        return bool(streaming_peak < len(INSTALLER) / 2 < memory_peak)
+
+    def streaming_write_error(self):
+        with StandInAPI() as stand_in, tempfile.TemporaryDirectory() as download_path:
+            stand_in.route("GET", DOWNLOAD_PATH, InstallerHandler())
+            target = FullDiskDownload(os.path.join(download_path, "sensor.rpm"), INSTALLER_SHA)
+            raised = False
+            try:
+                stream_download(lambda headers: requests.get(f"{stand_in.base_url}{DOWNLOAD_PATH}",
+                                                             params={"id": INSTALLER_SHA}, headers=headers,
+                                                             stream=True, verify=CERT_PATH, timeout=30),
+                                target)
+            except OSError:
+                raised = True
+            leftovers = os.listdir(download_path)
+
+        return bool(raised and target.handle is None and target.opened.closed and leftovers == ["sensor.rpm.part"])
+
+    def test_Resume(self):
+        assert self.streaming_resume() is True
+
+    def test_ResumeLater(self):
+        assert self.streaming_resume_later() is True
+
+    def test_Memory(self):
+        assert self.streaming_memory() is True
+
+    def test_WriteError(self):
+        assert self.streaming_write_error() is True
@@ -0,0 +1,153 @@
+# test_stream_consumer.py
+# Tests the Event Streams consumer using a local HTTPS stand-in serving
+# newline-delimited datafeeds for multiple partitions.
+import json
+import os
+import sys
+import time
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.event_streams import EventStreams
+from falconpy.stream_consumer import decode_events
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+APP_ID = "pytest-consumer"
+PARTITIONS = [0, 1]
+EVENTS = 500
+DISCOVER_PATH = "/sensors/entities/datafeed/v2"
+FEED_PATH = "/sensors/entities/datafeed/v1/{}"
+REFRESH_PATH = "/sensors/entities/datafeed-actions/v1/{}"
+
+
+def feed_handler(partition):
+    def handler(request):
+        start = int(request["params"].get("offset", ["0"])[0])
+        lines = []
+        for offset in range(start, EVENTS):
+            lines.append(json.dumps({"metadata": {"offset": offset, "partition": partition},
+                                     "event": {"ComputerName": f"host-{offset}"}}))
+            if offset % 100 == 0:
+                lines.append("")  # Keep-alive
+        return 200, {"Content-Type": "application/json"}, "\n".join(lines).encode("utf-8")
+
+    return handler
+
+
+def stand_in_streams(stand_in, interval=1800):
+    def discover(request):  # pylint: disable=W0613
+        return json_response({"resources": [{
+            "dataFeedURL": f"{stand_in.base_url}{FEED_PATH.format(partition)}?appId={APP_ID}",
+            "sessionToken": {"token": f"session-{partition}", "expiration": "2099-01-01T00:00:00Z"},
+            "refreshActiveSessionURL": f"{stand_in.base_url}{REFRESH_PATH.format(partition)}",
+            "refreshActiveSessionInterval": interval
+            } for partition in PARTITIONS]})
+
+    stand_in.route("GET", DISCOVER_PATH, discover)
+    for partition in PARTITIONS:
+        stand_in.route("GET", FEED_PATH.format(partition), feed_handler(partition))
+        stand_in.route("POST", REFRESH_PATH.format(partition), lambda request: json_response({"resources": []}))
+
+    return EventStreams(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                               base_url=stand_in.base_url, ssl_verify=CERT_PATH))
+
+
+class FakeResponse:
+    def __init__(self, lines):
+        self.lines = lines
+        self.read = 0
+
+    def iter_lines(self):
+        for line in self.lines:
+            self.read += 1
+            yield line
+
+
+class TestStreamConsumer:
+    def consumer_partitions(self):
+        with StandInAPI() as stand_in:
+            streams = stand_in_streams(stand_in, interval=1)
+            events = []
+            with streams.consume(app_id=APP_ID) as consumer:
+                consumer.reconnect_delay = 0.05
+                for event in consumer:
+                    events.append(event)
+                    if len(events) == EVENTS * len(PARTITIONS):
+                        break
+                time.sleep(0.2)
+            offsets = consumer.offsets
+            feeds = [req for req in stand_in.requests if req["path"].startswith("/sensors/entities/datafeed/v1/")]
+            refreshes = [req for req in stand_in.requests if req["path"].startswith("/sensors/entities/datafeed-actions/")]
+
+        by_partition = {partition: [event["metadata"]["offset"] for event in events
+                                    if event["metadata"]["partition"] == partition] for partition in PARTITIONS}
+        return bool(all(by_partition[partition] == list(range(EVENTS)) for partition in PARTITIONS)
+                    and all(req["headers"]["Authorization"] == f"Token session-{req['path'][-1]}" for req in feeds)
+                    # Ended streams are reopened after the last event read
+                    and {req["params"].get("offset", [None])[0] for req in feeds} == {None, str(EVENTS)}
+                    # Sessions are refreshed for every partition before the interval lapses
+                    and {req["path"] for req in refreshes} == {REFRESH_PATH.format(part) for part in PARTITIONS}
+                    and all(req["params"]["action_name"] == ["refresh_active_stream_session"] for req in refreshes)
+                    # The final event was not processed when iteration was stopped, so its offset is not recorded
+                    and sorted(offsets.values()) == [EVENTS - 2, EVENTS - 1]
+                    )
+
+    def consumer_backpressure(self):
+        with StandInAPI() as stand_in:
+            streams = stand_in_streams(stand_in)
+            with streams.consume(app_id=APP_ID, partitions=[0], max_queue=10) as consumer:
+                time.sleep(0.5)
+                queued = consumer.queue.qsize()
+                read = consumer.read_offsets.get(0, 0)
+                events = []
+                for event in consumer:
+                    events.append(event)
+                    if len(events) == EVENTS:
+                        break
+
+        return bool(queued == 10 and read < 20 and len(events) == EVENTS)
+
+    def consumer_resume(self):
+        with StandInAPI() as stand_in:
+            streams = stand_in_streams(stand_in)
+            with streams.consume(app_id=APP_ID, partitions=[1], offsets={1: 99}) as consumer:
+                first = next(iter(consumer))
+            feeds = [req for req in stand_in.requests if req["path"].startswith("/sensors/entities/datafeed/v1/")]
+
+        return bool(first["metadata"]["offset"] == 100 and feeds[0]["params"]["offset"] == ["100"]
+                    and feeds[0]["path"] == FEED_PATH.format(1)
+                    )
+
+    def consumer_discovery_failed(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", DISCOVER_PATH, lambda request: json_response({"errors": [{"message": "denied"}]}, 403))
+            streams = EventStreams(auth_object=FalconAuth(client_id="whatever", client_secret="whatever",
+                                                          base_url=stand_in.base_url, ssl_verify=CERT_PATH))
+            consumer = streams.consume(app_id=APP_ID)
+            events = list(consumer)
+
+        return bool(events == [] and consumer.failed["status_code"] == 403)
+
+    def consumer_lazy_decoding(self):
+        response = FakeResponse([b'{"metadata": {"offset": 1}}', b"", b'{"metadata": {"offset": 2}}', b"not json"])
+        events = decode_events(response)
+        first = next(events)
+        return bool(first["metadata"]["offset"] == 1 and response.read == 1
+                    and next(events)["metadata"]["offset"] == 2 and response.read == 3
+                    )
+
+    def test_Partitions(self):
+        assert self.consumer_partitions() is True
+
+    def test_Backpressure(self):
+        assert self.consumer_backpressure() is True
+
+    def test_Resume(self):
+        assert self.consumer_resume() is True
+
+    def test_DiscoveryFailed(self):
+        assert self.consumer_discovery_failed() is True
+
+    def test_LazyDecoding(self):
+        assert self.consumer_lazy_decoding() is True
@@ -0,0 +1,267 @@
+# test_streaming_uploads.py
+# Tests streamed uploads from paths and file-like objects using a local HTTPS stand-in,
+# comparing the peak memory used by a large path upload against an in-memory upload.
+import asyncio
+import hashlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+import pytest
+from email import policy
+from email.parser import BytesParser
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.sample_uploads import SampleUploads
+from falconpy.falconx_sandbox import FalconXSandbox
+from falconpy.real_time_response_admin import RealTimeResponseAdmin
+from falconpy._upload import MultipartStream
+from falconpy.async_service_class import asynchronous
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+SAMPLE_PATH = "/samples/entities/samples/v3"
+SANDBOX_PATH = "/samples/entities/samples/v2"
+PUT_FILES_PATH = "/real-time-response/entities/put-files/v1"
+SCRIPTS_PATH = "/real-time-response/entities/scripts/v1"
+LARGE_SIZE = 32 * 1024 * 1024
+
+
+def upload_handler(request):  # pylint: disable=W0613
+    return json_response({"resources": [{"sha256": "uploaded"}]})
+
+
+class Unseekable(io.RawIOBase):
+    """Reads a file the way a pipe would, without seeking."""
+    def __init__(self, source):
+        self.source = source
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self.source.readinto(buffer)
+
+
+def authenticate(stand_in):
+    return FalconAuth(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url, ssl_verify=CERT_PATH)
+
+
+def parse_multipart(request) -> dict:
+    message = BytesParser(policy=policy.HTTP).parsebytes(
+        f"Content-Type: {request['headers']['Content-Type']}\r\n\r\n".encode("utf-8") + request["body"]
+        )
+    return {part.get_param("name", header="content-disposition"): part for part in message.iter_parts()}
+
+
+class TestStreamingUploads:
+    def uploads_path_and_file_object(self, tmp_path):
+        content = os.urandom(3 * 1024 * 1024 + 17)
+        sample = tmp_path / "sample.bin"
+        sample.write_bytes(content)
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", SAMPLE_PATH, upload_handler)
+            stand_in.route("POST", SANDBOX_PATH, upload_handler)
+            auth = authenticate(stand_in)
+            samples = SampleUploads(auth_object=auth)
+            sandbox = FalconXSandbox(auth_object=auth)
+            results = [samples.upload_sample(file_data=sample, file_name="sample.bin")]
+            with open(sample, "rb") as upload:
+                results.append(sandbox.upload_sample(file_data=upload, file_name="sample.bin"))
+                still_open = not upload.closed
+            results.append(samples.upload_sample(file_data=content, file_name="sample.bin"))
+            uploads = [req for req in stand_in.requests if req["path"] in [SAMPLE_PATH, SANDBOX_PATH]]
+
+        return bool(still_open and len(uploads) == 3
+                    and all(result["status_code"] == 200 for result in results)
+                    and all(req["body"] == content for req in uploads)
+                    and all(req["headers"]["Content-Type"] == "application/octet-stream" for req in uploads)
+                    and all(req["headers"]["Content-Length"] == str(len(content)) for req in uploads)
+                    # The default headers are not modified by the upload
+                    and "Content-Type" not in samples.headers
+                    )
+
+    def uploads_rtr_multipart(self, tmp_path):
+        script = tmp_path / "collect.ps1"
+        script.write_bytes(b"Get-Process\r\n" * 1000)
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", PUT_FILES_PATH, upload_handler)
+            stand_in.route("POST", SCRIPTS_PATH, upload_handler)
+            rtr_admin = RealTimeResponseAdmin(auth_object=authenticate(stand_in))
+            put_file = rtr_admin.create_put_files(data={"name": "tool.exe", "description": "Tool"},
+                                                  file_data=io.BytesIO(b"MZ" + bytes(range(256)) * 64))
+            created = rtr_admin.create_scripts(data={"description": "Collect", "permission_type": "private"},
+                                               file_data=script)
+            put_request, script_request = [req for req in stand_in.requests if req["path"] != "/oauth2/token"]
+
+        put_parts = parse_multipart(put_request)
+        script_parts = parse_multipart(script_request)
+        return bool(put_file["status_code"] == 200 and created["status_code"] == 200
+                    and put_parts["name"].get_content() == "tool.exe"
+                    and put_parts["description"].get_content() == "Tool"
+                    and put_parts["file"].get_filename() == "tool.exe"
+                    and put_parts["file"].get_content() == b"MZ" + bytes(range(256)) * 64
+                    and script_parts["permission_type"].get_content() == "private"
+                    and script_parts["file"].get_filename() == "collect.ps1"
+                    and script_parts["file"].get_content() == script.read_bytes()
+                    )
+
+    def uploads_async(self, tmp_path):
+        pytest.importorskip("aiohttp")
+        content = os.urandom(2 * 1024 * 1024 + 5)
+        sample = tmp_path / "sample.bin"
+        sample.write_bytes(content)
+        script = tmp_path / "collect.ps1"
+        script.write_bytes(b"Get-Process\r\n" * 1000)
+
+        async def run(auth):
+            async with asynchronous(SampleUploads)(auth_object=auth) as samples:
+                sandbox = asynchronous(FalconXSandbox)(auth_object=auth)
+                rtr_admin = asynchronous(RealTimeResponseAdmin)(auth_object=auth)
+                with open(sample, "rb") as upload:
+                    results = await asyncio.gather(
+                        samples.upload_sample(file_data=sample, file_name="sample.bin"),
+                        sandbox.upload_sample(file_data=upload, file_name="sample.bin"),
+                        rtr_admin.create_put_files(data={"name": "tool.exe", "description": "Tool"}, file_data=sample),
+                        rtr_admin.create_scripts(data={"permission_type": "private"}, file_data=script)
+                        )
+                    still_open = not upload.closed
+            return results, still_open
+
+        with StandInAPI() as stand_in:
+            for path in [SAMPLE_PATH, SANDBOX_PATH, PUT_FILES_PATH, SCRIPTS_PATH]:
+                stand_in.route("POST", path, upload_handler)
+            results, still_open = asyncio.run(run(authenticate(stand_in)))
+            uploads = {req["path"]: req for req in stand_in.requests if req["path"] != "/oauth2/token"}
+
+        put_file = parse_multipart(uploads[PUT_FILES_PATH])["file"]
+        script_file = parse_multipart(uploads[SCRIPTS_PATH])["file"]
+        return bool(all(result["status_code"] == 200 for result in results) and still_open
+                    and uploads[SAMPLE_PATH]["body"] == uploads[SANDBOX_PATH]["body"] == content
+                    # Streamed bodies are sent with their length instead of being chunked
+                    and uploads[SAMPLE_PATH]["headers"]["Content-Length"] == str(len(content))
+                    and "Transfer-Encoding" not in uploads[SANDBOX_PATH]["headers"]
+                    and put_file.get_filename() == "tool.exe" and put_file.get_content() == content
+                    and script_file.get_filename() == "collect.ps1" and script_file.get_content() == script.read_bytes()
+                    )
+
+    def uploads_multipart_stream(self):
+        stream = MultipartStream({"name": "test"}, "file", "test.bin", b"0123456789")
+        first = b"".join(stream)
+        stream.seek(0)
+        second = stream.read(7) + stream.read(-1)
+        return bool(first == second and len(first) == len(stream) and stream.tell() == len(stream)
+                    and stream.content_type.endswith(stream.boundary)
+                    )
+
+    def uploads_retried_from_start(self, tmp_path):
+        content = os.urandom(256 * 1024)
+        sample = tmp_path / "sample.bin"
+        sample.write_bytes(content)
+        calls = []
+
+        def throttle_once(request):  # pylint: disable=W0613
+            calls.append(1)
+            if len(calls) == 1:
+                return json_response({"errors": [{"message": "API rate limit exceeded."}]}, 429,
+                                     {"X-RateLimit-Limit": "6000", "X-RateLimit-Remaining": "100",
+                                      "X-Ratelimit-Retryafter": str(time.time() + 0.01)})
+            return upload_handler(request)
+
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", SAMPLE_PATH, throttle_once)
+            stand_in.route("POST", PUT_FILES_PATH, throttle_once)
+            samples = SampleUploads(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                    ssl_verify=CERT_PATH, rate_limit=True)
+            with open(sample, "rb") as upload:
+                result = samples.upload_sample(file_data=upload, file_name="sample.bin")
+            uploads = [req for req in stand_in.requests if req["path"] == SAMPLE_PATH]
+            # File objects passed with files are rewound as well
+            calls.clear()
+            rtr_admin = RealTimeResponseAdmin(auth_object=samples.auth_object)
+            with open(sample, "rb") as upload:
+                put_file = rtr_admin.create_put_files(data={"name": "tool.exe"},
+                                                      files=[("file", ("tool.exe", upload, "application/octet-stream"))])
+            put_files = [parse_multipart(req)["file"].get_content() for req in stand_in.requests
+                         if req["path"] == PUT_FILES_PATH]
+            # Bodies that cannot be rewound are sent once, the throttled response is returned
+            calls.clear()
+            with open(sample, "rb") as upload:
+                piped = io.BufferedReader(Unseekable(upload))
+                not_retried = samples.upload_sample(file_data=piped, file_name="sample.bin")
+            sent_once = [req for req in stand_in.requests if req["path"] == SAMPLE_PATH][len(uploads):]
+
+        return bool(result["status_code"] == 200 and len(uploads) == 2
+                    and all(req["body"] == content for req in uploads)
+                    and put_file["status_code"] == 200 and put_files == [content, content]
+                    and not_retried["status_code"] == 429 and [req["body"] for req in sent_once] == [content]
+                    )
+
+    def uploads_text_content(self, tmp_path):
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", SAMPLE_PATH, upload_handler)
+            stand_in.route("POST", SCRIPTS_PATH, upload_handler)
+            auth = authenticate(stand_in)
+            # str file data is sent as content, never opened as a path
+            (tmp_path / "notes.txt").write_text("not this")
+            result = SampleUploads(auth_object=auth).upload_sample(file_data="notes.txt", file_name="notes.txt")
+            created = RealTimeResponseAdmin(auth_object=auth).create_scripts(data={"name": "hello.ps1"},
+                                                                             file_data="Write-Host 'Ünïcode'")
+            sample_request, script_request = [req for req in stand_in.requests if req["path"] != "/oauth2/token"]
+
+        script_file = parse_multipart(script_request)["file"]
+        return bool(result["status_code"] == 200 and sample_request["body"] == b"notes.txt"
+                    and created["status_code"] == 200 and script_file.get_filename() == "hello.ps1"
+                    and script_file.get_content() == "Write-Host 'Ünïcode'".encode("utf-8")
+                    )
+
+    def uploads_memory_benchmark(self, tmp_path):
+        content = os.urandom(LARGE_SIZE)
+        expected = hashlib.sha256(content).hexdigest()
+        sample = tmp_path / "large.bin"
+        sample.write_bytes(content)
+        del content
+        peaks = {}
+        with StandInAPI(keep_bodies=False) as stand_in:
+            stand_in.route("POST", SAMPLE_PATH, upload_handler)
+            samples = SampleUploads(auth_object=authenticate(stand_in))
+            for style in ["bytes", "path"]:
+                tracemalloc.start()
+                if style == "bytes":
+                    with open(sample, "rb") as upload:
+                        result = samples.upload_sample(file_data=upload.read(), file_name="large.bin")
+                else:
+                    result = samples.upload_sample(file_data=sample, file_name="large.bin")
+                peaks[style] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                if result["status_code"] != 200:
+                    return False
+            hashes = [req["sha256"] for req in stand_in.requests if req["path"] == SAMPLE_PATH]
+
+        print(f"\n[upload] {LARGE_SIZE // (1024 * 1024)} MB peak memory: in memory {peaks['bytes'] / 1e6:.1f} MB, "
+              f"streamed {peaks['path'] / 1e6:.1f} MB")
+        return bool(hashes == [expected, expected] and peaks["path"] < LARGE_SIZE / 4 < peaks["bytes"])
+
+    def test_PathAndFileObject(self, tmp_path):
+        assert self.uploads_path_and_file_object(tmp_path) is True
+
+    def test_RTRMultipart(self, tmp_path):
+        assert self.uploads_rtr_multipart(tmp_path) is True
+
+    def test_Async(self, tmp_path):
+        assert self.uploads_async(tmp_path) is True
+
+    def test_MultipartStream(self):
+        assert self.uploads_multipart_stream() is True
+
+    def test_RetriedFromStart(self, tmp_path):
+        assert self.uploads_retried_from_start(tmp_path) is True
+
+    def test_TextContent(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert self.uploads_text_content(tmp_path) is True
+
+    def test_MemoryBenchmark(self, tmp_path):
+        assert self.uploads_memory_benchmark(tmp_path) is True
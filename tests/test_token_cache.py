@@ -0,0 +1,115 @@
+# test_token_cache.py
+# Tests the cross-process persistent token cache using a local HTTPS stand-in.
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+import pytest
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.hosts import Hosts as FalconHosts
+from falconpy.api_complete import APIHarness
+from falconpy.token_cache import TokenCache
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+PROCESSES = 8
+CREDS = {"client_id": "whatever", "client_secret": "whatever"}
+# Each child process authenticates using the cache, then prints its token
+CHILD = """
+import sys
+sys.path.insert(0, "src")
+from falconpy.oauth2 import OAuth2
+from falconpy.token_cache import TokenCache
+auth = OAuth2(client_id="whatever", client_secret="whatever", base_url=sys.argv[1], ssl_verify=sys.argv[2],
+              token_cache=TokenCache(path=sys.argv[3], encrypt=False))
+print(auth.token()["body"]["access_token"])
+"""
+
+
+def revoke_handler(request):  # pylint: disable=W0613
+    return json_response({"resources": []}, 200)
+
+
+def token_requests(stand_in):
+    return len([req for req in stand_in.requests if req["path"] == "/oauth2/token"])
+
+
+class TestTokenCache:
+    def cache_processes(self):
+        with StandInAPI() as stand_in, tempfile.TemporaryDirectory() as cache_path:
+            children = [subprocess.Popen([sys.executable, "-c", CHILD, stand_in.base_url, CERT_PATH, cache_path],
+                                         stdout=subprocess.PIPE, universal_newlines=True)
+                        for _ in range(PROCESSES)]
+            tokens = set(child.communicate()[0].strip() for child in children)
+            requested = token_requests(stand_in)
+            mode = stat.S_IMODE(os.stat(os.path.join(cache_path, TokenCache.cache_key(CREDS, stand_in.base_url))).st_mode)
+
+        # Every process started at once, only one of them requested a token
+        return bool(requested == 1 and tokens == {"stand-in-token"} and mode == 0o600)
+
+    def cache_service_class(self):
+        with StandInAPI() as stand_in, tempfile.TemporaryDirectory() as cache_path:
+            stand_in.route("POST", "/oauth2/revoke", revoke_handler)
+            cache = TokenCache(path=cache_path, encrypt=False)
+            first = FalconHosts(creds=CREDS, base_url=stand_in.base_url, ssl_verify=CERT_PATH, token_cache=cache)
+            second = FalconAuth(creds=CREDS, base_url=stand_in.base_url, ssl_verify=CERT_PATH, token_cache=cache)
+            second.renew_token()
+            cached = bool(token_requests(stand_in) == 1 and second.token_value == first.token
+                          and 1700 < second.token_expiration <= 1799)
+            # A different member CID is cached separately
+            child = FalconAuth(creds={**CREDS, "member_cid": "child"}, base_url=stand_in.base_url,
+                               ssl_verify=CERT_PATH, token_cache=cache)
+            child.renew_token()
+            separate = bool(token_requests(stand_in) == 2)
+            # Revoking the token removes it from the cache
+            second.revoke(second.token_value)
+            third = FalconAuth(creds=CREDS, base_url=stand_in.base_url, ssl_verify=CERT_PATH, token_cache=cache)
+            third.renew_token()
+            discarded = bool(token_requests(stand_in) == 3)
+
+        return bool(cached and separate and discarded)
+
+    def cache_renew_window(self):
+        with StandInAPI() as stand_in, tempfile.TemporaryDirectory() as cache_path:
+            cache = TokenCache(path=cache_path, encrypt=False)
+            cache.write(CREDS, stand_in.base_url, {"access_token": "stale", "expires_in": 1799, "token_time": 0})
+            falcon = APIHarness(creds=CREDS, base_url=stand_in.base_url, ssl_verify=CERT_PATH, token_cache=cache)
+            falcon.authenticate()
+            expired = bool(falcon.token == "stand-in-token" and token_requests(stand_in) == 1)
+            # Tokens within the renewal window are not used
+            cache.write(CREDS, stand_in.base_url, {"access_token": "nearly", "expires_in": 15, "token_time": time.time()})
+            window = bool(cache.lookup(CREDS, stand_in.base_url, 20) is None
+                          and cache.lookup(CREDS, stand_in.base_url, 10)["body"]["access_token"] == "nearly")
+
+        return bool(expired and window)
+
+    def cache_encrypted(self):
+        pytest.importorskip("cryptography")
+        with StandInAPI() as stand_in, tempfile.TemporaryDirectory() as cache_path:
+            cache = TokenCache(path=cache_path)
+            FalconAuth(creds=CREDS, base_url=stand_in.base_url, ssl_verify=CERT_PATH, token_cache=cache).token()
+            with open(os.path.join(cache_path, TokenCache.cache_key(CREDS, stand_in.base_url)), "rb") as cache_file:
+                encrypted = bool(b"stand-in-token" not in cache_file.read())
+            # Entries cannot be read using a different secret
+            other = TokenCache(path=cache_path).lookup({"client_id": "whatever", "client_secret": "other"},
+                                                        stand_in.base_url, 20)
+            auth = FalconAuth(creds=CREDS, base_url=stand_in.base_url, ssl_verify=CERT_PATH, token_cache=cache)
+            auth.renew_token()
+
+        return bool(encrypted and other is None and auth.token_value == "stand-in-token" and token_requests(stand_in) == 1)
+
+    def test_Processes(self):
+        assert self.cache_processes() is True
+
+    def test_ServiceClass(self):
+        assert self.cache_service_class() is True
+
+    def test_RenewWindow(self):
+        assert self.cache_renew_window() is True
+
+    def test_Encrypted(self):
+        assert self.cache_encrypted() is True
@@ -0,0 +1,102 @@
+# test_token_refresh.py
+# Tests single-flight token renewal for authentication objects
+# shared between threads and Service Classes using a local HTTPS stand-in.
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.hosts import Hosts as FalconHosts
+from falconpy.detects import Detects as FalconDetects
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+THREADS = 32
+QUERY_PATH = "/devices/queries/devices/v1"
+
+
+def counting_token_handler():
+    counter = itertools.count(1)
+
+    def handler(request):  # pylint: disable=W0613
+        # Slow token responses widen the window for a refresh stampede
+        time.sleep(0.1)
+        return json_response({"access_token": f"token-{next(counter)}", "expires_in": 1799}, 201)
+
+    return handler
+
+
+def bearer_echo_handler(request):
+    return json_response({"resources": [request["headers"].get("Authorization", "")]})
+
+
+class TestTokenRefresh:
+    def refresh_single_flight(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", "/oauth2/token", counting_token_handler())
+            stand_in.route("GET", QUERY_PATH, bearer_echo_handler)
+            auth = FalconAuth(client_id="whatever", client_secret="whatever",
+                              base_url=stand_in.base_url, ssl_verify=CERT_PATH, pool_maxsize=THREADS)
+            hosts = FalconHosts(auth_object=auth)
+            # Force every thread into the renewal window at the same moment
+            auth.token_expiration = 0
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                results = list(executor.map(lambda _: hosts.query_devices_by_filter(), range(THREADS)))
+            tokens = len([req for req in stand_in.requests if req["path"] == "/oauth2/token"])
+
+        bearers = set(result["body"]["resources"][0] for result in results)
+        # One token at instantiation, one renewal shared by every thread
+        return bool(tokens == 2 and bearers == {"Bearer token-2"})
+
+    def refresh_shared_bearer(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", "/oauth2/token", counting_token_handler())
+            auth = FalconAuth(client_id="whatever", client_secret="whatever",
+                              base_url=stand_in.base_url, ssl_verify=CERT_PATH)
+            hosts = FalconHosts(auth_object=auth)
+            detects = FalconDetects(auth_object=auth)
+            auth.token()
+
+        return bool(hosts.headers == detects.headers == {"Authorization": "Bearer token-2"}
+                    and hosts.token == "token-2"
+                    )
+
+    def refresh_assigned_headers(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", "/oauth2/token", counting_token_handler())
+            stand_in.route("GET", QUERY_PATH, lambda request: json_response({"resources": [{
+                "authorization": request["headers"].get("Authorization", ""),
+                "user": request["headers"].get("X-CS-USERUUID", None)
+            }]}))
+            auth = FalconAuth(client_id="whatever", client_secret="whatever",
+                              base_url=stand_in.base_url, ssl_verify=CERT_PATH)
+            hosts = FalconHosts(auth_object=auth)
+            # Changes made to the default headers are retained when the token is renewed
+            hosts.headers["X-CS-USERUUID"] = "user-1"
+            auth.token_expiration = 0
+            renewed = hosts.query_devices_by_filter()["body"]["resources"][0]
+            replaced = FalconHosts(auth_object=auth)
+            replaced.headers = {"X-CS-USERUUID": "user-2"}
+            replaced_sent = replaced.query_devices_by_filter()["body"]["resources"][0]
+            # An assigned token is used instead of the authentication object's token
+            hosts.token = "assigned"
+            assigned = hosts.query_devices_by_filter()["body"]["resources"][0]
+
+        return bool(renewed == {"authorization": "Bearer token-2", "user": "user-1"}
+                    and replaced_sent == {"authorization": "Bearer token-2", "user": "user-2"}
+                    and assigned == {"authorization": "Bearer assigned", "user": "user-1"}
+                    and hosts.headers == {"Authorization": "Bearer assigned", "X-CS-USERUUID": "user-1"}
+                    and auth.token_value == "token-2"
+                    )
+
+    def test_SingleFlight(self):
+        assert self.refresh_single_flight() is True
+
+    def test_SharedBearer(self):
+        assert self.refresh_shared_bearer() is True
+
+    def test_AssignedHeaders(self):
+        assert self.refresh_assigned_headers() is True
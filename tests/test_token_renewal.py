@@ -0,0 +1,124 @@
+# test_token_renewal.py
+# Tests proactive background token renewal using a local HTTPS stand-in.
+import itertools
+import os
+import sys
+import threading
+import time
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.hosts import Hosts as FalconHosts
+from falconpy.api_complete import APIHarness
+from falconpy._token_renewal import TokenRenewal
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+# Short lived tokens are renewed halfway through their lifetime
+TOKEN_LIFETIME = 2
+
+
+def short_token_handler():
+    counter = itertools.count(1)
+
+    def handler(request):  # pylint: disable=W0613
+        return json_response({"access_token": f"token-{next(counter)}", "expires_in": TOKEN_LIFETIME}, 201)
+
+    return handler
+
+
+def revoke_handler(request):  # pylint: disable=W0613
+    return json_response({"resources": []}, 200)
+
+
+def token_requests(stand_in):
+    return len([req for req in stand_in.requests if req["path"] == "/oauth2/token"])
+
+
+class TestTokenRenewal:
+    def renewal_service_class(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", "/oauth2/token", short_token_handler())
+            stand_in.route("POST", "/oauth2/revoke", revoke_handler)
+            auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                              ssl_verify=CERT_PATH, background_renewal=True)
+            auth.token_renew_window = 0
+            hosts = FalconHosts(auth_object=auth)
+            first_token = hosts.token
+            time.sleep(TOKEN_LIFETIME * 1.5)
+            # The token was renewed without a request being made, and is still valid
+            renewed = bool(hosts.token != first_token and auth.authenticated() and auth.renewal.running)
+            auth.revoke(hosts.token)
+            stopped = token_requests(stand_in)
+            time.sleep(TOKEN_LIFETIME)
+            revoked = bool(not auth.renewal.running and token_requests(stand_in) == stopped)
+            auth.close()
+
+        return bool(renewed and revoked)
+
+    def renewal_uber(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", "/oauth2/token", short_token_handler())
+            stand_in.route("POST", "/oauth2/revoke", revoke_handler)
+            falcon = APIHarness(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                ssl_verify=CERT_PATH, background_renewal=True)
+            falcon.TOKEN_RENEW_WINDOW = 0
+            time.sleep(TOKEN_LIFETIME * 1.5)
+            renewed = bool(falcon.authenticated and token_requests(stand_in) >= 2)
+            falcon.deauthenticate()
+            stopped = bool(not falcon.renewal.running)
+
+        return bool(renewed and stopped)
+
+    def renewal_startup(self):
+        counter = itertools.count(1)
+
+        def slow_token_handler(request):  # pylint: disable=W0613
+            # Slow token responses widen the window for the renewal thread and the Service Class to race
+            time.sleep(0.2)
+            return json_response({"access_token": f"token-{next(counter)}", "expires_in": 1799}, 201)
+
+        with StandInAPI() as stand_in:
+            stand_in.route("POST", "/oauth2/token", slow_token_handler)
+            authenticated = []
+            for _ in range(3):
+                auth = FalconAuth(client_id="whatever", client_secret="whatever", base_url=stand_in.base_url,
+                                  ssl_verify=CERT_PATH, background_renewal=True)
+                hosts = FalconHosts(auth_object=auth)
+                time.sleep(0.3)
+                authenticated.append(bool(hosts.token))
+                auth.close()
+            requested = token_requests(stand_in)
+
+        # Only one token is requested for each authentication object at startup
+        return bool(all(authenticated) and requested == 3)
+
+    def renewal_waits_on_lock(self):
+        lock = threading.RLock()
+        expiration = {"remaining": -1}
+        renewals = []
+        renewal = TokenRenewal(renew=lambda: renewals.append(True) or True,
+                               seconds_remaining=lambda: expiration["remaining"], lock=lock)
+        with lock:
+            # The background renewal starts while another thread is requesting the first token
+            renewing = threading.Thread(target=renewal.renew_once)
+            renewing.start()
+            time.sleep(0.1)
+            expiration["remaining"] = 1700
+        renewing.join()
+        first = list(renewals)
+        renewal.renew_once()
+
+        return bool(first == [] and renewals == [True])
+
+    def test_ServiceClassRenewal(self):
+        assert self.renewal_service_class() is True
+
+    def test_UberRenewal(self):
+        assert self.renewal_uber() is True
+
+    def test_Startup(self):
+        assert self.renewal_startup() is True
+
+    def test_WaitsOnLock(self):
+        assert self.renewal_waits_on_lock() is True
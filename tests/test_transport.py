@@ -0,0 +1,91 @@
+# test_transport.py
+# Tests the persistent, pooled HTTP transport and benchmarks
+# per-call latency against one-shot connections using a local HTTPS stand-in.
+import os
+import sys
+import time
+# Import our sibling src folder into the path
+sys.path.append(os.path.abspath('src'))
+# flake8: noqa=E402
+from falconpy.oauth2 import OAuth2 as FalconAuth
+from falconpy.hosts import Hosts as FalconHosts
+from falconpy.detects import Detects as FalconDetects
+from falconpy.api_complete import APIHarness
+from falconpy._util import perform_request
+from tests.stand_in_api import StandInAPI, json_response, CERT_PATH
+
+ITERATIONS = 50
+QUERY_PATH = "/devices/queries/devices/v1"
+
+
+def query_handler(request):  # pylint: disable=W0613
+    return json_response({"meta": {}, "resources": ["1234567890abcdef"], "errors": []})
+
+
+class TestTransport:
+    def transport_shared_session(self):
+        with StandInAPI() as stand_in:
+            auth = FalconAuth(client_id="whatever", client_secret="whatever",
+                              base_url=stand_in.base_url, ssl_verify=CERT_PATH)
+            hosts = FalconHosts(auth_object=auth)
+            detects = FalconDetects(auth_object=auth)
+        return bool(hosts.session is auth.session and detects.session is auth.session)
+
+    def transport_connection_reuse(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", QUERY_PATH, query_handler)
+            auth = FalconAuth(client_id="whatever", client_secret="whatever",
+                              base_url=stand_in.base_url, ssl_verify=CERT_PATH)
+            hosts = FalconHosts(auth_object=auth)
+            for _ in range(ITERATIONS):
+                if hosts.query_devices_by_filter(limit=1)["status_code"] != 200:
+                    return False
+            # One connection for the token request and every API call
+            return bool(stand_in.connections == 1)
+
+    def transport_uber_connection_reuse(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", QUERY_PATH, query_handler)
+            falcon = APIHarness(client_id="whatever", client_secret="whatever",
+                                base_url=stand_in.base_url, ssl_verify=CERT_PATH)
+            for _ in range(ITERATIONS):
+                if falcon.command("QueryDevicesByFilter", parameters={"limit": 1})["status_code"] != 200:
+                    return False
+            return bool(stand_in.connections == 1)
+
+    def transport_benchmark(self):
+        with StandInAPI() as stand_in:
+            stand_in.route("GET", QUERY_PATH, query_handler)
+            target = f"{stand_in.base_url}{QUERY_PATH}"
+            start = time.perf_counter()
+            for _ in range(ITERATIONS):
+                perform_request(method="GET", endpoint=target, verify=CERT_PATH)
+            one_shot = (time.perf_counter() - start) / ITERATIONS
+            one_shot_connections = stand_in.connections
+
+            auth = FalconAuth(client_id="whatever", client_secret="whatever",
+                              base_url=stand_in.base_url, ssl_verify=CERT_PATH)
+            hosts = FalconHosts(auth_object=auth)
+            stand_in.connections = 0
+            start = time.perf_counter()
+            for _ in range(ITERATIONS):
+                hosts.query_devices_by_filter()
+            pooled = (time.perf_counter() - start) / ITERATIONS
+            pooled_connections = stand_in.connections
+
+        print(f"\n[transport] one-shot: {one_shot * 1000:.2f} ms/call ({one_shot_connections} connections)"
+              f" | pooled: {pooled * 1000:.2f} ms/call ({pooled_connections} connections)")
+
+        return bool(one_shot_connections == ITERATIONS and pooled_connections <= 1)
+
+    def test_SharedSession(self):
+        assert self.transport_shared_session() is True
+
+    def test_ConnectionReuse(self):
+        assert self.transport_connection_reuse() is True
+
+    def test_UberConnectionReuse(self):
+        assert self.transport_uber_connection_reuse() is True
+
+    def test_Benchmark(self):
+        assert self.transport_benchmark() is True
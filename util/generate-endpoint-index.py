@@ -0,0 +1,58 @@
+"""
+generate-endpoint-index.py - Regenerates src/falconpy/_endpoint/_index.py
+
+The index maps every operation ID to the endpoint module (collection) that defines it,
+allowing the Uber class to load a single endpoint module on demand instead of importing
+all of them. Run this utility from the repository root whenever an endpoint module is
+added, removed or updated.
+
+Usage: python3 util/generate-endpoint-index.py
+"""
+import ast
+import os
+import runpy
+
+ENDPOINT_FOLDER = os.path.join("src", "falconpy", "_endpoint")
+
+
+def literal_assignment(filename: str, target: str) -> list:
+    """Returns the literal value assigned to target within the specified file."""
+    with open(filename, "r") as source:
+        tree = ast.parse(source.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == target:
+            return ast.literal_eval(node.value)
+    raise ValueError(f"{target} not found in {filename}")
+
+
+def endpoint_list(collection: str) -> list:
+    """Loads the endpoint list from the module file for the collection without importing the package."""
+    module_file = os.path.join(ENDPOINT_FOLDER, *collection.split(".")) + ".py"
+    return runpy.run_path(module_file)[f"{collection.split('.')[-1]}_endpoints"]
+
+
+def main():
+    """Builds the operation ID to collection mapping and writes the index module."""
+    package_init = os.path.join(ENDPOINT_FOLDER, "__init__.py")
+    collections = literal_assignment(package_init, "_collections")
+    collections.extend([f"deprecated.{name}" for name in literal_assignment(package_init, "_deprecated_collections")])
+    index = {}
+    for collection in collections:
+        for endpoint in endpoint_list(collection):
+            # The first definition of an operation ID takes precedence, matching the api_endpoints order
+            index.setdefault(endpoint[0], collection)
+    with open(os.path.join(ENDPOINT_FOLDER, "_hosts.py"), "r") as template:
+        banner = template.read().split('"""')[1]
+    banner = banner.replace("_endpoint._hosts - Internal API endpoint constant library",
+                            "_endpoint._index - Operation ID to endpoint module index (generated, do not edit)")
+    lines = [f'"""{banner}"""', "", "_operation_collections = {"]
+    lines.extend([f'    "{operation_id}": "{collection}",' for operation_id, collection in index.items()])
+    lines[-1] = lines[-1].rstrip(",")
+    lines.append("}")
+    with open(os.path.join(ENDPOINT_FOLDER, "_index.py"), "w") as index_file:
+        index_file.write("\n".join(lines) + "\n")
+    print(f"Indexed {len(index)} operations from {len(collections)} endpoint modules.")
+
+
+if __name__ == "__main__":
+    main()